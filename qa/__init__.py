@@ -7,6 +7,7 @@ Comprehensive testing framework for Diverga plugin's agentic AI research assista
 Modules:
 - protocol: Test scenario definitions, metrics, and grading rubrics
 - runners: Execution engines for simulation and validation
+- detectors: Checkpoint, agent, halt and VS detection shared by all runners
 
 Features:
 - Checkpoint compliance testing (REQUIRED/RECOMMENDED/OPTIONAL)
@@ -0,0 +1,15 @@
+"""
+Diverga QA Protocol - Detector Benchmarks
+
+Microbenchmarks for the response analysis hot paths. Each benchmark runs
+against the recorded sessions in qa/reports/sessions and compares the
+current implementation with a frozen reference copy of the previous one,
+asserting identical output before reporting timings.
+
+Usage:
+    python -m qa.benchmarks.checkpoint_detection
+"""
+
+from .corpus import load_session_corpus
+
+__all__ = ['load_session_corpus']
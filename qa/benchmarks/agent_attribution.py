@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Agent attribution benchmark.
+
+Extracts synthetic sessions of growing length with ConversationExtractor
+(AGENT_PATTERNS compiled into one PatternTable, set-backed dedupe of
+tool-result agents) and with the v2.0 attribution preserved below as a
+reference (`re.search` per agent pattern, linear scan of agents_invoked
+per tool-result match). Extracted agents and turns are checked for
+equality before timings are reported; per-turn cost should stay flat as
+sessions grow.
+
+Usage:
+    python -m qa.benchmarks.agent_attribution [--repeat N] [--turns 500,1000,2000]
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.runners.extract_conversation import AgentInvocation, ConversationExtractor
+
+AGENTS = ['C5', 'B3', 'D2', 'A1', 'E1', 'F4', 'G2', 'H1']
+
+
+class LegacyExtractor(ConversationExtractor):
+    """Reference implementation of the v2.0 agent attribution."""
+
+    def _process_tool_result(self, entry: dict) -> None:
+        tool_name = entry.get('tool_name', '')
+        if 'diverga:' in tool_name.lower() or 'task' in tool_name.lower():
+            content = entry.get('content', str(entry.get('result', '')))
+            for agent, pattern in self.AGENT_PATTERNS.items():
+                if re.search(pattern, content, re.IGNORECASE):
+                    if not any(a.agent == agent for a in self.agents_invoked):
+                        self._record_agent(AgentInvocation(agent=agent, turn=self._turn_count, trigger='tool_result'))
+
+    def _detect_agent_from_tool_call(self, tool_call: dict):
+        tool_name = tool_call.get('name', tool_call.get('tool', ''))
+        args = tool_call.get('arguments', tool_call.get('input', {}))
+        for agent, pattern in self.AGENT_PATTERNS.items():
+            if re.search(pattern, tool_name, re.IGNORECASE):
+                return agent
+        if isinstance(args, dict):
+            prompt = args.get('prompt', '') + args.get('description', '')
+            for agent, pattern in self.AGENT_PATTERNS.items():
+                if re.search(pattern, prompt, re.IGNORECASE):
+                    return agent
+        return None
+
+
+def write_session(path: Path, turns: int) -> Path:
+    """A session of `turns` turns: every assistant turn calls a tool, every third is followed by its result."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(turns // 2):
+            agent = AGENTS[i % len(AGENTS)]
+            entries = [
+                {'type': 'user', 'content': f'Step {i}: what about the next analysis?'},
+                {
+                    'type': 'assistant',
+                    'content': f'Delegating step {i}.',
+                    'tool_calls': [{'id': f't{i}', 'name': 'Task', 'input': {
+                        'prompt': f'diverga:{agent} continue the review for step {i}', 'description': 'step',
+                    }}],
+                },
+            ]
+            if i % 3 == 0:
+                entries.append({'type': 'tool_result', 'tool_name': 'Task',
+                                'content': f'diverga:{agent} finished; effect size and interview notes attached'})
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+    return path
+
+
+def extract(cls, path: Path):
+    extractor = cls(str(path))
+    result = extractor.extract()
+    return result.agents_invoked, [t['agent_invoked'] for t in result.turns]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark agent attribution in ConversationExtractor')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best of N)')
+    parser.add_argument('--turns', default='500,1000,2000', help='Comma-separated session lengths')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for turns in (int(n) for n in args.turns.split(',')):
+            path = write_session(Path(tmp) / f'session_{turns}.jsonl', turns)
+            if extract(ConversationExtractor, path) != extract(LegacyExtractor, path):
+                print(f"❌ Attribution differs from reference for {turns} turns")
+                sys.exit(1)
+
+            timings = []
+            for cls in (LegacyExtractor, ConversationExtractor):
+                best = float('inf')
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    cls(str(path)).extract()
+                    best = min(best, time.perf_counter() - started)
+                timings.append(best / turns)
+            legacy, elapsed = timings
+            print(f"{turns:>6} turns  reference {legacy * 1e6:8.1f} µs/turn  "
+                  f"table {elapsed * 1e6:8.1f} µs/turn  ({legacy / elapsed:.2f}x, identical output ✅)")
+
+
+if __name__ == '__main__':
+    main()
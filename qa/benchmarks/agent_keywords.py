@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Agent keyword detection benchmark.
+
+Compares AgentTracker.detect_agent_from_keywords (Aho-Corasick index) with
+the v6 nested substring loop preserved below as a reference, over every
+user turn in the protocols and recorded sessions. Output equality is
+checked before timings are reported.
+
+Usage:
+    python -m qa.benchmarks.agent_keywords [--repeat N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.benchmarks.corpus import load_user_turns, time_per_call
+from qa.runners.agent_tracker import AgentTracker
+from qa.runners.keyword_index import KeywordIndex, ahocorasick
+
+
+def legacy_detect_agent_from_keywords(text: str, agent_keywords: dict) -> list:
+    """Reference implementation: nested `in` loop over every keyword."""
+    text_lower = text.lower()
+    matches = []
+
+    for agent_id, keywords in agent_keywords.items():
+        for keyword in keywords:
+            if keyword.lower() in text_lower:
+                matches.append((agent_id, keyword))
+                break  # Only one match per agent
+
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark agent keyword detection')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best of N)')
+    args = parser.parse_args()
+
+    tracker = AgentTracker()
+    keywords = tracker.AGENT_KEYWORDS
+    texts = load_user_turns()
+
+    mismatches = [
+        i for i, text in enumerate(texts)
+        if tracker.detect_agent_from_keywords(text) != legacy_detect_agent_from_keywords(text, keywords)
+    ]
+    if mismatches:
+        print(f"❌ Output differs from reference for {len(mismatches)} text(s): {mismatches[:10]}")
+        sys.exit(1)
+
+    print(f"Corpus: {len(texts)} user turns, {sum(len(t) for t in texts):,} chars (identical output ✅)")
+    legacy = time_per_call(lambda t: legacy_detect_agent_from_keywords(t, keywords), texts, args.repeat)
+    print(f"{'Reference loop':<28} {legacy * 1e6:8.1f} µs/turn")
+
+    backends = [('pure Python', False)]
+    if ahocorasick is not None:
+        backends.append(('pyahocorasick', True))
+    for label, native in backends:
+        index = KeywordIndex(keywords, native=native)
+        elapsed = time_per_call(index.first_per_key, texts, args.repeat)
+        print(f"{'Automaton (' + label + ')':<28} {elapsed * 1e6:8.1f} µs/turn  ({legacy / elapsed:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
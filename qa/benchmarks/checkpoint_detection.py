@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Checkpoint detection benchmark.
+
+Compares CLITestRunner._detect_checkpoints (single-pass, precompiled) with
+the v3.2.2 multi-pass implementation preserved below as a reference, over
+every response recorded in qa/reports/sessions. Output equality is checked
+before timings are reported.
+
+Usage:
+    python -m qa.benchmarks.checkpoint_detection [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.benchmarks.corpus import load_session_corpus, time_per_call
+from qa.runners.cli_test_runner import CLITestRunner
+
+
+# ============================================
+# Reference implementation (v3.2.2, frozen)
+# ============================================
+
+def legacy_normalize_checkpoint_name(name: str, aliases: Dict[str, str]) -> Optional[str]:
+    """
+    Normalize a checkpoint name to formal CP_ format using alias mapping.
+
+    Args:
+        name: Raw checkpoint name (could be formal CP_XXX or descriptive)
+
+    Returns:
+        Normalized CP_ identifier or None if not recognized
+    """
+    name = name.strip()
+
+    # Already in formal format
+    if name.upper().startswith('CP_'):
+        return name.upper()
+
+    # Check alias mapping (case-insensitive)
+    name_lower = name.lower()
+    for alias, formal_id in aliases.items():
+        if alias.lower() == name_lower:
+            return formal_id
+
+    # Try partial matching for common patterns
+    for alias, formal_id in aliases.items():
+        # If the name contains the core keywords from the alias
+        alias_words = set(alias.lower().split())
+        name_words = set(name_lower.split())
+        if len(alias_words) >= 2 and alias_words <= name_words:
+            return formal_id
+
+    return None
+
+def legacy_detect_checkpoints(response: str, aliases: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Detect checkpoint markers in response with confidence scoring.
+
+    HYBRID DETECTION (v3.2.0):
+    1. Primary: Look for formal CP_XXX identifiers
+    2. Fallback: Detect descriptive names and map via CHECKPOINT_ALIASES
+
+    Returns list of dicts with 'id', 'confidence', 'level', 'context', and 'original' keys.
+
+    Checkpoint naming convention (from research-coordinator):
+    - CP_RESEARCH_DIRECTION, CP_PARADIGM_SELECTION, CP_THEORY_SELECTION
+    - CP_METHODOLOGY_APPROVAL, CP_ANALYSIS_PLAN, CP_INTEGRATION_STRATEGY
+    - CP_QUALITY_REVIEW, CP_EFFECT_SIZE_SELECTION, CP_HETEROGENEITY_ANALYSIS
+    - CP_HUMANIZATION_REVIEW, CP_HUMANIZATION_VERIFY, etc.
+
+    Confidence levels:
+    - HIGH: Emoji marker + formal CP_XXX with options OR emoji + descriptive with options
+    - MEDIUM: Text "CHECKPOINT" + CP_XXX format OR emoji + descriptive without options
+    - LOW: Partial match or text mention without action
+    """
+    detected = []
+    seen_ids = set()
+
+    # Valid checkpoint ID pattern: CP_ followed by uppercase words/digits
+    # Examples: CP_RESEARCH_DIRECTION, CP_META_TIER3_REVIEW, CP_GATE_2
+    VALID_CP_PATTERN = r'^CP_[A-Z0-9]+(?:_[A-Z0-9]+)*$'
+
+    # ============================================
+    # PHASE 1: Detect formal CP_XXX identifiers
+    # ============================================
+
+    # HIGH confidence: Emoji + full checkpoint format + options presented
+    # Supports multiple formats:
+    # - 🔴 CHECKPOINT: CP_XXX
+    # - 🔴 CP_XXX (확인)
+    # - 🔴 CP_XXX
+    # - ## 🔴 CP_XXX
+    high_patterns_formal = [
+        # Format: 🔴 CHECKPOINT: CP_XXX
+        (r'🔴\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?', 'RED'),
+        (r'🟠\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?', 'ORANGE'),
+        (r'🟡\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?', 'YELLOW'),
+        # Format: 🔴 CP_XXX (with optional markdown headers and annotations)
+        (r'(?:#+\s*)?🔴\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\s*(?:\([^)]*\))?', 'RED'),
+        (r'(?:#+\s*)?🟠\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\s*(?:\([^)]*\))?', 'ORANGE'),
+        (r'(?:#+\s*)?🟡\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\s*(?:\([^)]*\))?', 'YELLOW'),
+    ]
+
+    for pattern, level in high_patterns_formal:
+        for match in re.finditer(pattern, response, re.IGNORECASE):
+            cp_id = match.group(1).upper()
+            after_match = response[match.end():match.end() + 500]
+            has_options = bool(re.search(r'\[(?:Y|N|A|B|C|[1-3])\]|옵션\s*[A-C]|Option\s*[A-C]', after_match, re.IGNORECASE))
+
+            if re.match(VALID_CP_PATTERN, cp_id) and cp_id not in seen_ids:
+                detected.append({
+                    'id': cp_id,
+                    'confidence': 'HIGH' if has_options else 'MEDIUM',
+                    'level': level,
+                    'context': 'formal CP_ with emoji' + (' + options' if has_options else ''),
+                    'original': cp_id
+                })
+                seen_ids.add(cp_id)
+
+    # MEDIUM confidence: Plain text checkpoint format with CP_
+    medium_patterns_formal = [
+        r'(?:\*\*)?CHECKPOINT(?:\*\*)?[:\s]+\*?\*?(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?',
+        r'(?:checkpoint|체크포인트)\s*[:]\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)',
+        r'(?:\*\*)?CHECKPOINT(?:\*\*)?[:\s]+\*?\*?(META_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?',
+        # Format: ## CP_XXX or ### CP_XXX (without emoji)
+        r'^#+\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\s*(?:\([^)]*\))?',
+        # Format: **CP_XXX** in bold
+        r'\*\*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*\*',
+    ]
+
+    for pattern in medium_patterns_formal:
+        for match in re.finditer(pattern, response, re.IGNORECASE):
+            cp_id = match.group(1).upper()
+            if re.match(VALID_CP_PATTERN, cp_id) and cp_id not in seen_ids:
+                detected.append({
+                    'id': cp_id,
+                    'confidence': 'MEDIUM',
+                    'level': 'UNKNOWN',
+                    'context': 'formal CP_ text mention',
+                    'original': cp_id
+                })
+                seen_ids.add(cp_id)
+
+    # ============================================
+    # PHASE 2: Detect descriptive checkpoint names (HYBRID)
+    # ============================================
+
+    # HIGH/MEDIUM confidence: Emoji + descriptive name (no CP_ prefix)
+    # Pattern: 🔴 CHECKPOINT: Effect Size Target Selection
+    descriptive_patterns = [
+        (r'🔴\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)', 'RED'),
+        (r'🟠\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)', 'ORANGE'),
+        (r'🟡\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)', 'YELLOW'),
+    ]
+
+    for pattern, level in descriptive_patterns:
+        for match in re.finditer(pattern, response, re.IGNORECASE):
+            raw_name = match.group(1).strip()
+
+            # Skip if it's already a formal CP_ identifier (handled in Phase 1)
+            if raw_name.upper().startswith('CP_'):
+                continue
+
+            # Try to map to formal identifier
+            formal_id = legacy_normalize_checkpoint_name(raw_name, aliases)
+
+            if formal_id and formal_id not in seen_ids:
+                after_match = response[match.end():match.end() + 500]
+                has_options = bool(re.search(r'\[(?:Y|N|A|B|C|[1-3])\]|옵션\s*[A-C]|Option\s*[A-C]', after_match, re.IGNORECASE))
+
+                detected.append({
+                    'id': formal_id,
+                    'confidence': 'HIGH' if has_options else 'MEDIUM',
+                    'level': level,
+                    'context': f'descriptive → {formal_id}' + (' + options' if has_options else ''),
+                    'original': raw_name
+                })
+                seen_ids.add(formal_id)
+            elif not formal_id:
+                # Unknown descriptive name - still record it with LOW confidence
+                # Generate a pseudo-ID from the name
+                pseudo_id = 'CP_' + re.sub(r'[^A-Z0-9]', '_', raw_name.upper()).strip('_')
+                pseudo_id = re.sub(r'_+', '_', pseudo_id)  # Remove duplicate underscores
+
+                if pseudo_id not in seen_ids and len(pseudo_id) > 4:
+                    detected.append({
+                        'id': pseudo_id,
+                        'confidence': 'LOW',
+                        'level': level,
+                        'context': f'unmapped descriptive: {raw_name[:30]}',
+                        'original': raw_name
+                    })
+                    seen_ids.add(pseudo_id)
+
+    # ============================================
+    # PHASE 3: LOW confidence - partial mentions
+    # ============================================
+
+    low_patterns = [
+        r'(?:checkpoint|체크포인트)\s+(?:for\s+)?([A-Z][A-Z_]+)',
+    ]
+
+    for pattern in low_patterns:
+        for match in re.finditer(pattern, response, re.IGNORECASE):
+            raw_id = match.group(1).upper()
+            cp_id = f"CP_{raw_id}" if not raw_id.startswith('CP_') else raw_id
+            if re.match(VALID_CP_PATTERN, cp_id) and cp_id not in seen_ids:
+                detected.append({
+                    'id': cp_id,
+                    'confidence': 'LOW',
+                    'level': 'UNKNOWN',
+                    'context': 'inferred from text',
+                    'original': raw_id
+                })
+                seen_ids.add(cp_id)
+
+    return detected
+
+
+# ============================================
+# Benchmark
+# ============================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark checkpoint detection')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best of N)')
+    args = parser.parse_args()
+
+    runner = CLITestRunner('QUAL-002', dry_run=True)
+    aliases = runner.CHECKPOINT_ALIASES
+    texts = load_session_corpus()
+
+    mismatches = [
+        i for i, text in enumerate(texts)
+        if runner._detect_checkpoints(text) != legacy_detect_checkpoints(text, aliases)
+    ]
+    if mismatches:
+        print(f"❌ Output differs from reference for {len(mismatches)} text(s): {mismatches[:10]}")
+        sys.exit(1)
+
+    legacy = time_per_call(lambda t: legacy_detect_checkpoints(t, aliases), texts, args.repeat)
+    current = time_per_call(runner._detect_checkpoints, texts, args.repeat)
+    total_chars = sum(len(t) for t in texts)
+
+    print(f"Corpus: {len(texts)} responses, {total_chars:,} chars (identical output ✅)")
+    print(f"Reference (v3.2.2): {legacy * 1e6:9.1f} µs/response")
+    print(f"Single-pass:        {current * 1e6:9.1f} µs/response")
+    print(f"Speedup:            {legacy / current:9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark corpus loader.
+
+Collects AI response texts recorded under qa/reports/sessions:
+- assistant turn `content` from conversation_raw*.json
+- raw CLI captures (*_raw.txt)
+- conversation transcripts (conversation_transcript*.md)
+
+and user messages from the test protocols and recorded sessions.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import yaml
+
+SESSIONS_DIR = Path(__file__).parent.parent / "reports" / "sessions"
+PROTOCOL_DIR = Path(__file__).parent.parent / "protocol"
+
+
+def load_session_corpus(sessions_dir: Optional[Path] = None) -> List[str]:
+    """Return every recorded response text, in a stable order."""
+    sessions_dir = Path(sessions_dir or SESSIONS_DIR)
+    texts = []
+
+    for raw_file in sorted(sessions_dir.glob("*/conversation_raw*.json")):
+        with open(raw_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for turn in data.get('turns', []):
+            if turn.get('role') == 'assistant' and turn.get('content'):
+                texts.append(turn['content'])
+
+    for pattern in ("*/*_raw.txt", "*/conversation_transcript*.md"):
+        for path in sorted(sessions_dir.glob(pattern)):
+            texts.append(path.read_text(encoding='utf-8'))
+
+    return texts
+
+
+def load_user_turns() -> List[str]:
+    """User messages from protocol flows and recorded session JSON."""
+    texts = []
+    for protocol_file in sorted(PROTOCOL_DIR.glob("test_*.yaml")):
+        with open(protocol_file, 'r', encoding='utf-8') as f:
+            protocol = yaml.safe_load(f) or {}
+        for turn in protocol.get('conversation_flow') or []:
+            message = turn.get('user') or turn.get('user_input')
+            if isinstance(message, str) and message.strip():
+                texts.append(message)
+    for raw_file in sorted(SESSIONS_DIR.glob("*/conversation_raw*.json")):
+        with open(raw_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        texts.extend(t['content'] for t in data.get('turns', []) if t.get('role') == 'user' and t.get('content'))
+    return texts
+
+
+def time_per_call(func: Callable[[str], object], texts: List[str], repeat: int = 5) -> float:
+    """Best-of-`repeat` mean seconds per call of `func` over `texts`."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - started)
+    return best / max(len(texts), 1)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+CLITestRunner load test against the local fake CLI.
+
+Runs many concurrent sessions of one scenario on a single asyncio event loop
+(or a thread pool with the blocking backend). Every turn spawns the fake CLI
+as a real subprocess, so concurrency, timeouts and memory are exercised
+exactly as in a live run, without a network or model.
+
+Usage:
+    python -m qa.benchmarks.runner_load --sessions 300 --latency lognormal:2,0.5
+    python -m qa.benchmarks.runner_load --sessions 100 --hang-rate 0.05 --timeout 5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.runners.cli_test_runner import CLITestRunner, summarize_timings
+from qa.runners.fake_cli import FakeCLIConfig, fake_cli_executables
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+
+def run_load(args: argparse.Namespace) -> list:
+    """Run `args.sessions` sessions concurrently and return their TestSessions."""
+    config = FakeCLIConfig(
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        hang_rate=args.hang_rate,
+        size=args.size,
+        seed=args.seed
+    )
+    executables = fake_cli_executables(config)
+    runners = [
+        CLITestRunner(args.scenario, cli_tool=args.cli, timeout=args.timeout, executables=executables)
+        for _ in range(args.sessions)
+    ]
+
+    if args.backend == 'asyncio':
+        async def drive():
+            slots = asyncio.Semaphore(args.concurrency or len(runners))
+
+            async def one(runner):
+                async with slots:
+                    return await runner.run_async()
+
+            return await asyncio.gather(*(one(r) for r in runners))
+
+        return asyncio.run(drive())
+
+    with ThreadPoolExecutor(max_workers=args.concurrency or len(runners)) as pool:
+        return list(pool.map(lambda r: r.run(), runners))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test CLITestRunner with the fake CLI')
+    parser.add_argument('--scenario', default='META-002', help='Scenario every session runs')
+    parser.add_argument('--cli', default='claude', choices=CLITestRunner.SUPPORTED_CLIS)
+    parser.add_argument('--sessions', type=int, default=100, help='Number of sessions')
+    parser.add_argument('--concurrency', type=int, default=0, help='Max sessions in flight (0 = all)')
+    parser.add_argument('--backend', default='asyncio', choices=CLITestRunner.BACKENDS)
+    parser.add_argument('--timeout', type=int, default=30, help='Per-turn timeout in seconds')
+    parser.add_argument('--latency', default='uniform:0.1,0.5', help='Fake response latency distribution')
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--hang-rate', type=float, default=0.0)
+    parser.add_argument('--size', default='fixed:2000', help='Extra response characters distribution')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    with contextlib.redirect_stdout(io.StringIO()):
+        sessions = run_load(args)
+    wall = time.monotonic() - started
+
+    completed = [s for s in sessions if s.status == 'completed']
+    errors = [s.error or '' for s in sessions if s.status != 'completed']
+    timeouts = [e for e in errors if 'timed out' in e]
+    timing = summarize_timings([t.timing for s in sessions for t in s.turns if t.timing])
+    latency, throughput = timing['total_seconds'], timing['chars_per_second']
+
+    print(f"Sessions: {len(sessions)} ({args.backend}, concurrency {args.concurrency or len(sessions)})")
+    print(f"Completed: {len(completed)} | Failed: {len(errors) - len(timeouts)} | Timed out: {len(timeouts)}")
+    print(f"Turns: {timing['turns']} in {wall:.1f}s ({timing['turns'] / wall:.1f} turns/s)")
+    if latency['count']:
+        print(
+            f"Turn latency: p50 {latency['p50']:.3f}s | p95 {latency['p95']:.3f}s | "
+            f"p99 {latency['p99']:.3f}s | max {latency['max']:.3f}s"
+        )
+        print(f"Throughput: p50 {throughput['p50']:.0f} chars/s")
+    if resource is not None:
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+        print(f"Runner peak RSS: {peak / 1024 / 1024:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Session index benchmark.
+
+Answers partial queries on synthetic session logs (one turn, every
+checkpoint-raising message, every tool call) by full extraction with
+ConversationExtractor, and through SessionReader over the sidecar
+SessionIndex. The index is timed when built, loaded from disk, and
+extended after an append. Answers are checked for equality before
+timings are reported.
+
+Usage:
+    python -m qa.benchmarks.session_index [--repeat N] [--turns 1000,5000]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.benchmarks.session_parsing import write_session
+from qa.runners.extract_conversation import ConversationExtractor
+from qa.runners.session_index import SessionIndex, SessionReader
+
+
+def best_of(repeat: int, func) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def extracted_answers(path: Path, turn: int):
+    """(turn content, [(turn, checkpoint)], tool call IDs) from a full extraction."""
+    result = ConversationExtractor(str(path)).extract()
+    return (
+        result.turns[turn - 1]['content'],
+        [(c['turn_triggered'], c['id']) for c in result.checkpoints],
+        [call.get('id') for t in result.turns for call in t['tool_calls']],
+    )
+
+
+def indexed_answers(path: Path, turn: int):
+    """The same answers read through the session index."""
+    with SessionReader(path) as reader:
+        return (
+            reader.turn(turn)['content'],
+            [(number, checkpoint_id) for number, checkpoint_id, _ in reader.checkpoint_messages()],
+            [call.get('id') for _, call in reader.tool_calls()],
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark partial session reads through the sidecar index')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best of N)')
+    parser.add_argument('--turns', default='1000,5000', help='Comma-separated session lengths')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for turns in (int(n) for n in args.turns.split(',')):
+            path = write_session(Path(tmp) / f'session_{turns}.jsonl', turns)
+            target = turns * 3 // 4
+            if indexed_answers(path, target) != extracted_answers(path, target):
+                print(f"❌ Indexed reads differ from extraction for {turns} turns")
+                sys.exit(1)
+
+            size = path.stat().st_size
+            print(f"\n{turns} turns, {size / 1e6:.1f} MB (identical answers ✅)")
+            extract = best_of(args.repeat, lambda: ConversationExtractor(str(path)).extract())
+            print(f"  {'Full extraction':<34} {extract * 1e3:9.2f} ms")
+            build = best_of(args.repeat, lambda: SessionIndex.open(path, rebuild=True))
+            print(f"  {'Index build':<34} {build * 1e3:9.2f} ms")
+            load = best_of(args.repeat, lambda: SessionIndex.open(path))
+            print(f"  {'Index load':<34} {load * 1e3:9.2f} ms")
+
+            index = SessionIndex.open(path)
+            with SessionReader(path, index) as reader:
+                one_turn = best_of(args.repeat, lambda: reader.turn(target))
+                print(f"  {f'Turn {target}':<34} {one_turn * 1e6:9.1f} µs  ({extract / one_turn:,.0f}x)")
+                checkpoints = best_of(args.repeat, lambda: list(reader.checkpoint_messages()))
+                print(f"  {'Checkpoint messages':<34} {checkpoints * 1e3:9.2f} ms  ({extract / checkpoints:,.0f}x)")
+                tool_calls = best_of(args.repeat, lambda: list(reader.tool_calls()))
+                print(f"  {'Tool calls':<34} {tool_calls * 1e3:9.2f} ms  ({extract / tool_calls:,.0f}x)")
+
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'type': 'user', 'content': 'One more question about step 1?'}) + '\n')
+            started = time.perf_counter()
+            SessionIndex.open(path)
+            print(f"  {'Index extend (1 appended line)':<34} {(time.perf_counter() - started) * 1e3:9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Session log parsing benchmark.
+
+Extracts synthetic Claude Code-like session logs, where most bytes sit in
+progress and system entries the extractor never reads, with the v2.0
+line reader preserved below as a reference (`json.loads` per line) and
+with ConversationExtractor over every installed JSON backend, with and
+without the entry-type prefilter. Extraction results are checked for
+equality before timings are reported.
+
+Usage:
+    python -m qa.benchmarks.session_parsing [--repeat N] [--turns 200,1000]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.benchmarks.agent_attribution import AGENTS
+from qa.runners.extract_conversation import ConversationExtractor
+from qa.runners.json_codec import JSONCodec, available_backends
+
+
+class LegacyExtractor(ConversationExtractor):
+    """Reference implementation of the v2.0 line reader."""
+
+    def _iter_entries(self):
+        if not self.session_path.exists():
+            raise FileNotFoundError(f"Session file not found: {self.session_path}")
+
+        with open(self.session_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+
+def write_session(path: Path, turns: int) -> Path:
+    """A session of `turns` turns, each followed by the progress and system entries a CLI session logs."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(turns // 2):
+            agent = AGENTS[i % len(AGENTS)]
+            entries = [
+                {'type': 'user', 'content': f'단계 {i}: 다음 분석은 어떻게 할까요? What about step {i}?'},
+                {
+                    'type': 'assistant',
+                    'content': f'🔴 CHECKPOINT: CP_RESEARCH_DIRECTION\n[A] Direct (T=0.6)\n[B] Broad (T=0.3)\nStep {i}?',
+                    'tool_calls': [{'id': f't{i}', 'name': 'Task', 'input': {
+                        'prompt': f'diverga:{agent} continue step {i}', 'description': 'step',
+                    }}],
+                },
+                {'type': 'tool_result', 'tool_name': 'Task', 'content': f'diverga:{agent} finished step {i}'},
+            ]
+            for k in range(4):
+                entries.append({
+                    'type': 'progress',
+                    'uuid': f'{i:08d}-{k:04d}',
+                    'data': {'tokens': list(range(k * 50, k * 50 + 200)), 'text': '분석 진행 중 ' * 80},
+                })
+            entries.append({'type': 'system', 'subtype': 'usage', 'usage': {'input_tokens': i, 'cache': [i] * 300}})
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    return path
+
+
+def extract(extractor: ConversationExtractor):
+    result = extractor.extract()
+    return result.turns, result.checkpoints, result.agents_invoked, result.metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark session log parsing in ConversationExtractor')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best of N)')
+    parser.add_argument('--turns', default='200,1000', help='Comma-separated session lengths')
+    args = parser.parse_args()
+
+    configs = [('json.loads per line (reference)', lambda path: LegacyExtractor(path))]
+    for backend in available_backends():
+        for prefilter in (False, True):
+            label = f"{backend}{' + type prefilter' if prefilter else ''}"
+            configs.append((label, lambda path, b=backend, p=prefilter: ConversationExtractor(
+                path, codec=JSONCodec(b), prefilter=p)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for turns in (int(n) for n in args.turns.split(',')):
+            path = str(write_session(Path(tmp) / f'session_{turns}.jsonl', turns))
+            size = Path(path).stat().st_size
+            reference = extract(configs[0][1](path))
+            for label, make in configs[1:]:
+                if extract(make(path)) != reference:
+                    print(f"❌ Extraction differs from reference with {label} for {turns} turns")
+                    sys.exit(1)
+
+            print(f"\n{turns} turns, {size / 1e6:.1f} MB (identical output ✅)")
+            legacy = None
+            for label, make in configs:
+                best = float('inf')
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    make(path).extract()
+                    best = min(best, time.perf_counter() - started)
+                legacy = legacy or best
+                print(f"  {label:<34} {best * 1e3:8.1f} ms  {size / best / 1e6:7.1f} MB/s  ({legacy / best:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Turn record memory benchmark.
+
+Extracts a synthetic session with ConversationExtractor three ways: with
+the v2.0 record layout preserved below as a reference (dataclasses with a
+per-instance `__dict__`, and every turn, checkpoint and agent copied into
+the result through `asdict`); with the slotted records the result now
+shares; and with `lazy_content`, where retained turns re-read their
+content from the log. The extracted data and written documents are
+checked for equality, then the memory retained by each result, peak
+memory during extraction, and the time to write the result are reported.
+
+Usage:
+    python -m qa.benchmarks.turn_records [--turns 20000] [--content-chars 1500]
+"""
+
+import argparse
+import gc
+import json
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.runners.extract_conversation import ConversationExtractor, _write_result
+
+
+@dataclass
+class LegacyTurn:
+    """v2.0 Turn: a plain dataclass."""
+    turn_number: int
+    role: str
+    content: str
+    timestamp: Optional[str] = None
+    turn_type: Optional[str] = None
+    tool_calls: list = field(default_factory=list)
+    checkpoint_triggered: Optional[str] = None
+    halt_verified: bool = False
+    vs_options: int = 0
+    t_scores: list = field(default_factory=list)
+    agent_invoked: Optional[str] = None
+    maintains_checkpoint: bool = False
+
+
+class LegacyExtractor(ConversationExtractor):
+    """Reference implementation of the v2.0 record layout."""
+
+    def _record_turn(self, turn) -> None:
+        super()._record_turn(turn)
+        if not self._streaming:
+            self.turns[-1] = LegacyTurn(**{name: getattr(turn, name) for name in turn.keys()})
+
+    def extract(self):
+        result = super().extract()
+        result.turns = [asdict(t) for t in self.turns]
+        result.checkpoints = [asdict(c) for c in self.checkpoints]
+        result.agents_invoked = [asdict(a) for a in self.agents_invoked]
+        return result
+
+
+def legacy_write_result(result, output_dir: Path, fmt: str) -> Path:
+    """Reference serializer: one `asdict` of the whole result, dumped at once."""
+    output_path = output_dir / f"{result.scenario_id or result.session_id}.{fmt}"
+    result_dict = asdict(result)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        if fmt == 'yaml':
+            yaml.dump(result_dict, f, default_flow_style=False, allow_unicode=True)
+        else:
+            json.dump(result_dict, f, indent=2, ensure_ascii=False)
+    return output_path
+
+
+def write_session(path: Path, turns: int, content_chars: int) -> Path:
+    """A session of `turns` turns with assistant responses of about `content_chars` characters."""
+    paragraph = 'The pooled effect size depends on the heterogeneity model chosen for the studies. '
+    filler = (paragraph * (content_chars // len(paragraph) + 1))[:content_chars]
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(turns // 2):
+            entries = [
+                {'type': 'user', 'content': f'Why is option B lower in step {i}? [A] proceed'},
+                {
+                    'type': 'assistant',
+                    'content': f'🔴 CHECKPOINT: CP_RESEARCH_DIRECTION\n[A] Direct (T=0.6)\n[B] Broad (T=0.3)\n{filler}',
+                    'tool_calls': [{'id': f't{i}', 'name': 'Task', 'input': {'prompt': 'diverga:C5 meta-analysis'}}],
+                },
+            ]
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    return path
+
+
+def measure(make, path: Path):
+    """(result, retained bytes, peak bytes) of one extraction."""
+    gc.collect()
+    tracemalloc.start()
+    result = make(str(path)).extract()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained, peak
+
+
+def normalize(text: str) -> str:
+    return re.sub(r'(extracted_at"?:\s*["\']?)[0-9T:.\-]+', r"\1X", text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark turn record memory in ConversationExtractor')
+    parser.add_argument('--turns', type=int, default=20000, help='Session length')
+    parser.add_argument('--content-chars', type=int, default=1500, help='Characters per assistant response')
+    args = parser.parse_args()
+
+    configs = [
+        ('dataclass + asdict (reference)', LegacyExtractor),
+        ('slotted records', ConversationExtractor),
+        ('slotted records + lazy_content', lambda path: ConversationExtractor(path, lazy_content=True)),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        path = write_session(tmp / 'session.jsonl', args.turns, args.content_chars)
+        print(f"{args.turns} turns, {path.stat().st_size / 1e6:.1f} MB")
+
+        reference = None
+        for label, make in configs:
+            result, retained, peak = measure(make, path)
+            out_dir = tmp / label.split()[0]
+            out_dir.mkdir(exist_ok=True)
+            writer = legacy_write_result if reference is None else _write_result
+            started = time.perf_counter()
+            document = normalize(writer(result, out_dir, 'json').read_text(encoding='utf-8'))
+            elapsed = time.perf_counter() - started
+
+            if reference is None:
+                reference = document
+            elif document != reference:
+                print(f"❌ Output differs from reference with {label}")
+                sys.exit(1)
+            print(f"  {label:<34} retained {retained / 1e6:8.1f} MB  peak {peak / 1e6:8.1f} MB  "
+                  f"write {elapsed * 1e3:8.1f} ms")
+            del result
+        print("Identical output ✅")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+User input classifier benchmark.
+
+Compares ConversationExtractor._classify_user_input (USER_TYPE_PATTERNS
+compiled once into a priority-ordered PatternTable, one scan per turn)
+with the v2.0 per-pattern `re.search` loop preserved below as a reference,
+over every user turn in the protocols and recorded sessions, plus the
+user turns of any session logs given with --sessions. Output equality is
+checked before timings and per-category hit counts are reported.
+
+Usage:
+    python -m qa.benchmarks.user_input_classifier [--repeat N] [--sessions DIR|GLOB]
+"""
+
+import argparse
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.benchmarks.corpus import load_user_turns, time_per_call
+from qa.runners.extract_conversation import ConversationExtractor, resolve_session_paths
+
+
+def legacy_classify_user_input(content: str) -> str:
+    """Reference implementation: `re.search` per pattern, category by category."""
+    content_lower = content.lower()
+
+    for input_type, patterns in ConversationExtractor.USER_TYPE_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, content_lower, re.IGNORECASE):
+                return input_type
+
+    return 'STANDARD_RESPONSE'
+
+
+def load_session_user_turns(spec: str) -> list:
+    """User message content from every session log matching `spec`."""
+    texts = []
+    for path in resolve_session_paths(spec):
+        for entry in ConversationExtractor(str(path))._iter_entries():
+            if entry.get('type') == 'user' or entry.get('role') == 'user':
+                content = entry.get('content', entry.get('message', ''))
+                if isinstance(content, str) and content:
+                    texts.append(content)
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark user input classification')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best of N)')
+    parser.add_argument('--sessions', help='Also classify user turns of these session logs (directory or glob)')
+    args = parser.parse_args()
+
+    extractor = ConversationExtractor('-')
+    texts = load_user_turns()
+    if args.sessions:
+        texts += load_session_user_turns(args.sessions)
+
+    mismatches = [
+        i for i, text in enumerate(texts)
+        if extractor._classify_user_input(text) != legacy_classify_user_input(text)
+    ]
+    if mismatches:
+        print(f"❌ Output differs from reference for {len(mismatches)} turn(s): {mismatches[:10]}")
+        sys.exit(1)
+
+    print(f"Corpus: {len(texts)} user turns, {sum(len(t) for t in texts):,} chars (identical output ✅)")
+    legacy = time_per_call(legacy_classify_user_input, texts, args.repeat)
+    print(f"{'Per-pattern re.search':<28} {legacy * 1e6:8.1f} µs/turn")
+    elapsed = time_per_call(extractor._classify_user_input, texts, args.repeat)
+    print(f"{'Priority table':<28} {elapsed * 1e6:8.1f} µs/turn  ({legacy / elapsed:.2f}x)")
+
+    hits = Counter(extractor._classify_user_input(text) for text in texts)
+    print("\nHits per category:")
+    for category in [*ConversationExtractor.USER_TYPE_TABLE.names, ConversationExtractor.DEFAULT_USER_TYPE]:
+        print(f"  {category:<28} {hits[category]:6d}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+CheckpointValidator pattern benchmark.
+
+Compares CheckpointValidator.scan (every pattern set compiled once into a
+single named-group PatternTable, one scan per response) with the v3.2
+per-pattern `re.search` loops preserved below as a reference, over every
+recorded response. Output equality is checked before timings are reported;
+halt is compared with the v3.2 validator's own HALT_PATTERNS, which the
+merged qa.detectors set extends, so every baseline halt must still be found
+and the extra halts are counted rather than treated as mismatches.
+
+Usage:
+    python -m qa.benchmarks.validator_patterns [--repeat N]
+"""
+
+import argparse
+import dataclasses
+import re
+import sys
+from pathlib import Path
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qa.benchmarks.corpus import load_session_corpus, time_per_call
+from qa.runners.checkpoint_validator import CheckpointValidator, ResponseFacts
+
+
+# v3.2 CheckpointValidator.HALT_PATTERNS, searched without re.MULTILINE. The
+# merged qa.detectors set adds patterns, so halt is checked against this list.
+LEGACY_HALT_PATTERNS = [
+    r"어떤.*방향.*진행하시겠습니까",
+    r"선택해.*주세요",
+    r"어떻게.*진행할까요",
+    r"승인.*주세요",
+    r"확인.*주세요",
+    r"which.*would.*like",
+    r"please.*select",
+    r"please.*confirm",
+    r"which.*approach",
+    r"would.*you.*like",
+    r"\[A\].*\[B\]",
+    r"\(A\).*\(B\)",
+]
+
+
+def _any_search(patterns, response, flags=re.IGNORECASE) -> bool:
+    for pattern in patterns:
+        if re.search(pattern, response, flags):
+            return True
+    return False
+
+
+def legacy_scan(response: str) -> ResponseFacts:
+    """Reference implementation: one uncompiled `re.search` per pattern, per fact."""
+    v = CheckpointValidator
+    option_letters = [
+        {letter.upper() for letter in re.findall(pattern, response, re.IGNORECASE)}
+        for pattern in v.VS_OPTION_PATTERNS
+    ]
+    t_scores = set()
+    seen = set()
+    for match in re.finditer(v.T_SCORE_PATTERN, response, re.IGNORECASE):
+        t_score = float(match.group('t_score'))
+        option = (match.group('option') or '').upper()
+        if not 0.0 <= t_score <= 1.0 or (option and option in seen):
+            continue
+        seen.add(option)
+        t_scores.add(t_score)
+    return ResponseFacts(
+        checkpoint_topics={
+            cp_id for cp_id, patterns in v.CHECKPOINT_PATTERNS.items() if _any_search(patterns, response)
+        },
+        halt=_any_search(LEGACY_HALT_PATTERNS, response),
+        wait=_any_search(v.WAIT_PATTERNS, response, re.IGNORECASE | re.MULTILINE),
+        auto_proceed=_any_search(v.AUTO_PROCEED_PATTERNS, response, re.IGNORECASE | re.MULTILINE),
+        options_count=max(map(len, option_letters), default=0),
+        t_scores=sorted(t_scores),
+        options_labeled=_any_search(v.LABELED_OPTION_PATTERNS, response, re.IGNORECASE | re.DOTALL),
+        summary_present=_any_search(v.SUMMARY_PATTERNS, response),
+    )
+
+
+def agrees_with_reference(facts: ResponseFacts, reference: ResponseFacts) -> bool:
+    """Same facts as the reference, except halt may also be found by the added patterns."""
+    return dataclasses.replace(facts, halt=reference.halt) == reference and (facts.halt or not reference.halt)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CheckpointValidator pattern tables')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best of N)')
+    args = parser.parse_args()
+
+    validator = CheckpointValidator()
+    texts = load_session_corpus()
+    texts += [line for text in texts for line in text.split('\n\n') if line.strip()]  # Short turns too
+
+    pairs = [(validator.scan(text), legacy_scan(text)) for text in texts]
+    mismatches = [i for i, (facts, reference) in enumerate(pairs) if not agrees_with_reference(facts, reference)]
+    if mismatches:
+        print(f"❌ Output differs from reference for {len(mismatches)} response(s): {mismatches[:10]}")
+        sys.exit(1)
+    extra_halts = sum(facts.halt and not reference.halt for facts, reference in pairs)
+
+    print(f"Corpus: {len(texts)} responses, {sum(len(t) for t in texts):,} chars (matches reference ✅)")
+    print(f"Halts found only by the merged patterns: {extra_halts}")
+    legacy = time_per_call(legacy_scan, texts, args.repeat)
+    print(f"{'Per-pattern re.search':<28} {legacy * 1e6:8.1f} µs/response")
+    elapsed = time_per_call(validator.scan, texts, args.repeat)
+    print(f"{'Named-group table':<28} {elapsed * 1e6:8.1f} µs/response  ({legacy / elapsed:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Diverga QA Detectors
+====================
+
+One versioned, precompiled set of response detectors shared by every QA
+runner (CLITestRunner, CheckpointValidator, ConversationSimulator,
+ConversationExtractor, AutomatedTestSimulator):
+
+- checkpoints: formal CP_ IDs and descriptive names, levels, topic keywords
+- agents:      Diverga agent invocations with confidence
+- behavior:    halt, wait and auto-proceed
+- vs:          VS options and T-Scores
+- skill:       research-coordinator skill loading
+- table:       PatternTable, named pattern groups matched in one scan
+
+Usage:
+    from qa.detectors import analyze
+    analysis = analyze(response)
+    analysis.checkpoint_ids, analysis.agent_ids, analysis.halt, analysis.auto_proceed
+"""
+
+from .analysis import (
+    Analysis,
+    analyze,
+    DETECTOR_VERSION,
+    PATTERN_VERSIONS,
+)
+
+from .checkpoints import (
+    CHECKPOINT_ALIASES,
+    CHECKPOINT_LEVELS,
+    checkpoint_level,
+    detect_checkpoints,
+    filter_by_confidence,
+    normalize_checkpoint_name,
+)
+
+from .agents import VALID_AGENTS, detect_agents
+from .behavior import detect_auto_proceed, detect_halt, detect_wait
+from .skill import check_skill_loaded
+from .table import PatternTable
+from .vs import count_options, extract_vs_options
+
+__all__ = [
+    "Analysis",
+    "analyze",
+    "DETECTOR_VERSION",
+    "PATTERN_VERSIONS",
+    "CHECKPOINT_ALIASES",
+    "CHECKPOINT_LEVELS",
+    "checkpoint_level",
+    "detect_checkpoints",
+    "filter_by_confidence",
+    "normalize_checkpoint_name",
+    "VALID_AGENTS",
+    "detect_agents",
+    "detect_auto_proceed",
+    "detect_halt",
+    "detect_wait",
+    "check_skill_loaded",
+    "PatternTable",
+    "count_options",
+    "extract_vs_options",
+]
@@ -0,0 +1,105 @@
+"""
+Agent Detection
+===============
+
+Detects Diverga agent invocations (A1-H2) in assistant responses, with a
+confidence per agent: Task tool calls (HIGH), explicit execution wording
+(MEDIUM) and plain mentions (LOW).
+"""
+
+import re
+from typing import Any
+
+VERSION = 1  # Bump when any pattern or the agent registry below changes
+
+# Valid agent IDs per category (33 agents, v6.0.1)
+VALID_AGENTS = {
+    "A": [1, 2, 3, 4, 5, 6],      # Foundation
+    "B": [1, 2, 3, 4],             # Evidence (no B5)
+    "C": [1, 2, 3, 4, 5, 6, 7],    # Design & Meta-Analysis
+    "D": [1, 2, 3, 4],             # Data Collection
+    "E": [1, 2, 3, 4, 5],          # Analysis
+    "F": [1, 2, 3, 4],             # Quality (no F5)
+    "G": [1, 2, 3, 4],             # Communication (no G5-G7)
+    "H": [1, 2],                   # Specialized
+}
+_VALID_IDS = frozenset(f"{letter}{number}" for letter, numbers in VALID_AGENTS.items() for number in numbers)
+
+# HIGH confidence: Task tool invocation
+TASK_PATTERNS = [
+    r"Task\s*\(\s*subagent_type\s*=\s*[\"']diverga:([a-h][1-7])[\"']",
+    r"subagent_type\s*=\s*[\"']diverga:([a-h][1-7])[\"']",
+    r"Task.*diverga:([a-h][1-7])",
+    # Also detect general-purpose with agent ID in prompt
+    r"Task\s*\(.*model.*[\"']([A-H][1-7])[\"']",
+    r"description\s*=\s*[\"'][^\"']*([A-H][1-7])[^\"']*[\"']",
+]
+
+# MEDIUM confidence: Explicit execution with action verbs, as (pattern, context)
+ACTION_PATTERNS = [
+    # Korean action verbs
+    (r"([A-H][1-7])[-\s]?[A-Za-z-]*\s*(에이전트|agent)?\s*(실행|호출|사용|활성화)", "실행/호출"),
+    (r"(실행|호출).*([A-H][1-7])", "실행/호출"),
+    # English action verbs
+    (r"([A-H][1-7])[-\s]?[A-Za-z-]*\s*(agent)?\s*(invoke|invok|execut|running|activat)", "invocation"),
+    (r"(invoking|executing|running)\s+([A-H][1-7])", "invocation"),
+]
+
+# LOW confidence: Text mentions only (for reference, not counted as invocations)
+MENTION_PATTERNS = [
+    r"diverga:([a-h][1-7])",  # diverga:a1
+    r"([A-H][1-7])-[A-Za-z-]+",  # A1-ResearchQuestionRefiner or A1-research-question-refiner
+    r"\*?\*?([A-H][1-7])\*?\*?\s*[-:]\s*[A-Za-z-]+",  # A1: ResearchQuestionRefiner or **A1**-...
+]
+
+_TASK_RES = [re.compile(pattern, re.IGNORECASE) for pattern in TASK_PATTERNS]
+_ACTION_RES = [(re.compile(pattern, re.IGNORECASE), context) for pattern, context in ACTION_PATTERNS]
+_MENTION_RES = [re.compile(pattern, re.IGNORECASE) for pattern in MENTION_PATTERNS]
+
+
+def is_valid_agent(agent_id: str) -> bool:
+    """Check if agent ID is in the valid registry."""
+    return agent_id.upper() in _VALID_IDS
+
+
+def detect_agents(response: str) -> list[dict[str, Any]]:
+    """
+    Detect agent invocations in response with confidence scoring.
+
+    Returns list of dicts with 'id', 'confidence', and 'context' keys.
+
+    Confidence levels:
+    - HIGH: Task tool invocation (e.g., Task(subagent_type="diverga:a1"))
+    - MEDIUM: Explicit agent reference with action verb (e.g., "A1 에이전트 실행")
+    - LOW: Text mention only (e.g., "A1-ResearchQuestionRefiner를 사용할 수 있습니다")
+
+    Only IDs in VALID_AGENTS are reported, each once at its highest confidence.
+    """
+    detected = []
+    seen_ids = set()
+
+    for pattern in _TASK_RES:
+        for match in pattern.finditer(response):
+            agent_id = match.group(1).upper()
+            if agent_id in _VALID_IDS and agent_id not in seen_ids:
+                detected.append({"id": agent_id, "confidence": "HIGH", "context": "Task tool invocation"})
+                seen_ids.add(agent_id)
+
+    for pattern, context in _ACTION_RES:
+        for match in pattern.finditer(response):
+            # Extract agent ID from match groups
+            for group in match.groups():
+                if group and len(group) >= 2:
+                    potential_id = group[:2].upper() if group[0].isalpha() and group[1].isdigit() else None
+                    if potential_id and potential_id in _VALID_IDS and potential_id not in seen_ids:
+                        detected.append({"id": potential_id, "confidence": "MEDIUM", "context": context})
+                        seen_ids.add(potential_id)
+
+    for pattern in _MENTION_RES:
+        for match in pattern.finditer(response):
+            agent_id = match.group(1).upper()
+            if agent_id in _VALID_IDS and agent_id not in seen_ids:
+                detected.append({"id": agent_id, "confidence": "LOW", "context": "text mention"})
+                seen_ids.add(agent_id)
+
+    return detected
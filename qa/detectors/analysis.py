@@ -0,0 +1,133 @@
+"""
+Response Analysis
+=================
+
+`analyze(response)` is the single entry point the QA runners use to read
+an assistant response. The returned Analysis computes each fact on first
+access and keeps it. `analyze(response, memo=True)` also shares the
+Analysis with later memo calls for the same text, so a response checked
+repeatedly within one run (live run, then validation) is scanned once per
+detector. The memo is opt-in and holds only the last ANALYSIS_MEMO_SIZE
+responses: extraction and streaming read every response once and leave
+it alone, so their memory stays flat.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Any
+
+from . import agents as _agents
+from . import behavior as _behavior
+from . import checkpoints as _checkpoints
+from . import skill as _skill
+from . import vs as _vs
+
+# Part of every AnalysisCache key: derived from the pattern set versions,
+# so bumping any module's VERSION invalidates cached results
+PATTERN_VERSIONS = {
+    "checkpoints": _checkpoints.VERSION,
+    "agents": _agents.VERSION,
+    "behavior": _behavior.VERSION,
+    "vs": _vs.VERSION,
+    "skill": _skill.VERSION,
+}
+DETECTOR_VERSION = "3.3+" + ".".join(str(version) for version in PATTERN_VERSIONS.values())
+
+ANALYSIS_MEMO_SIZE = 16  # Distinct responses kept by analyze(memo=True)
+
+
+@dataclass(frozen=True)
+class Analysis:
+    """
+    Everything the detectors report about one assistant response.
+
+    Facts are computed lazily and cached on the instance. Returned lists
+    and dicts are shared by every caller holding the instance (every
+    analyze(memo=True) caller for the same text): treat them as read-only.
+    """
+    response: str
+
+    @cached_property
+    def checkpoints(self) -> list[dict[str, Any]]:
+        """Detected checkpoints with id, confidence, level, context and original."""
+        return _checkpoints.detect_checkpoints(self.response)
+
+    @cached_property
+    def checkpoint_ids(self) -> list[str]:
+        """IDs of checkpoints detected with HIGH or MEDIUM confidence."""
+        return _checkpoints.filter_by_confidence(self.checkpoints, "MEDIUM")
+
+    @cached_property
+    def checkpoint(self) -> str | None:
+        """
+        The checkpoint this response raises: the first detected ID, else the
+        first known checkpoint ID mentioned, else `CP_<WORD>` from a
+        "CHECKPOINT: word" mention.
+        """
+        if self.checkpoint_ids:
+            return self.checkpoint_ids[0]
+        return _checkpoints.find_known_checkpoint(self.response) or _checkpoints.find_generic_checkpoint(self.response)
+
+    @cached_property
+    def agents(self) -> list[dict[str, Any]]:
+        """Detected agents with id, confidence and context."""
+        return _agents.detect_agents(self.response)
+
+    @cached_property
+    def agent_ids(self) -> list[str]:
+        """IDs of agents detected with HIGH or MEDIUM confidence (actual invocations)."""
+        return _checkpoints.filter_by_confidence(self.agents, "MEDIUM")
+
+    @cached_property
+    def vs_options(self) -> list[dict[str, Any]]:
+        """Options written as `[A] Label (T=0.50)`."""
+        return _vs.extract_vs_options(self.response)
+
+    @cached_property
+    def options_count(self) -> int:
+        """Distinct labelled alternatives ([A] / (A) / Option A / 옵션 A)."""
+        return _vs.count_options(self.response)
+
+    @cached_property
+    def t_scores(self) -> list[tuple[str, float, bool]]:
+        """(option, T-Score, recommended) rows, as vs_analytics.extract_t_scores."""
+        return _vs.extract_t_scores(self.response)
+
+    @cached_property
+    def vs_summary(self) -> dict[str, Any]:
+        """VS quality in MetricsCollector.record_vs_quality terms."""
+        return _vs.summarize_response(self.response)
+
+    @cached_property
+    def halt(self) -> bool:
+        return _behavior.detect_halt(self.response)
+
+    @cached_property
+    def wait(self) -> bool:
+        return _behavior.detect_wait(self.response)
+
+    @cached_property
+    def auto_proceed(self) -> bool:
+        return _behavior.detect_auto_proceed(self.response)
+
+    @cached_property
+    def skill(self) -> dict[str, Any]:
+        """Skill loading check with loaded, confidence, score and evidence."""
+        return _skill.check_skill_loaded(self.response)
+
+    def mentions_checkpoint(self, checkpoint_id: str) -> bool:
+        """Whether the response raises `checkpoint_id`, by ID or by its topic keywords."""
+        return _checkpoints.mentions_checkpoint(self.response, checkpoint_id, self.checkpoint_ids)
+
+
+_memoized = lru_cache(maxsize=ANALYSIS_MEMO_SIZE)(Analysis)
+
+
+def analyze(response: str, memo: bool = False) -> Analysis:
+    """
+    Analysis of an assistant response.
+
+    With `memo`, the Analysis is shared with other memo callers for the same
+    text while it is among the last ANALYSIS_MEMO_SIZE responses analyzed so.
+    """
+    return _memoized(response) if memo else Analysis(response)
@@ -0,0 +1,82 @@
+"""
+Halt, Wait and Auto-Proceed Detection
+=====================================
+
+Whether an assistant response stops for the user:
+- halt:          the response hands control back (asks to select/confirm,
+                 lists labelled options, or the response ends with a
+                 question; a question mid-text followed by more text is
+                 not a halt)
+- wait:          the response explicitly waits for approval or a choice
+- auto-proceed:  the response announces it is continuing on its own
+                 (a violation at REQUIRED checkpoints)
+
+Each pattern set is compiled once into a single alternation.
+"""
+
+import re
+
+VERSION = 2  # Bump when any pattern below changes
+
+HALT_PATTERNS = [
+    r"어떤.*방향.*진행하시겠습니까",
+    r"선택해.*주세요",
+    r"어떻게.*진행할까요",
+    r"승인.*주세요",
+    r"확인.*주세요",
+    r"which.*would.*like",
+    r"which.*direction",
+    r"which.*approach",
+    r"would.*you.*like",
+    r"please.*select",
+    r"please.*confirm",
+    r"choose.*option",
+    r"approve.*proceed",
+    r"confirm.*continue",
+    r"\[A\].*\[B\]",
+    r"\(A\).*\(B\)",
+    r"\?\s*\Z",  # The response ends with a question (CHECKPOINT_SPEC.md)
+]
+
+WAIT_PATTERNS = [
+    r"어떤.*선택하시겠습니까",
+    r"진행해도.*될까요",
+    r"which.*prefer",
+    r"please.*choose",
+    r"waiting for.*response",
+    r"\?\s*$",  # A line ending with a question
+]
+
+# Should NOT be present at a checkpoint
+AUTO_PROCEED_PATTERNS = [
+    r"진행하겠습니다(?![?])",  # Not followed by question mark
+    r"시작하겠습니다(?![?])",
+    r"I will proceed",
+    r"I'll proceed",
+    r"proceeding with",
+    r"moving forward with",
+]
+
+
+def _alternation(patterns: list[str], flags: int = re.IGNORECASE | re.MULTILINE) -> re.Pattern:
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+_HALT_RE = _alternation(HALT_PATTERNS, re.IGNORECASE)  # Not MULTILINE: halts are judged on the whole response
+_WAIT_RE = _alternation(WAIT_PATTERNS)
+_AUTO_PROCEED_RE = _alternation(AUTO_PROCEED_PATTERNS)
+
+
+def detect_halt(response: str) -> bool:
+    """Check if response indicates a halt for user input."""
+    return _HALT_RE.search(response) is not None
+
+
+def detect_wait(response: str) -> bool:
+    """Detect explicit wait for user approval."""
+    return _WAIT_RE.search(response) is not None
+
+
+def detect_auto_proceed(response: str) -> bool:
+    """Detect if the response proceeds without waiting."""
+    return _AUTO_PROCEED_RE.search(response) is not None
@@ -0,0 +1,503 @@
+"""
+Checkpoint Detection
+====================
+
+Hybrid checkpoint detection for assistant responses:
+1. Formal `CP_XXX` identifiers (with or without 🔴/🟠/🟡 markers)
+2. Descriptive names ("🔴 CHECKPOINT: Effect Size Target Selection")
+   mapped to formal IDs via CHECKPOINT_ALIASES
+
+Also holds the checkpoint level table (RED / ORANGE / YELLOW) and the
+keyword patterns that identify a checkpoint from its topic alone.
+"""
+
+import bisect
+import re
+from typing import Any
+
+VERSION = 1  # Bump when any pattern or alias below changes
+
+# Checkpoint alias mapping: descriptive names → formal CP_ identifiers
+# This enables hybrid detection that works with both formal and natural language checkpoints
+CHECKPOINT_ALIASES = {
+    # Research Direction & Paradigm
+    "Research Direction": "CP_RESEARCH_DIRECTION",
+    "Paradigm Selection": "CP_PARADIGM_SELECTION",
+    "Paradigm Confirmation": "CP_PARADIGM_CONFIRMATION",
+    "Research Question": "CP_RESEARCH_DIRECTION",
+    "연구 방향": "CP_RESEARCH_DIRECTION",
+    "패러다임 선택": "CP_PARADIGM_SELECTION",
+    "패러다임 확인": "CP_PARADIGM_CONFIRMATION",
+
+    # Theory & Framework
+    "Theory Selection": "CP_THEORY_SELECTION",
+    "Theoretical Framework": "CP_THEORY_SELECTION",
+    "이론 선택": "CP_THEORY_SELECTION",
+    "이론적 프레임워크": "CP_THEORY_SELECTION",
+
+    # Methodology
+    "Methodology Approval": "CP_METHODOLOGY_APPROVAL",
+    "Method Approval": "CP_METHODOLOGY_APPROVAL",
+    "방법론 승인": "CP_METHODOLOGY_APPROVAL",
+
+    # Meta-Analysis Specific
+    "Effect Size Selection": "CP_EFFECT_SIZE_SELECTION",
+    "Effect Size Target Selection": "CP_EFFECT_SIZE_SELECTION",
+    "Effect Size": "CP_EFFECT_SIZE_SELECTION",
+    "효과크기 선택": "CP_EFFECT_SIZE_SELECTION",
+
+    "Heterogeneity Analysis": "CP_HETEROGENEITY_ANALYSIS",
+    "Heterogeneity Strategy": "CP_HETEROGENEITY_ANALYSIS",
+    "이질성 분석": "CP_HETEROGENEITY_ANALYSIS",
+
+    "Moderator Analysis": "CP_MODERATOR_ANALYSIS",
+    "Moderator Analysis Strategy": "CP_MODERATOR_ANALYSIS",
+    "Moderator Strategy": "CP_MODERATOR_ANALYSIS",
+    "조절변수 분석": "CP_MODERATOR_ANALYSIS",
+
+    "Multiple Testing": "CP_MULTIPLE_TESTING",
+    "Multiple Testing Strategy": "CP_MULTIPLE_TESTING",
+    "다중검정": "CP_MULTIPLE_TESTING",
+
+    "Single-Group Study Decision": "CP_SINGLE_GROUP_DECISION",
+    "Single Group Decision": "CP_SINGLE_GROUP_DECISION",
+    "단일그룹 연구 결정": "CP_SINGLE_GROUP_DECISION",
+
+    "F-Statistic Details": "CP_FSTAT_DETAILS",
+    "F-Statistic": "CP_FSTAT_DETAILS",
+    "F통계량": "CP_FSTAT_DETAILS",
+
+    # Analysis
+    "Analysis Plan": "CP_ANALYSIS_PLAN",
+    "분석 계획": "CP_ANALYSIS_PLAN",
+
+    # Quality & Integration
+    "Quality Review": "CP_QUALITY_REVIEW",
+    "품질 검토": "CP_QUALITY_REVIEW",
+
+    "Integration Strategy": "CP_INTEGRATION_STRATEGY",
+    "통합 전략": "CP_INTEGRATION_STRATEGY",
+
+    # Humanization
+    "Humanization Review": "CP_HUMANIZATION_REVIEW",
+    "Humanization Verify": "CP_HUMANIZATION_VERIFY",
+    "휴먼화 검토": "CP_HUMANIZATION_REVIEW",
+
+    # Sampling & Data Collection
+    "Sampling Strategy": "CP_SAMPLING_STRATEGY",
+    "표집 전략": "CP_SAMPLING_STRATEGY",
+
+    "Protocol Design": "CP_PROTOCOL_DESIGN",
+    "프로토콜 설계": "CP_PROTOCOL_DESIGN",
+
+    # Qualitative
+    "Coding Approach": "CP_CODING_APPROACH",
+    "코딩 접근": "CP_CODING_APPROACH",
+
+    "Theme Validation": "CP_THEME_VALIDATION",
+    "주제 검증": "CP_THEME_VALIDATION",
+
+    "Trustworthiness": "CP_TRUSTWORTHINESS",
+    "신뢰성": "CP_TRUSTWORTHINESS",
+
+    "Member Check": "CP_MEMBER_CHECK",
+    "멤버 체크": "CP_MEMBER_CHECK",
+
+    # Writing & Review
+    "Writing Style": "CP_WRITING_STYLE",
+    "작성 스타일": "CP_WRITING_STYLE",
+
+    "Final Review": "CP_FINAL_REVIEW",
+    "최종 검토": "CP_FINAL_REVIEW",
+
+    # Additional mappings for AI-generated variants
+    "Analysis Plan Approval": "CP_METHODOLOGY_APPROVAL",
+    "Moderator Selection": "CP_MODERATOR_ANALYSIS",
+    "Analysis Model": "CP_HETEROGENEITY_ANALYSIS",
+    "Data Extraction": "CP_DATA_EXTRACTION",
+
+    # Search & Screening
+    "Search Strategy": "CP_SEARCH_STRATEGY",
+    "검색 전략": "CP_SEARCH_STRATEGY",
+
+    "Screening Criteria": "CP_SCREENING_CRITERIA",
+    "선별 기준": "CP_SCREENING_CRITERIA",
+
+    "Extraction Template": "CP_EXTRACTION_TEMPLATE",
+    "추출 템플릿": "CP_EXTRACTION_TEMPLATE",
+}
+
+# Checkpoint IDs by level, highest first
+CHECKPOINT_LEVELS = {
+    "RED": [
+        "CP_RESEARCH_DIRECTION",
+        "CP_METHODOLOGY_APPROVAL",
+        "CP_ETHICS_APPROVAL",
+        "CP_FINAL_SUBMISSION",
+        "CP_DATA_COLLECTION_START",
+    ],
+    "ORANGE": [
+        "CP_THEORY_SELECTION",
+        "CP_SCOPE_DECISION",
+        "CP_HUMANIZATION_REVIEW",
+        "CP_ANALYSIS_APPROACH",
+        "CP_INTEGRATION_STRATEGY",
+    ],
+    "YELLOW": [
+        "CP_PARADIGM_RECONSIDERATION",
+        "CP_MINOR_ADJUSTMENT",
+    ],
+}
+
+# Topic keywords that show a checkpoint was raised even without its ID
+CHECKPOINT_KEYWORDS = {
+    "CP_RESEARCH_DIRECTION": [
+        r"연구.*방향",
+        r"research.*direction",
+        r"어떤.*방향.*진행",
+        r"다음.*옵션",
+        r"which.*direction",
+    ],
+    "CP_PARADIGM_SELECTION": [
+        r"패러다임.*선택",
+        r"paradigm.*select",
+        r"양적.*질적.*혼합",
+        r"quantitative.*qualitative",
+    ],
+    "CP_THEORY_SELECTION": [
+        r"이론.*프레임워크",
+        r"theoretical.*framework",
+        r"theory.*select",
+    ],
+    "CP_METHODOLOGY_APPROVAL": [
+        r"방법론.*승인",
+        r"methodology.*approv",
+        r"설계.*확인",
+        r"design.*confirm",
+    ],
+    "CP_HUMANIZATION_REVIEW": [
+        r"휴먼화.*검토",
+        r"humaniz.*review",
+        r"AI.*패턴.*확인",
+    ],
+}
+
+# ============================================
+# Checkpoint detection patterns (compiled once)
+# ============================================
+# Each entry: (phase, pattern, level, anchors). Entries are listed in
+# priority order - when two patterns report the same ID the earlier one
+# wins. `anchors` are the characters a match can start with; a single
+# scan for all anchors drives every pattern (see scan_checkpoints).
+_CP_ID = r"CP_[A-Z0-9]+(?:_[A-Z0-9]+)*"
+CHECKPOINT_PATTERN_SPECS = [
+    # PHASE 1 (HIGH): Emoji + full checkpoint format, e.g. 🔴 CHECKPOINT: CP_XXX
+    ("formal_emoji", r"🔴\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(" + _CP_ID + r")\*?\*?", "RED", "🔴"),
+    ("formal_emoji", r"🟠\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(" + _CP_ID + r")\*?\*?", "ORANGE", "🟠"),
+    ("formal_emoji", r"🟡\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(" + _CP_ID + r")\*?\*?", "YELLOW", "🟡"),
+    # Format: 🔴 CP_XXX (with optional markdown headers and annotations)
+    ("formal_emoji", r"(?:#+\s*)?🔴\s*(" + _CP_ID + r")\s*(?:\([^)]*\))?", "RED", "#🔴"),
+    ("formal_emoji", r"(?:#+\s*)?🟠\s*(" + _CP_ID + r")\s*(?:\([^)]*\))?", "ORANGE", "#🟠"),
+    ("formal_emoji", r"(?:#+\s*)?🟡\s*(" + _CP_ID + r")\s*(?:\([^)]*\))?", "YELLOW", "#🟡"),
+    # PHASE 1 (MEDIUM): Plain text checkpoint format with CP_
+    ("formal_text", r"(?:\*\*)?CHECKPOINT(?:\*\*)?[:\s]+\*?\*?(" + _CP_ID + r")\*?\*?", None, "*c"),
+    ("formal_text", r"(?:checkpoint|체크포인트)\s*[:]\s*(" + _CP_ID + r")", None, "c체"),
+    ("formal_text", r"(?:\*\*)?CHECKPOINT(?:\*\*)?[:\s]+\*?\*?(META_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?", None, "*c"),
+    # Format: ## CP_XXX or ### CP_XXX (without emoji); `^` without
+    # MULTILINE only matches at the very start of the response
+    ("formal_text", r"^#+\s*(" + _CP_ID + r")\s*(?:\([^)]*\))?", None, "^"),
+    # Format: **CP_XXX** in bold
+    ("formal_text", r"\*\*(" + _CP_ID + r")\*\*", None, "*"),
+    # PHASE 2: Emoji + descriptive name, e.g. 🔴 CHECKPOINT: Effect Size Target Selection
+    ("descriptive", r"🔴\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)", "RED", "🔴"),
+    ("descriptive", r"🟠\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)", "ORANGE", "🟠"),
+    ("descriptive", r"🟡\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)", "YELLOW", "🟡"),
+    # PHASE 3: LOW confidence - partial mentions
+    ("partial", r"(?:checkpoint|체크포인트)\s+(?:for\s+)?([A-Z][A-Z_]+)", None, "c체"),
+]
+OPTIONS_LOOKAHEAD = 500  # Characters after a checkpoint marker searched for options
+
+CONFIDENCE_ORDER = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+
+
+def _build_alias_index(aliases: dict[str, str]) -> tuple[dict[str, str], dict[str, list[int]], list[tuple[frozenset, str]]]:
+    """
+    Precompute checkpoint alias lookups.
+
+    Returns (exact, tokens, words): `exact` maps lowercase alias -> formal ID
+    (first declaration wins), `words` lists (alias word set, formal ID) in
+    declaration order for multi-word aliases, and `tokens` maps each word to
+    the positions in `words` of aliases containing it.
+    """
+    exact: dict[str, str] = {}
+    tokens: dict[str, list[int]] = {}
+    words: list[tuple[frozenset, str]] = []
+
+    for alias, formal_id in aliases.items():
+        exact.setdefault(alias.lower(), formal_id)
+        alias_words = frozenset(alias.lower().split())
+        if len(alias_words) >= 2:
+            for word in alias_words:
+                tokens.setdefault(word, []).append(len(words))
+            words.append((alias_words, formal_id))
+
+    return exact, tokens, words
+
+
+def _build_anchor_dispatch(specs: list[tuple]) -> dict[str, list[int]]:
+    """Map each anchor key to the indices of patterns that can start there."""
+    dispatch: dict[str, list[int]] = {}
+    for index, spec in enumerate(specs):
+        for anchor in spec[3]:
+            dispatch.setdefault(anchor, []).append(index)
+    return dispatch
+
+
+# Alias lookups built once: exact lowercase match (first alias wins, as in
+# declaration order) and a token index over multi-word aliases.
+_ALIAS_EXACT, _ALIAS_TOKENS, _ALIAS_WORDS = _build_alias_index(CHECKPOINT_ALIASES)
+
+_CHECKPOINT_PATTERNS = [re.compile(spec[1], re.IGNORECASE) for spec in CHECKPOINT_PATTERN_SPECS]
+# One alternation over every anchor, kept as narrow as the patterns allow
+# so markdown noise does not become candidates: `checkpoint`/`체크포인트`
+# as whole words, `*` only when it opens `**`, `#` only when a heading
+# run leads into a checkpoint emoji.
+_CHECKPOINT_ANCHOR_RE = re.compile(
+    r"🔴|🟠|🟡|#+\s*(?=[🔴🟠🟡])|\*(?=\*)|checkpoint|체크포인트",
+    re.IGNORECASE,
+)
+_CHECKPOINT_DISPATCH = _build_anchor_dispatch(CHECKPOINT_PATTERN_SPECS)
+_CHECKPOINT_OPTIONS_RE = re.compile(r"\[(?:Y|N|A|B|C|[1-3])\]|옵션\s*[A-C]|Option\s*[A-C]", re.IGNORECASE)
+_VALID_CP_RE = re.compile(r"^" + _CP_ID + r"$")
+_PSEUDO_ID_CHARS_RE = re.compile(r"[^A-Z0-9]")
+_REPEATED_UNDERSCORE_RE = re.compile(r"_+")
+del _CP_ID
+
+# Known IDs in level priority order, and every ID → its level
+_KNOWN_CHECKPOINT_RES = [re.compile(cp_id, re.IGNORECASE) for ids in CHECKPOINT_LEVELS.values() for cp_id in ids]
+_LEVEL_BY_ID = {cp_id: level for level, ids in CHECKPOINT_LEVELS.items() for cp_id in ids}
+# "CHECKPOINT: name" without a CP_ identifier (a colon must follow on the line)
+_GENERIC_CHECKPOINT_RE = re.compile(r"CHECKPOINT(?=[^\n]*:)[:\s]*(\w+)", re.IGNORECASE)
+_KEYWORD_RES = {
+    cp_id: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    for cp_id, patterns in CHECKPOINT_KEYWORDS.items()
+}
+
+
+def normalize_checkpoint_name(name: str) -> str | None:
+    """
+    Normalize a checkpoint name to formal CP_ format using alias mapping.
+
+    Args:
+        name: Raw checkpoint name (could be formal CP_XXX or descriptive)
+
+    Returns:
+        Normalized CP_ identifier or None if not recognized
+    """
+    name = name.strip()
+
+    # Already in formal format
+    if name.upper().startswith("CP_"):
+        return name.upper()
+
+    # Check alias mapping (case-insensitive)
+    name_lower = name.lower()
+    formal_id = _ALIAS_EXACT.get(name_lower)
+    if formal_id:
+        return formal_id
+
+    # Try partial matching: every word of a multi-word alias appears in the
+    # name. Only aliases sharing a word with the name are candidates; the
+    # earliest-declared alias wins.
+    name_words = set(name_lower.split())
+    candidates = set()
+    for word in name_words:
+        candidates.update(_ALIAS_TOKENS.get(word, ()))
+    for index in sorted(candidates):
+        alias_words, formal_id = _ALIAS_WORDS[index]
+        if alias_words <= name_words:
+            return formal_id
+
+    return None
+
+
+def scan_checkpoints(response: str) -> list[list[re.Match]]:
+    """
+    Find matches for every checkpoint pattern in one pass over the response.
+
+    A single anchor scan yields candidate positions; only the patterns that
+    can start at a candidate are tried there. Per pattern, matches are
+    non-overlapping and in position order, exactly as `re.finditer` would
+    report them.
+    """
+    patterns = _CHECKPOINT_PATTERNS
+    dispatch = _CHECKPOINT_DISPATCH
+    found: list[list[re.Match]] = [[] for _ in patterns]
+    resume_at = [0] * len(patterns)
+
+    # Patterns anchored with `^` can only match at position 0
+    for index in dispatch.get("^", ()):
+        match = patterns[index].match(response)
+        if match:
+            found[index].append(match)
+            resume_at[index] = match.end()
+
+    for anchor in _CHECKPOINT_ANCHOR_RE.finditer(response):
+        pos = anchor.start()
+        for index in dispatch.get(anchor.group()[0].lower(), ()):
+            if pos < resume_at[index]:
+                continue
+            match = patterns[index].match(response, pos)
+            if match:
+                found[index].append(match)
+                resume_at[index] = match.end()
+
+    return found
+
+
+def _has_options_after(end: int, option_starts: list[int], option_ends: list[int]) -> bool:
+    """Check whether an option marker lies within OPTIONS_LOOKAHEAD chars after `end`."""
+    i = bisect.bisect_left(option_starts, end)
+    return i < len(option_starts) and option_ends[i] <= end + OPTIONS_LOOKAHEAD
+
+
+def detect_checkpoints(response: str) -> list[dict[str, Any]]:
+    """
+    Detect checkpoint markers in response with confidence scoring.
+
+    HYBRID DETECTION (v3.2.0):
+    1. Primary: Look for formal CP_XXX identifiers
+    2. Fallback: Detect descriptive names and map via CHECKPOINT_ALIASES
+
+    Returns list of dicts with 'id', 'confidence', 'level', 'context', and 'original' keys.
+
+    Checkpoint naming convention (from research-coordinator):
+    - CP_RESEARCH_DIRECTION, CP_PARADIGM_SELECTION, CP_THEORY_SELECTION
+    - CP_METHODOLOGY_APPROVAL, CP_ANALYSIS_PLAN, CP_INTEGRATION_STRATEGY
+    - CP_QUALITY_REVIEW, CP_EFFECT_SIZE_SELECTION, CP_HETEROGENEITY_ANALYSIS
+    - CP_HUMANIZATION_REVIEW, CP_HUMANIZATION_VERIFY, etc.
+
+    Confidence levels:
+    - HIGH: Emoji marker + formal CP_XXX with options OR emoji + descriptive with options
+    - MEDIUM: Text "CHECKPOINT" + CP_XXX format OR emoji + descriptive without options
+    - LOW: Partial match or text mention without action
+
+    Patterns live in CHECKPOINT_PATTERN_SPECS and are compiled once; the
+    response is scanned a single time.
+    """
+    detected = []
+    seen_ids = set()
+    option_spans = None  # Computed on first use
+
+    for (phase, _, level, _), matches in zip(CHECKPOINT_PATTERN_SPECS, scan_checkpoints(response)):
+        for match in matches:
+            if phase == "descriptive":
+                raw = match.group(1).strip()
+            else:
+                raw = match.group(1).upper()
+
+            if phase == "descriptive":
+                # Skip if it's already a formal CP_ identifier (handled in Phase 1)
+                if raw.upper().startswith("CP_"):
+                    continue
+                cp_id = normalize_checkpoint_name(raw)
+                if not cp_id:
+                    # Unknown descriptive name - still record it with LOW confidence
+                    # Generate a pseudo-ID from the name
+                    pseudo_id = "CP_" + _PSEUDO_ID_CHARS_RE.sub("_", raw.upper()).strip("_")
+                    pseudo_id = _REPEATED_UNDERSCORE_RE.sub("_", pseudo_id)
+                    if pseudo_id not in seen_ids and len(pseudo_id) > 4:
+                        detected.append({
+                            "id": pseudo_id,
+                            "confidence": "LOW",
+                            "level": level,
+                            "context": f"unmapped descriptive: {raw[:30]}",
+                            "original": raw,
+                        })
+                        seen_ids.add(pseudo_id)
+                    continue
+            elif phase == "partial":
+                cp_id = f"CP_{raw}" if not raw.startswith("CP_") else raw
+            else:
+                cp_id = raw
+
+            if cp_id in seen_ids:
+                continue
+            if phase != "descriptive" and not _VALID_CP_RE.match(cp_id):
+                continue
+
+            if phase == "formal_emoji" or phase == "descriptive":
+                if option_spans is None:
+                    option_matches = list(_CHECKPOINT_OPTIONS_RE.finditer(response))
+                    option_spans = ([m.start() for m in option_matches], [m.end() for m in option_matches])
+                has_options = _has_options_after(match.end(), *option_spans)
+                options_suffix = " + options" if has_options else ""
+                detected.append({
+                    "id": cp_id,
+                    "confidence": "HIGH" if has_options else "MEDIUM",
+                    "level": level,
+                    "context": ("formal CP_ with emoji" if phase == "formal_emoji"
+                                else f"descriptive → {cp_id}") + options_suffix,
+                    "original": raw,
+                })
+            elif phase == "formal_text":
+                detected.append({
+                    "id": cp_id,
+                    "confidence": "MEDIUM",
+                    "level": "UNKNOWN",
+                    "context": "formal CP_ text mention",
+                    "original": cp_id,
+                })
+            else:
+                detected.append({
+                    "id": cp_id,
+                    "confidence": "LOW",
+                    "level": "UNKNOWN",
+                    "context": "inferred from text",
+                    "original": raw,
+                })
+            seen_ids.add(cp_id)
+
+    return detected
+
+
+def filter_by_confidence(detected: list[dict[str, Any]], min_confidence: str = "MEDIUM") -> list[str]:
+    """IDs of detected checkpoints (or agents) at or above `min_confidence`."""
+    min_level = CONFIDENCE_ORDER.get(min_confidence, 2)
+    return [item["id"] for item in detected if CONFIDENCE_ORDER.get(item["confidence"], 0) >= min_level]
+
+
+def find_known_checkpoint(text: str) -> str | None:
+    """The first CHECKPOINT_LEVELS ID mentioned anywhere in the text, highest level first."""
+    for pattern in _KNOWN_CHECKPOINT_RES:
+        if pattern.search(text):
+            return pattern.pattern
+    return None
+
+
+def find_generic_checkpoint(text: str) -> str | None:
+    """`CP_<WORD>` for a "CHECKPOINT: word" mention without a CP_ identifier."""
+    match = _GENERIC_CHECKPOINT_RE.search(text)
+    return f"CP_{match.group(1).upper()}" if match else None
+
+
+def checkpoint_level(checkpoint_id: str) -> str:
+    """Level (RED, ORANGE, YELLOW) of a checkpoint ID, or 'UNKNOWN'."""
+    level = _LEVEL_BY_ID.get(checkpoint_id.upper())
+    if level:
+        return level
+    known = find_known_checkpoint(checkpoint_id)
+    return _LEVEL_BY_ID[known] if known else "UNKNOWN"
+
+
+def mentions_checkpoint(response: str, checkpoint_id: str, detected_ids: list[str] | None = None) -> bool:
+    """
+    Whether a response raises `checkpoint_id`: detected by ID (pass
+    `detected_ids` to reuse an earlier detection) or by its topic keywords.
+    """
+    if detected_ids is None:
+        detected_ids = filter_by_confidence(detect_checkpoints(response))
+    if checkpoint_id in detected_ids:
+        return True
+    pattern = _KEYWORD_RES.get(checkpoint_id)
+    return bool(pattern and pattern.search(response))
@@ -0,0 +1,90 @@
+"""
+Skill Loading Detection
+=======================
+
+Whether the Diverga research-coordinator skill was loaded and active,
+judged from the first assistant response.
+"""
+
+import re
+from typing import Any
+
+VERSION = 1  # Bump when any marker set or weight below changes
+
+# (category, weight, patterns): the first matching pattern in a category
+# adds its weight to the confidence score
+SKILL_MARKERS = [
+    ("Skill", 30, [
+        r"Research\s*Coordinator\s*v[\d.]+",  # Version mention
+        r"diverga[:\-]research[:\-]coordinator",  # Skill name
+        r"Human[:\-]Centered\s*Edition",  # v6.0 marker
+        r"(27|33|40)\s*specialized\s*agents",  # Agent system mention (v5.0=27, v6.0.1=33, v6.3+=40)
+        r"패러다임\s*(탐지|감지)",  # Korean paradigm detection
+        r"[A-H][1-7][-\s]?[A-Za-z-]+",  # Agent name pattern like A1-ResearchQuestionRefiner
+    ]),
+    ("VS", 25, [
+        r"\(T\s*=\s*\d+\.?\d*\)",  # T-Score notation
+        r"T[:\-]Score",  # T-Score label
+        r"Typicality\s*Score",  # Full name
+        r"\[A\].*\[B\].*\[C\]",  # Option format
+        r"modal\s*(recommendation|option)",  # Modal awareness
+    ]),
+    ("Checkpoint", 25, [
+        r"🔴\s*CHECKPOINT",  # Red checkpoint emoji
+        r"🟠\s*CHECKPOINT",  # Orange checkpoint emoji
+        r"체크포인트.*CP_",  # Korean checkpoint
+        r"Human\s*Checkpoint\s*System",  # System mention
+        r"MANDATORY\s*HALT",  # Halt terminology
+    ]),
+    ("Agent", 20, [
+        r"Task\(subagent_type\s*=\s*[\"']diverga:",  # Task tool call
+        r"diverga:[a-h][1-7]",  # Agent ID pattern
+        r"([A-H][1-7])\s*에이전트\s*실행",  # Korean agent execution
+    ]),
+]
+
+_SKILL_MARKER_RES = [
+    (category, weight, [re.compile(pattern, re.IGNORECASE) for pattern in patterns])
+    for category, weight, patterns in SKILL_MARKERS
+]
+
+
+def check_skill_loaded(response: str) -> dict[str, Any]:
+    """
+    Verify if Diverga skill was actually loaded and active.
+
+    Looks for definitive markers that indicate the skill is loaded:
+    1. Skill activation confirmation message
+    2. VS methodology markers (T-Score, options with typicality)
+    3. Checkpoint system markers with proper formatting
+    4. Agent invocation patterns via Task tool
+
+    Returns dict with 'loaded', 'confidence', 'score', 'evidence' keys.
+    """
+    evidence = []
+    confidence_score = 0
+
+    for category, weight, patterns in _SKILL_MARKER_RES:
+        for pattern in patterns:
+            if pattern.search(response):
+                evidence.append(f"{category} marker: {pattern.pattern[:30]}...")
+                confidence_score += weight
+                break
+
+    # Determine overall confidence
+    if confidence_score >= 50:
+        loaded = True
+        confidence = "HIGH" if confidence_score >= 75 else "MEDIUM"
+    elif confidence_score >= 25:
+        loaded = True
+        confidence = "LOW"
+    else:
+        loaded = False
+        confidence = "NONE"
+
+    return {
+        "loaded": loaded,
+        "confidence": confidence,
+        "score": confidence_score,
+        "evidence": evidence,
+    }
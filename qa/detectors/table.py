@@ -0,0 +1,246 @@
+"""
+Pattern Tables
+==============
+
+A PatternTable compiles named groups of regex alternatives once: one
+regex per group, and one combined alternation over every group's
+alternatives, so a single left-to-right scan answers "which groups match
+this text, and where" for all of them.
+
+The combined regex only proposes candidate positions; each candidate is
+re-checked with every group still of interest (its own compiled
+alternation, anchored at that position). Because every group's leftmost
+match is a candidate, `scan` reports exactly the matches `re.search` /
+`re.finditer` would find per group, even when groups overlap or share a
+starting position. The combined regex may therefore match a superset of
+the groups, and does wherever that lets the engine skip ahead: it uses
+every group's flags at once (MULTILINE and DOTALL only widen a match)
+instead of per-alternative flag groups, a leading `\b` is dropped and a
+leading optional group `(?:X)?Y` becomes `XY|Y`, so every alternative
+starts with a literal or a character class.
+
+Case-insensitive tables are matched case-sensitively against the
+lowercased text, with the pattern literals lowercased: `re.IGNORECASE`
+disables the engine's literal-prefix and branch fast paths, which makes a
+large ignore-case alternation slower than searching its parts one by
+one. Texts whose lowercase form changes length (positions would no longer
+line up) are matched with IGNORECASE instead.
+"""
+
+import functools
+import operator
+import re
+from typing import Iterable, Iterator
+
+
+def alternation(patterns: Iterable[str]) -> str:
+    """One regex matching any of `patterns`, tried in order."""
+    return "|".join(f"(?:{pattern})" for pattern in patterns)
+
+
+_NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
+
+
+def _structure(pattern: str) -> Iterator[tuple[int, str, int]]:
+    """(index, character, depth) of each `(`, `)` and `|` outside escapes and character classes."""
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 1
+        elif char == "[":  # Skip the character class; a leading `]` (or `^]`) is literal
+            i += 2 if pattern.startswith("^", i + 1) else 1
+            i += 1 if pattern.startswith("]", i) else 0
+            while pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+        elif char == "(":
+            yield i, char, depth
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            yield i, char, depth
+        elif char == "|":
+            yield i, char, depth
+        i += 1
+
+
+def _branches(pattern: str) -> list[str]:
+    """The top-level alternatives of `pattern`."""
+    cuts = [i for i, char, depth in _structure(pattern) if char == "|" and depth == 0]
+    return [pattern[start + 1:end] for start, end in zip([-1, *cuts], [*cuts, len(pattern)])]
+
+
+def _group_end(pattern: str, start: int) -> int:
+    """Index of the `)` closing the group opened at `pattern[start]`."""
+    for i, char, depth in _structure(pattern[start:]):
+        if char == ")" and depth == 0:
+            return start + i
+    raise ValueError(f"Unbalanced group in pattern: {pattern!r}")
+
+
+def _candidate_forms(pattern: str) -> list[str]:
+    """
+    Alternatives without a top-level `|` or named groups that, together,
+    match (at least) wherever `pattern` matches.
+    """
+    forms = []
+    for branch in _branches(pattern):
+        while branch.startswith("\\b"):
+            branch = branch[2:]
+        if branch.startswith("(?:"):
+            end = _group_end(branch, 0)
+            if branch.startswith("?", end + 1):
+                rest = branch[end + 2:]
+                rest = rest[1:] if rest.startswith("?") else rest  # Lazy `??`
+                with_group = "|".join(inner + rest for inner in _branches(branch[3:end]))
+                forms += _candidate_forms(with_group) + _candidate_forms(rest)
+                continue
+        forms.append(_NAMED_GROUP_RE.sub("(?:", branch))
+    return forms
+
+
+def lowercase_pattern(pattern: str) -> str:
+    """
+    `pattern` with its literal characters lowercased, for matching against
+    lowercased text. Escapes (`\\S`, `\\B`, `\\[`...) and group names are
+    kept as written.
+    """
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+        elif pattern.startswith(("(?P<", "(?P="), i):
+            end = pattern.index(">" if pattern[i + 3] == "<" else ")", i)
+            out.append(pattern[i:end + 1])
+            i = end + 1
+        else:
+            out.append(char.lower())
+            i += 1
+    return "".join(out)
+
+
+class PatternTable:
+    """
+    Named, priority-ordered pattern groups compiled once.
+
+    Args:
+        groups: name → list of regex alternatives (or a single regex), in
+            priority order
+        ignore_case: Match every group case-insensitively
+        group_flags: Extra flags for individual groups (re.MULTILINE, re.DOTALL)
+
+    With `ignore_case`, matched text (`match.group()`) is usually the
+    lowercased text: compare it case-insensitively. Match positions always
+    index the original text.
+    """
+
+    def __init__(self, groups: dict[str, list[str] | str], ignore_case: bool = True,
+                 group_flags: dict[str, int] | None = None):
+        group_flags = group_flags or {}
+        self.names = list(groups)
+        self.ignore_case = ignore_case
+        alternatives = [[patterns] if isinstance(patterns, str) else list(patterns) for patterns in groups.values()]
+        flags = [group_flags.get(name, 0) for name in self.names]
+
+        if ignore_case:
+            folded = [[lowercase_pattern(pattern) for pattern in patterns] for patterns in alternatives]
+            self._folded = self._compile(folded, flags)
+            flags = [flag | re.IGNORECASE for flag in flags]
+        self._exact = self._compile(alternatives, flags)
+        self.patterns = dict(zip(self.names, self._exact[2]))
+
+    @staticmethod
+    def _compile(alternatives: list[list[str]], flags: list[int]) -> tuple[re.Pattern, dict[str, int], list[re.Pattern]]:
+        """
+        (combined candidate regex, candidate marker → group index, group regexes)
+
+        Each candidate alternative ends in an empty marker group naming the
+        table group it came from, so a candidate tells which groups cannot
+        match there: every group before it in priority order.
+        """
+        forms = []
+        owner = {}
+        for index, patterns in enumerate(alternatives):
+            for pattern in patterns:
+                for form in _candidate_forms(pattern):
+                    marker = f"_c{len(forms)}"
+                    owner[marker] = index
+                    forms.append(f"{form}(?P<{marker}>)")
+        combined = re.compile("|".join(forms), functools.reduce(operator.or_, flags, 0))
+        return combined, owner, [re.compile(alternation(patterns), flag) for patterns, flag in zip(alternatives, flags)]
+
+    def _subject(self, text: str) -> tuple[str, re.Pattern, dict[str, int], list[re.Pattern]]:
+        """The text to match and the compiled table for it."""
+        if self.ignore_case:
+            lowered = text.lower()
+            if len(lowered) == len(text):
+                return (lowered, *self._folded)
+        return (text, *self._exact)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def scan(self, text: str, collect: Iterable[str] = ()) -> dict[str, list[re.Match]]:
+        """
+        Matches per group in one pass over `text`, in priority order.
+
+        Every group that matches gets its first (leftmost) match, as
+        `re.search` would find it; groups in `collect` get every match
+        `re.finditer` would find.
+        """
+        subject, combined, owner, patterns = self._subject(text)
+        collect = set(collect)
+        pending = [index for index, name in enumerate(self.names) if name not in collect]
+        resume = {index: 0 for index, name in enumerate(self.names) if name in collect}  # Group → end of its last match
+        found: dict[int, list[re.Match]] = {}
+        pos = 0
+
+        while pending or resume:
+            candidate = combined.search(subject, pos)
+            if candidate is None:
+                break
+            start = candidate.start()
+            lowest = owner[candidate.lastgroup]
+            for index in pending:
+                if index >= lowest:
+                    match = patterns[index].match(subject, start)
+                    if match:
+                        found[index] = [match]
+            for index, end in resume.items():
+                if index >= lowest and start >= end:
+                    match = patterns[index].match(subject, start)
+                    if match:
+                        found.setdefault(index, []).append(match)
+                        resume[index] = max(match.end(), start + 1)
+            if found:
+                pending = [index for index in pending if index not in found]
+            pos = start + 1
+
+        return {self.names[index]: found[index] for index in sorted(found)}
+
+    def matching(self, text: str) -> list[str]:
+        """Every group matching anywhere in `text`, in priority order."""
+        return list(self.scan(text))
+
+    def first(self, text: str) -> str | None:
+        """The highest-priority group matching anywhere in `text`."""
+        subject, combined, owner, patterns = self._subject(text)
+        best = len(self.names)
+        pos = 0
+
+        while best:
+            candidate = combined.search(subject, pos)
+            if candidate is None:
+                break
+            start = candidate.start()
+            for index in range(owner[candidate.lastgroup], best):
+                if patterns[index].match(subject, start):
+                    best = index
+                    break
+            pos = start + 1
+
+        return self.names[best] if best < len(self.names) else None
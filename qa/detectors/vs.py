@@ -0,0 +1,44 @@
+"""
+VS Option Detection
+===================
+
+VS (Verbalized Sampling) alternatives in assistant responses: labelled
+options ([A] / (A) / Option A / 옵션 A) and their T-Scores. T-Score
+extraction and VS quality scoring are shared with qa.protocol.vs_analytics.
+"""
+
+import re
+from typing import Any
+
+try:
+    from ..protocol.vs_analytics import extract_t_scores, summarize_response
+except (ImportError, ValueError):  # qa/detectors imported as a top-level package
+    from protocol.vs_analytics import extract_t_scores, summarize_response
+
+VERSION = 1  # Bump when any pattern below (or vs_analytics.T_SCORE_RE) changes
+
+# Option label styles; the captured group is the option letter
+OPTION_LABEL_PATTERNS = [
+    r"\[([A-D])\][:\s]",
+    r"\(([A-C])\)[:\s]",
+    r"Option\s+([A-D])",
+    r"옵션\s+([A-D])",
+]
+
+# Pattern: [A] Option Label (T=0.50)
+_LABELLED_OPTION_RE = re.compile(r"\[([A-Z])\]\s*([^(]+?)\s*\(T\s*=\s*(\d+\.?\d*)\)")
+_OPTION_LABEL_RES = [re.compile(pattern, re.IGNORECASE) for pattern in OPTION_LABEL_PATTERNS]
+
+
+def extract_vs_options(response: str) -> list[dict[str, Any]]:
+    """Extract VS methodology options written as `[A] Label (T=0.50)`."""
+    return [
+        {"option": option, "label": label.strip(), "t_score": float(t_score)}
+        for option, label, t_score in _LABELLED_OPTION_RE.findall(response)
+    ]
+
+
+def count_options(response: str) -> int:
+    """Number of distinct option letters, in the most-used label style."""
+    return max(len({letter.upper() for letter in pattern.findall(response)}) for pattern in _OPTION_LABEL_RES)
+
@@ -7,8 +7,11 @@ comprehensive Diverga plugin testing.
 
 Classes:
 - Scenario: Test scenario definition
+- ScenarioRegistry: Indexed scenario lookup and filtering
+- select_scenarios / shard_scenarios: Selection expressions and CI sharding
 - Checkpoint: Expected checkpoint behavior
 - Metrics: Evaluation metrics framework
+- VSTable: Columnar VS option / T-Score analytics across session archives
 """
 
 from .scenarios import (
@@ -16,10 +19,19 @@ from .scenarios import (
     CheckpointExpectation,
     AgentExpectation,
     ConversationTurn,
+    ScenarioRegistry,
+    ScenarioIndexEntry,
+    get_registry,
     load_scenario,
     list_scenarios,
 )
 
+from .selection import (
+    parse_selection,
+    select_scenarios,
+    shard_scenarios,
+)
+
 from .metrics import (
     MetricsCollector,
     CheckpointMetrics,
@@ -29,17 +41,34 @@ from .metrics import (
     GradeLevel,
 )
 
+from .vs_analytics import (
+    VSTable,
+    VSStats,
+    extract_t_scores,
+    summarize_response,
+)
+
 __all__ = [
     "Scenario",
     "CheckpointExpectation",
     "AgentExpectation",
     "ConversationTurn",
+    "ScenarioRegistry",
+    "ScenarioIndexEntry",
+    "get_registry",
     "load_scenario",
     "list_scenarios",
+    "parse_selection",
+    "select_scenarios",
+    "shard_scenarios",
     "MetricsCollector",
     "CheckpointMetrics",
     "AgentMetrics",
     "VSQualityMetrics",
     "TestResult",
+    "VSTable",
+    "VSStats",
+    "extract_t_scores",
+    "summarize_response",
     "GradeLevel",
 ]
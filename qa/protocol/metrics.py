@@ -10,10 +10,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 import json
 import yaml
 
+from .vs_analytics import CREATIVE_T_SCORE, EXPERIMENTAL_T_SCORE, summarize_response
+
 
 class GradeLevel(Enum):
     """Grading rubric for test results."""
@@ -414,8 +416,19 @@ class MetricsCollector:
         modal_identified: bool = False,
         modal_t_score: float | None = None,
         modal_recommended: bool = False,
+        t_scores: Sequence[float] | None = None,
     ) -> VSQualityMetrics:
-        """Record VS quality metrics."""
+        """
+        Record VS quality metrics.
+
+        With `t_scores` (e.g. a row of vs_analytics statistics or
+        `summarize_response`), creative and experimental options are counted
+        per option instead of being inferred from `t_score_min`.
+        """
+        if t_scores is not None:
+            return self._record_vs_scores(
+                options_presented, list(t_scores), modal_identified, modal_t_score, modal_recommended
+            )
         self._vs_metrics = VSQualityMetrics(
             options_presented=options_presented,
             t_score_min=t_score_min,
@@ -429,6 +442,40 @@ class MetricsCollector:
         )
         return self._vs_metrics
 
+    def _record_vs_scores(
+        self,
+        options_presented: int,
+        t_scores: list[float],
+        modal_identified: bool,
+        modal_t_score: float | None,
+        modal_recommended: bool,
+    ) -> VSQualityMetrics:
+        t_score_min = min(t_scores, default=1.0)
+        t_score_max = max(t_scores, default=0.0)
+        self._vs_metrics = VSQualityMetrics(
+            options_presented=options_presented,
+            t_score_min=t_score_min,
+            t_score_max=t_score_max,
+            t_score_spread=max(t_score_max - t_score_min, 0.0),
+            modal_option_identified=modal_identified,
+            modal_option_t_score=modal_t_score,
+            modal_recommended_as_primary=modal_recommended,
+            creative_options_count=sum(1 for t in t_scores if t <= CREATIVE_T_SCORE),
+            experimental_options_count=sum(1 for t in t_scores if t < EXPERIMENTAL_T_SCORE),
+        )
+        return self._vs_metrics
+
+    def record_vs_response(self, response: str) -> VSQualityMetrics:
+        """Record VS quality extracted from a response (see vs_analytics)."""
+        summary = summarize_response(response)
+        return self.record_vs_quality(
+            options_presented=summary["options_presented"],
+            modal_identified=summary["modal_identified"],
+            modal_t_score=summary["modal_t_score"],
+            modal_recommended=summary["modal_recommended"],
+            t_scores=summary["t_scores"],
+        )
+
     def add_issue(self, issue: str) -> None:
         """Record a critical issue."""
         self._issues.append(issue)
@@ -4,14 +4,27 @@ Diverga QA Scenario Definitions
 
 Defines test scenario structures for comprehensive Diverga plugin testing.
 Scenarios cover all major research paradigms and workflows.
+
+Scenario lookup goes through a ScenarioRegistry: protocol files are indexed
+once (id, name, priority, paradigm, tags), the index is persisted and only
+re-parsed for files whose mtime or size changed, and full scenario bodies
+are loaded on demand.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+import json
+import os
 import yaml
 
+# libyaml's C loader when available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+PROTOCOL_DIR = Path(__file__).parent
+DEFAULT_INDEX_PATH = PROTOCOL_DIR.parent / ".cache" / "scenario_index.json"
+
 
 class Paradigm(Enum):
     """Research paradigm types."""
@@ -205,7 +218,7 @@ class Scenario:
         """Load scenario from YAML file."""
         yaml_path = Path(yaml_path)
         with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAML_LOADER)
         return cls.from_dict(data)
 
     @classmethod
@@ -293,7 +306,8 @@ class Scenario:
             ))
 
         return cls(
-            scenario_id=scenario_data.get("id", ""),
+            # v1 protocols nest `scenario: {id: ...}`; v2 use top-level `scenario_id`
+            scenario_id=scenario_data.get("id") or scenario_data.get("scenario_id", ""),
             name=scenario_data.get("name", ""),
             description=scenario_data.get("description", ""),
             paradigm=paradigm,
@@ -335,29 +349,209 @@ class Scenario:
             yaml.dump(self.to_dict(), f, default_flow_style=False, allow_unicode=True)
 
 
-def load_scenario(scenario_id: str) -> Scenario:
-    """Load a scenario by ID from the protocol directory."""
-    protocol_dir = Path(__file__).parent
+@dataclass
+class ScenarioIndexEntry:
+    """Indexed metadata of one protocol file; the full body loads on demand."""
+    scenario_id: str
+    name: str
+    priority: Priority
+    paradigm: Paradigm
+    tags: list[str]
+    estimated_duration_minutes: int
+    path: str
+    mtime_ns: int
+    size: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        data = asdict(self)
+        data["priority"] = self.priority.value
+        data["paradigm"] = self.paradigm.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScenarioIndexEntry":
+        """Create an entry from its serialized form."""
+        return cls(**{**data, "priority": Priority(data["priority"]), "paradigm": Paradigm(data["paradigm"])})
+
+
+class ScenarioRegistry:
+    """
+    Indexed scenario lookup over a protocol directory.
+
+    The index (id -> path, name, priority, paradigm, tags, estimated
+    duration) is built once
+    and persisted to `index_path`; on open and on refresh() only files
+    whose mtime or size changed are parsed again. Lookups by id are
+    dictionary hits, and tag/paradigm/priority queries use inverted
+    indexes. Full Scenario objects are parsed lazily by load().
+
+    Args:
+        protocol_dir: Directory of test_*.yaml protocols
+        index_path: Persisted index file, or None to keep the index in memory
+    """
+
+    INDEX_VERSION = 2
+
+    def __init__(self, protocol_dir: Path | str | None = None, index_path: Path | str | None = DEFAULT_INDEX_PATH):
+        self.protocol_dir = Path(protocol_dir or PROTOCOL_DIR)
+        self.index_path = Path(index_path) if index_path else None
+        self._entries: dict[str, ScenarioIndexEntry] = {}
+        self._by_file: dict[str, ScenarioIndexEntry] = self._read_index()
+        self._by_tag: dict[str, set[str]] = {}
+        self._by_paradigm: dict[Paradigm, set[str]] = {}
+        self._by_priority: dict[Priority, set[str]] = {}
+        self._loaded: dict[str, tuple[int, Scenario]] = {}
+        self.refresh()
+
+    def _read_index(self) -> dict[str, ScenarioIndexEntry]:
+        """Persisted entries by file name ({} if missing, stale or unreadable)."""
+        if not self.index_path:
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.INDEX_VERSION or data.get("protocol_dir") != str(self.protocol_dir):
+                return {}
+            return {name: ScenarioIndexEntry.from_dict(e) for name, e in data["files"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _write_index(self) -> None:
+        """Persist the index atomically (best effort: the index is only a cache)."""
+        if not self.index_path:
+            return
+        data = {
+            "version": self.INDEX_VERSION,
+            "protocol_dir": str(self.protocol_dir),
+            "files": {name: e.to_dict() for name, e in self._by_file.items()},
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)  # Concurrent refreshes never read a half-written index
+        except OSError:
+            pass  # Read-only location: scan the headers again next time
+
+    def _index_file(self, yaml_file: Path, stat: os.stat_result) -> ScenarioIndexEntry:
+        """Parse one protocol's header fields."""
+        with open(yaml_file, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=YAML_LOADER) or {}
+        scenario_data = data.get("scenario", data)
+        return ScenarioIndexEntry(
+            scenario_id=scenario_data.get("id") or scenario_data.get("scenario_id", ""),
+            name=scenario_data.get("name", ""),
+            priority=Priority(scenario_data.get("priority", "medium")),
+            paradigm=Paradigm(scenario_data.get("paradigm", "any")),
+            tags=list(data.get("tags") or []),
+            estimated_duration_minutes=data.get("estimated_duration_minutes", 10),
+            path=str(yaml_file),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+        )
+
+    def refresh(self) -> int:
+        """Re-index new or changed protocol files; returns how many were parsed."""
+        by_file = {}
+        parsed = 0
+        for yaml_file in sorted(self.protocol_dir.glob("test_*.yaml")):
+            stat = yaml_file.stat()
+            cached = self._by_file.get(yaml_file.name)
+            if cached and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+                by_file[yaml_file.name] = cached
+                continue
+            try:
+                by_file[yaml_file.name] = self._index_file(yaml_file, stat)
+                parsed += 1
+            except Exception as e:
+                print(f"Warning: Could not load {yaml_file}: {e}")
+
+        changed = parsed or by_file.keys() != self._by_file.keys()
+        self._by_file = by_file
+        self._rebuild()
+        if changed:
+            self._write_index()
+        return parsed
+
+    def _rebuild(self) -> None:
+        """Rebuild the id and inverted indexes from the per-file entries."""
+        self._entries, self._by_tag, self._by_paradigm, self._by_priority = {}, {}, {}, {}
+        for entry in self._by_file.values():
+            if not entry.scenario_id or entry.scenario_id in self._entries:
+                continue  # First file (by name) wins for duplicate ids
+            self._entries[entry.scenario_id] = entry
+            for tag in entry.tags:
+                self._by_tag.setdefault(tag.lower(), set()).add(entry.scenario_id)
+            self._by_paradigm.setdefault(entry.paradigm, set()).add(entry.scenario_id)
+            self._by_priority.setdefault(entry.priority, set()).add(entry.scenario_id)
+
+    def __contains__(self, scenario_id: str) -> bool:
+        return scenario_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ScenarioIndexEntry]:
+        return iter(self._entries.values())
+
+    def get(self, scenario_id: str) -> ScenarioIndexEntry:
+        """Index entry for a scenario; raises ValueError if unknown."""
+        entry = self._entries.get(scenario_id)
+        if entry is None:
+            raise ValueError(f"Scenario not found: {scenario_id}")
+        return entry
+
+    def query(
+        self,
+        tag: str | None = None,
+        paradigm: Paradigm | str | None = None,
+        priority: Priority | str | None = None,
+    ) -> list[ScenarioIndexEntry]:
+        """Entries matching every given filter (tags match case-insensitively)."""
+        selected: set[str] | None = None
+        filters = []
+        if tag is not None:
+            filters.append(self._by_tag.get(tag.lower(), set()))
+        if paradigm is not None:
+            filters.append(self._by_paradigm.get(Paradigm(paradigm), set()))
+        if priority is not None:
+            filters.append(self._by_priority.get(Priority(priority), set()))
+
+        for ids in filters:
+            selected = ids if selected is None else selected & ids
+        return [e for e in self._entries.values() if selected is None or e.scenario_id in selected]
+
+    def load(self, scenario_id: str) -> Scenario:
+        """Parse the full scenario (memoized until its file changes)."""
+        entry = self.get(scenario_id)
+        cached = self._loaded.get(scenario_id)
+        if cached and cached[0] == entry.mtime_ns:
+            return cached[1]
+        scenario = Scenario.from_yaml(entry.path)
+        self._loaded[scenario_id] = (entry.mtime_ns, scenario)
+        return scenario
+
+
+_registry: ScenarioRegistry | None = None
+
+
+def get_registry() -> ScenarioRegistry:
+    """Process-wide registry over this directory, refreshed on each call."""
+    global _registry
+    if _registry is None:
+        _registry = ScenarioRegistry()
+    else:
+        _registry.refresh()
+    return _registry
 
-    # Try to find matching YAML file
-    for yaml_file in protocol_dir.glob("test_*.yaml"):
-        scenario = Scenario.from_yaml(yaml_file)
-        if scenario.scenario_id == scenario_id:
-            return scenario
 
-    raise ValueError(f"Scenario not found: {scenario_id}")
+def load_scenario(scenario_id: str) -> Scenario:
+    """Load a scenario by ID from the protocol directory."""
+    return get_registry().load(scenario_id)
 
 
 def list_scenarios() -> list[tuple[str, str, Priority]]:
     """List all available test scenarios."""
-    protocol_dir = Path(__file__).parent
-    scenarios = []
-
-    for yaml_file in protocol_dir.glob("test_*.yaml"):
-        try:
-            scenario = Scenario.from_yaml(yaml_file)
-            scenarios.append((scenario.scenario_id, scenario.name, scenario.priority))
-        except Exception as e:
-            print(f"Warning: Could not load {yaml_file}: {e}")
-
-    return scenarios
+    return [(e.scenario_id, e.name, e.priority) for e in get_registry()]
@@ -0,0 +1,205 @@
+"""
+Diverga QA Scenario Selection
+==============================
+
+Selection expressions and deterministic sharding over the ScenarioRegistry.
+
+An expression combines terms with `and`, `or`, `not` and parentheses:
+
+    priority>=high and paradigm:qualitative
+    tag:meta-analysis or id:QUANT-*
+    not tag:slow and duration<=10
+
+Terms are `key:value` (or `key=value`):
+- id:      scenario id, glob patterns allowed (case-insensitive)
+- tag:     any tag, glob patterns allowed (case-insensitive)
+- paradigm: quantitative | qualitative | mixed_methods | any
+- priority: low | medium | high | critical; also priority>=high etc.
+- duration: estimated_duration_minutes; also duration<=10 etc.
+
+Shards (`3/8` = third of eight) are balanced by estimated duration with a
+longest-first greedy assignment, so every CI runner computes the same
+partition and all shards finish at about the same time.
+"""
+
+import fnmatch
+import operator
+import re
+from typing import Callable, Iterable
+
+from .scenarios import Paradigm, Priority, ScenarioIndexEntry
+
+Predicate = Callable[[ScenarioIndexEntry], bool]
+
+PRIORITY_ORDER = [Priority.LOW, Priority.MEDIUM, Priority.HIGH, Priority.CRITICAL]
+
+COMPARISONS = {
+    ":": operator.eq,
+    "=": operator.eq,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<paren>[()])"
+    r"|(?P<term>(?P<key>[a-z_]+)\s*(?P<op>>=|<=|>|<|=|:)\s*(?P<value>[^\s()]+))"
+    r"|(?P<word>[A-Za-z_]+))"
+)
+
+
+def _term(key: str, op: str, value: str) -> Predicate:
+    """Compile one `key op value` term."""
+    compare = COMPARISONS[op]
+    ordered = op not in (":", "=")
+
+    if key in ("id", "tag"):
+        if ordered:
+            raise ValueError(f"'{key}' only supports ':' matching, got {key}{op}{value}")
+        pattern = value.lower()
+        if key == "id":
+            return lambda e: fnmatch.fnmatchcase(e.scenario_id.lower(), pattern)
+        return lambda e: any(fnmatch.fnmatchcase(t.lower(), pattern) for t in e.tags)
+
+    if key == "paradigm":
+        if ordered:
+            raise ValueError(f"'paradigm' only supports ':' matching, got {key}{op}{value}")
+        try:
+            paradigm = Paradigm(value.lower().replace("-", "_"))
+        except ValueError:
+            raise ValueError(f"Unknown paradigm {value!r}. Supported: {[p.value for p in Paradigm]}")
+        return lambda e: e.paradigm is paradigm
+
+    if key == "priority":
+        try:
+            rank = PRIORITY_ORDER.index(Priority(value.lower()))
+        except ValueError:
+            raise ValueError(f"Unknown priority {value!r}. Supported: {[p.value for p in PRIORITY_ORDER]}")
+        return lambda e: compare(PRIORITY_ORDER.index(e.priority), rank)
+
+    if key == "duration":
+        try:
+            minutes = float(value)
+        except ValueError:
+            raise ValueError(f"duration needs a number of minutes, got {value!r}")
+        return lambda e: compare(e.estimated_duration_minutes, minutes)
+
+    raise ValueError(f"Unknown selection key {key!r}. Supported: id, tag, paradigm, priority, duration")
+
+
+def _tokenize(expression: str) -> list:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Invalid selection at {expression[position:]!r}")
+        if match.group("paren"):
+            tokens.append(match.group("paren"))
+        elif match.group("term"):
+            tokens.append(_term(match.group("key"), match.group("op"), match.group("value")))
+        else:
+            word = match.group("word").lower()
+            if word not in ("and", "or", "not"):
+                raise ValueError(f"Expected a key:value term or and/or/not, got {match.group('word')!r}")
+            tokens.append(word)
+        position = match.end()
+    return tokens
+
+
+def parse_selection(expression: str) -> Predicate:
+    """
+    Compile a selection expression into a predicate over index entries.
+
+    `not` binds tighter than `and`, which binds tighter than `or`.
+    Raises ValueError on syntax errors or unknown keys/values.
+    """
+    tokens = _tokenize(expression)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or() -> Predicate:
+        terms = [parse_and()]
+        while peek() == "or":
+            take()
+            terms.append(parse_and())
+        return terms[0] if len(terms) == 1 else lambda e: any(t(e) for t in terms)
+
+    def parse_and() -> Predicate:
+        terms = [parse_not()]
+        while peek() == "and":
+            take()
+            terms.append(parse_not())
+        return terms[0] if len(terms) == 1 else lambda e: all(t(e) for t in terms)
+
+    def parse_not() -> Predicate:
+        if peek() == "not":
+            take()
+            inner = parse_not()
+            return lambda e: not inner(e)
+        token = take() if peek() is not None else None
+        if token == "(":
+            inner = parse_or()
+            if peek() != ")":
+                raise ValueError(f"Unbalanced parentheses in {expression!r}")
+            take()
+            return inner
+        if callable(token):
+            return token
+        raise ValueError(f"Expected a term in {expression!r}, got {token!r}")
+
+    if not tokens:
+        raise ValueError("Empty selection expression")
+    predicate = parse_or()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected {tokens[position]!r} in {expression!r}")
+    return predicate
+
+
+def select_scenarios(entries: Iterable[ScenarioIndexEntry], expression: str) -> list[ScenarioIndexEntry]:
+    """Entries matching a selection expression, in their original order."""
+    predicate = parse_selection(expression)
+    return [e for e in entries if predicate(e)]
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse 'K/N' (1-based shard K of N)."""
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", spec)
+    if not match:
+        raise ValueError(f"Shard must look like K/N (e.g. 3/8), got {spec!r}")
+    index, count = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {count}, got {spec!r}")
+    return index, count
+
+
+def assign_shards(entries: Iterable[ScenarioIndexEntry], count: int) -> list[list[ScenarioIndexEntry]]:
+    """
+    Partition entries into `count` shards balanced by estimated duration.
+
+    Longest scenarios are placed first, each on the currently lightest
+    shard (lowest shard number on ties); ids break duration ties, so the
+    result depends only on the set of entries.
+    """
+    shards: list[list[ScenarioIndexEntry]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for entry in sorted(entries, key=lambda e: (-e.estimated_duration_minutes, e.scenario_id)):
+        lightest = min(range(count), key=lambda i: (loads[i], i))
+        shards[lightest].append(entry)
+        loads[lightest] += entry.estimated_duration_minutes
+    return [sorted(shard, key=lambda e: e.scenario_id) for shard in shards]
+
+
+def shard_scenarios(entries: Iterable[ScenarioIndexEntry], spec: str) -> list[ScenarioIndexEntry]:
+    """Entries of shard 'K/N'."""
+    index, count = parse_shard(spec)
+    return assign_shards(entries, count)[index - 1]
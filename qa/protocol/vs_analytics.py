@@ -0,0 +1,358 @@
+"""
+Diverga QA VS Analytics
+========================
+
+Batch extraction and scoring of VS (Verbalized Sampling) options and T-Scores.
+
+Every T-Score in every assistant turn becomes one row of a columnar table:
+(session, turn, option, T-Score, recommended). Spread, modal-avoidance and
+distribution statistics are then computed per turn or per session for the
+whole table at once, so an archive of thousands of sessions is scored with
+a handful of array operations instead of a regex-and-loop pass per response.
+
+Definitions (shared with VSQualityMetrics):
+- modal option:        T-Score >= 0.7 (the predictable, most typical choice)
+- creative option:     T-Score <= 0.4
+- experimental option: T-Score < 0.2
+- modal recommended:   a modal option's line is marked ⭐ / recommend / 권장 / 추천
+
+NumPy is optional: with it the columns are NumPy arrays and the group
+statistics use `ufunc.reduceat`; without it a pure-Python path returns the
+same values.
+
+Usage:
+    from qa.protocol.vs_analytics import VSTable
+    table = VSTable.from_archive("qa/reports/sessions")
+    table.turn_stats()      # One row per (session, turn) with T-Scores
+    table.session_stats()   # One row per session
+    table.distribution()    # T-Score histogram and quantiles
+"""
+
+import bisect
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+try:
+    import numpy as np  # Optional: pip install numpy
+except ImportError:
+    np = None
+
+MODAL_T_SCORE = 0.7
+CREATIVE_T_SCORE = 0.4
+EXPERIMENTAL_T_SCORE = 0.2
+
+# A T-Score, optionally preceded on the same line by its option label:
+# "[A] Label (T=0.65)", "[B] ... T-Score: .40", "T ≈ 0.3"
+T_SCORE_RE = re.compile(
+    r"(?:\[(?P<option>[A-Z])\][^\n\[]*?)?"
+    r"\bT(?:[- ]?scores?)?\s*[=≈:]\s*(?P<t_score>\d*\.\d+|[01])\b",
+    re.IGNORECASE,
+)
+RECOMMENDED_RE = re.compile(r"⭐|recommend|권장|추천", re.IGNORECASE)
+
+STAT_COLUMNS = (
+    "options", "t_score_min", "t_score_max", "t_score_spread", "t_score_mean", "t_score_std",
+    "creative", "experimental", "modal_identified", "modal_recommended",
+)
+
+
+def extract_t_scores(text: str, matches: Iterable[re.Match] | None = None) -> list[tuple[str, float, bool]]:
+    """
+    (option, T-Score, recommended) for each T-Score in a response.
+
+    `option` is "" for T-Scores without an [X] label on the same line; a
+    labelled option is reported once (its first T-Score). Values outside
+    [0, 1] are ignored. Pass `matches` (T_SCORE_RE matches over `text`,
+    e.g. from a combined pattern scan) to skip the search.
+    """
+    rows = []
+    seen = set()
+    for match in T_SCORE_RE.finditer(text) if matches is None else matches:
+        t_score = float(match.group("t_score"))
+        option = (match.group("option") or "").upper()
+        if not 0.0 <= t_score <= 1.0 or (option and option in seen):
+            continue
+        seen.add(option)
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.end())
+        line = text[line_start:line_end if line_end != -1 else len(text)]
+        rows.append((option, t_score, bool(RECOMMENDED_RE.search(line))))
+    return rows
+
+
+def summarize_response(text: str) -> dict[str, Any]:
+    """VS quality of one response, in MetricsCollector.record_vs_quality terms."""
+    rows = extract_t_scores(text)
+    t_scores = [t for _, t, _ in rows]
+    modal = [(t, recommended) for _, t, recommended in rows if t >= MODAL_T_SCORE]
+    return {
+        "options_presented": len({option for option, _, _ in rows if option}) or len(rows),
+        "t_scores": t_scores,
+        "t_score_min": min(t_scores, default=1.0),
+        "t_score_max": max(t_scores, default=0.0),
+        "modal_identified": bool(modal),
+        "modal_t_score": max((t for t, _ in modal), default=None),
+        "modal_recommended": any(recommended for _, recommended in modal),
+    }
+
+
+@dataclass
+class VSStats:
+    """
+    Columnar group statistics; every column has one entry per group.
+
+    `keys` holds the group columns (session / scenario_id / turn); `columns`
+    holds STAT_COLUMNS. Columns are NumPy arrays when NumPy is available.
+    """
+    keys: dict[str, Any] = field(default_factory=dict)
+    columns: dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.columns["options"]) if self.columns else 0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.keys[name] if name in self.keys else self.columns[name]
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """One plain dict per group."""
+        names = [*self.keys, *self.columns]
+        values = [*self.keys.values(), *self.columns.values()]
+        for row in zip(*values):
+            yield {name: value.item() if hasattr(value, "item") else value for name, value in zip(names, row)}
+
+
+class VSTable:
+    """
+    Columnar (session, turn, option, T-Score, recommended) rows.
+
+    Sessions are numbered in insertion order; `sessions[i]` and
+    `scenarios[i]` describe session number i.
+
+    Args:
+        native: Use NumPy when True, pure Python when False, auto-detect when None
+    """
+
+    def __init__(self, native: bool | None = None):
+        if native and np is None:
+            raise ImportError("numpy is not installed")
+        self.native = np is not None if native is None else native
+
+        self.sessions: list[str] = []
+        self.scenarios: list[str] = []
+        self._session_by_key: dict[str, int] = {}
+        self._session: list[int] = []
+        self._turn: list[int] = []
+        self._option: list[str] = []
+        self._t_score: list[float] = []
+        self._recommended: list[bool] = []
+        self._frozen: dict[str, Any] | None = None
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def add_response(self, session: str, turn: int, text: str, scenario_id: str = "") -> int:
+        """Add every T-Score of one response; returns the number of rows added."""
+        index = self._session_by_key.get(session)
+        if index is None:
+            index = self._session_by_key[session] = len(self.sessions)
+            self.sessions.append(session)
+            self.scenarios.append(scenario_id)
+
+        rows = extract_t_scores(text)
+        for option, t_score, recommended in rows:
+            self._session.append(index)
+            self._turn.append(turn)
+            self._option.append(option)
+            self._t_score.append(t_score)
+            self._recommended.append(recommended)
+        self._frozen = None
+        return len(rows)
+
+    def add_session(self, data: dict[str, Any]) -> int:
+        """Add the assistant turns of a session (conversation_raw*.json or TestSession dict)."""
+        key = data.get("session_id") or f"{data.get('scenario_id')}:{data.get('start_time')}"
+        added = 0
+        for turn in data.get("turns", []):
+            if turn.get("role") == "assistant":
+                added += self.add_response(key, int(turn.get("number", 0)), turn.get("content") or "",
+                                           data.get("scenario_id", ""))
+        return added
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[dict[str, Any]], native: bool | None = None) -> "VSTable":
+        table = cls(native=native)
+        for data in sessions:
+            table.add_session(data)
+        return table
+
+    @classmethod
+    def from_archive(cls, path: Path | str, native: bool | None = None) -> "VSTable":
+        """Load every conversation_raw*.json under a directory (or one file)."""
+        path = Path(path)
+        files = sorted(path.rglob("conversation_raw*.json")) if path.is_dir() else [path]
+        table = cls(native=native)
+        for raw_file in files:
+            with open(raw_file, "r", encoding="utf-8") as f:
+                table.add_session(json.load(f))
+        return table
+
+    def __len__(self) -> int:
+        return len(self._t_score)
+
+    @property
+    def columns(self) -> dict[str, Any]:
+        """Row columns: session, turn, option, t_score, recommended."""
+        if self._frozen is None:
+            columns = {
+                "session": self._session,
+                "turn": self._turn,
+                "option": self._option,
+                "t_score": self._t_score,
+                "recommended": self._recommended,
+            }
+            if self.native:
+                columns = {
+                    "session": np.asarray(self._session, dtype=np.int64),
+                    "turn": np.asarray(self._turn, dtype=np.int64),
+                    "option": np.asarray(self._option, dtype="<U1"),
+                    "t_score": np.asarray(self._t_score, dtype=np.float64),
+                    "recommended": np.asarray(self._recommended, dtype=bool),
+                }
+            self._frozen = columns
+        return self._frozen
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def turn_stats(self) -> VSStats:
+        """Statistics per (session, turn) that has at least one T-Score."""
+        return self._group_stats(by_turn=True)
+
+    def session_stats(self) -> VSStats:
+        """Statistics per session over all of its turns."""
+        return self._group_stats(by_turn=False)
+
+    def _group_stats(self, by_turn: bool) -> VSStats:
+        columns = self.columns
+        if self.native:
+            session_keys, turn_keys, stats = _group_stats_numpy(columns, by_turn)
+        else:
+            session_keys, turn_keys, stats = _group_stats_python(columns, by_turn)
+
+        keys = {
+            "session": [self.sessions[i] for i in session_keys],
+            "scenario_id": [self.scenarios[i] for i in session_keys],
+        }
+        if by_turn:
+            keys["turn"] = turn_keys
+        return VSStats(keys=keys, columns=stats)
+
+    def distribution(self, bins: int = 10, quantiles: Sequence[float] = (0.1, 0.25, 0.5, 0.75, 0.9)) -> dict[str, Any]:
+        """T-Score histogram over [0, 1] (last bin closed) and linear-interpolated quantiles."""
+        edges = [i / bins for i in range(bins + 1)]
+        t_scores = self.columns["t_score"]
+        if not len(t_scores):
+            return {"count": 0, "histogram": {"edges": edges, "counts": [0] * bins}}
+
+        if self.native:
+            counts = np.histogram(t_scores, bins=np.asarray(edges))[0].tolist()
+            mean = float(t_scores.mean())
+            std = float(t_scores.std())
+            values = np.quantile(t_scores, quantiles).tolist()
+            modal = int((t_scores >= MODAL_T_SCORE).sum())
+        else:
+            counts = [0] * bins
+            for t in t_scores:
+                counts[min(bisect.bisect_right(edges, t) - 1, bins - 1)] += 1
+            mean = sum(t_scores) / len(t_scores)
+            std = math.sqrt(sum((t - mean) ** 2 for t in t_scores) / len(t_scores))
+            values = [_quantile(sorted(t_scores), q) for q in quantiles]
+            modal = sum(1 for t in t_scores if t >= MODAL_T_SCORE)
+
+        return {
+            "count": len(t_scores),
+            "mean": mean,
+            "std": std,
+            "quantiles": dict(zip(quantiles, values)),
+            "histogram": {"edges": edges, "counts": counts},
+            "modal_share": modal / len(t_scores),
+        }
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    """NumPy's default (linear) quantile of a sorted list."""
+    position = (len(ordered) - 1) * q
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _group_stats_numpy(columns: dict[str, Any], by_turn: bool) -> tuple[list[int], list[int], dict[str, Any]]:
+    session, turn, t_score = columns["session"], columns["turn"], columns["t_score"]
+    if not len(t_score):
+        return [], [], {name: np.empty(0) for name in STAT_COLUMNS}
+
+    # Stable sort by group key, then one reduceat per statistic over group starts
+    order = np.lexsort((turn, session)) if by_turn else np.argsort(session, kind="stable")
+    session, turn, t = session[order], turn[order], t_score[order]
+    recommended = columns["recommended"][order]
+
+    changed = np.diff(session) != 0
+    if by_turn:
+        changed |= np.diff(turn) != 0
+    starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+    counts = np.diff(np.append(starts, len(t)))
+
+    t_min = np.minimum.reduceat(t, starts)
+    t_max = np.maximum.reduceat(t, starts)
+    mean = np.add.reduceat(t, starts) / counts
+    std = np.sqrt(np.add.reduceat((t - np.repeat(mean, counts)) ** 2, starts) / counts)
+    modal = t >= MODAL_T_SCORE
+
+    stats = {
+        "options": counts,
+        "t_score_min": t_min,
+        "t_score_max": t_max,
+        "t_score_spread": t_max - t_min,
+        "t_score_mean": mean,
+        "t_score_std": std,
+        "creative": np.add.reduceat((t <= CREATIVE_T_SCORE).astype(np.int64), starts),
+        "experimental": np.add.reduceat((t < EXPERIMENTAL_T_SCORE).astype(np.int64), starts),
+        "modal_identified": np.logical_or.reduceat(modal, starts),
+        "modal_recommended": np.logical_or.reduceat(modal & recommended, starts),
+    }
+    return session[starts].tolist(), turn[starts].tolist() if by_turn else [], stats
+
+
+def _group_stats_python(columns: dict[str, Any], by_turn: bool) -> tuple[list[int], list[int], dict[str, Any]]:
+    groups: dict[tuple[int, int], list[tuple[float, bool]]] = {}
+    for session, turn, t, recommended in zip(columns["session"], columns["turn"], columns["t_score"],
+                                             columns["recommended"]):
+        groups.setdefault((session, turn if by_turn else 0), []).append((t, recommended))
+
+    stats: dict[str, list] = {name: [] for name in STAT_COLUMNS}
+    session_keys, turn_keys = [], []
+    for (session, turn), rows in sorted(groups.items(), key=lambda item: item[0]):
+        t_scores = [t for t, _ in rows]
+        mean = sum(t_scores) / len(t_scores)
+        modal = [recommended for t, recommended in rows if t >= MODAL_T_SCORE]
+        session_keys.append(session)
+        if by_turn:
+            turn_keys.append(turn)
+        stats["options"].append(len(rows))
+        stats["t_score_min"].append(min(t_scores))
+        stats["t_score_max"].append(max(t_scores))
+        stats["t_score_spread"].append(max(t_scores) - min(t_scores))
+        stats["t_score_mean"].append(mean)
+        stats["t_score_std"].append(math.sqrt(sum((t - mean) ** 2 for t in t_scores) / len(t_scores)))
+        stats["creative"].append(sum(1 for t in t_scores if t <= CREATIVE_T_SCORE))
+        stats["experimental"].append(sum(1 for t in t_scores if t < EXPERIMENTAL_T_SCORE))
+        stats["modal_identified"].append(bool(modal))
+        stats["modal_recommended"].append(any(modal))
+    return session_keys, turn_keys, stats
@@ -6,12 +6,16 @@ Main entry point for running QA tests and generating reports.
 
 Usage:
     python run_tests.py --all                    # Run all protocol tests
+    python run_tests.py --all --incremental      # Re-validate changed protocols only
+    python run_tests.py --all --select "priority>=high" --shard 1/4
     python run_tests.py --evaluate-extracted ... # Evaluate extracted conversation
     python run_tests.py --report ...             # Generate report from results
 """
 
 import argparse
+import hashlib
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -26,6 +30,12 @@ from runners.extract_conversation import (
     ConversationEvaluator,
     ExtractionResult,
 )
+from runners.results_store import DEFAULT_STORE_PATH, ResultsStore
+from protocol.scenarios import ScenarioRegistry
+from protocol.selection import select_scenarios, shard_scenarios
+
+# libyaml's C loader parses protocols several times faster when available
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 @dataclass
@@ -60,18 +70,41 @@ class DivergaQARunner:
 
     PROTOCOL_DIR = Path(__file__).parent / "protocol"
     REPORTS_DIR = Path(__file__).parent / "reports"
+    MANIFEST_PATH = Path(__file__).parent / ".cache" / "protocol_manifest.json"
+
+    # Bump whenever _check_protocol changes so cached results are discarded
+    VALIDATION_VERSION = '2.0-1'
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        incremental: bool = False,
+        manifest_path: Optional[str] = None
+    ):
+        """
+        Initialize runner.
 
-    def __init__(self, verbose: bool = False):
-        """Initialize runner."""
+        Args:
+            verbose: Print failing checks
+            incremental: Reuse manifest results for unchanged protocols in run_all()
+            manifest_path: Manifest file (default: qa/.cache/protocol_manifest.json)
+        """
         self.verbose = verbose
+        self.incremental = incremental
+        self.manifest_path = Path(manifest_path) if manifest_path else self.MANIFEST_PATH
         self.results: list[TestResult] = []
+        self.revalidated = 0
 
-    def run_all(self) -> TestReport:
+    def run_all(self, select: Optional[str] = None, shard: Optional[str] = None) -> TestReport:
         """
         Run all protocol tests.
 
         Note: This validates protocol YAML files, not actual conversations.
         For real conversation testing, use evaluate_extracted().
+
+        Args:
+            select: Selection expression (see protocol/selection.py)
+            shard: 'K/N' to validate only shard K of N of the selection
         """
         print("=" * 60)
         print("Diverga QA Protocol v2.0 - Protocol Validation")
@@ -84,85 +117,86 @@ class DivergaQARunner:
             print("No protocol files found in:", self.PROTOCOL_DIR)
             return self._generate_report()
 
-        for protocol_file in protocol_files:
-            self._validate_protocol(protocol_file)
+        existing = {p.name for p in protocol_files}
+        if select or shard:
+            # Protocols that fail to index cannot be selected
+            selected = list(ScenarioRegistry(self.PROTOCOL_DIR))
+            if select:
+                selected = select_scenarios(selected, select)
+            if shard:
+                selected = shard_scenarios(selected, shard)
+            protocol_files = [Path(e.path) for e in selected]
+            print(f"Selected {len(protocol_files)} protocols\n")
+
+        manifest = self._load_manifest() if self.incremental else {}
+        entries = {}
+        for protocol_file in sorted(protocol_files):
+            entries[protocol_file.name] = self._validate_protocol(protocol_file, manifest.get(protocol_file.name))
+
+        if self.incremental:
+            # Unselected protocols keep their entries; deleted ones drop out
+            merged = {**manifest, **entries}
+            self._save_manifest({name: e for name, e in merged.items() if name in existing})
+            print(f"\nRe-validated {self.revalidated} of {len(protocol_files)} protocols")
 
         return self._generate_report()
 
-    def _validate_protocol(self, protocol_path: Path) -> None:
-        """Validate a protocol YAML file structure."""
-        scenario_id = protocol_path.stem.replace("test_", "").upper()
-        print(f"Validating: {scenario_id}...")
-
+    def _load_manifest(self) -> dict:
+        """Manifest entries by protocol file name ({} if missing, stale or unreadable)."""
         try:
-            with open(protocol_path, 'r', encoding='utf-8') as f:
-                protocol = yaml.safe_load(f)
-
-            checks = []
-
-            # Check required fields
-            required_fields = [
-                'scenario_id', 'name', 'paradigm', 'agents_involved',
-                'language', 'conversation_flow', 'checkpoints_expected'
-            ]
-            for field in required_fields:
-                passed = field in protocol
-                checks.append({
-                    'name': f'Required field: {field}',
-                    'passed': passed,
-                    'details': ['Present' if passed else 'Missing']
-                })
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != self.VALIDATION_VERSION:
+            return {}
+        return manifest.get('protocols', {})
+
+    def _save_manifest(self, entries: dict) -> None:
+        """Write the manifest atomically (best effort: the manifest is only a cache)."""
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_name(f'{self.manifest_path.name}.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VALIDATION_VERSION, 'protocols': entries}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.manifest_path)  # Concurrent runs never read a half-written manifest
+        except OSError:
+            pass  # Read-only location: re-validate every protocol next time
+
+    def _validate_protocol(self, protocol_path: Path, cached: Optional[dict] = None) -> dict:
+        """
+        Validate a protocol YAML file structure and return its manifest entry.
 
-            # Check conversation flow structure
-            flow = protocol.get('conversation_flow', [])
-            if flow:
-                for i, turn in enumerate(flow):
-                    turn_valid = all(k in turn for k in ['turn', 'user', 'expected_behavior'])
-                    if not turn_valid:
-                        checks.append({
-                            'name': f'Turn {i+1} structure',
-                            'passed': False,
-                            'details': ['Missing required keys']
-                        })
-
-            # Check checkpoints
-            checkpoints = protocol.get('checkpoints_expected', [])
-            for cp in checkpoints:
-                cp_valid = all(k in cp for k in ['id', 'level'])
-                if not cp_valid:
-                    checks.append({
-                        'name': f'Checkpoint {cp.get("id", "unknown")}',
-                        'passed': False,
-                        'details': ['Missing level or id']
-                    })
+        `cached` is the protocol's previous manifest entry: when the file's
+        (mtime, size) or, failing that, its content hash is unchanged, the
+        recorded result is reused without parsing the YAML.
+        """
+        scenario_id = protocol_path.stem.replace("test_", "").upper()
+        stat = protocol_path.stat()
 
-            # Check agents format
-            agents = protocol.get('agents_involved', [])
-            if not isinstance(agents, list) or len(agents) == 0:
-                checks.append({
-                    'name': 'Agents list',
-                    'passed': False,
-                    'details': ['Must be non-empty list']
-                })
+        if cached and (cached['mtime_ns'], cached['size']) == (stat.st_mtime_ns, stat.st_size):
+            return self._reuse_result(cached)
 
-            all_passed = all(c['passed'] for c in checks)
+        content = protocol_path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+        if cached and cached['sha256'] == digest:
+            # Touched but not modified
+            return self._reuse_result({**cached, **entry})
 
-            result = TestResult(
-                scenario_id=scenario_id,
-                passed=all_passed,
-                checks=checks,
-                summary={
-                    'total_checks': len(checks),
-                    'passed': sum(1 for c in checks if c['passed']),
-                    'failed': sum(1 for c in checks if not c['passed'])
-                }
-            )
-            self.results.append(result)
+        print(f"Validating: {scenario_id}...")
+        self.revalidated += 1
+        name = scenario_id
 
-            status = "PASS" if all_passed else "FAIL"
-            print(f"  [{status}] {protocol.get('name', scenario_id)}")
-            if self.verbose and not all_passed:
-                for check in checks:
+        try:
+            protocol = yaml.load(content.decode('utf-8'), Loader=YAML_LOADER)
+            name = protocol.get('name', scenario_id)
+            result = self._check_protocol(scenario_id, protocol)
+
+            status = "PASS" if result.passed else "FAIL"
+            print(f"  [{status}] {name}")
+            if self.verbose and not result.passed:
+                for check in result.checks:
                     if not check['passed']:
                         print(f"    - {check['name']}: {check['details']}")
 
@@ -174,9 +208,82 @@ class DivergaQARunner:
                 summary={'error': str(e)},
                 errors=[str(e)]
             )
-            self.results.append(result)
             print(f"  [ERROR] {e}")
 
+        self.results.append(result)
+        return {**entry, 'name': name, 'result': asdict(result)}
+
+    def _reuse_result(self, entry: dict) -> dict:
+        """Record a manifest entry's result without re-validating."""
+        result = TestResult(**entry['result'])
+        self.results.append(result)
+        if self.verbose:
+            status = "PASS" if result.passed else "FAIL"
+            print(f"  [{status}] {entry['name']} (unchanged)")
+        return entry
+
+    def _check_protocol(self, scenario_id: str, protocol: dict) -> TestResult:
+        """Run the structural checks on a parsed protocol."""
+        checks = []
+
+        # Check required fields
+        required_fields = [
+            'scenario_id', 'name', 'paradigm', 'agents_involved',
+            'language', 'conversation_flow', 'checkpoints_expected'
+        ]
+        for field in required_fields:
+            passed = field in protocol
+            checks.append({
+                'name': f'Required field: {field}',
+                'passed': passed,
+                'details': ['Present' if passed else 'Missing']
+            })
+
+        # Check conversation flow structure
+        flow = protocol.get('conversation_flow', [])
+        if flow:
+            for i, turn in enumerate(flow):
+                turn_valid = all(k in turn for k in ['turn', 'user', 'expected_behavior'])
+                if not turn_valid:
+                    checks.append({
+                        'name': f'Turn {i+1} structure',
+                        'passed': False,
+                        'details': ['Missing required keys']
+                    })
+
+        # Check checkpoints
+        checkpoints = protocol.get('checkpoints_expected', [])
+        for cp in checkpoints:
+            cp_valid = all(k in cp for k in ['id', 'level'])
+            if not cp_valid:
+                checks.append({
+                    'name': f'Checkpoint {cp.get("id", "unknown")}',
+                    'passed': False,
+                    'details': ['Missing level or id']
+                })
+
+        # Check agents format
+        agents = protocol.get('agents_involved', [])
+        if not isinstance(agents, list) or len(agents) == 0:
+            checks.append({
+                'name': 'Agents list',
+                'passed': False,
+                'details': ['Must be non-empty list']
+            })
+
+        all_passed = all(c['passed'] for c in checks)
+
+        return TestResult(
+            scenario_id=scenario_id,
+            passed=all_passed,
+            checks=checks,
+            summary={
+                'total_checks': len(checks),
+                'passed': sum(1 for c in checks if c['passed']),
+                'failed': sum(1 for c in checks if not c['passed'])
+            }
+        )
+
     def evaluate_extracted(
         self,
         extracted_path: str,
@@ -466,6 +573,32 @@ def main():
         default='yaml',
         help='Report format (default: yaml)'
     )
+    parser.add_argument(
+        '--select',
+        metavar='EXPR',
+        help="With --all: selection expression, e.g. 'priority>=high and paradigm:qualitative'"
+    )
+    parser.add_argument(
+        '--shard',
+        metavar='K/N',
+        help='With --all: validate shard K of N, balanced by estimated duration'
+    )
+    parser.add_argument(
+        '--incremental',
+        nargs='?',
+        const=str(DivergaQARunner.MANIFEST_PATH),
+        default=None,
+        metavar='MANIFEST',
+        help='With --all, only re-validate protocols changed since the last run '
+             '(default manifest: qa/.cache/protocol_manifest.json)'
+    )
+    parser.add_argument(
+        '--store',
+        nargs='?',
+        const=str(DEFAULT_STORE_PATH),
+        default=None,
+        help='Also ingest results into the SQLite results store (default path: qa/.cache/results.sqlite3)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -474,10 +607,20 @@ def main():
 
     args = parser.parse_args()
 
-    runner = DivergaQARunner(verbose=args.verbose)
+    runner = DivergaQARunner(
+        verbose=args.verbose,
+        incremental=args.incremental is not None,
+        manifest_path=args.incremental
+    )
+
+    if (args.select or args.shard) and not args.all:
+        parser.error("--select and --shard require --all")
 
     if args.all:
-        report = runner.run_all()
+        try:
+            report = runner.run_all(select=args.select, shard=args.shard)
+        except ValueError as e:
+            parser.error(str(e))
 
     elif args.evaluate_extracted:
         if not args.input or not args.expected:
@@ -501,8 +644,14 @@ def main():
     print("=" * 60)
 
     # Save report if output specified
+    report_path = None
     if args.output:
-        runner.save_report(report, args.output, args.report_format)
+        report_path = runner.save_report(report, args.output, args.report_format)
+
+    if args.store:
+        with ResultsStore(args.store) as store:
+            store.ingest_report(report, source=str(report_path or ''))
+        print(f"Results ingested into: {args.store}")
 
     # Exit with appropriate code
     sys.exit(0 if report.failed == 0 else 1)
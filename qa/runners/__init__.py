@@ -12,8 +12,48 @@ Usage:
     session = runner.run()
     runner.save_results('qa/reports/sessions')
 
+    # v3.3 - Parallel multi-scenario execution
+    from qa.runners import BatchRunner
+    batch = BatchRunner(['QUAL-002', 'META-002'], jobs=2)
+    batch.save_report(batch.run())
+
+    # Cache response analysis across runs and re-scoring
+    from qa.runners import AnalysisCache
+    runner = CLITestRunner('QUAL-002', cache=AnalysisCache('qa/.cache/analysis.sqlite3'))
+
+    # Record live CLI calls once, replay them offline
+    from qa.runners import Cassette
+    cassette = Cassette.for_scenario('qa/cassettes', 'QUAL-002', 'claude', 'replay')
+    session = CLITestRunner('QUAL-002', cassette=cassette).run()
+
+    # Load-test against the local fake CLI (no network, no model)
+    from qa.runners import FakeCLIConfig, fake_cli_executables
+    config = FakeCLIConfig(latency='lognormal:2,0.5', failure_rate=0.02)
+    runner = CLITestRunner('QUAL-002', executables=fake_cli_executables(config))
+
+    # Index results for trends and regression reports
+    from qa.runners import ResultsStore
+    store = ResultsStore('qa/.cache/results.sqlite3')
+    store.ingest_path('qa/reports/sessions')
+    store.trend('META-002', metric='latency_p95', last=50)
+    store.regression_report(window=10)
+
+    # Stop live sessions early once they can no longer pass
+    from qa.runners import AbortPolicy
+    runner = CLITestRunner('META-002', abort_policy=AbortPolicy.parse('red-miss,timeouts:2'))
+
+    # Longest-first dispatch plan with predicted makespan
+    from qa.runners import Scheduler
+    schedule = Scheduler(CLITestRunner.PROTOCOL_DIR, store=store).plan(['QUAL-002', 'META-002'], 'claude', jobs=2)
+
     # v2.x - Simulation and extraction
     from qa.runners import ConversationExtractor, AutomatedTestSimulator
+
+    # Random access to large session logs through a sidecar offset index
+    from qa.runners import SessionReader
+    with SessionReader('big_session.jsonl') as reader:
+        entry = reader.turn(734)
+        checkpoints = list(reader.checkpoint_messages())
 """
 
 from .extract_conversation import (
@@ -29,6 +69,21 @@ from .cli_test_runner import (
     CLITestRunner,
     TestSession,
     Turn as CLITurn,
+    TurnTiming,
+)
+
+from .abort_policy import AbortPolicy
+from .analysis_cache import AnalysisCache
+from .cassette import Cassette, CassetteMissError
+from .fake_cli import FakeCLIConfig, fake_cli_executables
+from .results_store import ResultsStore, welch_t_test
+from .scheduler import Schedule, Scheduler
+from .session_index import SessionIndex, SessionReader
+
+from .batch_runner import (
+    BatchRunner,
+    BatchReport,
+    ScenarioOutcome,
 )
 
 from .automated_test import (
@@ -42,6 +97,20 @@ __all__ = [
     'CLITestRunner',
     'TestSession',
     'CLITurn',
+    'TurnTiming',
+    'BatchRunner',
+    'BatchReport',
+    'ScenarioOutcome',
+    'AbortPolicy',
+    'AnalysisCache',
+    'Cassette',
+    'CassetteMissError',
+    'FakeCLIConfig',
+    'fake_cli_executables',
+    'ResultsStore',
+    'welch_t_test',
+    'Scheduler',
+    'Schedule',
     # v2.x - Simulation
     'AutomatedTestSimulator',
     'SimulatedTurn',
@@ -53,4 +122,6 @@ __all__ = [
     'Turn',
     'Checkpoint',
     'AgentInvocation',
+    'SessionIndex',
+    'SessionReader',
 ]
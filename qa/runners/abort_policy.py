@@ -0,0 +1,90 @@
+"""
+Diverga QA Abort Policies
+==========================
+
+Early-abort rules for live CLITestRunner sessions.
+
+Some turn outcomes already decide a scenario: once a RED checkpoint has
+been skipped (the assistant auto-proceeded past a mandatory halt), the
+session cannot reach the compliance threshold, yet every remaining turn
+still costs up to `timeout` seconds of CLI time. An AbortPolicy stops the
+session after the turn that decided it:
+
+- red-miss:          a turn that should raise a RED checkpoint did not
+- compliance[:PCT]:  the maximum still-achievable compliance fell below PCT
+                     (default 80); a checkpoint counts as missed once the
+                     last turn that should raise it has passed without it
+- timeouts:N:        N consecutive CLI timeouts; earlier timeouts are
+                     recorded as empty turns instead of failing the session
+
+The partial session is finalized, validated and saved like a completed
+one, with status 'aborted' and the policy, turn and reason in `abort`.
+
+Usage:
+    python cli_test_runner.py --scenario META-002 --fail-fast
+    python cli_test_runner.py --scenarios all --abort-on red-miss,timeouts:2
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+DEFAULT_MIN_COMPLIANCE = 80.0  # Same threshold as a PASSED result
+
+
+@dataclass
+class AbortPolicy:
+    """Which early-abort rules are active for a session."""
+    red_miss: bool = False
+    min_compliance: Optional[float] = None
+    max_consecutive_timeouts: Optional[int] = None
+
+    @classmethod
+    def fail_fast(cls) -> 'AbortPolicy':
+        """Abort on a RED miss or once the session can no longer pass."""
+        return cls(red_miss=True, min_compliance=DEFAULT_MIN_COMPLIANCE)
+
+    @classmethod
+    def parse(cls, spec: str) -> 'AbortPolicy':
+        """
+        Parse a comma-separated policy list, e.g. 'red-miss,compliance:80,timeouts:2'.
+
+        Raises ValueError on unknown policies or bad values.
+        """
+        policy = cls()
+        for item in filter(None, (part.strip() for part in spec.split(','))):
+            name, _, value = item.partition(':')
+            name = name.strip().lower()
+            value = value.strip()
+            if name == 'red-miss' and not value:
+                policy.red_miss = True
+            elif name == 'compliance':
+                try:
+                    policy.min_compliance = float(value) if value else DEFAULT_MIN_COMPLIANCE
+                except ValueError:
+                    raise ValueError(f"compliance needs a percentage, got {value!r}")
+                if not 0 < policy.min_compliance <= 100:
+                    raise ValueError(f"compliance must be in (0, 100], got {value!r}")
+            elif name == 'timeouts':
+                if not value.isdigit() or int(value) < 1:
+                    raise ValueError(f"timeouts needs a count >= 1, e.g. timeouts:2, got {item!r}")
+                policy.max_consecutive_timeouts = int(value)
+            else:
+                raise ValueError(f"Unknown abort policy {item!r}. Supported: red-miss, compliance[:PCT], timeouts:N")
+        if not policy.enabled:
+            raise ValueError(f"No abort policy in {spec!r}")
+        return policy
+
+    @property
+    def enabled(self) -> bool:
+        return self.red_miss or self.min_compliance is not None or self.max_consecutive_timeouts is not None
+
+    def describe(self) -> str:
+        """The policy in --abort-on syntax."""
+        parts: List[str] = []
+        if self.red_miss:
+            parts.append('red-miss')
+        if self.min_compliance is not None:
+            parts.append(f"compliance:{self.min_compliance:g}")
+        if self.max_consecutive_timeouts is not None:
+            parts.append(f"timeouts:{self.max_consecutive_timeouts}")
+        return ','.join(parts) or 'none'
@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from .keyword_index import KeywordIndex, KeywordMatch
+
 
 @dataclass
 class AgentInvocation:
@@ -150,6 +152,10 @@ class AgentTracker:
         "G6-AcademicStyleHumanizer": "diverga:g6",
     }
 
+    # Aho-Corasick index over AGENT_KEYWORDS, built on first use per class
+    _keyword_index: KeywordIndex | None = None
+    _keyword_index_source: dict | None = None
+
     def __init__(self):
         """Initialize agent tracker."""
         self.invocations: list[AgentInvocation] = []
@@ -170,16 +176,28 @@ class AgentTracker:
         Returns:
             List of (agent_id, matched_keyword) tuples
         """
-        text_lower = text.lower()
-        matches = []
+        # Only one match per agent: the first keyword in its list found in text
+        return self.keyword_index().first_per_key(text)
+
+    def find_keyword_matches(self, text: str) -> list[KeywordMatch]:
+        """
+        Find every agent trigger keyword in text with its offsets.
 
-        for agent_id, keywords in self.AGENT_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    matches.append((agent_id, keyword))
-                    break  # Only one match per agent
+        Args:
+            text: User input or context text
 
-        return matches
+        Returns:
+            KeywordMatch records (agent in `key`), ordered by position
+        """
+        return self.keyword_index().find_all(text)
+
+    @classmethod
+    def keyword_index(cls) -> KeywordIndex:
+        """Return the keyword automaton for AGENT_KEYWORDS, building it once."""
+        if cls._keyword_index is None or cls._keyword_index_source is not cls.AGENT_KEYWORDS:
+            cls._keyword_index = KeywordIndex(cls.AGENT_KEYWORDS)
+            cls._keyword_index_source = cls.AGENT_KEYWORDS
+        return cls._keyword_index
 
     def normalize_agent_id(self, agent_id: str) -> str:
         """Normalize agent ID to diverga:XX format."""
@@ -0,0 +1,174 @@
+"""
+Diverga QA Analysis Cache
+==========================
+
+Persistent, content-addressed cache for response analysis results.
+
+The same assistant response is analysed by several detectors, during a run,
+during validation and again whenever a saved session is re-scored. Results
+are stored in SQLite keyed by SHA-256 of (detector, detector version,
+response text), so re-scoring an archive only pays for responses that
+actually changed. Bumping the detector version invalidates every entry.
+
+The database is bounded in size: when stored results exceed `max_bytes`,
+the least recently used entries are evicted.
+
+Usage:
+    cache = AnalysisCache('qa/.cache/analysis.sqlite3')
+    runner = CLITestRunner('QUAL-002', cache=cache)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class AnalysisCache:
+    """
+    SQLite-backed LRU cache of JSON-serializable analysis results.
+
+    Safe to share between threads of one process; separate processes may
+    open the same file concurrently.
+
+    Args:
+        path: SQLite database file (parent directories are created)
+        max_bytes: Upper bound on the total size of stored results
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS analysis (
+            key TEXT PRIMARY KEY,
+            detector TEXT NOT NULL,
+            value TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            last_used REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS analysis_last_used ON analysis (last_used);
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._last_stamp = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+        self._total_bytes = self._stored_bytes()
+
+    @staticmethod
+    def make_key(detector: str, version: str, text: str) -> str:
+        """SHA-256 over detector name, detector version and response text."""
+        digest = hashlib.sha256()
+        for part in (detector, version, text):
+            encoded = part.encode('utf-8')
+            # Length-prefix each part so ('ab', 'c') and ('a', 'bc') differ
+            digest.update(len(encoded).to_bytes(8, 'big'))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def _stamp(self) -> float:
+        """Wall-clock recency stamp, strictly increasing within this process."""
+        self._last_stamp = max(time.time(), self._last_stamp + 1e-6)
+        return self._last_stamp
+
+    def _stored_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM analysis").fetchone()[0]
+
+    def get(self, detector: str, version: str, text: str) -> Optional[Any]:
+        """Return the cached result, or None on a miss."""
+        key = self.make_key(detector, version, text)
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM analysis WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._conn:
+                self._conn.execute("UPDATE analysis SET last_used = ? WHERE key = ?", (self._stamp(), key))
+        return json.loads(row[0])
+
+    def put(self, detector: str, version: str, text: str, value: Any) -> None:
+        """Store a result, evicting least recently used entries if over budget."""
+        key = self.make_key(detector, version, text)
+        encoded = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        size = len(encoded.encode('utf-8'))
+        if size > self.max_bytes:
+            return  # Would evict everything and still not fit
+
+        with self._lock, self._conn:
+            previous = self._conn.execute("SELECT size FROM analysis WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis (key, detector, value, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, detector, encoded, size, self._stamp())
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its budget."""
+        # Other processes may have written too; start from the real total
+        self._total_bytes = self._stored_bytes()
+        excess = self._total_bytes - self.max_bytes
+        if excess <= 0:
+            return
+
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM analysis ORDER BY last_used"):
+            victims.append((key,))
+            excess -= size
+            self._total_bytes -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM analysis WHERE key = ?", victims)
+
+    def get_or_compute(self, detector: str, version: str, text: str, compute: Callable[[str], Any]) -> Any:
+        """Return the cached result for `text`, computing and storing it on a miss."""
+        cached = self.get(detector, version, text)
+        if cached is not None:
+            return cached
+        value = compute(text)
+        self.put(detector, version, text, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            'entries': entries,
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM analysis")
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> 'AnalysisCache':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -10,13 +10,24 @@ Usage:
 """
 
 import argparse
-import json
+import sys
 import yaml
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict, Any
 
+try:
+    from .json_codec import get_codec
+except ImportError:  # Executed as a script from qa/runners
+    from json_codec import get_codec
+
+try:
+    from .. import detectors
+except (ImportError, ValueError):  # qa/runners imported as a top-level package or script
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    import detectors
+
 
 @dataclass
 class SimulatedTurn:
@@ -990,19 +1001,8 @@ All checkpoints have been cleared.
         return templates.get(turn_num, f"[Simulated response for turn {turn_num}]")
 
     def _detect_checkpoints(self, response: str, expected: dict) -> List[str]:
-        """Detect checkpoints in response."""
-        checkpoints = []
-
-        # Check for checkpoint markers in response
-        if 'CHECKPOINT' in response:
-            if 'CP_PARADIGM_SELECTION' in response or expected.get('checkpoint') == 'CP_PARADIGM_SELECTION':
-                checkpoints.append('CP_PARADIGM_SELECTION')
-            if 'CP_METHODOLOGY_APPROVAL' in response or expected.get('next_checkpoint') == 'CP_METHODOLOGY_APPROVAL':
-                checkpoints.append('CP_METHODOLOGY_APPROVAL')
-            if 'CP_PARADIGM_RECONSIDERATION' in response or expected.get('checkpoint') == 'CP_PARADIGM_RECONSIDERATION':
-                checkpoints.append('CP_PARADIGM_RECONSIDERATION')
-            if 'CP_ANALYSIS_APPROACH' in response or expected.get('checkpoint') == 'CP_ANALYSIS_APPROACH':
-                checkpoints.append('CP_ANALYSIS_APPROACH')
+        """Detect checkpoints in response, plus the one the protocol expects."""
+        checkpoints = list(detectors.analyze(response).checkpoint_ids)
 
         # Also check expected checkpoints
         if expected.get('checkpoint'):
@@ -1096,7 +1096,7 @@ All checkpoints have been cleared.
         # Save raw JSON
         raw_file = output_path / 'conversation_raw.json'
         with open(raw_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(self.session), f, indent=2, ensure_ascii=False)
+            get_codec().dump(asdict(self.session), f)
 
         # Save test result YAML
         result_file = output_path / f'{self.scenario_id}_test_result.yaml'
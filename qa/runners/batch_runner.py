@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Diverga QA Protocol v3.3 - Parallel Multi-Scenario Execution
+
+Runs several CLITestRunner scenarios concurrently with a bounded worker pool.
+Each worker gets its own working directory and session, so `--continue`
+calls from one scenario never resume another scenario's conversation.
+
+Per-scenario artifacts are written exactly as in single-scenario mode; an
+aggregate `batch_summary_<timestamp>.yaml` is written next to them.
+
+Usage:
+    python cli_test_runner.py --scenarios all --jobs 4
+    python cli_test_runner.py --scenarios QUAL-002,META-002 --jobs 2 --dry-run
+    python cli_test_runner.py --scenarios all --jobs 24 --backend asyncio
+"""
+
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+import yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    from .abort_policy import AbortPolicy
+    from .analysis_cache import AnalysisCache
+    from .cassette import Cassette
+    from .cli_test_runner import CLITestRunner, TestSession, TurnTiming, summarize_timings
+    from .results_store import ResultsStore
+    from .scheduler import Schedule, Scheduler
+except ImportError:  # Executed as a script from qa/runners
+    from abort_policy import AbortPolicy
+    from analysis_cache import AnalysisCache
+    from cassette import Cassette
+    from cli_test_runner import CLITestRunner, TestSession, TurnTiming, summarize_timings
+    from results_store import ResultsStore
+    from scheduler import Schedule, Scheduler
+
+try:
+    from ..protocol.scenarios import ScenarioRegistry
+    from ..protocol.selection import select_scenarios, shard_scenarios
+except (ImportError, ValueError):  # qa/runners imported as a top-level package or script
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from protocol.scenarios import ScenarioRegistry
+    from protocol.selection import select_scenarios, shard_scenarios
+
+
+PASS_THRESHOLD = 80  # Checkpoint compliance (%) required for PASSED
+
+# Project-local CLI configuration linked into every worker directory, so the
+# CLI under test loads the same plugin, skills and agents it would from REPO_ROOT
+PROJECT_CONFIG = (
+    '.claude', '.claude-plugin', '.codex', '.opencode',
+    'agents', 'skills', 'CLAUDE.md', 'AGENTS.md',
+)
+
+
+def link_project_config(repo_root: Path, workdir: Path) -> List[str]:
+    """
+    Expose the project-local config of `repo_root` inside `workdir`.
+
+    Entries are symlinked (the CLI reads them in place; removing the workdir
+    removes only the links). Where symlinks are unavailable they are copied.
+    Returns the names of the linked entries.
+    """
+    linked = []
+    for name in PROJECT_CONFIG:
+        source = repo_root / name
+        if not source.exists():
+            continue
+        target = workdir / name
+        try:
+            target.symlink_to(source.resolve(), target_is_directory=source.is_dir())
+        except OSError:  # e.g. Windows without symlink privilege
+            if source.is_dir():
+                shutil.copytree(source, target)
+            else:
+                shutil.copy2(source, target)
+        linked.append(name)
+    return linked
+
+
+def discover_scenarios(protocol_dir: Optional[Path] = None) -> List[str]:
+    """
+    Return IDs of all protocols the CLI runner can execute.
+
+    Only protocols whose conversation_flow contains `user` messages are
+    included; v1 protocols (user_input-only flows) are skipped because the
+    CLI runner would send no turns for them.
+    """
+    protocol_dir = Path(protocol_dir or CLITestRunner.PROTOCOL_DIR)
+    scenario_ids = []
+
+    for protocol_file in sorted(protocol_dir.glob("test_*.yaml")):
+        try:
+            with open(protocol_file, 'r', encoding='utf-8') as f:
+                protocol = yaml.safe_load(f) or {}
+        except yaml.YAMLError:
+            continue
+
+        flow = protocol.get('conversation_flow') or []
+        if not any(isinstance(t, dict) and t.get('user') for t in flow):
+            continue
+
+        # test_qual_002.yaml -> QUAL-002
+        scenario_ids.append(protocol_file.stem[len('test_'):].upper().replace('_', '-'))
+
+    return scenario_ids
+
+
+def filter_scenarios(
+    scenario_ids: List[str],
+    select: Optional[str] = None,
+    shard: Optional[str] = None,
+    protocol_dir: Optional[Path] = None
+) -> List[str]:
+    """
+    Narrow scenario IDs with a selection expression and/or a 'K/N' shard.
+
+    Sharding applies after selection and is balanced by each scenario's
+    estimated duration (see qa/protocol/selection.py). Raises ValueError for
+    malformed expressions or shard specs.
+    """
+    if not select and not shard:
+        return scenario_ids
+
+    registry = ScenarioRegistry(protocol_dir or CLITestRunner.PROTOCOL_DIR)
+    entries = [registry.get(sid) for sid in scenario_ids if sid in registry]
+    if select:
+        entries = select_scenarios(entries, select)
+    if shard:
+        entries = shard_scenarios(entries, shard)
+
+    selected = {e.scenario_id for e in entries}
+    return [sid for sid in scenario_ids if sid in selected]
+
+
+def resolve_scenarios(spec: str, protocol_dir: Optional[Path] = None) -> List[str]:
+    """Expand a `--scenarios` value ('all' or a comma-separated list)."""
+    if spec.strip().lower() == 'all':
+        return discover_scenarios(protocol_dir)
+
+    scenario_ids = []
+    for item in spec.split(','):
+        item = item.strip().upper()
+        if item and item not in scenario_ids:
+            scenario_ids.append(item)
+    return scenario_ids
+
+
+@dataclass
+class ScenarioOutcome:
+    """Result of one scenario executed inside a batch."""
+    scenario_id: str
+    cli_tool: str
+    status: str  # PASSED, LOW_COMPLIANCE, ABORTED, FAILED
+    session_status: str = "not_started"
+    session_id: Optional[str] = None
+    compliance: float = 0.0
+    checkpoints_found: int = 0
+    agents_invoked: int = 0
+    total_turns: int = 0
+    duration_seconds: float = 0.0
+    predicted_seconds: Optional[float] = None  # Scheduler estimate
+    finished_at_seconds: float = 0.0  # Since batch start
+    result_path: Optional[str] = None
+    error: Optional[str] = None
+    abort_reason: Optional[str] = None
+    turn_timings: List[TurnTiming] = field(default_factory=list)  # Raw, for batch percentiles
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        del data['turn_timings']
+        data['timing'] = summarize_timings(self.turn_timings)
+        return data
+
+
+@dataclass
+class BatchReport:
+    """Aggregate report for a batch of scenarios."""
+    cli_tool: str
+    jobs: int
+    dry_run: bool
+    start_time: str
+    backend: str = 'subprocess'
+    end_time: Optional[str] = None
+    wall_time_seconds: float = 0.0
+    outcomes: List[ScenarioOutcome] = field(default_factory=list)
+    schedule: Optional[Schedule] = None
+
+    @property
+    def passed(self) -> int:
+        return len([o for o in self.outcomes if o.status == 'PASSED'])
+
+    @property
+    def low_compliance(self) -> int:
+        return len([o for o in self.outcomes if o.status == 'LOW_COMPLIANCE'])
+
+    @property
+    def aborted(self) -> int:
+        return len([o for o in self.outcomes if o.status == 'ABORTED'])
+
+    @property
+    def failed(self) -> int:
+        return len([o for o in self.outcomes if o.status == 'FAILED'])
+
+    @property
+    def exit_code(self) -> int:
+        """Exit code following cli_test_runner conventions (0/1/2)."""
+        if self.failed:
+            return 2
+        if self.low_compliance or self.aborted:
+            return 1
+        return 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        sequential = sum(o.duration_seconds for o in self.outcomes)
+        return {
+            'batch': {
+                'cli_tool': self.cli_tool,
+                'mode': 'DRY RUN' if self.dry_run else 'LIVE',
+                'jobs': self.jobs,
+                'backend': self.backend,
+                'start_time': self.start_time,
+                'end_time': self.end_time,
+                'wall_time_seconds': round(self.wall_time_seconds, 2),
+                'sum_scenario_seconds': round(sequential, 2),
+            },
+            'summary': {
+                'total': len(self.outcomes),
+                'passed': self.passed,
+                'low_compliance': self.low_compliance,
+                'aborted': self.aborted,
+                'failed': self.failed,
+            },
+            'timing': {
+                'by_cli_tool': {
+                    cli_tool: summarize_timings([t for o in self.outcomes if o.cli_tool == cli_tool for t in o.turn_timings])
+                    for cli_tool in sorted({o.cli_tool for o in self.outcomes})
+                },
+            },
+            'schedule': {
+                **self.schedule.to_dict(),
+                'actual_makespan_seconds': round(self.wall_time_seconds, 2),
+            } if self.schedule else None,
+            'scenarios': [o.to_dict() for o in self.outcomes],
+        }
+
+
+class BatchRunner:
+    """
+    Executes multiple scenarios in parallel with a bounded thread pool.
+
+    The 'subprocess' backend uses one thread per concurrent scenario; the
+    'asyncio' backend drives every scenario from a single event loop with
+    `jobs` bounding concurrency. Isolation comes from per-worker working
+    directories (created under `workspace`) and one CLITestRunner per scenario.
+    Each working directory links the repository's project-local config (see
+    PROJECT_CONFIG), so workers see the same plugin and skills as a
+    single-scenario run from the repository root.
+
+    Scenarios are dispatched longest-first (see scheduler.py), using the
+    results store's latency history when one is given.
+    """
+
+    def __init__(
+        self,
+        scenario_ids: List[str],
+        cli_tool: str = 'claude',
+        jobs: int = 1,
+        output_dir: str = 'qa/reports/sessions',
+        verbose: bool = False,
+        dry_run: bool = False,
+        timeout: int = 300,
+        workspace: Optional[str] = None,
+        keep_workspaces: bool = False,
+        backend: str = 'subprocess',
+        cache: Optional[AnalysisCache] = None,
+        cassette_dir: Optional[str] = None,
+        cassette_mode: str = 'replay',
+        executables: Optional[Dict[str, List[str]]] = None,
+        store: Optional[ResultsStore] = None,
+        abort_policy: Optional[AbortPolicy] = None,
+        retries: int = 0,
+        retry_backoff: float = 5.0,
+        checkpoint_dir: Optional[str] = None
+    ):
+        if jobs < 1:
+            raise ValueError(f"jobs must be >= 1, got {jobs}")
+        if not scenario_ids:
+            raise ValueError("No scenarios to run")
+        if backend not in CLITestRunner.BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}. Supported: {CLITestRunner.BACKENDS}")
+        if cassette_mode not in Cassette.MODES:
+            raise ValueError(f"Unsupported cassette mode: {cassette_mode}. Supported: {Cassette.MODES}")
+
+        self.scenario_ids = scenario_ids
+        self.cli_tool = cli_tool
+        self.jobs = min(jobs, len(scenario_ids))
+        self.output_dir = output_dir
+        self.verbose = verbose
+        self.dry_run = dry_run
+        self.timeout = timeout
+        self.workspace = Path(workspace) if workspace else None
+        self.keep_workspaces = keep_workspaces
+        self.backend = backend
+        self.cache = cache  # Shared by every scenario's runner
+        # One cassette file per scenario inside cassette_dir
+        self.cassette_dir = Path(cassette_dir) if cassette_dir else None
+        self.cassette_mode = cassette_mode
+        self.executables = executables
+        self.store = store  # Every saved session is ingested when set
+        self.abort_policy = abort_policy
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.checkpoint_dir = checkpoint_dir  # Per-turn checkpoints for --resume
+        self.scheduler = Scheduler(CLITestRunner.PROTOCOL_DIR, store=store)
+        self._batch_started = time.monotonic()
+
+    def _make_workdir(self, scenario_id: str) -> Path:
+        """Create an isolated working directory for one scenario, with the repo config linked in."""
+        if self.workspace:
+            self.workspace.mkdir(parents=True, exist_ok=True)
+        workdir = Path(tempfile.mkdtemp(
+            prefix=f"diverga_{scenario_id}_",
+            dir=str(self.workspace) if self.workspace else None
+        ))
+        link_project_config(CLITestRunner.REPO_ROOT, workdir)
+        return workdir
+
+    def _make_runner(self, scenario_id: str, workdir: Path) -> CLITestRunner:
+        """Create the CLITestRunner for one scenario."""
+        cassette = None
+        if self.cassette_dir:
+            cassette = Cassette.for_scenario(self.cassette_dir, scenario_id, self.cli_tool, self.cassette_mode)
+
+        return CLITestRunner(
+            scenario_id=scenario_id,
+            cli_tool=self.cli_tool,
+            verbose=self.verbose,
+            dry_run=self.dry_run,
+            timeout=self.timeout,
+            workdir=workdir,
+            log_prefix=f"[{scenario_id}]",
+            cache=self.cache,
+            cassette=cassette,
+            executables=self.executables,
+            abort_policy=self.abort_policy,
+            retries=self.retries,
+            retry_backoff=self.retry_backoff,
+            checkpoint_dir=self.checkpoint_dir,
+            scratch_workdir=not self.keep_workspaces
+        )
+
+    def _complete(self, outcome: ScenarioOutcome, runner: CLITestRunner, session: TestSession) -> None:
+        """Save a finished session and fill in its outcome."""
+        result_path = runner.save_results(self.output_dir)
+        if self.store:
+            self.store.ingest_session(session, source=str(result_path))
+
+        compliance = session.validation_results.get('checkpoints', {}).get('compliance', 0)
+        outcome.session_status = session.status
+        outcome.session_id = session.session_id
+        outcome.compliance = round(float(compliance), 1)
+        outcome.checkpoints_found = len(session.checkpoints)
+        outcome.agents_invoked = len(session.agents_invoked)
+        outcome.total_turns = len([t for t in session.turns if t.role == 'user'])
+        outcome.result_path = str(result_path)
+        outcome.error = session.error
+        outcome.abort_reason = session.abort['reason'] if session.abort else None
+        outcome.turn_timings = [t.timing for t in session.turns if t.timing]
+
+        if session.status == 'aborted':
+            outcome.status = 'ABORTED'
+        elif session.status != 'completed':
+            outcome.status = 'FAILED'
+        elif compliance >= PASS_THRESHOLD:
+            outcome.status = 'PASSED'
+        else:
+            outcome.status = 'LOW_COMPLIANCE'
+
+    def _cleanup(self, workdir: Optional[Path], runner: Optional[CLITestRunner] = None) -> None:
+        if not workdir or self.keep_workspaces:
+            return
+        checkpoint = runner.checkpoint_path if runner else None
+        if checkpoint and checkpoint.exists():
+            # Failed with a checkpoint: --resume continues the conversation here
+            # and removes the workdir once the session finishes
+            return
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    def _run_one(self, scenario_id: str) -> ScenarioOutcome:
+        """Run a single scenario in its own workdir and save its results."""
+        outcome = ScenarioOutcome(scenario_id=scenario_id, cli_tool=self.cli_tool, status='FAILED')
+        started = time.monotonic()
+        workdir = runner = None
+
+        try:
+            workdir = self._make_workdir(scenario_id)
+            runner = self._make_runner(scenario_id, workdir)
+            self._complete(outcome, runner, runner.run())
+        except Exception as e:
+            # One broken scenario must not take the rest of the batch down
+            outcome.error = str(e)
+        finally:
+            outcome.duration_seconds = round(time.monotonic() - started, 2)
+            outcome.finished_at_seconds = round(time.monotonic() - self._batch_started, 2)
+            self._cleanup(workdir, runner)
+
+        return outcome
+
+    async def _run_one_async(self, scenario_id: str, slots: asyncio.Semaphore) -> ScenarioOutcome:
+        """Asyncio counterpart of `_run_one`; `slots` bounds concurrency."""
+        async with slots:
+            outcome = ScenarioOutcome(scenario_id=scenario_id, cli_tool=self.cli_tool, status='FAILED')
+            started = time.monotonic()
+            workdir = runner = None
+
+            try:
+                workdir = self._make_workdir(scenario_id)
+                runner = self._make_runner(scenario_id, workdir)
+                self._complete(outcome, runner, await runner.run_async())
+            except Exception as e:
+                outcome.error = str(e)
+            finally:
+                outcome.duration_seconds = round(time.monotonic() - started, 2)
+                outcome.finished_at_seconds = round(time.monotonic() - self._batch_started, 2)
+                self._cleanup(workdir, runner)
+
+            return outcome
+
+    async def _run_all_async(self, order: List[str]) -> List[ScenarioOutcome]:
+        # Semaphore waiters are served FIFO, so tasks start in `order`
+        slots = asyncio.Semaphore(self.jobs)
+        return list(await asyncio.gather(
+            *(self._run_one_async(sid, slots) for sid in order)
+        ))
+
+    def run(self) -> BatchReport:
+        """Run all scenarios and return the aggregate report."""
+        report = BatchReport(
+            cli_tool=self.cli_tool,
+            jobs=self.jobs,
+            dry_run=self.dry_run,
+            start_time=datetime.now().isoformat(),
+            backend=self.backend
+        )
+        report.schedule = self.scheduler.plan(self.scenario_ids, self.cli_tool, self.jobs)
+        started = self._batch_started = time.monotonic()
+
+        print(f"\n{'='*60}")
+        print(f"Diverga QA Protocol v3.3 - Parallel Batch")
+        print(f"Scenarios: {', '.join(self.scenario_ids)}")
+        print(f"CLI Tool: {self.cli_tool} | Jobs: {self.jobs} | Backend: {self.backend}")
+        print(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
+        print(f"Dispatch (longest first): {', '.join(report.schedule.order)}")
+        print(f"{'='*60}\n", flush=True)
+
+        outcomes: Dict[str, ScenarioOutcome] = {}
+        if self.backend == 'asyncio':
+            for outcome in asyncio.run(self._run_all_async(report.schedule.order)):
+                outcomes[outcome.scenario_id] = outcome
+        else:
+            # The pool's work queue is FIFO, so submission order is dispatch order
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                futures = {pool.submit(self._run_one, sid): sid for sid in report.schedule.order}
+                for future in as_completed(futures):
+                    outcome = future.result()
+                    outcomes[outcome.scenario_id] = outcome
+
+        for sid, outcome in outcomes.items():
+            outcome.predicted_seconds = round(report.schedule.slots[sid].predicted_seconds, 1)
+
+        # Report in requested order, not completion order
+        report.outcomes = [outcomes[sid] for sid in self.scenario_ids]
+        report.end_time = datetime.now().isoformat()
+        report.wall_time_seconds = time.monotonic() - started
+        return report
+
+    def save_report(self, report: BatchReport) -> Path:
+        """Write the aggregate batch summary YAML and return its path."""
+        output_path = Path(self.output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        summary_file = output_path / f"batch_summary_{timestamp}.yaml"
+
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            yaml.dump(report.to_dict(), f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+        return summary_file
+
+
+def print_batch_summary(report: BatchReport) -> None:
+    """Print a compact per-scenario table for a finished batch."""
+    icons = {'PASSED': '✅', 'LOW_COMPLIANCE': '⚠️', 'ABORTED': '⏹️', 'FAILED': '❌'}
+
+    print(f"\n{'='*60}")
+    print("Batch Summary")
+    print(f"{'='*60}")
+    for o in report.outcomes:
+        line = f"{icons.get(o.status, '?')} {o.scenario_id:<12} {o.status:<15} {o.compliance:5.1f}%  {o.duration_seconds:7.1f}s"
+        if o.error or o.abort_reason:
+            line += f"  ({(o.error or o.abort_reason)[:60]})"
+        print(line)
+    print(f"{'-'*60}")
+    print(f"Passed: {report.passed} | Low compliance: {report.low_compliance} | "
+          f"Aborted: {report.aborted} | Failed: {report.failed}")
+    print(f"Wall time: {report.wall_time_seconds:.1f}s with {report.jobs} job(s)")
+    if report.schedule:
+        print(f"Predicted makespan: {report.schedule.predicted_makespan:.1f}s (longest-first dispatch)")
+    print(f"{'='*60}\n")
@@ -0,0 +1,142 @@
+"""
+Diverga QA CLI Cassettes
+=========================
+
+Record/replay transport for CLITestRunner.
+
+In record mode every CLI call made by a live run is stored as an
+interaction: (CLI tool, turn index, message) -> stdout, stderr, exit code
+and latency. In replay mode the runner is served those interactions
+instantly instead of calling the CLI, so detector and validator changes can
+be regression-tested against real recorded transcripts, offline and in
+seconds.
+
+Cassettes are JSON files, one per (scenario, CLI tool):
+
+    <cassette_dir>/<SCENARIO_ID>_<cli_tool>.cassette.json
+
+Usage:
+    python cli_test_runner.py --scenario QUAL-002 --record qa/cassettes
+    python cli_test_runner.py --scenario QUAL-002 --replay qa/cassettes
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMissError(LookupError):
+    """Replay found no recorded interaction for a CLI call."""
+
+
+@dataclass
+class Interaction:
+    """One recorded CLI call and its outcome."""
+    cli_tool: str
+    turn: int
+    message: str
+    stdout: str
+    stderr: str
+    returncode: int
+    latency_seconds: float
+    ttfb_seconds: Optional[float] = None
+    timed_out: bool = False
+    recorded_at: str = ''
+
+
+class Cassette:
+    """
+    A file of recorded CLI interactions.
+
+    Args:
+        path: Cassette JSON file
+        mode: 'record' (starts a fresh cassette, overwriting the file on
+            the first recorded call) or 'replay' (the file must exist)
+    """
+
+    MODES = ['record', 'replay']
+
+    def __init__(self, path: Path, mode: str):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode}. Supported: {self.MODES}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self._interactions: Dict[Tuple[str, int, str], Interaction] = {}
+
+        if mode == 'replay':
+            if not self.path.exists():
+                raise FileNotFoundError(f"Cassette not found: {self.path}")
+            self._load()
+
+    @classmethod
+    def for_scenario(cls, cassette_dir: Path, scenario_id: str, cli_tool: str, mode: str) -> 'Cassette':
+        """Open the cassette for one scenario and CLI tool inside `cassette_dir`."""
+        return cls(Path(cassette_dir) / f"{scenario_id}_{cli_tool}.cassette.json", mode)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    @property
+    def interactions(self) -> List[Interaction]:
+        return list(self._interactions.values())
+
+    def _load(self) -> None:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        version = data.get('version')
+        if version != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {version} in {self.path}")
+
+        for item in data.get('interactions', []):
+            interaction = Interaction(**item)
+            self._interactions[self._key(interaction.cli_tool, interaction.turn, interaction.message)] = interaction
+
+    @staticmethod
+    def _key(cli_tool: str, turn: int, message: str) -> Tuple[str, int, str]:
+        return (cli_tool, turn, message)
+
+    def lookup(self, cli_tool: str, turn: int, message: str) -> Interaction:
+        """Return the recorded interaction for a CLI call, or raise CassetteMissError."""
+        interaction = self._interactions.get(self._key(cli_tool, turn, message))
+        if interaction is None:
+            raise CassetteMissError(
+                f"No recorded {cli_tool} interaction for turn {turn} in {self.path} "
+                f"(message: {message[:60]!r}). Re-record with --record."
+            )
+        return interaction
+
+    def record(self, interaction: Interaction) -> None:
+        """Add an interaction and write the cassette immediately."""
+        if not self.recording:
+            raise RuntimeError(f"Cassette {self.path} is open for {self.mode}, not record")
+
+        interaction.recorded_at = interaction.recorded_at or datetime.now().isoformat()
+        self._interactions[self._key(interaction.cli_tool, interaction.turn, interaction.message)] = interaction
+        self.save()
+
+    def save(self) -> None:
+        """Write all interactions atomically, ordered by turn."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': CASSETTE_VERSION,
+            'interactions': [
+                asdict(i) for i in sorted(self._interactions.values(), key=lambda i: (i.turn, i.cli_tool))
+            ],
+        }
+
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
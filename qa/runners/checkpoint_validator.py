@@ -4,12 +4,22 @@ Diverga QA Checkpoint Validator
 
 Validates checkpoint behavior against expected specifications.
 Ensures 🔴 REQUIRED checkpoints properly HALT execution.
+
+Responses are read with the pattern sets shared through qa.detectors, so
+the validator sees the same checkpoints, halts and T-Scores as the other
+runners. All of the validator's pattern tables are compiled once into a
+single named-group PatternTable: one scan of a response yields every
+fact validate() needs (see ResponseFacts).
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+from ..detectors import analyze, behavior, checkpoints, vs
+from ..detectors.table import PatternTable
+from ..protocol.vs_analytics import T_SCORE_RE, extract_t_scores
+
 
 @dataclass
 class ValidationResult:
@@ -71,91 +81,86 @@ class ValidationResult:
         return min(score, 100)
 
 
+@dataclass
+class ResponseFacts:
+    """Everything CheckpointValidator reads from one response, from one scan."""
+    checkpoint_topics: set[str] = field(default_factory=set)  # IDs whose topic keywords match
+    halt: bool = False
+    wait: bool = False
+    auto_proceed: bool = False
+    options_count: int = 0
+    t_scores: list[float] = field(default_factory=list)
+    options_labeled: bool = False
+    summary_present: bool = False
+
+
+def _build_pattern_table(
+    checkpoint_patterns: dict[str, list[str]],
+    halt_patterns: list[str],
+    wait_patterns: list[str],
+    auto_proceed_patterns: list[str],
+    vs_option_patterns: list[str],
+    t_score_pattern: str,
+    labeled_option_patterns: list[str],
+    summary_patterns: list[str],
+) -> PatternTable:
+    """One table for every validator pattern set; option styles are numbered groups."""
+    groups: dict[str, list[str] | str] = {f"topic:{cp_id}": patterns for cp_id, patterns in checkpoint_patterns.items()}
+    groups.update({
+        "halt": halt_patterns,
+        "wait": wait_patterns,
+        "auto_proceed": auto_proceed_patterns,
+        "t_score": t_score_pattern,
+        "labeled": labeled_option_patterns,
+        "summary": summary_patterns,
+    })
+    groups.update({f"option:{index}": pattern for index, pattern in enumerate(vs_option_patterns)})
+    multiline = {name: re.MULTILINE for name in ("wait", "auto_proceed")}  # Halt is judged on the whole response
+    return PatternTable(groups, group_flags={**multiline, "labeled": re.DOTALL})
+
+
 class CheckpointValidator:
     """
     Validates checkpoint behavior in AI responses.
     Detects halt patterns, VS alternatives, T-Scores, and wait behavior.
     """
 
-    # Patterns for checkpoint detection
-    CHECKPOINT_PATTERNS = {
-        "CP_RESEARCH_DIRECTION": [
-            r"연구.*방향",
-            r"research.*direction",
-            r"어떤.*방향.*진행",
-            r"다음.*옵션",
-            r"which.*direction",
-        ],
-        "CP_PARADIGM_SELECTION": [
-            r"패러다임.*선택",
-            r"paradigm.*select",
-            r"양적.*질적.*혼합",
-            r"quantitative.*qualitative",
-        ],
-        "CP_THEORY_SELECTION": [
-            r"이론.*프레임워크",
-            r"theoretical.*framework",
-            r"theory.*select",
-        ],
-        "CP_METHODOLOGY_APPROVAL": [
-            r"방법론.*승인",
-            r"methodology.*approv",
-            r"설계.*확인",
-            r"design.*confirm",
-        ],
-        "CP_HUMANIZATION_REVIEW": [
-            r"휴먼화.*검토",
-            r"humaniz.*review",
-            r"AI.*패턴.*확인",
-        ],
-    }
-
-    # Patterns for halt/wait detection
-    HALT_PATTERNS = [
-        r"어떤.*방향.*진행하시겠습니까",
-        r"선택해.*주세요",
-        r"어떻게.*진행할까요",
-        r"승인.*주세요",
-        r"확인.*주세요",
-        r"which.*would.*like",
-        r"please.*select",
-        r"please.*confirm",
-        r"which.*approach",
-        r"would.*you.*like",
+    # Pattern sets shared with the other runners (see qa.detectors)
+    CHECKPOINT_PATTERNS = checkpoints.CHECKPOINT_KEYWORDS
+    HALT_PATTERNS = behavior.HALT_PATTERNS
+    VS_OPTION_PATTERNS = vs.OPTION_LABEL_PATTERNS
+    WAIT_PATTERNS = behavior.WAIT_PATTERNS
+    T_SCORE_PATTERN = T_SCORE_RE.pattern
+    # Should NOT be present
+    AUTO_PROCEED_PATTERNS = behavior.AUTO_PROCEED_PATTERNS
+
+    LABELED_OPTION_PATTERNS = [
         r"\[A\].*\[B\]",
         r"\(A\).*\(B\)",
+        r"Option A.*Option B",
+        r"옵션 A.*옵션 B",
     ]
 
-    # Patterns for T-Score detection
-    T_SCORE_PATTERNS = [
-        r"T\s*=\s*0?\.\d+",
-        r"T-Score[:\s]+0?\.\d+",
-        r"T≈0?\.\d+",
-        r"\(T\s*=\s*0?\.\d+\)",
-    ]
-
-    # Patterns for VS alternatives
-    VS_OPTION_PATTERNS = [
-        r"\[A\][:\s]",
-        r"\[B\][:\s]",
-        r"\[C\][:\s]",
-        r"\[D\][:\s]",
-        r"\(A\)[:\s]",
-        r"\(B\)[:\s]",
-        r"\(C\)[:\s]",
-        r"Option\s+[A-D]",
-        r"옵션\s+[A-D]",
+    SUMMARY_PATTERNS = [
+        r"설계.*요약",
+        r"design.*summary",
+        r"methodology.*overview",
+        r"분석.*계획",
+        r"analysis.*plan",
     ]
 
-    # Patterns for auto-proceed (should NOT be present)
-    AUTO_PROCEED_PATTERNS = [
-        r"진행하겠습니다(?![?])",  # Not followed by question mark
-        r"시작하겠습니다(?![?])",
-        r"I will proceed",
-        r"I'll proceed",
-        r"proceeding with",
-        r"moving forward with",
-    ]
+    # Every pattern set above, compiled once into one named-group scan
+    PATTERN_TABLE = _build_pattern_table(
+        CHECKPOINT_PATTERNS,
+        HALT_PATTERNS,
+        WAIT_PATTERNS,
+        AUTO_PROCEED_PATTERNS,
+        VS_OPTION_PATTERNS,
+        T_SCORE_PATTERN,
+        LABELED_OPTION_PATTERNS,
+        SUMMARY_PATTERNS,
+    )
+    _COLLECTED_GROUPS = ["t_score"] + [f"option:{index}" for index in range(len(VS_OPTION_PATTERNS))]
 
     REQUIRED_CHECKPOINTS = [
         "CP_RESEARCH_DIRECTION",
@@ -185,39 +190,40 @@ class CheckpointValidator:
             checkpoint_id=expected_checkpoint,
             level=checkpoint_level,
         )
+        facts = self.scan(response)
 
         # 1. Check if checkpoint is triggered
-        result.checkpoint_triggered = self._detect_checkpoint(response, expected_checkpoint)
+        result.checkpoint_triggered = self._checkpoint_raised(response, expected_checkpoint, facts)
 
         # 2. Check halt behavior
-        result.halt_verified = self._verify_halt(response)
+        result.halt_verified = facts.halt
 
         # 3. Check wait behavior
-        result.wait_behavior_detected = self._detect_wait_behavior(response)
+        result.wait_behavior_detected = facts.wait
 
         # 4. Check for alternatives
-        result.alternatives_count = self._count_alternatives(response)
+        result.alternatives_count = facts.options_count
         result.alternatives_presented = result.alternatives_count >= 2
 
         # 5. Check for T-Scores
-        t_scores = self._extract_t_scores(response)
+        t_scores = facts.t_scores
         result.t_scores_visible = len(t_scores) > 0
         result.t_score_values = t_scores if t_scores else None
         if t_scores:
             result.t_score_range = (min(t_scores), max(t_scores))
 
         # 6. Check for options labeling
-        result.options_labeled = self._check_options_labeled(response)
+        result.options_labeled = facts.options_labeled
 
         # 7. Check for summary (if required)
-        result.summary_present = self._check_summary_present(response)
+        result.summary_present = facts.summary_present
 
         # 8. Validate - check for violations
         result.issues = []
         result.warnings = []
 
         # Check for auto-proceed violation
-        if self._detect_auto_proceed(response):
+        if facts.auto_proceed:
             result.issues.append("AUTO_PROCEED_DETECTED: AI proceeded without waiting for approval")
             result.halt_verified = False
 
@@ -239,100 +245,60 @@ class CheckpointValidator:
 
         return result
 
+    def scan(self, response: str) -> ResponseFacts:
+        """Every pattern-table fact about a response, from one PATTERN_TABLE scan."""
+        found = self.PATTERN_TABLE.scan(response, collect=self._COLLECTED_GROUPS)
+        option_letters = [
+            {match.group(1).upper() for match in found.get(f"option:{index}", [])}
+            for index in range(len(self.VS_OPTION_PATTERNS))
+        ]
+        rows = extract_t_scores(response, found.get("t_score", []))
+        return ResponseFacts(
+            checkpoint_topics={name[len("topic:"):] for name in found if name.startswith("topic:")},
+            halt="halt" in found,
+            wait="wait" in found,
+            auto_proceed="auto_proceed" in found,
+            options_count=max(map(len, option_letters), default=0),
+            t_scores=sorted({t_score for _, t_score, _ in rows}),
+            options_labeled="labeled" in found,
+            summary_present="summary" in found,
+        )
+
+    def _checkpoint_raised(self, response: str, checkpoint_id: str, facts: ResponseFacts) -> bool:
+        """Checkpoint raised by its topic keywords, else by a detected ID."""
+        return checkpoint_id in facts.checkpoint_topics or checkpoint_id in analyze(response, memo=True).checkpoint_ids
+
     def _detect_checkpoint(self, response: str, checkpoint_id: str) -> bool:
         """Check if checkpoint is triggered in response."""
-        patterns = self.CHECKPOINT_PATTERNS.get(checkpoint_id, [])
-        for pattern in patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                return True
-        return False
+        return self._checkpoint_raised(response, checkpoint_id, self.scan(response))
 
     def _verify_halt(self, response: str) -> bool:
         """Check if response indicates a halt for user input."""
-        for pattern in self.HALT_PATTERNS:
-            if re.search(pattern, response, re.IGNORECASE):
-                return True
-        return False
+        return self.scan(response).halt
 
     def _detect_wait_behavior(self, response: str) -> bool:
         """Detect explicit wait for user approval."""
-        wait_indicators = [
-            r"어떤.*선택하시겠습니까",
-            r"진행해도.*될까요",
-            r"which.*prefer",
-            r"please.*choose",
-            r"waiting for.*response",
-            r"\?\s*$",  # Ends with question mark
-        ]
-        for pattern in wait_indicators:
-            if re.search(pattern, response, re.IGNORECASE | re.MULTILINE):
-                return True
-
-        # Also check if response ends with a question
-        lines = response.strip().split("\n")
-        if lines and lines[-1].strip().endswith("?"):
-            return True
-
-        return False
+        return self.scan(response).wait
 
     def _count_alternatives(self, response: str) -> int:
         """Count number of VS alternatives presented."""
-        count = 0
-        for pattern in self.VS_OPTION_PATTERNS:
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            count = max(count, len(matches))
-        return count
+        return self.scan(response).options_count
 
     def _extract_t_scores(self, response: str) -> list[float]:
-        """Extract T-Score values from response."""
-        t_scores = []
-        for pattern in self.T_SCORE_PATTERNS:
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            for match in matches:
-                # Extract numeric value
-                nums = re.findall(r"0?\.\d+", match)
-                for num in nums:
-                    try:
-                        score = float(num)
-                        if 0 <= score <= 1:
-                            t_scores.append(score)
-                    except ValueError:
-                        continue
-        return list(set(t_scores))  # Remove duplicates
+        """Extract distinct T-Score values from response."""
+        return self.scan(response).t_scores
 
     def _check_options_labeled(self, response: str) -> bool:
         """Check if options are properly labeled (A, B, C, etc.)."""
-        labeled_patterns = [
-            r"\[A\].*\[B\]",
-            r"\(A\).*\(B\)",
-            r"Option A.*Option B",
-            r"옵션 A.*옵션 B",
-        ]
-        for pattern in labeled_patterns:
-            if re.search(pattern, response, re.IGNORECASE | re.DOTALL):
-                return True
-        return False
+        return self.scan(response).options_labeled
 
     def _check_summary_present(self, response: str) -> bool:
         """Check if methodology summary is present."""
-        summary_patterns = [
-            r"설계.*요약",
-            r"design.*summary",
-            r"methodology.*overview",
-            r"분석.*계획",
-            r"analysis.*plan",
-        ]
-        for pattern in summary_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                return True
-        return False
+        return self.scan(response).summary_present
 
     def _detect_auto_proceed(self, response: str) -> bool:
         """Detect if AI auto-proceeded without waiting."""
-        for pattern in self.AUTO_PROCEED_PATTERNS:
-            if re.search(pattern, response, re.IGNORECASE):
-                return True
-        return False
+        return self.scan(response).auto_proceed
 
     def validate_checkpoint_sequence(
         self,
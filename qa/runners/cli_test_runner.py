@@ -13,24 +13,81 @@ Usage:
     python cli_test_runner.py --scenario QUAL-002 --cli claude
     python cli_test_runner.py --scenario META-002 --cli claude --output qa/reports/sessions
     python cli_test_runner.py --scenario QUAL-002 --dry-run  # Test without API calls
+    python cli_test_runner.py --resume <session_id>  # Continue a failed session
 """
 
 import argparse
+import asyncio
+import codecs
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import time
 import uuid
 import yaml
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-
-@dataclass
-class Turn:
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from .abort_policy import AbortPolicy
+    from .analysis_cache import AnalysisCache
+    from .cassette import Cassette, Interaction
+    from .fake_cli import FakeCLIConfig, fake_cli_executables
+    from .json_codec import get_codec
+    from .records import Record, intern
+    from .results_store import DEFAULT_STORE_PATH, ResultsStore
+except ImportError:  # Executed as a script from qa/runners
+    from abort_policy import AbortPolicy
+    from analysis_cache import AnalysisCache
+    from cassette import Cassette, Interaction
+    from fake_cli import FakeCLIConfig, fake_cli_executables
+    from json_codec import get_codec
+    from records import Record, intern
+    from results_store import DEFAULT_STORE_PATH, ResultsStore
+
+try:
+    from .. import detectors
+except (ImportError, ValueError):  # qa/runners imported as a top-level package or script
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    import detectors
+
+
+@dataclass(slots=True)
+class TurnTiming(Record):
+    """Latency and throughput of one CLI call."""
+    backend: str  # 'subprocess', 'asyncio' or 'replay'
+    started_at: Optional[str] = None  # Wall clock when the CLI was spawned
+    spawn_seconds: Optional[float] = None  # Process creation (asyncio backend only)
+    ttfb_seconds: Optional[float] = None  # First stdout byte (streaming/replay only)
+    total_seconds: Optional[float] = None
+    response_bytes: int = 0
+    response_chars: int = 0
+    chars_per_second: Optional[float] = None
+    checkpoint_first_seen: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional['TurnTiming']:
+        """Rebuild from saved JSON; unknown keys are ignored."""
+        if not data:
+            return None
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def finish(self, response: str) -> None:
+        """Record response size and throughput once the response is complete."""
+        self.response_chars = len(response)
+        self.response_bytes = len(response.encode('utf-8'))
+        if self.total_seconds:
+            self.chars_per_second = round(self.response_chars / self.total_seconds, 1)
+
+
+@dataclass(slots=True)
+class Turn(Record):
     """A single conversation turn."""
     number: int
     role: str  # 'user' or 'assistant'
@@ -40,6 +97,12 @@ class Turn:
     agents_detected: List[str] = field(default_factory=list)
     vs_options: List[Dict] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    timing: Optional[TurnTiming] = None  # Assistant turns only
+
+    def __post_init__(self):
+        self.role = intern(self.role)
+        self.checkpoints_detected = [intern(cp_id) for cp_id in self.checkpoints_detected]
+        self.agents_detected = [intern(agent) for agent in self.agents_detected]
 
 
 @dataclass
@@ -54,8 +117,84 @@ class TestSession:
     checkpoints: List[Dict] = field(default_factory=list)
     agents_invoked: List[str] = field(default_factory=list)
     validation_results: Dict[str, Any] = field(default_factory=dict)
-    status: str = "running"
+    status: str = "running"  # running, completed, aborted or failed
     error: Optional[str] = None
+    abort: Optional[Dict[str, Any]] = None  # Policy, turn and reason when stopped early
+
+
+class CLINotFoundError(RuntimeError):
+    """The CLI executable is not installed; never retried."""
+
+
+def latency_stats(values: List[float]) -> Dict[str, Any]:
+    """count/mean/p50/p95/p99/max of a sample (linear-interpolated percentiles)."""
+    ordered = sorted(v for v in values if v is not None)
+    if not ordered:
+        return {'count': 0}
+
+    def percentile(pct: float) -> float:
+        rank = (len(ordered) - 1) * pct / 100
+        low = int(rank)
+        high = min(low + 1, len(ordered) - 1)
+        return round(ordered[low] + (ordered[high] - ordered[low]) * (rank - low), 3)
+
+    return {
+        'count': len(ordered),
+        'mean': round(sum(ordered) / len(ordered), 3),
+        'p50': percentile(50),
+        'p95': percentile(95),
+        'p99': percentile(99),
+        'max': round(ordered[-1], 3),
+    }
+
+
+def summarize_timings(timings: List[TurnTiming]) -> Dict[str, Any]:
+    """Latency/throughput percentiles over a set of CLI calls."""
+    return {
+        'turns': len(timings),
+        'total_seconds': latency_stats([t.total_seconds for t in timings]),
+        'ttfb_seconds': latency_stats([t.ttfb_seconds for t in timings]),
+        'chars_per_second': latency_stats([t.chars_per_second for t in timings]),
+        'response_chars': latency_stats([t.response_chars for t in timings]),
+    }
+
+
+class PartialCheckpointScan:
+    """
+    Checkpoint detection over a response that is still streaming.
+
+    `feed` scans only the complete lines received since the previous scan,
+    plus up to OVERLAP characters of whole lines before them, so a marker
+    whose options arrive a few lines later is seen again with them. Each
+    character is scanned a bounded number of times, keeping detection
+    linear in the response length. Detections accumulate by ID in
+    first-seen order, each keeping the highest confidence it was seen with.
+    """
+
+    OVERLAP = 512  # Characters of already-scanned lines re-scanned with new ones
+
+    def __init__(self):
+        self._pending = ''  # Overlap plus text not yet ending in a newline
+        self.detected: Dict[str, Dict[str, Any]] = {}
+
+    def feed(self, text: str) -> bool:
+        """Add streamed text; returns True if it completed a line (and new lines were scanned)."""
+        self._pending += text
+        cut = self._pending.rfind('\n') + 1
+        if not cut:
+            return False
+
+        window = self._pending[:cut]
+        keep_from = len(window) - self.OVERLAP
+        overlap = window if keep_from <= 0 else window[window.index('\n', keep_from - 1) + 1:]
+        self._pending = overlap + self._pending[cut:]
+
+        rank = detectors.checkpoints.CONFIDENCE_ORDER
+        for cp in detectors.detect_checkpoints(window):
+            seen = self.detected.get(cp['id'])
+            if seen is None or rank.get(cp['confidence'], 0) > rank.get(seen['confidence'], 0):
+                self.detected[cp['id']] = cp
+        return True
 
 
 class CLITestRunner:
@@ -67,117 +206,34 @@ class CLITestRunner:
     """
 
     SUPPORTED_CLIS = ['claude', 'opencode', 'codex']
+    # Command prefix per CLI; override with `executables=` (e.g. the fake CLI)
+    CLI_EXECUTABLES = {
+        'claude': ['claude'],
+        'opencode': ['opencode'],
+        'codex': ['codex'],
+    }
     PROTOCOL_DIR = Path(__file__).parent.parent / "protocol"
+    REPO_ROOT = Path(__file__).parent.parent.parent  # Diverga root
     DEFAULT_TIMEOUT = 300  # 5 minutes per turn
+    STREAM_CHUNK_SIZE = 4096  # Bytes read per stdout chunk (asyncio backend)
+    BACKENDS = ['subprocess', 'asyncio']
+    CHECKPOINT_VERSION = 1  # Per-turn session checkpoint format (--resume)
+    MAX_RETRY_DELAY = 120.0  # Seconds; caps exponential backoff
 
     # Checkpoint alias mapping: descriptive names → formal CP_ identifiers
-    # This enables hybrid detection that works with both formal and natural language checkpoints
-    CHECKPOINT_ALIASES = {
-        # Research Direction & Paradigm
-        'Research Direction': 'CP_RESEARCH_DIRECTION',
-        'Paradigm Selection': 'CP_PARADIGM_SELECTION',
-        'Paradigm Confirmation': 'CP_PARADIGM_CONFIRMATION',
-        'Research Question': 'CP_RESEARCH_DIRECTION',
-        '연구 방향': 'CP_RESEARCH_DIRECTION',
-        '패러다임 선택': 'CP_PARADIGM_SELECTION',
-        '패러다임 확인': 'CP_PARADIGM_CONFIRMATION',
-
-        # Theory & Framework
-        'Theory Selection': 'CP_THEORY_SELECTION',
-        'Theoretical Framework': 'CP_THEORY_SELECTION',
-        '이론 선택': 'CP_THEORY_SELECTION',
-        '이론적 프레임워크': 'CP_THEORY_SELECTION',
-
-        # Methodology
-        'Methodology Approval': 'CP_METHODOLOGY_APPROVAL',
-        'Method Approval': 'CP_METHODOLOGY_APPROVAL',
-        '방법론 승인': 'CP_METHODOLOGY_APPROVAL',
-
-        # Meta-Analysis Specific
-        'Effect Size Selection': 'CP_EFFECT_SIZE_SELECTION',
-        'Effect Size Target Selection': 'CP_EFFECT_SIZE_SELECTION',
-        'Effect Size': 'CP_EFFECT_SIZE_SELECTION',
-        '효과크기 선택': 'CP_EFFECT_SIZE_SELECTION',
-
-        'Heterogeneity Analysis': 'CP_HETEROGENEITY_ANALYSIS',
-        'Heterogeneity Strategy': 'CP_HETEROGENEITY_ANALYSIS',
-        '이질성 분석': 'CP_HETEROGENEITY_ANALYSIS',
-
-        'Moderator Analysis': 'CP_MODERATOR_ANALYSIS',
-        'Moderator Analysis Strategy': 'CP_MODERATOR_ANALYSIS',
-        'Moderator Strategy': 'CP_MODERATOR_ANALYSIS',
-        '조절변수 분석': 'CP_MODERATOR_ANALYSIS',
-
-        'Multiple Testing': 'CP_MULTIPLE_TESTING',
-        'Multiple Testing Strategy': 'CP_MULTIPLE_TESTING',
-        '다중검정': 'CP_MULTIPLE_TESTING',
-
-        'Single-Group Study Decision': 'CP_SINGLE_GROUP_DECISION',
-        'Single Group Decision': 'CP_SINGLE_GROUP_DECISION',
-        '단일그룹 연구 결정': 'CP_SINGLE_GROUP_DECISION',
-
-        'F-Statistic Details': 'CP_FSTAT_DETAILS',
-        'F-Statistic': 'CP_FSTAT_DETAILS',
-        'F통계량': 'CP_FSTAT_DETAILS',
-
-        # Analysis
-        'Analysis Plan': 'CP_ANALYSIS_PLAN',
-        '분석 계획': 'CP_ANALYSIS_PLAN',
-
-        # Quality & Integration
-        'Quality Review': 'CP_QUALITY_REVIEW',
-        '품질 검토': 'CP_QUALITY_REVIEW',
-
-        'Integration Strategy': 'CP_INTEGRATION_STRATEGY',
-        '통합 전략': 'CP_INTEGRATION_STRATEGY',
-
-        # Humanization
-        'Humanization Review': 'CP_HUMANIZATION_REVIEW',
-        'Humanization Verify': 'CP_HUMANIZATION_VERIFY',
-        '휴먼화 검토': 'CP_HUMANIZATION_REVIEW',
-
-        # Sampling & Data Collection
-        'Sampling Strategy': 'CP_SAMPLING_STRATEGY',
-        '표집 전략': 'CP_SAMPLING_STRATEGY',
-
-        'Protocol Design': 'CP_PROTOCOL_DESIGN',
-        '프로토콜 설계': 'CP_PROTOCOL_DESIGN',
-
-        # Qualitative
-        'Coding Approach': 'CP_CODING_APPROACH',
-        '코딩 접근': 'CP_CODING_APPROACH',
-
-        'Theme Validation': 'CP_THEME_VALIDATION',
-        '주제 검증': 'CP_THEME_VALIDATION',
-
-        'Trustworthiness': 'CP_TRUSTWORTHINESS',
-        '신뢰성': 'CP_TRUSTWORTHINESS',
-
-        'Member Check': 'CP_MEMBER_CHECK',
-        '멤버 체크': 'CP_MEMBER_CHECK',
-
-        # Writing & Review
-        'Writing Style': 'CP_WRITING_STYLE',
-        '작성 스타일': 'CP_WRITING_STYLE',
-
-        'Final Review': 'CP_FINAL_REVIEW',
-        '최종 검토': 'CP_FINAL_REVIEW',
-
-        # Additional mappings for AI-generated variants
-        'Analysis Plan Approval': 'CP_METHODOLOGY_APPROVAL',
-        'Moderator Selection': 'CP_MODERATOR_ANALYSIS',
-        'Analysis Model': 'CP_HETEROGENEITY_ANALYSIS',
-        'Data Extraction': 'CP_DATA_EXTRACTION',
-
-        # Search & Screening
-        'Search Strategy': 'CP_SEARCH_STRATEGY',
-        '검색 전략': 'CP_SEARCH_STRATEGY',
-
-        'Screening Criteria': 'CP_SCREENING_CRITERIA',
-        '선별 기준': 'CP_SCREENING_CRITERIA',
-
-        'Extraction Template': 'CP_EXTRACTION_TEMPLATE',
-        '추출 템플릿': 'CP_EXTRACTION_TEMPLATE',
+    # (shared with every runner through qa.detectors)
+    CHECKPOINT_ALIASES = detectors.CHECKPOINT_ALIASES
+
+    # Part of every AnalysisCache key: qa.detectors bumps it whenever
+    # checkpoint, agent, VS or skill detection changes so cached results
+    # are not reused.
+    DETECTOR_VERSION = detectors.DETECTOR_VERSION
+    # Detector name → Analysis attribute
+    CACHED_DETECTORS = {
+        'detect_checkpoints': 'checkpoints',
+        'detect_agents': 'agents',
+        'extract_vs_options': 'vs_options',
+        'check_skill_loaded': 'skill',
     }
 
     def __init__(
@@ -186,13 +242,42 @@ class CLITestRunner:
         cli_tool: str = 'claude',
         verbose: bool = False,
         dry_run: bool = False,
-        timeout: int = 300
+        timeout: int = 300,
+        workdir: Optional[Path] = None,
+        log_prefix: str = '',
+        cache: Optional[AnalysisCache] = None,
+        cassette: Optional[Cassette] = None,
+        executables: Optional[Dict[str, List[str]]] = None,
+        abort_policy: Optional[AbortPolicy] = None,
+        retries: int = 0,
+        retry_backoff: float = 5.0,
+        checkpoint_dir: Optional[Path] = None,
+        scratch_workdir: bool = False
     ):
         self.scenario_id = scenario_id
         self.cli_tool = cli_tool
         self.verbose = verbose
         self.dry_run = dry_run
         self.timeout = timeout
+        # Working directory for CLI subprocesses. Parallel runs give each
+        # worker its own directory so `--continue` resolves to its own session.
+        self.workdir = Path(workdir) if workdir else self.REPO_ROOT
+        # A scratch workdir (batch mode) is deleted once its session finishes;
+        # a failed session keeps it so --resume can continue the conversation
+        self.scratch_workdir = scratch_workdir and workdir is not None
+        self.log_prefix = log_prefix
+        self.cache = cache
+        # Record live CLI calls to, or serve them from, a cassette
+        self.cassette = cassette
+        self.executables = {**self.CLI_EXECUTABLES, **(executables or {})}
+        # Stop early once a turn decides the outcome (None plays every turn)
+        self.abort_policy = abort_policy if abort_policy and abort_policy.enabled else None
+        # Transient CLI failures (timeouts, non-zero exits) are retried after
+        # retry_backoff, 2x retry_backoff, ... seconds
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        # Session state is written here after every turn so --resume can continue it
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
 
         if cli_tool not in self.SUPPORTED_CLIS:
             raise ValueError(f"Unsupported CLI: {cli_tool}. Supported: {self.SUPPORTED_CLIS}")
@@ -209,6 +294,29 @@ class CLITestRunner:
         # Track conversation state
         self._turn_count = 0
         self._is_first_turn = True
+        self._last_timing = TurnTiming(backend='subprocess')
+        self._consecutive_timeouts = 0
+        self._missed_checkpoints: List[str] = []
+
+    def _log(self, message: str = '') -> None:
+        """Print a progress line, prefixed when running inside a batch."""
+        if self.log_prefix:
+            message = '\n'.join(
+                f"{self.log_prefix} {line}" if line else line
+                for line in message.split('\n')
+            )
+        print(message, flush=bool(self.log_prefix))
+
+    def _analyze(self, detector: str, response: str) -> Any:
+        """Read one of CACHED_DETECTORS from the shared response analysis, via the analysis cache if set."""
+        field_name = self.CACHED_DETECTORS[detector]
+
+        def compute(text: str) -> Any:
+            return getattr(detectors.analyze(text, memo=True), field_name)
+
+        if self.cache is None:
+            return compute(response)
+        return self.cache.get_or_compute(detector, self.DETECTOR_VERSION, response, compute)
 
     def _load_protocol(self) -> dict:
         """Load protocol YAML file."""
@@ -231,7 +339,7 @@ class CLITestRunner:
             prefix = "/diverga:research-coordinator\n\n"
             full_message = prefix + message
             return [
-                'claude',
+                *self.executables['claude'],
                 '-p', full_message,
                 '--output-format', 'text',
                 '--allowedTools', 'Read,Glob,Grep,Task,WebSearch,WebFetch'
@@ -239,129 +347,54 @@ class CLITestRunner:
         else:
             # Subsequent turns: Continue conversation
             return [
-                'claude',
+                *self.executables['claude'],
                 '-p', message,
                 '--continue',
                 '--output-format', 'text'
             ]
 
     def _check_skill_loaded(self, response: str) -> Dict[str, Any]:
-        """
-        Verify if Diverga skill was actually loaded and active.
-
-        Looks for definitive markers that indicate the skill is loaded:
-        1. Skill activation confirmation message
-        2. Research Coordinator specific terminology
-        3. VS methodology markers (T-Score, options with typicality)
-        4. Checkpoint system markers with proper formatting
-        5. Agent invocation patterns via Task tool
-
-        Returns dict with 'loaded', 'confidence', 'evidence' keys.
-        """
-        evidence = []
-        confidence_score = 0
-
-        # Check 1: Skill activation markers (weight: 30)
-        activation_patterns = [
-            r'Research\s*Coordinator\s*v[\d.]+',  # Version mention
-            r'diverga[:\-]research[:\-]coordinator',  # Skill name
-            r'Human[:\-]Centered\s*Edition',  # v6.0 marker
-            r'(27|33|40)\s*specialized\s*agents',  # Agent system mention (v5.0=27, v6.0.1=33, v6.3+=40)
-            r'패러다임\s*(탐지|감지)',  # Korean paradigm detection
-            r'[A-H][1-7][-\s]?[A-Za-z-]+',  # Agent name pattern like A1-ResearchQuestionRefiner
-        ]
-        for pattern in activation_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                evidence.append(f"Skill marker: {pattern[:30]}...")
-                confidence_score += 30
-                break
-
-        # Check 2: VS Methodology markers (weight: 25)
-        vs_patterns = [
-            r'\(T\s*=\s*\d+\.?\d*\)',  # T-Score notation
-            r'T[:\-]Score',  # T-Score label
-            r'Typicality\s*Score',  # Full name
-            r'\[A\].*\[B\].*\[C\]',  # Option format
-            r'modal\s*(recommendation|option)',  # Modal awareness
-        ]
-        for pattern in vs_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                evidence.append(f"VS marker: {pattern[:30]}...")
-                confidence_score += 25
-                break
-
-        # Check 3: Checkpoint system markers (weight: 25)
-        checkpoint_patterns = [
-            r'🔴\s*CHECKPOINT',  # Red checkpoint emoji
-            r'🟠\s*CHECKPOINT',  # Orange checkpoint emoji
-            r'체크포인트.*CP_',  # Korean checkpoint
-            r'Human\s*Checkpoint\s*System',  # System mention
-            r'MANDATORY\s*HALT',  # Halt terminology
-        ]
-        for pattern in checkpoint_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                evidence.append(f"Checkpoint marker: {pattern[:30]}...")
-                confidence_score += 25
-                break
-
-        # Check 4: Agent invocation evidence (weight: 20)
-        agent_patterns = [
-            r'Task\(subagent_type\s*=\s*["\']diverga:',  # Task tool call
-            r'diverga:[a-h][1-7]',  # Agent ID pattern
-            r'([A-H][1-7])\s*에이전트\s*실행',  # Korean agent execution
-        ]
-        for pattern in agent_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                evidence.append(f"Agent marker: {pattern[:30]}...")
-                confidence_score += 20
-                break
-
-        # Determine overall confidence
-        if confidence_score >= 50:
-            loaded = True
-            confidence = 'HIGH' if confidence_score >= 75 else 'MEDIUM'
-        elif confidence_score >= 25:
-            loaded = True
-            confidence = 'LOW'
-        else:
-            loaded = False
-            confidence = 'NONE'
-
-        return {
-            'loaded': loaded,
-            'confidence': confidence,
-            'score': confidence_score,
-            'evidence': evidence
-        }
+        """Verify if Diverga skill was actually loaded and active ('loaded', 'confidence', 'score', 'evidence')."""
+        return detectors.check_skill_loaded(response)
 
     def _build_opencode_command(self, message: str) -> List[str]:
         """Build OpenCode CLI command."""
-        return ['opencode', 'run', message]
+        return [*self.executables['opencode'], 'run', message]
 
     def _build_codex_command(self, message: str) -> List[str]:
         """Build Codex CLI command."""
-        return ['codex', 'exec', message]
-
-    def _execute_cli(self, message: str) -> str:
-        """Execute CLI command and capture response."""
-        is_first = self._is_first_turn
+        return [*self.executables['codex'], 'exec', message]
 
+    def _build_command(self, message: str, is_first_turn: bool) -> List[str]:
+        """Build the CLI command for the configured tool."""
         if self.cli_tool == 'claude':
-            cmd = self._build_claude_command(message, is_first)
+            return self._build_claude_command(message, is_first_turn)
         elif self.cli_tool == 'opencode':
-            cmd = self._build_opencode_command(message)
+            return self._build_opencode_command(message)
         elif self.cli_tool == 'codex':
-            cmd = self._build_codex_command(message)
+            return self._build_codex_command(message)
         else:
             raise ValueError(f"Unsupported CLI: {self.cli_tool}")
 
+    def _execute_cli(self, message: str) -> str:
+        """Execute CLI command and capture response."""
+        is_first = self._is_first_turn
+        cmd = self._build_command(message, is_first)
+
         if self.verbose:
-            print(f"  [CMD] {' '.join(cmd[:3])}...")
+            self._log(f"  [CMD] {' '.join(cmd[:3])}...")
+
+        if self.cassette and self.cassette.replaying:
+            return self._replay_cli(message)
 
         if self.dry_run:
             # Return mock response for dry run
-            return self._get_dry_run_response(message, is_first)
+            response = self._get_dry_run_response(message, is_first)
+            self._last_timing = TurnTiming(backend='subprocess', started_at=datetime.now().isoformat(), total_seconds=0.0)
+            return response
 
+        started_at = datetime.now().isoformat()
+        started = time.monotonic()
         try:
             # Execute command
             result = subprocess.run(
@@ -369,22 +402,251 @@ class CLITestRunner:
                 capture_output=True,
                 text=True,
                 timeout=self.timeout,
-                cwd=Path(__file__).parent.parent.parent  # Diverga root
+                cwd=self.workdir
             )
+            total_seconds = round(time.monotonic() - started, 3)
+            self._record_cli(message, result.stdout, result.stderr, result.returncode, total_seconds)
 
             if result.returncode != 0:
                 error_msg = f"CLI returned non-zero: {result.returncode}\nStderr: {result.stderr}"
                 if self.verbose:
-                    print(f"  [ERROR] {error_msg}")
+                    self._log(f"  [ERROR] {error_msg}")
                 raise RuntimeError(error_msg)
 
             self._is_first_turn = False
+            # Blocking capture cannot observe spawn or first byte; only total latency is known
+            self._last_timing = TurnTiming(backend='subprocess', started_at=started_at, total_seconds=total_seconds)
             return result.stdout
 
         except subprocess.TimeoutExpired:
+            self._record_cli(message, '', '', None, time.monotonic() - started, timed_out=True)
             raise TimeoutError(f"CLI command timed out after {self.timeout}s")
         except FileNotFoundError:
-            raise RuntimeError(f"CLI tool '{self.cli_tool}' not found. Is it installed?")
+            raise CLINotFoundError(f"CLI tool '{self.cli_tool}' not found. Is it installed?")
+
+    def _retry_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """Backoff before retry `attempt` (1-based), or None when the error is final."""
+        if attempt > self.retries or isinstance(error, CLINotFoundError):
+            return None
+        if not isinstance(error, (TimeoutError, RuntimeError)):
+            return None
+        if self.cassette and self.cassette.replaying:
+            return None  # A replayed failure fails the same way every time
+        return min(self.retry_backoff * 2 ** (attempt - 1), self.MAX_RETRY_DELAY)
+
+    def _log_retry(self, attempt: int, error: Exception, delay: float) -> None:
+        reason = str(error).splitlines()[0] if str(error) else type(error).__name__
+        self._log(f"  [RETRY {attempt}/{self.retries}] {reason}; retrying in {delay:.1f}s")
+
+    def _execute_with_retry(self, message: str) -> str:
+        """_execute_cli with exponential backoff on transient failures."""
+        attempt = 0
+        while True:
+            try:
+                return self._execute_cli(message)
+            except Exception as e:
+                attempt += 1
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                self._log_retry(attempt, e, delay)
+                time.sleep(delay)
+
+    async def _execute_with_retry_async(
+        self,
+        message: str,
+        on_partial: Optional[Callable[[str, List[Dict]], None]] = None
+    ) -> str:
+        """_execute_cli_async with exponential backoff on transient failures."""
+        attempt = 0
+        while True:
+            try:
+                return await self._execute_cli_async(message, on_partial)
+            except Exception as e:
+                attempt += 1
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                self._log_retry(attempt, e, delay)
+                await asyncio.sleep(delay)
+
+    def _record_cli(
+        self,
+        message: str,
+        stdout: str,
+        stderr: str,
+        returncode: Optional[int],
+        latency: float,
+        ttfb: Optional[float] = None,
+        timed_out: bool = False
+    ) -> None:
+        """Store a live CLI call on the cassette when recording."""
+        if not (self.cassette and self.cassette.recording):
+            return
+        self.cassette.record(Interaction(
+            cli_tool=self.cli_tool,
+            turn=self._turn_count,
+            message=message,
+            stdout=stdout,
+            stderr=stderr,
+            returncode=-1 if returncode is None else returncode,
+            latency_seconds=round(latency, 3),
+            ttfb_seconds=None if ttfb is None else round(ttfb, 3),
+            timed_out=timed_out
+        ))
+
+    def _replay_cli(self, message: str) -> str:
+        """
+        Serve a CLI call from the cassette without running anything.
+
+        Recorded failures are raised exactly as a live call would raise them;
+        timing reports the latencies measured when the call was recorded.
+        """
+        interaction = self.cassette.lookup(self.cli_tool, self._turn_count, message)
+        self._last_timing = TurnTiming(
+            backend='replay',
+            started_at=interaction.recorded_at or None,
+            ttfb_seconds=interaction.ttfb_seconds,
+            total_seconds=interaction.latency_seconds
+        )
+
+        if interaction.timed_out:
+            raise TimeoutError(f"CLI command timed out after {self.timeout}s")
+        if interaction.returncode != 0:
+            error_msg = f"CLI returned non-zero: {interaction.returncode}\nStderr: {interaction.stderr}"
+            if self.verbose:
+                self._log(f"  [ERROR] {error_msg}")
+            raise RuntimeError(error_msg)
+
+        self._is_first_turn = False
+        return interaction.stdout
+
+    async def _execute_cli_async(
+        self,
+        message: str,
+        on_partial: Optional[Callable[[str, List[Dict]], None]] = None
+    ) -> str:
+        """
+        Execute CLI command with asyncio, streaming stdout as it arrives.
+
+        Records spawn, time-to-first-byte and total latency in `self._last_timing`.
+        Whenever a chunk completes a line, checkpoint detection runs on the
+        newly completed lines (see PartialCheckpointScan); the first time each
+        checkpoint appears is recorded and `on_partial(text_so_far,
+        detected_checkpoints)` is called. The complete response is analyzed
+        once, and the turn record reuses that analysis.
+        """
+        is_first = self._is_first_turn
+        cmd = self._build_command(message, is_first)
+
+        if self.verbose:
+            self._log(f"  [CMD] {' '.join(cmd[:3])}...")
+
+        if self.cassette and self.cassette.replaying:
+            response = self._replay_cli(message)
+            self._analyze_final(response, self._last_timing.total_seconds or 0.0, self._last_timing, on_partial)
+            return response
+
+        timing = TurnTiming(backend='asyncio', started_at=datetime.now().isoformat())
+        self._last_timing = timing
+
+        if self.dry_run:
+            response = self._get_dry_run_response(message, is_first)
+            timing.spawn_seconds = timing.ttfb_seconds = timing.total_seconds = 0.0
+            self._analyze_final(response, 0.0, timing, on_partial)
+            return response
+
+        started = time.monotonic()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.workdir)
+            )
+        except FileNotFoundError:
+            raise CLINotFoundError(f"CLI tool '{self.cli_tool}' not found. Is it installed?")
+        timing.spawn_seconds = round(time.monotonic() - started, 3)
+
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        parts: List[str] = []
+        scan = PartialCheckpointScan()
+
+        async def read_stdout() -> None:
+            while True:
+                chunk = await process.stdout.read(self.STREAM_CHUNK_SIZE)
+                if not chunk:
+                    parts.append(decoder.decode(b'', final=True))
+                    return
+                elapsed = time.monotonic() - started
+                if timing.ttfb_seconds is None:
+                    timing.ttfb_seconds = round(elapsed, 3)
+                text = decoder.decode(chunk)
+                parts.append(text)
+                # Run detectors on line boundaries only, over the new lines
+                if scan.feed(text):
+                    detected = list(scan.detected.values())
+                    self._report_checkpoints(detected, elapsed, timing)
+                    if on_partial:
+                        on_partial(''.join(parts), detected)
+
+        try:
+            _, stderr = await asyncio.wait_for(
+                asyncio.gather(read_stdout(), process.stderr.read()),
+                timeout=self.timeout
+            )
+            returncode = await process.wait()
+        except asyncio.TimeoutError:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass  # Exited between the timeout firing and the kill
+            await process.wait()
+            self._record_cli(message, ''.join(parts), '', None, time.monotonic() - started,
+                             timing.ttfb_seconds, timed_out=True)
+            raise TimeoutError(f"CLI command timed out after {self.timeout}s")
+
+        timing.total_seconds = round(time.monotonic() - started, 3)
+        response = ''.join(parts)
+        self._record_cli(message, response, stderr.decode('utf-8', errors='replace'), returncode,
+                         timing.total_seconds, timing.ttfb_seconds)
+
+        if returncode != 0:
+            error_msg = (
+                f"CLI returned non-zero: {returncode}\n"
+                f"Stderr: {stderr.decode('utf-8', errors='replace')}"
+            )
+            if self.verbose:
+                self._log(f"  [ERROR] {error_msg}")
+            raise RuntimeError(error_msg)
+
+        self._is_first_turn = False
+        self._analyze_final(response, timing.total_seconds, timing, on_partial)
+        return response
+
+    def _report_checkpoints(self, detected: List[Dict[str, Any]], elapsed: float, timing: TurnTiming) -> None:
+        """Record when each detected checkpoint was first seen."""
+        first_seen = timing.checkpoint_first_seen
+        for cp in detected:
+            first_seen.setdefault(cp['id'], round(elapsed, 3))
+
+    def _analyze_final(
+        self,
+        response: str,
+        elapsed: float,
+        timing: TurnTiming,
+        on_partial: Optional[Callable[[str, List[Dict]], None]]
+    ) -> None:
+        """
+        Run checkpoint detection on a complete response.
+
+        Goes through _analyze, so _record_assistant_turn reads the same
+        analysis back instead of scanning the response again.
+        """
+        detected = self._analyze('detect_checkpoints', response)
+        self._report_checkpoints(detected, elapsed, timing)
+        if on_partial:
+            on_partial(response, detected)
 
     def _get_dry_run_response(self, message: str, is_first_turn: bool) -> str:
         """Generate mock response for dry run mode."""
@@ -413,459 +675,454 @@ To run with real AI responses, remove --dry-run flag.
 """
 
     def _normalize_checkpoint_name(self, name: str) -> Optional[str]:
-        """
-        Normalize a checkpoint name to formal CP_ format using alias mapping.
-
-        Args:
-            name: Raw checkpoint name (could be formal CP_XXX or descriptive)
-
-        Returns:
-            Normalized CP_ identifier or None if not recognized
-        """
-        name = name.strip()
-
-        # Already in formal format
-        if name.upper().startswith('CP_'):
-            return name.upper()
-
-        # Check alias mapping (case-insensitive)
-        name_lower = name.lower()
-        for alias, formal_id in self.CHECKPOINT_ALIASES.items():
-            if alias.lower() == name_lower:
-                return formal_id
-
-        # Try partial matching for common patterns
-        for alias, formal_id in self.CHECKPOINT_ALIASES.items():
-            # If the name contains the core keywords from the alias
-            alias_words = set(alias.lower().split())
-            name_words = set(name_lower.split())
-            if len(alias_words) >= 2 and alias_words <= name_words:
-                return formal_id
-
-        return None
+        """Normalize a checkpoint name to formal CP_ format (None if not recognized)."""
+        return detectors.normalize_checkpoint_name(name)
 
     def _detect_checkpoints(self, response: str) -> List[Dict[str, Any]]:
         """
         Detect checkpoint markers in response with confidence scoring.
 
-        HYBRID DETECTION (v3.2.0):
-        1. Primary: Look for formal CP_XXX identifiers
-        2. Fallback: Detect descriptive names and map via CHECKPOINT_ALIASES
-
-        Returns list of dicts with 'id', 'confidence', 'level', 'context', and 'original' keys.
-
-        Checkpoint naming convention (from research-coordinator):
-        - CP_RESEARCH_DIRECTION, CP_PARADIGM_SELECTION, CP_THEORY_SELECTION
-        - CP_METHODOLOGY_APPROVAL, CP_ANALYSIS_PLAN, CP_INTEGRATION_STRATEGY
-        - CP_QUALITY_REVIEW, CP_EFFECT_SIZE_SELECTION, CP_HETEROGENEITY_ANALYSIS
-        - CP_HUMANIZATION_REVIEW, CP_HUMANIZATION_VERIFY, etc.
-
-        Confidence levels:
-        - HIGH: Emoji marker + formal CP_XXX with options OR emoji + descriptive with options
-        - MEDIUM: Text "CHECKPOINT" + CP_XXX format OR emoji + descriptive without options
-        - LOW: Partial match or text mention without action
+        See qa.detectors.detect_checkpoints; bypasses the analyze() memo.
         """
-        detected = []
-        seen_ids = set()
-
-        # Valid checkpoint ID pattern: CP_ followed by uppercase words/digits
-        # Examples: CP_RESEARCH_DIRECTION, CP_META_TIER3_REVIEW, CP_GATE_2
-        VALID_CP_PATTERN = r'^CP_[A-Z0-9]+(?:_[A-Z0-9]+)*$'
-
-        # ============================================
-        # PHASE 1: Detect formal CP_XXX identifiers
-        # ============================================
-
-        # HIGH confidence: Emoji + full checkpoint format + options presented
-        # Supports multiple formats:
-        # - 🔴 CHECKPOINT: CP_XXX
-        # - 🔴 CP_XXX (확인)
-        # - 🔴 CP_XXX
-        # - ## 🔴 CP_XXX
-        high_patterns_formal = [
-            # Format: 🔴 CHECKPOINT: CP_XXX
-            (r'🔴\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?', 'RED'),
-            (r'🟠\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?', 'ORANGE'),
-            (r'🟡\s*(?:CHECKPOINT|체크포인트)[:\s]+\*?\*?(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?', 'YELLOW'),
-            # Format: 🔴 CP_XXX (with optional markdown headers and annotations)
-            (r'(?:#+\s*)?🔴\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\s*(?:\([^)]*\))?', 'RED'),
-            (r'(?:#+\s*)?🟠\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\s*(?:\([^)]*\))?', 'ORANGE'),
-            (r'(?:#+\s*)?🟡\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\s*(?:\([^)]*\))?', 'YELLOW'),
-        ]
-
-        for pattern, level in high_patterns_formal:
-            for match in re.finditer(pattern, response, re.IGNORECASE):
-                cp_id = match.group(1).upper()
-                after_match = response[match.end():match.end() + 500]
-                has_options = bool(re.search(r'\[(?:Y|N|A|B|C|[1-3])\]|옵션\s*[A-C]|Option\s*[A-C]', after_match, re.IGNORECASE))
-
-                if re.match(VALID_CP_PATTERN, cp_id) and cp_id not in seen_ids:
-                    detected.append({
-                        'id': cp_id,
-                        'confidence': 'HIGH' if has_options else 'MEDIUM',
-                        'level': level,
-                        'context': 'formal CP_ with emoji' + (' + options' if has_options else ''),
-                        'original': cp_id
-                    })
-                    seen_ids.add(cp_id)
-
-        # MEDIUM confidence: Plain text checkpoint format with CP_
-        medium_patterns_formal = [
-            r'(?:\*\*)?CHECKPOINT(?:\*\*)?[:\s]+\*?\*?(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?',
-            r'(?:checkpoint|체크포인트)\s*[:]\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)',
-            r'(?:\*\*)?CHECKPOINT(?:\*\*)?[:\s]+\*?\*?(META_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*?\*?',
-            # Format: ## CP_XXX or ### CP_XXX (without emoji)
-            r'^#+\s*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\s*(?:\([^)]*\))?',
-            # Format: **CP_XXX** in bold
-            r'\*\*(CP_[A-Z0-9]+(?:_[A-Z0-9]+)*)\*\*',
-        ]
+        return detectors.detect_checkpoints(response)
 
-        for pattern in medium_patterns_formal:
-            for match in re.finditer(pattern, response, re.IGNORECASE):
-                cp_id = match.group(1).upper()
-                if re.match(VALID_CP_PATTERN, cp_id) and cp_id not in seen_ids:
-                    detected.append({
-                        'id': cp_id,
-                        'confidence': 'MEDIUM',
-                        'level': 'UNKNOWN',
-                        'context': 'formal CP_ text mention',
-                        'original': cp_id
-                    })
-                    seen_ids.add(cp_id)
-
-        # ============================================
-        # PHASE 2: Detect descriptive checkpoint names (HYBRID)
-        # ============================================
-
-        # HIGH/MEDIUM confidence: Emoji + descriptive name (no CP_ prefix)
-        # Pattern: 🔴 CHECKPOINT: Effect Size Target Selection
-        descriptive_patterns = [
-            (r'🔴\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)', 'RED'),
-            (r'🟠\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)', 'ORANGE'),
-            (r'🟡\s*(?:CHECKPOINT|체크포인트)[:\s]+([A-Za-z가-힣][A-Za-z0-9가-힣\s\-]+?)(?:\n|\*\*|$)', 'YELLOW'),
-        ]
-
-        for pattern, level in descriptive_patterns:
-            for match in re.finditer(pattern, response, re.IGNORECASE):
-                raw_name = match.group(1).strip()
+    def _get_checkpoint_ids(self, detected_checkpoints: List[Dict[str, Any]], min_confidence: str = 'MEDIUM') -> List[str]:
+        """Extract checkpoint IDs from detected checkpoints, filtered by minimum confidence."""
+        return detectors.filter_by_confidence(detected_checkpoints, min_confidence)
 
-                # Skip if it's already a formal CP_ identifier (handled in Phase 1)
-                if raw_name.upper().startswith('CP_'):
-                    continue
+    def _detect_agents(self, response: str) -> List[Dict[str, Any]]:
+        """Detect agent invocations in response with confidence scoring."""
+        return detectors.detect_agents(response)
 
-                # Try to map to formal identifier
-                formal_id = self._normalize_checkpoint_name(raw_name)
+    def _get_agent_ids(self, detected_agents: List[Dict[str, Any]], min_confidence: str = 'LOW') -> List[str]:
+        """Extract agent IDs from detected agents, filtered by minimum confidence."""
+        return detectors.filter_by_confidence(detected_agents, min_confidence)
 
-                if formal_id and formal_id not in seen_ids:
-                    after_match = response[match.end():match.end() + 500]
-                    has_options = bool(re.search(r'\[(?:Y|N|A|B|C|[1-3])\]|옵션\s*[A-C]|Option\s*[A-C]', after_match, re.IGNORECASE))
+    def _extract_vs_options(self, response: str) -> List[Dict]:
+        """Extract VS methodology options with T-Scores."""
+        return detectors.extract_vs_options(response)
+
+    def _iter_turn_specs(self):
+        """Yield (turn_num, user_type, user_message, expected) for each user turn not yet played."""
+        for turn_spec in self.protocol.get('conversation_flow', [])[self._turn_count:]:
+            self._turn_count += 1
+            turn_num = turn_spec.get('turn', self._turn_count)
+            user_message = turn_spec.get('user', '').strip()
+            user_type = turn_spec.get('user_type', 'UNKNOWN')
+            expected = turn_spec.get('expected_behavior', {})
+
+            if not user_message:
+                continue
+
+            yield turn_num, user_type, user_message, expected
+
+    def _print_header(self) -> None:
+        self._log(f"\n{'='*60}")
+        self._log(f"Diverga QA Protocol v3.2.2 - True Automated Testing")
+        self._log(f"Scenario: {self.scenario_id}")
+        self._log(f"CLI Tool: {self.cli_tool}")
+        self._log(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
+        self._log(f"{'='*60}\n")
+
+    def _record_user_turn(self, turn_num: int, user_type: str, user_message: str) -> None:
+        """Record the user side of a turn."""
+        self._log(f"[Turn {turn_num}] {user_type}")
+        if self.verbose:
+            self._log(f"  User: {user_message[:60]}...")
+
+        user_turn = Turn(
+            number=turn_num,
+            role='user',
+            content=user_message,
+            timestamp=datetime.now().isoformat(),
+            metadata={'user_type': user_type}
+        )
+        self.session.turns.append(user_turn)
+
+    def _record_assistant_turn(self, turn_num: int, response: str, expected: Dict) -> None:
+        """Analyze an assistant response and record it with session aggregates."""
+        self._log(f"  Received: {len(response)} chars")
+
+        # Analyze response
+        detected_checkpoints = self._analyze('detect_checkpoints', response)
+        detected_agents = self._analyze('detect_agents', response)
+        vs_options = self._analyze('extract_vs_options', response)
+
+        # Check if skill is loaded (for first turn)
+        skill_check = {}
+        if self._turn_count == 1:
+            skill_check = self._analyze('check_skill_loaded', response)
+
+        # Extract IDs for backward compatibility
+        checkpoint_ids = self._get_checkpoint_ids(detected_checkpoints, min_confidence='MEDIUM')
+        agent_ids = self._get_agent_ids(detected_agents, min_confidence='MEDIUM')
+
+        timing = self._last_timing
+        if timing:
+            timing.finish(response)
+
+        # Record assistant turn
+        assistant_turn = Turn(
+            number=turn_num,
+            role='assistant',
+            content=response,
+            timestamp=datetime.now().isoformat(),
+            checkpoints_detected=checkpoint_ids,
+            agents_detected=agent_ids,
+            vs_options=vs_options,
+            metadata={
+                'expected': expected,
+                'detected_checkpoints_full': detected_checkpoints,
+                'detected_agents_full': detected_agents,
+                'skill_check': skill_check
+            },
+            timing=timing
+        )
+        self.session.turns.append(assistant_turn)
+
+        # Update session-level aggregates
+        for cp in detected_checkpoints:
+            if cp['confidence'] in ['HIGH', 'MEDIUM']:
+                self.session.checkpoints.append({
+                    'checkpoint': cp['id'],
+                    'turn': turn_num,
+                    'confidence': cp['confidence'],
+                    'level': cp.get('level', 'UNKNOWN'),
+                    'timestamp': datetime.now().isoformat()
+                })
+
+        # Only count agents with HIGH/MEDIUM confidence as actually invoked
+        for agent in detected_agents:
+            if agent['confidence'] in ['HIGH', 'MEDIUM']:
+                if agent['id'] not in self.session.agents_invoked:
+                    self.session.agents_invoked.append(agent['id'])
+
+        high_cp = len([c for c in detected_checkpoints if c['confidence'] == 'HIGH'])
+        high_agents = len([a for a in detected_agents if a['confidence'] in ['HIGH', 'MEDIUM']])
+        self._log(f"  ✓ Completed (CP: {high_cp} high/{len(detected_checkpoints)} total, Agents: {high_agents})")
+
+    def _record_timeout(self, turn_num: int, expected: Dict, error: TimeoutError) -> None:
+        """Record a timed-out CLI call as an empty response; fatal without a timeout policy."""
+        if not (self.abort_policy and self.abort_policy.max_consecutive_timeouts):
+            raise error
+
+        self._consecutive_timeouts += 1
+        self._log(f"  [TIMEOUT] {error} ({self._consecutive_timeouts} in a row)")
+        self._last_timing = None  # No response; latency falls back to timestamps
+        self._record_assistant_turn(turn_num, '', expected)
+        self.session.turns[-1].metadata['timed_out'] = True
+
+    def _expected_checkpoint(self, expected: Dict) -> Optional[str]:
+        """The checkpoints_expected ID a turn should raise, if any."""
+        designated = expected.get('checkpoint') or expected.get('checkpoint_trigger')
+        if not designated:
+            return None
+        for cp in self.protocol.get('checkpoints_expected', []):
+            if self._fuzzy_checkpoint_match(designated, cp['id']):
+                return cp['id']
+        return None
 
-                    detected.append({
-                        'id': formal_id,
-                        'confidence': 'HIGH' if has_options else 'MEDIUM',
-                        'level': level,
-                        'context': f'descriptive → {formal_id}' + (' + options' if has_options else ''),
-                        'original': raw_name
-                    })
-                    seen_ids.add(formal_id)
-                elif not formal_id:
-                    # Unknown descriptive name - still record it with LOW confidence
-                    # Generate a pseudo-ID from the name
-                    pseudo_id = 'CP_' + re.sub(r'[^A-Z0-9]', '_', raw_name.upper()).strip('_')
-                    pseudo_id = re.sub(r'_+', '_', pseudo_id)  # Remove duplicate underscores
-
-                    if pseudo_id not in seen_ids and len(pseudo_id) > 4:
-                        detected.append({
-                            'id': pseudo_id,
-                            'confidence': 'LOW',
-                            'level': level,
-                            'context': f'unmapped descriptive: {raw_name[:30]}',
-                            'original': raw_name
-                        })
-                        seen_ids.add(pseudo_id)
-
-        # ============================================
-        # PHASE 3: LOW confidence - partial mentions
-        # ============================================
-
-        low_patterns = [
-            r'(?:checkpoint|체크포인트)\s+(?:for\s+)?([A-Z][A-Z_]+)',
-        ]
+    def _check_abort(self, turn_num: int, expected: Dict) -> bool:
+        """
+        Apply the abort policy after a turn; record the abort and return True to stop.
 
-        for pattern in low_patterns:
-            for match in re.finditer(pattern, response, re.IGNORECASE):
-                raw_id = match.group(1).upper()
-                cp_id = f"CP_{raw_id}" if not raw_id.startswith('CP_') else raw_id
-                if re.match(VALID_CP_PATTERN, cp_id) and cp_id not in seen_ids:
-                    detected.append({
-                        'id': cp_id,
-                        'confidence': 'LOW',
-                        'level': 'UNKNOWN',
-                        'context': 'inferred from text',
-                        'original': raw_id
-                    })
-                    seen_ids.add(cp_id)
+        A checkpoint counts as missed for the compliance bound only once no
+        later turn is designated to raise it.
+        """
+        policy = self.abort_policy
+        if not policy:
+            return False
 
-        return detected
+        timed_out = self.session.turns[-1].metadata.get('timed_out', False)
+        levels = {cp['id']: cp.get('level') for cp in self.protocol.get('checkpoints_expected', [])}
+        checkpoint = self._expected_checkpoint(expected)
+        missed = checkpoint is not None and not any(
+            self._fuzzy_checkpoint_match(found['checkpoint'], checkpoint) for found in self.session.checkpoints
+        )
+        if missed and checkpoint not in self._missed_checkpoints:
+            remaining = self.protocol.get('conversation_flow', [])[self._turn_count:]
+            if not any(self._expected_checkpoint(spec.get('expected_behavior') or {}) == checkpoint
+                       for spec in remaining if spec.get('user', '').strip()):
+                self._missed_checkpoints.append(checkpoint)
+
+        rule = reason = None
+        if policy.max_consecutive_timeouts and self._consecutive_timeouts >= policy.max_consecutive_timeouts:
+            rule, reason = 'timeouts', f"{self._consecutive_timeouts} consecutive CLI timeouts"
+        elif policy.red_miss and missed and not timed_out and levels.get(checkpoint) == 'RED':
+            rule, reason = 'red-miss', f"RED checkpoint {checkpoint} was not raised (auto-proceed)"
+        elif policy.min_compliance is not None and levels:
+            achievable = (len(levels) - len(self._missed_checkpoints)) / len(levels) * 100
+            if achievable < policy.min_compliance:
+                rule = 'compliance'
+                reason = (f"Max achievable compliance {achievable:.1f}% < {policy.min_compliance:g}% "
+                          f"(missed: {', '.join(self._missed_checkpoints)})")
+        if not rule:
+            return False
 
-    def _get_checkpoint_ids(self, detected_checkpoints: List[Dict[str, Any]], min_confidence: str = 'MEDIUM') -> List[str]:
-        """Extract checkpoint IDs from detected checkpoints, filtered by minimum confidence."""
-        confidence_order = {'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}
-        min_level = confidence_order.get(min_confidence, 2)
+        flow = self.protocol.get('conversation_flow', [])
+        self.session.abort = {
+            'policy': policy.describe(),
+            'rule': rule,
+            'turn': turn_num,
+            'reason': reason,
+            'turns_skipped': len([t for t in flow[self._turn_count:] if t.get('user', '').strip()]),
+        }
+        self._log(f"  ⏹ Aborting after turn {turn_num}: {reason}")
+        return True
+
+    def _finalize_session(self) -> None:
+        self.session.end_time = datetime.now().isoformat()
+        self.session.agents_invoked = list(set(self.session.agents_invoked))
+        # An aborted session is still complete up to its last turn and is validated as such
+        self.session.status = "aborted" if self.session.abort else "completed"
+        self.session.validation_results = self._validate_session()
+        # Finished sessions cannot be resumed; only failed ones keep their checkpoint
+        if self.checkpoint_path and self.checkpoint_path.exists():
+            self.checkpoint_path.unlink()
+        if self.scratch_workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _fail_session(self, error: Exception) -> None:
+        self.session.status = "failed"
+        self.session.error = str(error)
+        self._log(f"\n[ERROR] {error}")
+        if self.checkpoint_path and self.checkpoint_path.exists():
+            self._log(f"Resume from the last completed turn with: --resume {self.session_id}")
+
+    @property
+    def checkpoint_path(self) -> Optional[Path]:
+        """Per-turn checkpoint file of this session, when checkpointing is on."""
+        if not self.checkpoint_dir:
+            return None
+        return self.checkpoint_dir / f"{self.session_id}.json"
+
+    def _save_checkpoint(self) -> None:
+        """Write the session state after a completed turn (atomically)."""
+        path = self.checkpoint_path
+        if not path:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': self.CHECKPOINT_VERSION,
+            'scenario_id': self.session.scenario_id,
+            'cli_tool': self.session.cli_tool,
+            'session_id': self.session.session_id,
+            'start_time': self.session.start_time,
+            'saved_at': datetime.now().isoformat(),
+            'workdir': str(self.workdir),
+            'scratch_workdir': self.scratch_workdir,
+            # Index of the next conversation_flow entry to play
+            'next_turn_spec': self._turn_count,
+            'is_first_turn': self._is_first_turn,
+            'consecutive_timeouts': self._consecutive_timeouts,
+            'missed_checkpoints': self._missed_checkpoints,
+            'checkpoints': self.session.checkpoints,
+            'agents_invoked': self.session.agents_invoked,
+            'turns': [t.to_dict() for t in self.session.turns],
+        }
 
-        return [
-            cp['id'] for cp in detected_checkpoints
-            if confidence_order.get(cp['confidence'], 0) >= min_level
-        ]
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
 
-    def _detect_agents(self, response: str) -> List[Dict[str, Any]]:
+    @classmethod
+    def from_checkpoint(cls, checkpoint: Path, new_conversation: bool = False, **kwargs) -> 'CLITestRunner':
         """
-        Detect agent invocations in response with confidence scoring.
-
-        Returns list of dicts with 'id', 'confidence', and 'context' keys.
-
-        Confidence levels:
-        - HIGH: Task tool invocation (e.g., Task(subagent_type="diverga:a1"))
-        - MEDIUM: Explicit agent reference with action verb (e.g., "A1 에이전트 실행")
-        - LOW: Text mention only (e.g., "A1-ResearchQuestionRefiner를 사용할 수 있습니다")
-
-        Note: Valid Diverga agents per category (33 agents total, v6.0.1):
-        - A1-A6: Foundation (6)
-        - B1-B4: Evidence (4) - Note: B5 does not exist
-        - C1-C7: Design & Meta-Analysis (7)
-        - D1-D4: Data Collection (4)
-        - E1-E5: Analysis (5)
-        - F1-F4: Quality (4) - Note: F5 does not exist
-        - G1-G4: Communication (4) - Note: G5-G7 do not exist
-        - H1-H2: Specialized (2)
+        Rebuild a runner from a per-turn checkpoint so `run()` continues after
+        the last completed turn.
+
+        The CLI conversation is continued with `--continue` in the original
+        working directory. If that directory is gone, FileNotFoundError is
+        raised unless `new_conversation` is set, in which case the remaining
+        turns are played in a new CLI conversation. `kwargs` are passed to
+        the constructor; scenario, CLI tool and workdir come from the
+        checkpoint.
         """
-        # Valid agent IDs per category (strict validation)
-        VALID_AGENTS = {
-            'A': [1, 2, 3, 4, 5, 6],      # Foundation
-            'B': [1, 2, 3, 4],             # Evidence (no B5)
-            'C': [1, 2, 3, 4, 5, 6, 7],    # Design & Meta-Analysis
-            'D': [1, 2, 3, 4],             # Data Collection
-            'E': [1, 2, 3, 4, 5],          # Analysis
-            'F': [1, 2, 3, 4],             # Quality (no F5)
-            'G': [1, 2, 3, 4],             # Communication (no G5-G7)
-            'H': [1, 2],                   # Specialized
-        }
+        with open(checkpoint, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        version = data.get('version')
+        if version != cls.CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version} in {checkpoint}")
+
+        workdir = Path(data['workdir'])
+        if not workdir.is_dir() and not data['is_first_turn'] and not new_conversation:
+            raise FileNotFoundError(
+                f"Working directory {workdir} of session {data['session_id']} no longer exists, so its "
+                f"{data['cli_tool']} conversation cannot be continued; use --resume-new-conversation "
+                f"to play the remaining turns in a new conversation"
+            )
 
-        def is_valid_agent(agent_id: str) -> bool:
-            """Check if agent ID is in the valid registry."""
-            if len(agent_id) < 2:
-                return False
-            letter = agent_id[0].upper()
-            try:
-                number = int(agent_id[1:])
-                return letter in VALID_AGENTS and number in VALID_AGENTS[letter]
-            except ValueError:
-                return False
-
-        detected = []
-        seen_ids = set()
-
-        # HIGH confidence: Task tool invocation
-        task_patterns = [
-            r'Task\s*\(\s*subagent_type\s*=\s*["\']diverga:([a-h][1-7])["\']',
-            r'subagent_type\s*=\s*["\']diverga:([a-h][1-7])["\']',
-            r'Task.*diverga:([a-h][1-7])',
-            # Also detect general-purpose with agent ID in prompt
-            r'Task\s*\(.*model.*["\']([A-H][1-7])["\']',
-            r'description\s*=\s*["\'][^"\']*([A-H][1-7])[^"\']*["\']',
-        ]
-        for pattern in task_patterns:
-            for match in re.finditer(pattern, response, re.IGNORECASE):
-                agent_id = match.group(1).upper()
-                if is_valid_agent(agent_id) and agent_id not in seen_ids:
-                    detected.append({
-                        'id': agent_id,
-                        'confidence': 'HIGH',
-                        'context': 'Task tool invocation'
-                    })
-                    seen_ids.add(agent_id)
-
-        # MEDIUM confidence: Explicit execution with action verbs
-        action_patterns = [
-            # Korean action verbs
-            (r'([A-H][1-7])[-\s]?[A-Za-z-]*\s*(에이전트|agent)?\s*(실행|호출|사용|활성화)', '실행/호출'),
-            (r'(실행|호출).*([A-H][1-7])', '실행/호출'),
-            # English action verbs
-            (r'([A-H][1-7])[-\s]?[A-Za-z-]*\s*(agent)?\s*(invoke|invok|execut|running|activat)', 'invocation'),
-            (r'(invoking|executing|running)\s+([A-H][1-7])', 'invocation'),
-        ]
-        for pattern, context in action_patterns:
-            for match in re.finditer(pattern, response, re.IGNORECASE):
-                # Extract agent ID from match groups
-                for group in match.groups():
-                    if group and len(group) >= 2:
-                        potential_id = group[:2].upper() if group[0].isalpha() and group[1].isdigit() else None
-                        if potential_id and is_valid_agent(potential_id) and potential_id not in seen_ids:
-                            detected.append({
-                                'id': potential_id,
-                                'confidence': 'MEDIUM',
-                                'context': context
-                            })
-                            seen_ids.add(potential_id)
-
-        # LOW confidence: Text mentions only (for reference, not counted as invocations)
-        mention_patterns = [
-            r'diverga:([a-h][1-7])',  # diverga:a1
-            r'([A-H][1-7])-[A-Za-z-]+',  # A1-ResearchQuestionRefiner or A1-research-question-refiner
-            r'\*?\*?([A-H][1-7])\*?\*?\s*[-:]\s*[A-Za-z-]+',  # A1: ResearchQuestionRefiner or **A1**-...
-        ]
-        for pattern in mention_patterns:
-            for match in re.finditer(pattern, response, re.IGNORECASE):
-                agent_id = match.group(1).upper()
-                if is_valid_agent(agent_id) and agent_id not in seen_ids:
-                    detected.append({
-                        'id': agent_id,
-                        'confidence': 'LOW',
-                        'context': 'text mention'
-                    })
-                    seen_ids.add(agent_id)
+        for key in ('scenario_id', 'cli_tool', 'workdir', 'scratch_workdir'):
+            kwargs.pop(key, None)
+        runner = cls(
+            scenario_id=data['scenario_id'],
+            cli_tool=data['cli_tool'],
+            workdir=workdir if workdir.is_dir() else None,
+            scratch_workdir=data.get('scratch_workdir', False),
+            **kwargs
+        )
 
-        return detected
+        runner.session_id = data['session_id']
+        runner.session = TestSession(
+            scenario_id=data['scenario_id'],
+            cli_tool=data['cli_tool'],
+            session_id=data['session_id'],
+            start_time=data['start_time'],
+            turns=[
+                Turn(**{**turn, 'timing': TurnTiming.from_dict(turn.get('timing'))})
+                for turn in data.get('turns', [])
+            ],
+            checkpoints=data.get('checkpoints', []),
+            agents_invoked=data.get('agents_invoked', [])
+        )
+        runner._turn_count = data['next_turn_spec']
+        runner._is_first_turn = data['is_first_turn']
+        runner._consecutive_timeouts = data.get('consecutive_timeouts', 0)
+        runner._missed_checkpoints = data.get('missed_checkpoints', [])
+
+        if not workdir.is_dir() and not runner._is_first_turn:
+            runner._log(f"[WARN] Working directory {workdir} no longer exists; "
+                        f"starting a new {runner.cli_tool} conversation")
+            runner._is_first_turn = True
+        return runner
+
+    @classmethod
+    def find_checkpoint(cls, session_id: str, checkpoint_dir: Path) -> Path:
+        """Checkpoint file for a session ID (or an explicit checkpoint path)."""
+        if Path(session_id).is_file():
+            return Path(session_id)
+        path = Path(checkpoint_dir) / f"{session_id}.json"
+        if not path.is_file():
+            raise FileNotFoundError(f"No checkpoint for session {session_id} in {checkpoint_dir}")
+        return path
+
+    def _print_summary(self) -> None:
+        self._log(f"\n{'='*60}")
+        self._log(f"Test {self.session.status.capitalize()}: {self.scenario_id}")
+        self._log(f"Turns: {len([t for t in self.session.turns if t.role == 'user'])}")
+        self._log(f"Checkpoints: {len(self.session.checkpoints)}")
+        self._log(f"Agents: {len(self.session.agents_invoked)}")
+        self._log(f"{'='*60}\n")
+
+    def _print_resume(self) -> None:
+        completed = len([t for t in self.session.turns if t.role == 'assistant'])
+        if completed:
+            self._log(f"Resuming session {self.session_id} after {completed} completed turn(s)\n")
 
-    def _get_agent_ids(self, detected_agents: List[Dict[str, Any]], min_confidence: str = 'LOW') -> List[str]:
-        """Extract agent IDs from detected agents, filtered by minimum confidence."""
-        confidence_order = {'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}
-        min_level = confidence_order.get(min_confidence, 1)
+    def run(self) -> TestSession:
+        """Execute the complete test scenario (or the rest of a resumed one)."""
+        self._print_header()
+        self._print_resume()
 
-        return [
-            agent['id'] for agent in detected_agents
-            if confidence_order.get(agent['confidence'], 0) >= min_level
-        ]
+        try:
+            self._save_checkpoint()
+            for turn_num, user_type, user_message, expected in self._iter_turn_specs():
+                self._record_user_turn(turn_num, user_type, user_message)
 
-    def _extract_vs_options(self, response: str) -> List[Dict]:
-        """Extract VS methodology options with T-Scores."""
-        options = []
+                # Execute CLI and get response
+                self._log(f"  Sending to {self.cli_tool}...")
+                try:
+                    response = self._execute_with_retry(user_message)
+                except TimeoutError as e:
+                    self._record_timeout(turn_num, expected, e)
+                else:
+                    self._record_assistant_turn(turn_num, response, expected)
+                    self._consecutive_timeouts = 0
+                self._save_checkpoint()
+                if self._check_abort(turn_num, expected):
+                    break
 
-        # Pattern: [A] Option Label (T=0.50)
-        pattern = r'\[([A-Z])\]\s*([^(]+?)\s*\(T\s*=\s*(\d+\.?\d*)\)'
-        matches = re.findall(pattern, response)
+            self._finalize_session()
 
-        for match in matches:
-            options.append({
-                'option': match[0],
-                'label': match[1].strip(),
-                't_score': float(match[2])
-            })
+        except Exception as e:
+            self._fail_session(e)
 
-        return options
+        self._print_summary()
+        return self.session
 
-    def run(self) -> TestSession:
-        """Execute the complete test scenario."""
-        print(f"\n{'='*60}")
-        print(f"Diverga QA Protocol v3.2.2 - True Automated Testing")
-        print(f"Scenario: {self.scenario_id}")
-        print(f"CLI Tool: {self.cli_tool}")
-        print(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
-        print(f"{'='*60}\n")
+    async def run_async(
+        self,
+        on_partial: Optional[Callable[[str, List[Dict]], None]] = None
+    ) -> TestSession:
+        """
+        Execute the complete test scenario on the asyncio backend.
 
-        conversation_flow = self.protocol.get('conversation_flow', [])
+        Turns within a scenario stay sequential (each depends on `--continue`),
+        but many scenarios can share one event loop via `asyncio.gather`.
+        """
+        self._print_header()
+        self._print_resume()
 
         try:
-            for turn_spec in conversation_flow:
-                self._turn_count += 1
-                turn_num = turn_spec.get('turn', self._turn_count)
-                user_message = turn_spec.get('user', '').strip()
-                user_type = turn_spec.get('user_type', 'UNKNOWN')
-                expected = turn_spec.get('expected_behavior', {})
+            self._save_checkpoint()
+            for turn_num, user_type, user_message, expected in self._iter_turn_specs():
+                self._record_user_turn(turn_num, user_type, user_message)
+
+                self._log(f"  Streaming from {self.cli_tool}...")
+                try:
+                    response = await self._execute_with_retry_async(user_message, on_partial)
+                except TimeoutError as e:
+                    self._record_timeout(turn_num, expected, e)
+                else:
+                    self._record_assistant_turn(turn_num, response, expected)
+                    self._consecutive_timeouts = 0
+                self._save_checkpoint()
+                if self._check_abort(turn_num, expected):
+                    break
 
-                if not user_message:
-                    continue
+            self._finalize_session()
 
-                print(f"[Turn {turn_num}] {user_type}")
-                if self.verbose:
-                    print(f"  User: {user_message[:60]}...")
-
-                # Record user turn
-                user_turn = Turn(
-                    number=turn_num,
-                    role='user',
-                    content=user_message,
-                    timestamp=datetime.now().isoformat(),
-                    metadata={'user_type': user_type}
-                )
-                self.session.turns.append(user_turn)
+        except Exception as e:
+            self._fail_session(e)
 
-                # Execute CLI and get response
-                print(f"  Sending to {self.cli_tool}...")
-                response = self._execute_cli(user_message)
-                print(f"  Received: {len(response)} chars")
-
-                # Analyze response
-                detected_checkpoints = self._detect_checkpoints(response)
-                detected_agents = self._detect_agents(response)
-                vs_options = self._extract_vs_options(response)
-
-                # Check if skill is loaded (for first turn)
-                skill_check = {}
-                if self._turn_count == 1:
-                    skill_check = self._check_skill_loaded(response)
-
-                # Extract IDs for backward compatibility
-                checkpoint_ids = self._get_checkpoint_ids(detected_checkpoints, min_confidence='MEDIUM')
-                agent_ids = self._get_agent_ids(detected_agents, min_confidence='MEDIUM')
-
-                # Record assistant turn
-                assistant_turn = Turn(
-                    number=turn_num,
-                    role='assistant',
-                    content=response,
-                    timestamp=datetime.now().isoformat(),
-                    checkpoints_detected=checkpoint_ids,
-                    agents_detected=agent_ids,
-                    vs_options=vs_options,
-                    metadata={
-                        'expected': expected,
-                        'detected_checkpoints_full': detected_checkpoints,
-                        'detected_agents_full': detected_agents,
-                        'skill_check': skill_check
-                    }
-                )
-                self.session.turns.append(assistant_turn)
-
-                # Update session-level aggregates
-                for cp in detected_checkpoints:
-                    if cp['confidence'] in ['HIGH', 'MEDIUM']:
-                        self.session.checkpoints.append({
-                            'checkpoint': cp['id'],
-                            'turn': turn_num,
-                            'confidence': cp['confidence'],
-                            'level': cp.get('level', 'UNKNOWN'),
-                            'timestamp': datetime.now().isoformat()
-                        })
-
-                # Only count agents with HIGH/MEDIUM confidence as actually invoked
-                for agent in detected_agents:
-                    if agent['confidence'] in ['HIGH', 'MEDIUM']:
-                        if agent['id'] not in self.session.agents_invoked:
-                            self.session.agents_invoked.append(agent['id'])
-
-                high_cp = len([c for c in detected_checkpoints if c['confidence'] == 'HIGH'])
-                high_agents = len([a for a in detected_agents if a['confidence'] in ['HIGH', 'MEDIUM']])
-                print(f"  ✓ Completed (CP: {high_cp} high/{len(detected_checkpoints)} total, Agents: {high_agents})")
-
-            # Finalize session
-            self.session.end_time = datetime.now().isoformat()
-            self.session.agents_invoked = list(set(self.session.agents_invoked))
-            self.session.status = "completed"
-            self.session.validation_results = self._validate_session()
+        self._print_summary()
+        return self.session
+
+    def rescore(self, raw_file: Path) -> TestSession:
+        """
+        Re-analyze and re-validate a saved conversation_raw*.json.
+
+        No CLI calls are made: recorded responses go through the current
+        detectors (via the analysis cache when one is set), so only responses
+        whose text or detector version changed are actually re-analyzed.
+        """
+        with open(raw_file, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+
+        self.session_id = raw.get('session_id') or self.session_id
+        self.session = TestSession(
+            scenario_id=self.scenario_id,
+            cli_tool=raw.get('cli_tool') or self.cli_tool,
+            session_id=self.session_id,
+            start_time=raw.get('start_time') or datetime.now().isoformat()
+        )
+        self._turn_count = 0
+
+        try:
+            for turn in raw.get('turns', []):
+                metadata = turn.get('metadata') or {}
+                if turn['role'] == 'user':
+                    self._turn_count += 1
+                    self._record_user_turn(turn['number'], metadata.get('user_type', 'UNKNOWN'), turn['content'])
+                else:
+                    self._last_timing = TurnTiming.from_dict(turn.get('timing'))
+                    self._record_assistant_turn(turn['number'], turn['content'], metadata.get('expected') or {})
+                self.session.turns[-1].timestamp = turn.get('timestamp') or self.session.turns[-1].timestamp
+
+            self._finalize_session()
+            self.session.end_time = raw.get('end_time') or self.session.end_time
+            # Keep the recorded outcome; only the analysis is refreshed
+            if raw.get('status') == 'failed':
+                self.session.status = 'failed'
+                self.session.error = raw.get('error')
+            elif raw.get('status') == 'aborted':
+                self.session.status = 'aborted'
+                self.session.abort = raw.get('abort')
 
         except Exception as e:
-            self.session.status = "failed"
-            self.session.error = str(e)
-            print(f"\n[ERROR] {e}")
-
-        # Print summary
-        print(f"\n{'='*60}")
-        print(f"Test {'Completed' if self.session.status == 'completed' else 'Failed'}: {self.scenario_id}")
-        print(f"Turns: {len([t for t in self.session.turns if t.role == 'user'])}")
-        print(f"Checkpoints: {len(self.session.checkpoints)}")
-        print(f"Agents: {len(self.session.agents_invoked)}")
-        print(f"{'='*60}\n")
+            self._fail_session(e)
 
         return self.session
 
@@ -1032,7 +1289,7 @@ To run with real AI responses, remove --dry-run flag.
 
         # Fallback: Run skill check on first response if not done during execution
         first_response = first_turn.content
-        skill_check = self._check_skill_loaded(first_response)
+        skill_check = self._analyze('check_skill_loaded', first_response)
 
         return {
             'verified': skill_check.get('loaded', False),
@@ -1098,20 +1355,8 @@ To run with real AI responses, remove --dry-run flag.
         }
 
         # Check 3: TIMESTAMP_VARIANCE
-        timestamps = []
-        for turn in assistant_turns:
-            try:
-                ts = datetime.fromisoformat(turn.timestamp)
-                timestamps.append(ts)
-            except:
-                pass
-
-        if len(timestamps) >= 2:
-            intervals = []
-            for i in range(1, len(timestamps)):
-                interval = (timestamps[i] - timestamps[i-1]).total_seconds()
-                intervals.append(interval)
-
+        intervals = self._response_intervals(assistant_turns)
+        if intervals:
             # Check if intervals vary (not all identical)
             if len(set(intervals)) > 1 or len(intervals) == 1:
                 timestamp_ok = True
@@ -1119,7 +1364,6 @@ To run with real AI responses, remove --dry-run flag.
                 timestamp_ok = False
         else:
             timestamp_ok = True
-            intervals = []
 
         results['checks']['TIMESTAMP_VARIANCE'] = {
             'passed': timestamp_ok,
@@ -1187,6 +1431,26 @@ To run with real AI responses, remove --dry-run flag.
 
         return results
 
+    @staticmethod
+    def _response_intervals(assistant_turns: List[Turn]) -> List[float]:
+        """
+        Per-response CLI latencies from turn timing.
+
+        Sessions saved without timing fall back to the intervals between
+        consecutive response timestamps.
+        """
+        latencies = [t.timing.total_seconds for t in assistant_turns if t.timing and t.timing.total_seconds is not None]
+        if len(latencies) == len(assistant_turns):
+            return latencies if len(latencies) >= 2 else []
+
+        timestamps = []
+        for turn in assistant_turns:
+            try:
+                timestamps.append(datetime.fromisoformat(turn.timestamp))
+            except ValueError:
+                pass
+        return [(later - earlier).total_seconds() for earlier, later in zip(timestamps, timestamps[1:])]
+
     def save_results(self, output_dir: str) -> Path:
         """Save test results to session folder."""
         output_path = Path(output_dir) / self.session.scenario_id
@@ -1204,7 +1468,7 @@ To run with real AI responses, remove --dry-run flag.
         # 4. Save README
         self._save_readme(output_path)
 
-        print(f"Results saved to: {output_path}")
+        self._log(f"Results saved to: {output_path}")
         return output_path
 
     def _save_transcript(self, output_path: Path):
@@ -1274,15 +1538,16 @@ To run with real AI responses, remove --dry-run flag.
             'end_time': self.session.end_time,
             'status': self.session.status,
             'error': self.session.error,
+            'abort': self.session.abort,
             'total_turns': len([t for t in self.session.turns if t.role == 'user']),
             'checkpoints': self.session.checkpoints,
             'agents_invoked': self.session.agents_invoked,
             'validation_results': self.session.validation_results,
-            'turns': [asdict(t) for t in self.session.turns]
+            'turns': self.session.turns  # Records are serialized by the codec
         }
 
         with open(raw_file, 'w', encoding='utf-8') as f:
-            json.dump(raw_data, f, indent=2, ensure_ascii=False)
+            get_codec().dump(raw_data, f)
 
     def _save_result_yaml(self, output_path: Path):
         """Save test result summary as YAML with CLI tool suffix."""
@@ -1303,6 +1568,8 @@ To run with real AI responses, remove --dry-run flag.
             status = "PARTIAL"  # Checkpoints OK but skill not verified
         else:
             status = "FAILED"
+        if self.session.status != 'completed':
+            status = 'ABORTED' if self.session.status == 'aborted' else 'ERROR'
 
         test_result = {
             'scenario_id': self.session.scenario_id,
@@ -1310,8 +1577,9 @@ To run with real AI responses, remove --dry-run flag.
             'test_date': datetime.now().strftime('%Y-%m-%d'),
             'test_mode': 'cli_automated' if not self.dry_run else 'dry_run',
             'cli_tool': self.session.cli_tool,
-            'status': status if self.session.status == 'completed' else 'ERROR',
+            'status': status,
             'error': self.session.error,
+            'abort': self.session.abort,
             'metrics': {
                 'total_turns': len([t for t in self.session.turns if t.role == 'user']),
                 'checkpoints_found': len(self.session.checkpoints),
@@ -1320,6 +1588,10 @@ To run with real AI responses, remove --dry-run flag.
                 'skill_loaded': skill_verified,
                 'skill_confidence': skill_loading.get('confidence', 'NONE'),
             },
+            'timing': {
+                'cli_tool': self.session.cli_tool,
+                **summarize_timings([t.timing for t in self.session.turns if t.timing]),
+            },
             'validation': validation,
             'checkpoints': [
                 {
@@ -1341,7 +1613,7 @@ To run with real AI responses, remove --dry-run flag.
         readme_file = output_path / 'README.md'
 
         validation = self.session.validation_results
-        status_icon = "✅" if self.session.status == 'completed' else "❌"
+        status_icon = {'completed': "✅", 'aborted': "⏹️"}.get(self.session.status, "❌")
 
         with open(readme_file, 'w', encoding='utf-8') as f:
             f.write(f"# {self.session.scenario_id} Test Session\n\n")
@@ -1352,6 +1624,9 @@ To run with real AI responses, remove --dry-run flag.
 
             if self.session.error:
                 f.write(f"**Error**: {self.session.error}\n\n")
+            if self.session.abort:
+                f.write(f"**Aborted**: after turn {self.session.abort['turn']} "
+                        f"({self.session.abort['rule']}): {self.session.abort['reason']}\n\n")
 
             f.write("---\n\n")
             f.write("## Session Contents\n\n")
@@ -1427,6 +1702,138 @@ To run with real AI responses, remove --dry-run flag.
                 f.write("- **DYNAMIC_CONTENT**: Non-templated, reasoning-based content\n")
 
 
+DEFAULT_CACHE_PATH = CLITestRunner.REPO_ROOT / 'qa' / '.cache' / 'analysis.sqlite3'
+DEFAULT_CHECKPOINT_DIR = CLITestRunner.REPO_ROOT / 'qa' / '.cache' / 'sessions'
+
+
+def open_cache(args: argparse.Namespace) -> Optional[AnalysisCache]:
+    """Open the analysis cache requested with --cache, if any."""
+    if not args.cache:
+        return None
+    return AnalysisCache(args.cache, max_bytes=args.cache_max_mb * 1024 * 1024)
+
+
+def open_store(args: argparse.Namespace) -> Optional[ResultsStore]:
+    """Open the results store requested with --store, if any."""
+    if not args.store:
+        return None
+    return ResultsStore(args.store)
+
+
+def resolve_executables(args: argparse.Namespace) -> Optional[Dict[str, List[str]]]:
+    """CLI executable overrides requested with --fake-cli, if any."""
+    if args.fake_cli is None:
+        return None
+    config = FakeCLIConfig.from_file(args.fake_cli) if args.fake_cli else FakeCLIConfig()
+    return fake_cli_executables(config)
+
+
+def open_cassette(args: argparse.Namespace, scenario_id: str) -> Optional[Cassette]:
+    """Open the cassette requested with --record/--replay for one scenario, if any."""
+    if args.record:
+        return Cassette.for_scenario(args.record, scenario_id, args.cli, 'record')
+    if args.replay:
+        return Cassette.for_scenario(args.replay, scenario_id, args.cli, 'replay')
+    return None
+
+
+def run_rescore(
+    args: argparse.Namespace,
+    cache: Optional[AnalysisCache],
+    store: Optional[ResultsStore] = None
+) -> int:
+    """Re-score saved conversation_raw*.json files and return the exit code."""
+    target = Path(args.rescore)
+    raw_files = sorted(target.rglob('conversation_raw*.json')) if target.is_dir() else [target]
+    raw_files = [p for p in raw_files if p.is_file()]
+    if not raw_files:
+        print(f"Error: no conversation_raw*.json found at '{args.rescore}'")
+        return 3
+
+    exit_code = 0
+    for raw_file in raw_files:
+        try:
+            with open(raw_file, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            runner = CLITestRunner(
+                scenario_id=raw['scenario_id'],
+                cli_tool=raw.get('cli_tool') or args.cli,
+                verbose=args.verbose,
+                dry_run=True,
+                cache=cache
+            )
+            session = runner.rescore(raw_file)
+            result_path = runner.save_results(args.output)
+            if store:
+                store.ingest_session(session, source=str(result_path))
+        except Exception as e:
+            print(f"❌ {raw_file}: {e}")
+            exit_code = 2
+            continue
+
+        compliance = session.validation_results.get('checkpoints', {}).get('compliance', 0)
+        print(f"{session.scenario_id} ({raw_file}): {session.status}, compliance {compliance:.1f}%")
+
+    if cache:
+        stats = cache.stats()
+        print(f"Analysis cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']}% hit rate)")
+    return exit_code
+
+
+def run_batch(
+    args: argparse.Namespace,
+    cache: Optional[AnalysisCache] = None,
+    executables: Optional[Dict[str, List[str]]] = None,
+    store: Optional[ResultsStore] = None
+) -> int:
+    """Run multiple scenarios in parallel and return the aggregate exit code."""
+    try:
+        from .batch_runner import BatchRunner, filter_scenarios, print_batch_summary, resolve_scenarios
+    except ImportError:  # Executed as a script from qa/runners
+        from batch_runner import BatchRunner, filter_scenarios, print_batch_summary, resolve_scenarios
+
+    try:
+        scenario_ids = filter_scenarios(resolve_scenarios(args.scenarios), args.select, args.shard)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 4
+    if not scenario_ids:
+        print(f"Error: no scenarios matched '{args.scenarios}'")
+        return 3
+
+    try:
+        batch = BatchRunner(
+            scenario_ids=scenario_ids,
+            cli_tool=args.cli,
+            jobs=args.jobs,
+            output_dir=args.output,
+            verbose=args.verbose,
+            dry_run=args.dry_run,
+            timeout=args.timeout,
+            workspace=args.workspace,
+            keep_workspaces=args.keep_workspaces,
+            backend=args.backend,
+            cache=cache,
+            cassette_dir=args.record or args.replay,
+            cassette_mode='record' if args.record else 'replay',
+            executables=executables,
+            store=store,
+            abort_policy=args.abort_policy,
+            retries=args.retries,
+            retry_backoff=args.retry_backoff,
+            checkpoint_dir=args.checkpoint_dir
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 4
+
+    report = batch.run()
+    summary_path = batch.save_report(report)
+    print_batch_summary(report)
+    print(f"Batch summary saved to: {summary_path}")
+    return report.exit_code
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Diverga QA v3.2.2 - True Automated Testing via CLI',
@@ -1447,14 +1854,72 @@ Examples:
 
   # Custom output directory
   python cli_test_runner.py --scenario QUAL-002 --output ./my-reports
+
+  # Run every runnable scenario, 4 at a time
+  python cli_test_runner.py --scenarios all --jobs 4
+
+  # Run a subset in parallel
+  python cli_test_runner.py --scenarios QUAL-002,META-002 --jobs 2
+
+  # Select by priority/paradigm/tags; split the selection across CI runners
+  python cli_test_runner.py --scenarios all --select "priority>=high and paradigm:qualitative"
+  python cli_test_runner.py --scenarios all --shard 3/8
+
+  # Stream responses (time-to-first-byte, partial detection) on one event loop
+  python cli_test_runner.py --scenarios all --jobs 24 --backend asyncio
+
+  # Record a live run, then replay it offline in seconds
+  python cli_test_runner.py --scenario QUAL-002 --record qa/cassettes
+  python cli_test_runner.py --scenario QUAL-002 --replay qa/cassettes
+
+  # Load-test against the local fake CLI (latency, failures, sizes from YAML)
+  python cli_test_runner.py --scenarios all --jobs 13 --backend asyncio --fake-cli fake_cli.yaml
+
+  # Stop a live session as soon as it can no longer pass (RED miss, compliance bound)
+  python cli_test_runner.py --scenario META-002 --fail-fast
+  python cli_test_runner.py --scenarios all --abort-on red-miss,timeouts:2
+
+  # Retry transient CLI failures; continue a failed session from its last completed turn
+  python cli_test_runner.py --scenario META-002 --retries 3 --retry-backoff 10
+  python cli_test_runner.py --resume 0b7c1e9a-...
+
+  # Re-score saved sessions, re-analyzing only changed responses
+  python cli_test_runner.py --rescore qa/reports/sessions --cache
+
+  # Index every run for trends and regression reports (see results_store.py)
+  python cli_test_runner.py --scenarios all --jobs 4 --store
         """
     )
 
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
         '--scenario', '-s',
-        required=True,
         help='Scenario ID (e.g., QUAL-002, META-002)'
     )
+    target.add_argument(
+        '--scenarios',
+        help="Run several scenarios: 'all' or a comma-separated list of IDs"
+    )
+    target.add_argument(
+        '--resume',
+        metavar='SESSION_ID',
+        help='Continue a failed session from its last completed turn (session ID or checkpoint file)'
+    )
+    target.add_argument(
+        '--rescore',
+        help='Re-analyze a saved conversation_raw*.json, or every one under a directory, without CLI calls'
+    )
+    parser.add_argument(
+        '--select',
+        metavar='EXPR',
+        help="With --scenarios: selection expression, e.g. 'priority>=high and paradigm:qualitative' "
+             "(keys: id, tag, paradigm, priority, duration; and/or/not)"
+    )
+    parser.add_argument(
+        '--shard',
+        metavar='K/N',
+        help='With --scenarios: run shard K of N, balanced by estimated duration'
+    )
     parser.add_argument(
         '--cli', '-c',
         default='claude',
@@ -1482,20 +1947,170 @@ Examples:
         default=300,
         help='Timeout per turn in seconds (default: 300)'
     )
+    abort = parser.add_mutually_exclusive_group()
+    abort.add_argument(
+        '--abort-on',
+        metavar='POLICIES',
+        help='Stop a session early and save it as aborted: comma-separated '
+             'red-miss, compliance[:PCT] (default 80), timeouts:N'
+    )
+    abort.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Same as --abort-on red-miss,compliance:80'
+    )
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=0,
+        help='Retry a turn this many times after a CLI timeout or error (default: 0)'
+    )
+    parser.add_argument(
+        '--retry-backoff',
+        type=float,
+        default=5.0,
+        metavar='SECONDS',
+        help='Delay before the first retry; doubles on each further retry (default: 5)'
+    )
+    parser.add_argument(
+        '--checkpoint-dir',
+        default=str(DEFAULT_CHECKPOINT_DIR),
+        metavar='DIR',
+        help=f'Per-turn session checkpoints for --resume '
+             f'(default: {DEFAULT_CHECKPOINT_DIR.relative_to(CLITestRunner.REPO_ROOT)})'
+    )
+    parser.add_argument(
+        '--resume-new-conversation',
+        action='store_true',
+        help="With --resume: if the session's working directory is gone, play the remaining turns "
+             "in a new CLI conversation instead of failing"
+    )
+    parser.add_argument(
+        '--backend',
+        default='subprocess',
+        choices=CLITestRunner.BACKENDS,
+        help='Execution backend: blocking subprocess or streaming asyncio (default: subprocess)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of scenarios to run concurrently with --scenarios (default: 1)'
+    )
+    parser.add_argument(
+        '--workspace',
+        default=None,
+        help='Parent directory for per-scenario working directories (default: system temp)'
+    )
+    parser.add_argument(
+        '--keep-workspaces',
+        action='store_true',
+        help='Do not delete per-scenario working directories after the batch'
+    )
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const=str(DEFAULT_CACHE_PATH),
+        default=None,
+        help=f'Cache response analysis in SQLite (default path: {DEFAULT_CACHE_PATH.relative_to(CLITestRunner.REPO_ROOT)})'
+    )
+    parser.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=64,
+        help='Analysis cache size limit in MB; least recently used entries are evicted (default: 64)'
+    )
+    parser.add_argument(
+        '--store',
+        nargs='?',
+        const=str(DEFAULT_STORE_PATH),
+        default=None,
+        help=f'Ingest every session result into the SQLite results store '
+             f'(default path: {DEFAULT_STORE_PATH.relative_to(CLITestRunner.REPO_ROOT)})'
+    )
+
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument(
+        '--record',
+        metavar='DIR',
+        help='Record every CLI call to DIR/<SCENARIO>_<cli>.cassette.json'
+    )
+    transport.add_argument(
+        '--replay',
+        metavar='DIR',
+        help='Serve CLI calls from cassettes recorded with --record (no CLI calls)'
+    )
+
+    parser.add_argument(
+        '--fake-cli',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='CONFIG',
+        help='Run the local fake CLI instead of the real tool; optional YAML config '
+             '(latency, failure_rate, hang_rate, size, chunks, seed, cassette_dir)'
+    )
 
     args = parser.parse_args()
+    if args.record and args.dry_run:
+        parser.error('--record needs live CLI calls; it cannot be combined with --dry-run')
+    if (args.select or args.shard) and not args.scenarios:
+        parser.error('--select and --shard require --scenarios')
+    if args.fake_cli is not None and args.dry_run:
+        parser.error('--fake-cli replaces the CLI executable; it cannot be combined with --dry-run')
+    if args.resume and (args.record or args.replay):
+        parser.error('--resume cannot be combined with --record/--replay')
+    if args.resume_new_conversation and not args.resume:
+        parser.error('--resume-new-conversation requires --resume')
+    if args.retries < 0:
+        parser.error('--retries must be >= 0')
+    try:
+        args.abort_policy = AbortPolicy.parse(args.abort_on) if args.abort_on else (
+            AbortPolicy.fail_fast() if args.fail_fast else None)
+    except ValueError as e:
+        parser.error(str(e))
+    cache = open_cache(args)
+    store = open_store(args)
+    executables = resolve_executables(args)
+
+    if args.scenarios:
+        sys.exit(run_batch(args, cache, executables, store))
+    if args.rescore:
+        sys.exit(run_rescore(args, cache, store))
 
     try:
-        runner = CLITestRunner(
-            scenario_id=args.scenario,
-            cli_tool=args.cli,
+        options = dict(
             verbose=args.verbose,
             dry_run=args.dry_run,
-            timeout=args.timeout
+            timeout=args.timeout,
+            cache=cache,
+            executables=executables,
+            abort_policy=args.abort_policy,
+            retries=args.retries,
+            retry_backoff=args.retry_backoff,
+            checkpoint_dir=args.checkpoint_dir
         )
+        if args.resume:
+            runner = CLITestRunner.from_checkpoint(
+                CLITestRunner.find_checkpoint(args.resume, args.checkpoint_dir),
+                new_conversation=args.resume_new_conversation,
+                **options
+            )
+        else:
+            runner = CLITestRunner(
+                scenario_id=args.scenario,
+                cli_tool=args.cli,
+                cassette=open_cassette(args, args.scenario),
+                **options
+            )
 
-        session = runner.run()
+        if args.backend == 'asyncio':
+            session = asyncio.run(runner.run_async())
+        else:
+            session = runner.run()
         result_path = runner.save_results(args.output)
+        if store:
+            store.ingest_session(session, source=str(result_path))
 
         # Exit code based on status
         if session.status == 'completed':
@@ -1506,6 +2121,9 @@ Examples:
             else:
                 print(f"\n⚠️ Test completed but low compliance ({compliance:.1f}%): {result_path}")
                 sys.exit(1)
+        elif session.status == 'aborted':
+            print(f"\n⏹️ Test aborted after turn {session.abort['turn']}: {session.abort['reason']}: {result_path}")
+            sys.exit(1)
         else:
             print(f"\n❌ Test FAILED: {session.error}")
             sys.exit(2)
@@ -26,6 +26,7 @@ from ..protocol.metrics import (
     AgentMetrics,
     VSQualityMetrics,
 )
+from ..detectors import analyze
 from .checkpoint_validator import CheckpointValidator, ValidationResult
 from .agent_tracker import AgentTracker, AgentInvocation
 
@@ -229,11 +230,11 @@ class ConversationSimulator:
             # 5. Check VS quality from response
             vs_quality = self._evaluate_vs_quality(ai_response)
             self.metrics.record_vs_quality(
-                options_presented=vs_quality.get("options_count", 0),
-                t_score_min=vs_quality.get("t_score_min", 1.0),
-                t_score_max=vs_quality.get("t_score_max", 0.0),
-                modal_identified=vs_quality.get("modal_identified", False),
-                modal_recommended=vs_quality.get("modal_recommended", False),
+                options_presented=vs_quality["options_presented"],
+                modal_identified=vs_quality["modal_identified"],
+                modal_t_score=vs_quality["modal_t_score"],
+                modal_recommended=vs_quality["modal_recommended"],
+                t_scores=vs_quality["t_scores"],
             )
 
             # 6. Check for auto-proceed violation
@@ -319,75 +320,19 @@ class ConversationSimulator:
         return matched
 
     def _detect_agent_in_response(self, response: str) -> str | None:
-        """Detect which agent was invoked based on response patterns."""
-        # Look for Task tool patterns
-        task_patterns = [
-            r'subagent_type\s*=\s*["\']diverga:([a-h]\d)["\']',
-            r'diverga:([a-h]\d)',
-            r'([A-H]\d)-\w+Master',
-            r'([A-H]\d)-\w+Guard',
-            r'([A-H]\d)-\w+Engine',
-        ]
-
-        for pattern in task_patterns:
-            match = re.search(pattern, response, re.IGNORECASE)
-            if match:
-                agent_code = match.group(1).lower()
-                return f"diverga:{agent_code}"
-
+        """Detect which agent was invoked, most confident detection first."""
+        detected = analyze(response).agents
+        if detected:
+            return f"diverga:{detected[0]['id'].lower()}"
         return None
 
     def _evaluate_vs_quality(self, response: str) -> dict[str, Any]:
         """Evaluate VS methodology quality in response."""
-        quality = {
-            "options_count": 0,
-            "t_score_min": 1.0,
-            "t_score_max": 0.0,
-            "modal_identified": False,
-            "modal_recommended": False,
-        }
-
-        # Count options
-        option_patterns = [r"\[A\]", r"\[B\]", r"\[C\]", r"\[D\]"]
-        for pattern in option_patterns:
-            if re.search(pattern, response):
-                quality["options_count"] += 1
-
-        # Extract T-scores
-        t_score_pattern = r"T\s*[=≈]\s*(0?\.\d+)"
-        matches = re.findall(t_score_pattern, response, re.IGNORECASE)
-        if matches:
-            t_scores = [float(m) for m in matches]
-            quality["t_score_min"] = min(t_scores)
-            quality["t_score_max"] = max(t_scores)
-
-            # Check for modal avoidance
-            if quality["t_score_max"] >= 0.7:
-                quality["modal_identified"] = True
-                # Check if modal is recommended as primary
-                if "권장" in response or "recommend" in response.lower():
-                    # Check if high T-score option is marked as recommended
-                    modal_recommended_pattern = r"\[A\].*?T\s*[=≈]\s*0\.[6-9].*?(?:권장|recommend)"
-                    if re.search(modal_recommended_pattern, response, re.IGNORECASE | re.DOTALL):
-                        quality["modal_recommended"] = True
-
-        return quality
+        return analyze(response).vs_summary
 
     def _detect_auto_proceed(self, response: str) -> bool:
         """Detect if AI auto-proceeded without waiting."""
-        auto_proceed_patterns = [
-            r"진행하겠습니다(?![?])",
-            r"시작하겠습니다(?![?])",
-            r"I will proceed",
-            r"I'll proceed",
-            r"proceeding with",
-        ]
-
-        for pattern in auto_proceed_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                return True
-
-        return False
+        return analyze(response).auto_proceed
 
     @classmethod
     def from_scenario_file(cls, scenario_path: Path | str) -> "ConversationSimulator":
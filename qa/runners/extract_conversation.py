@@ -13,24 +13,48 @@ Features:
 - VS methodology option detection
 - T-Score extraction
 - Language consistency validation
+- Streaming mode with flat memory for very large session logs
 
 Usage:
     python extract_conversation.py --session <path> --output <dir>
     python extract_conversation.py --session ~/.claude/projects/abc123/session.jsonl
+    python extract_conversation.py --session big_session.jsonl --stream
+    python extract_conversation.py --batch ~/.claude/projects/abc123 --output extracted/ --jobs 8
+    python extract_conversation.py --batch "archive/2026-*/*.jsonl" --output extracted/
 """
 
 import json
+import os
 import re
 import argparse
+import glob
+import mmap
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Union
 import yaml
 
+try:
+    from .json_codec import JSONCodec, get_codec
+    from .records import Record, field_names, intern
+except ImportError:  # Executed as a script from qa/runners
+    from json_codec import JSONCodec, get_codec
+    from records import Record, field_names, intern
 
-@dataclass
-class Turn:
+try:
+    from .. import detectors
+except (ImportError, ValueError):  # qa/runners imported as a top-level package or script
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    import detectors
+
+
+@dataclass(slots=True)
+class Turn(Record):
     """Single conversation turn."""
     turn_number: int
     role: str  # 'user' or 'assistant'
@@ -45,9 +69,62 @@ class Turn:
     agent_invoked: Optional[str] = None
     maintains_checkpoint: bool = False
 
-
-@dataclass
-class Checkpoint:
+    def __post_init__(self):
+        self.role = intern(self.role)
+        self.turn_type = intern(self.turn_type)
+
+
+class _LazyTurn(Turn):
+    """A retained Turn whose content is re-read from the session log on each access."""
+    __slots__ = ('_source', '_start', '_end')
+
+    @classmethod
+    def detach(cls, turn: Turn, source: '_SessionContent', span: tuple[int, int]) -> '_LazyTurn':
+        """Copy of `turn` that keeps the byte span of its log line instead of its content."""
+        lazy = cls.__new__(cls)
+        for name in field_names(Turn):
+            if name != 'content':
+                setattr(lazy, name, getattr(turn, name))
+        lazy._source = source
+        lazy._start, lazy._end = span
+        return lazy
+
+    @property
+    def content(self) -> str:
+        return self._source.content(self._start, self._end)
+
+    def __eq__(self, other):
+        # Equal to the eager Turn with the same fields
+        if not isinstance(other, Turn):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in field_names(Turn))
+
+
+class _SessionContent:
+    """Turn content read back from a session log, memory-mapped on first use."""
+    __slots__ = ('path', 'codec', '_map')
+
+    def __init__(self, path: Path, codec: JSONCodec):
+        self.path = path
+        self.codec = codec
+        self._map = None
+
+    def content(self, start: int, end: int) -> str:
+        if self._map is None:
+            with open(self.path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        entry = self.codec.loads(self._map[start:end])
+        return entry.get('content', entry.get('message', ''))
+
+    def close(self) -> None:
+        """Unmap the log; content read after this maps it again."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+@dataclass(slots=True)
+class Checkpoint(Record):
     """Checkpoint tracking."""
     id: str
     status: str  # 'TRIGGERED', 'PASSED', 'BYPASSED'
@@ -57,19 +134,32 @@ class Checkpoint:
     user_selection: Optional[str] = None
     level: str = "RED"  # RED, ORANGE, YELLOW
 
+    def __post_init__(self):
+        self.id = intern(self.id)
+        self.level = intern(self.level)
+
 
-@dataclass
-class AgentInvocation:
+@dataclass(slots=True)
+class AgentInvocation(Record):
     """Agent invocation tracking."""
     agent: str
     turn: int
     trigger: str
     tool_call_id: Optional[str] = None
 
+    def __post_init__(self):
+        self.agent = intern(self.agent)
 
-@dataclass
-class ExtractionResult:
-    """Complete extraction result."""
+
+@dataclass(slots=True)
+class ExtractionResult(Record):
+    """
+    Complete extraction result.
+
+    `turns`, `checkpoints` and `agents_invoked` hold the extractor's
+    records themselves (readable by key, like the dicts they replace);
+    `to_dict()` or `_write_result` serialize them.
+    """
     session_id: str
     scenario_id: Optional[str]
     extracted_at: str
@@ -80,6 +170,11 @@ class ExtractionResult:
     agents_invoked: list
     metrics: dict
 
+    def close(self) -> None:
+        """Release the session log mapped by `lazy_content` turns (a no-op otherwise)."""
+        for source in {turn._source for turn in self.turns if isinstance(turn, _LazyTurn)}:
+            source.close()
+
 
 class ConversationExtractor:
     """
@@ -93,27 +188,12 @@ class ConversationExtractor:
     - User input type classification
     """
 
-    # Checkpoint patterns
-    CHECKPOINT_PATTERNS = {
-        'RED': [
-            r'CP_RESEARCH_DIRECTION',
-            r'CP_METHODOLOGY_APPROVAL',
-            r'CP_ETHICS_APPROVAL',
-            r'CP_FINAL_SUBMISSION',
-            r'CP_DATA_COLLECTION_START',
-        ],
-        'ORANGE': [
-            r'CP_THEORY_SELECTION',
-            r'CP_SCOPE_DECISION',
-            r'CP_HUMANIZATION_REVIEW',
-            r'CP_ANALYSIS_APPROACH',
-            r'CP_INTEGRATION_STRATEGY',
-        ],
-        'YELLOW': [
-            r'CP_PARADIGM_RECONSIDERATION',
-            r'CP_MINOR_ADJUSTMENT',
-        ]
-    }
+    # Entries _process_entry handles, by "type" (or "role"); with the
+    # prefilter on, JSONL lines without one of these are never decoded
+    ENTRY_TYPES = ('user', 'assistant', 'tool_result')
+
+    # Checkpoint IDs by level (shared with the other runners, see qa.detectors)
+    CHECKPOINT_PATTERNS = detectors.CHECKPOINT_LEVELS
 
     # User input type patterns
     USER_TYPE_PATTERNS = {
@@ -177,6 +257,11 @@ class ConversationExtractor:
             r'\bagree\b',
         ],
     }
+    DEFAULT_USER_TYPE = 'STANDARD_RESPONSE'
+
+    # USER_TYPE_PATTERNS compiled once into one priority-ordered table: a
+    # single scan finds the first category (in declaration order) that matches
+    USER_TYPE_TABLE = detectors.PatternTable(USER_TYPE_PATTERNS)
 
     # Agent detection patterns (from Task tool calls)
     AGENT_PATTERNS = {
@@ -230,22 +315,36 @@ class ConversationExtractor:
         'H2-ActionResearchFacilitator': r'diverga:H2|action.*research|PAR|CBPR',
     }
 
-    # T-Score pattern
-    TSCORE_PATTERN = r'T[=-]?\s*(\d+\.?\d*)'
-
-    # VS options pattern
-    VS_OPTIONS_PATTERN = r'\[([A-Z])\].*?(?:T[=-]?\s*\d+\.?\d*|\(T\s*=\s*\d+\.?\d*\))'
-
-    def __init__(self, session_path: str, scenario_id: Optional[str] = None):
+    # AGENT_PATTERNS compiled once into one table: a single scan attributes a
+    # tool call to its first matching agent, or a tool result to every agent
+    AGENT_TABLE = detectors.PatternTable(AGENT_PATTERNS)
+
+    def __init__(
+        self,
+        session_path: str,
+        scenario_id: Optional[str] = None,
+        codec: Optional[JSONCodec] = None,
+        prefilter: bool = True,
+        lazy_content: bool = False,
+    ):
         """
         Initialize extractor with session path.
 
         Args:
             session_path: Path to Claude Code session JSONL file
             scenario_id: Optional scenario ID for matching against expected
+            codec: JSON codec for session lines (fastest installed backend by default)
+            prefilter: Skip lines without a handled entry type before decoding them
+            lazy_content: Retain turns without their content, which is read back
+                from the session log on access (the log must stay unchanged)
         """
         self.session_path = Path(session_path)
         self.scenario_id = scenario_id
+        self.codec = codec or get_codec()
+        self.prefilter = prefilter
+        self.lazy_content = lazy_content
+        self._content_source = _SessionContent(self.session_path, self.codec) if lazy_content else None
+        self._span = (0, 0)  # Byte span of the entry being processed (lazy_content only)
         self.turns: list[Turn] = []
         self.checkpoints: list[Checkpoint] = []
         self.agents_invoked: list[AgentInvocation] = []
@@ -253,6 +352,16 @@ class ConversationExtractor:
         self._language: str = "unknown"
         self._turn_count = 0
 
+        # Streaming state: when set, turns are handed out instead of retained
+        self._streaming = False
+        self._pending: list = []
+
+        # Running metrics (see _calculate_metrics)
+        self._user_turns = 0
+        self._type_counts: dict = {}
+        self._transition_agents: set = set()
+        self._unique_agents: set = set()  # Also the dedupe index for tool-result attribution
+
     def extract(self) -> ExtractionResult:
         """
         Parse JSONL and extract conversation.
@@ -260,43 +369,145 @@ class ConversationExtractor:
         Returns:
             ExtractionResult with all extracted data
         """
+        for entry in self._iter_entries():
+            self._process_entry(entry)
+
+        self._finalize_checkpoints()
+        return self._build_result(list(self.turns))
+
+    def stream(self) -> Iterator[Union[Turn, Checkpoint, AgentInvocation]]:
+        """
+        Parse JSONL and yield records as soon as they are final.
+
+        Turns are yielded once processed and are not retained, so memory stays
+        flat regardless of session length. Agent invocations are yielded when
+        detected; checkpoints when resolved, superseded by a newer checkpoint,
+        or closed at the end of the session. Call `_calculate_metrics()` (or
+        use `extract_to_file`) after the iterator is exhausted.
+        """
+        self._streaming = True
+        try:
+            for entry in self._iter_entries():
+                self._process_entry(entry)
+                yield from self._drain()
+
+            self._finalize_checkpoints()
+            yield from self._drain()
+        finally:
+            self._streaming = False
+
+    def extract_to_file(self, output_path: str, fmt: str = 'yaml') -> ExtractionResult:
+        """
+        Stream extraction straight into a YAML/JSON file.
+
+        Output is identical to dumping `extract()`'s result, but turns are
+        spooled to a temporary file as they are extracted instead of being
+        held in memory. The returned result carries metrics, checkpoints and
+        agents; its `turns` list is empty.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryFile('w+', encoding='utf-8', dir=output_path.parent) as spool:
+            writer = _TurnSpool(spool, fmt)
+            for record in self.stream():
+                if isinstance(record, Turn):
+                    writer.add(record.to_dict())
+
+            result = self._build_result([])
+            header = result.to_dict()
+            with open(output_path, 'w', encoding='utf-8') as f:
+                writer.write_document(header, f)
+
+        return result
+
+    def _iter_entries(self) -> Iterator[dict]:
+        """Yield parsed JSONL entries, skipping blank and malformed lines."""
         if not self.session_path.exists():
             raise FileNotFoundError(f"Session file not found: {self.session_path}")
 
-        with open(self.session_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entry = json.loads(line)
-                        self._process_entry(entry)
-                    except json.JSONDecodeError:
-                        continue  # Skip malformed lines
+        types = self.ENTRY_TYPES if self.prefilter else None
+        if not self.lazy_content:
+            yield from self.codec.iter_jsonl(self.session_path, types=types, keys=('type', 'role'))
+            return
+
+        for offset, line, entry in self.codec.scan_jsonl(self.session_path, types=types, keys=('type', 'role')):
+            if entry is not None:
+                self._span = (offset, offset + len(line))
+                yield entry
 
-        # Finalize any open checkpoint
+    def _finalize_checkpoints(self) -> None:
+        """Finalize any open checkpoint."""
         if self._active_checkpoint and self._active_checkpoint.status == 'TRIGGERED':
             self._active_checkpoint.status = 'INCOMPLETE'
+            self._emit(self._active_checkpoint)
 
+    def _build_result(self, turns: list) -> ExtractionResult:
         return ExtractionResult(
             session_id=self.session_path.stem,
             scenario_id=self.scenario_id,
             extracted_at=datetime.now().isoformat(),
             language=self._language,
-            total_turns=len(self.turns),
-            turns=[asdict(t) for t in self.turns],
-            checkpoints=[asdict(c) for c in self.checkpoints],
-            agents_invoked=[asdict(a) for a in self.agents_invoked],
+            total_turns=self._turn_count,
+            turns=turns,
+            checkpoints=list(self.checkpoints),
+            agents_invoked=list(self.agents_invoked),
             metrics=self._calculate_metrics()
         )
 
-    def _process_entry(self, entry: dict) -> None:
-        """Process a single JSONL entry."""
+    def _emit(self, record) -> None:
+        """Queue a finished record for stream() consumers."""
+        if self._streaming:
+            self._pending.append(record)
+
+    def _drain(self) -> list:
+        pending, self._pending = self._pending, []
+        return pending
+
+    def _record_turn(self, turn: Turn) -> None:
+        """Account for a processed turn and retain or emit it."""
+        if turn.role == 'user':
+            self._user_turns += 1
+            t_type = turn.turn_type or 'UNKNOWN'
+            self._type_counts[t_type] = self._type_counts.get(t_type, 0) + 1
+
+        if self._streaming:
+            self._pending.append(turn)
+        elif self.lazy_content:
+            self.turns.append(_LazyTurn.detach(turn, self._content_source, self._span))
+        else:
+            self.turns.append(turn)
+
+    def _record_agent(self, invocation: AgentInvocation) -> None:
+        """Track an agent invocation and update transition counters."""
+        if self.agents_invoked and self.agents_invoked[-1].agent != invocation.agent:
+            self._transition_agents.add(invocation.agent)
+        self._unique_agents.add(invocation.agent)
+        self.agents_invoked.append(invocation)
+        self._emit(invocation)
+
+    @staticmethod
+    def entry_kind(entry: dict) -> Optional[str]:
+        """'user', 'assistant' or 'tool_result' for entries the extractor handles, else None."""
         entry_type = entry.get('type', '')
 
         if entry_type == 'user' or entry.get('role') == 'user':
-            self._process_user_turn(entry)
+            return 'user'
         elif entry_type == 'assistant' or entry.get('role') == 'assistant':
-            self._process_assistant_turn(entry)
+            return 'assistant'
         elif entry_type == 'tool_result':
+            return 'tool_result'
+        return None
+
+    def _process_entry(self, entry: dict) -> None:
+        """Process a single JSONL entry."""
+        kind = self.entry_kind(entry)
+
+        if kind == 'user':
+            self._process_user_turn(entry)
+        elif kind == 'assistant':
+            self._process_assistant_turn(entry)
+        elif kind == 'tool_result':
             self._process_tool_result(entry)
 
     def _process_user_turn(self, entry: dict) -> None:
@@ -315,7 +526,7 @@ class ConversationExtractor:
             timestamp=entry.get('timestamp'),
             turn_type=self._classify_user_input(content)
         )
-        self.turns.append(turn)
+        self._record_turn(turn)
 
         # Check if user is responding to checkpoint
         if self._active_checkpoint:
@@ -327,6 +538,7 @@ class ConversationExtractor:
                     self._turn_count - self._active_checkpoint.turn_triggered
                 )
                 self._active_checkpoint.status = 'PASSED'
+                self._emit(self._active_checkpoint)
                 self._active_checkpoint = None
 
     def _process_assistant_turn(self, entry: dict) -> None:
@@ -344,7 +556,7 @@ class ConversationExtractor:
         )
 
         # Detect checkpoint triggers
-        checkpoint_id = self._detect_checkpoint(content)
+        checkpoint_id = intern(self._detect_checkpoint(content))
         if checkpoint_id:
             turn.checkpoint_triggered = checkpoint_id
             turn.halt_verified = self._verify_halt(content)
@@ -358,6 +570,9 @@ class ConversationExtractor:
                 level=level
             )
             self.checkpoints.append(checkpoint)
+            if self._active_checkpoint:
+                # Superseded checkpoints can no longer be resolved
+                self._emit(self._active_checkpoint)
             self._active_checkpoint = checkpoint
 
         # Check if maintaining checkpoint (technical question without selection)
@@ -374,86 +589,54 @@ class ConversationExtractor:
             agent = self._detect_agent_from_tool_call(tool_call)
             if agent:
                 turn.agent_invoked = agent
-                self.agents_invoked.append(AgentInvocation(
+                self._record_agent(AgentInvocation(
                     agent=agent,
                     turn=self._turn_count,
                     trigger='tool_call',
                     tool_call_id=tool_call.get('id')
                 ))
 
-        self.turns.append(turn)
+        self._record_turn(turn)
 
     def _process_tool_result(self, entry: dict) -> None:
         """Process tool result for agent detection."""
         tool_name = entry.get('tool_name', '')
         if 'diverga:' in tool_name.lower() or 'task' in tool_name.lower():
             content = entry.get('content', str(entry.get('result', '')))
-            for agent, pattern in self.AGENT_PATTERNS.items():
-                if re.search(pattern, content, re.IGNORECASE):
-                    # Check if not already tracked
-                    if not any(a.agent == agent for a in self.agents_invoked):
-                        self.agents_invoked.append(AgentInvocation(
-                            agent=agent,
-                            turn=self._turn_count,
-                            trigger='tool_result'
-                        ))
+            for agent in self.AGENT_TABLE.matching(content):
+                # Check if not already tracked
+                if agent not in self._unique_agents:
+                    self._record_agent(AgentInvocation(
+                        agent=agent,
+                        turn=self._turn_count,
+                        trigger='tool_result'
+                    ))
 
     def _classify_user_input(self, content: str) -> str:
         """Classify user input type."""
-        content_lower = content.lower()
-
-        for input_type, patterns in self.USER_TYPE_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower, re.IGNORECASE):
-                    return input_type
+        return self.USER_TYPE_TABLE.first(content) or self.DEFAULT_USER_TYPE
 
-        return 'STANDARD_RESPONSE'
+    def user_type_hits(self) -> dict:
+        """User turns classified as each input type so far, in priority order (0 if none)."""
+        categories = [*self.USER_TYPE_TABLE.names, self.DEFAULT_USER_TYPE]
+        return {category: self._type_counts.get(category, 0) for category in categories}
 
     def _detect_checkpoint(self, content: str) -> Optional[str]:
         """Detect checkpoint in assistant response."""
-        for level, patterns in self.CHECKPOINT_PATTERNS.items():
-            for pattern in patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    return match.group(0)
-
-        # Also check for generic checkpoint indicators
-        if re.search(r'CHECKPOINT.*:', content, re.IGNORECASE):
-            match = re.search(r'CHECKPOINT[:\s]*(\w+)', content, re.IGNORECASE)
-            if match:
-                return f"CP_{match.group(1).upper()}"
-
-        return None
+        return detectors.analyze(content).checkpoint
 
     def _get_checkpoint_level(self, checkpoint_id: str) -> str:
         """Get checkpoint level (RED, ORANGE, YELLOW)."""
-        for level, patterns in self.CHECKPOINT_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, checkpoint_id, re.IGNORECASE):
-                    return level
-        return 'UNKNOWN'
+        return detectors.checkpoint_level(checkpoint_id)
 
     def _verify_halt(self, content: str) -> bool:
         """Verify that assistant halted for user input."""
-        halt_indicators = [
-            r'which.*would you.*like',
-            r'which.*direction',
-            r'please.*select',
-            r'choose.*option',
-            r'approve.*proceed',
-            r'confirm.*continue',
-            r'\?$',
-        ]
-        for pattern in halt_indicators:
-            if re.search(pattern, content, re.IGNORECASE | re.MULTILINE):
-                return True
-        return False
+        return detectors.analyze(content).halt
 
     def _extract_vs_options(self, content: str) -> tuple[int, list]:
         """Extract VS methodology options and T-Scores."""
-        options = re.findall(self.VS_OPTIONS_PATTERN, content, re.IGNORECASE)
-        t_scores = [float(t) for t in re.findall(self.TSCORE_PATTERN, content)]
-        return len(set(options)), t_scores
+        rows = detectors.analyze(content).t_scores
+        return len({option for option, _, _ in rows if option}), [t_score for _, t_score, _ in rows]
 
     def _extract_selection(self, content: str) -> Optional[str]:
         """Extract user's option selection."""
@@ -475,16 +658,14 @@ class ConversationExtractor:
         args = tool_call.get('arguments', tool_call.get('input', {}))
 
         # Check tool name for agent pattern
-        for agent, pattern in self.AGENT_PATTERNS.items():
-            if re.search(pattern, tool_name, re.IGNORECASE):
-                return agent
+        agent = self.AGENT_TABLE.first(tool_name)
+        if agent:
+            return agent
 
         # Check arguments for agent references
         if isinstance(args, dict):
             prompt = args.get('prompt', '') + args.get('description', '')
-            for agent, pattern in self.AGENT_PATTERNS.items():
-                if re.search(pattern, prompt, re.IGNORECASE):
-                    return agent
+            return self.AGENT_TABLE.first(prompt)
 
         return None
 
@@ -500,14 +681,13 @@ class ConversationExtractor:
         return 'English'
 
     def _calculate_metrics(self) -> dict:
-        """Calculate extraction metrics."""
-        user_turns = [t for t in self.turns if t.role == 'user']
+        """
+        Calculate extraction metrics.
 
-        # Count user input types
-        type_counts = {}
-        for turn in user_turns:
-            t_type = turn.turn_type or 'UNKNOWN'
-            type_counts[t_type] = type_counts.get(t_type, 0) + 1
+        Turn-level figures come from counters maintained while turns are
+        recorded, so metrics are available in streaming mode too.
+        """
+        type_counts = dict(self._type_counts)
 
         # Checkpoint compliance
         red_checkpoints = [c for c in self.checkpoints if c.level == 'RED']
@@ -517,29 +697,79 @@ class ConversationExtractor:
             if red_checkpoints else 100
         )
 
-        # Agent transition count
-        agent_transitions = len(set(
-            self.agents_invoked[i].agent
-            for i in range(1, len(self.agents_invoked))
-            if self.agents_invoked[i].agent != self.agents_invoked[i-1].agent
-        )) if len(self.agents_invoked) > 1 else 0
-
         return {
-            'total_turns': len(self.turns),
-            'user_turns': len(user_turns),
-            'assistant_turns': len(self.turns) - len(user_turns),
+            'total_turns': self._turn_count,
+            'user_turns': self._user_turns,
+            'assistant_turns': self._turn_count - self._user_turns,
             'user_input_types': type_counts,
             'technical_questions': type_counts.get('TECHNICAL_FOLLOW_UP', 0),
             'methodological_challenges': type_counts.get('METHODOLOGICAL_CHALLENGE', 0),
-            'agent_transitions': agent_transitions,
+            # Distinct agents entered from a different agent
+            'agent_transitions': len(self._transition_agents),
             'total_checkpoints': len(self.checkpoints),
             'checkpoints_passed': len([c for c in self.checkpoints if c.status == 'PASSED']),
             'checkpoint_compliance_pct': round(checkpoint_compliance, 1),
-            'unique_agents_invoked': len(set(a.agent for a in self.agents_invoked)),
+            'unique_agents_invoked': len(self._unique_agents),
             'language': self._language,
         }
 
 
+class _TurnSpool:
+    """
+    Spools serialized turns to a file so a result document can be written
+    without holding every turn in memory.
+
+    The final document matches `yaml.dump` / `json.dump(indent=2)` of the
+    full result dict byte for byte.
+    """
+
+    def __init__(self, spool, fmt: str):
+        if fmt not in ('yaml', 'json'):
+            raise ValueError(f"Unsupported format: {fmt}")
+        self.spool = spool
+        self.fmt = fmt
+        self.count = 0
+
+    def add(self, turn: dict) -> None:
+        if self.fmt == 'yaml':
+            # Sequences under a mapping key are not indented by PyYAML, so a
+            # one-item list dumps exactly as the item appears under `turns:`
+            self.spool.write(yaml.dump([turn], default_flow_style=False, allow_unicode=True))
+        else:
+            if self.count:
+                self.spool.write(',\n')
+            body = json.dumps(turn, indent=2, ensure_ascii=False)
+            self.spool.write('\n'.join('    ' + line for line in body.split('\n')))
+        self.count += 1
+
+    def write_document(self, header: dict, f) -> None:
+        """Write `header` (a result dict with empty turns) with spooled turns in place."""
+        self.spool.seek(0)
+
+        if self.fmt == 'yaml':
+            # `turns` sorts last among the result keys
+            rest = {k: v for k, v in header.items() if k != 'turns'}
+            f.write(yaml.dump(rest, default_flow_style=False, allow_unicode=True))
+            if not self.count:
+                f.write('turns: []\n')
+                return
+            f.write('turns:\n')
+            shutil.copyfileobj(self.spool, f)
+            return
+
+        document = json.dumps(header, indent=2, ensure_ascii=False)
+        marker = '\n  "turns": [],'
+        before, after = document.split(marker, 1)
+        f.write(before)
+        if not self.count:
+            f.write(marker)
+        else:
+            f.write('\n  "turns": [\n')
+            shutil.copyfileobj(self.spool, f)
+            f.write('\n  ],')
+        f.write(after)
+
+
 class ConversationEvaluator:
     """
     Evaluate extracted conversation against expected scenario.
@@ -701,16 +931,226 @@ class ConversationEvaluator:
         return result
 
 
+def resolve_session_paths(spec: str) -> list[Path]:
+    """
+    Expand a batch spec into session files.
+
+    A directory yields every *.jsonl beneath it (recursively), a pattern
+    containing glob characters is expanded (`**` allowed), and a plain file
+    path is returned as-is.
+    """
+    path = Path(spec).expanduser()
+    if path.is_dir():
+        return sorted(path.rglob('*.jsonl'))
+    if glob.has_magic(spec):
+        return sorted(Path(p) for p in glob.glob(os.path.expanduser(spec), recursive=True) if Path(p).is_file())
+    return [path] if path.is_file() else []
+
+
+def _output_names(paths: list[Path]) -> list[str]:
+    """
+    One output name per session: its stem, or for a stem several sessions
+    share, its path below their common directory joined with '_'
+    (`a/x/s.jsonl` and `b/x/s.jsonl` become `a_x_s` and `b_x_s`).
+
+    Raises ValueError if two sessions would still be written to the same
+    name (e.g. the same file listed twice).
+    """
+    by_stem: dict[str, list[Path]] = {}
+    for p in paths:
+        by_stem.setdefault(p.stem, []).append(p)
+
+    names = []
+    for p in paths:
+        shared = by_stem[p.stem]
+        if len(shared) == 1:
+            names.append(p.stem)
+            continue
+        root = os.path.commonpath([os.path.abspath(s.parent) for s in shared])
+        names.append('_'.join(Path(os.path.relpath(os.path.abspath(p.with_suffix('')), root)).parts))
+
+    seen: dict[str, Path] = {}
+    for p, name in zip(paths, names):
+        if name in seen:
+            raise ValueError(f"Sessions {seen[name]} and {p} would both be written to '{name}'")
+        seen[name] = p
+    return names
+
+
+def _extract_session_worker(session_path: str, output_path: str, fmt: str) -> dict:
+    """
+    Extract one session in a worker process.
+
+    Never raises: failures are reported in the returned summary so one bad
+    file cannot abort the batch.
+    """
+    summary = {'session': session_path, 'output': output_path, 'status': 'ok', 'error': None}
+    try:
+        result = ConversationExtractor(session_path).extract_to_file(output_path, fmt)
+    except Exception as e:
+        summary.update(status='failed', error=f"{type(e).__name__}: {e}")
+        return summary
+
+    red = [c for c in result.checkpoints if c['level'] == 'RED']
+    summary.update(
+        metrics=result.metrics,
+        red_checkpoints=len(red),
+        red_passed=len([c for c in red if c['status'] == 'PASSED']),
+        agents=sorted({a['agent'] for a in result.agents_invoked}),
+    )
+    return summary
+
+
+def _rollup(summaries: list[dict]) -> dict:
+    """Combine per-session summaries into batch-level metrics."""
+    ok = [s for s in summaries if s['status'] == 'ok']
+    totals = {
+        key: sum(s['metrics'][key] for s in ok)
+        for key in ('total_turns', 'user_turns', 'assistant_turns', 'technical_questions',
+                    'methodological_challenges', 'agent_transitions', 'total_checkpoints',
+                    'checkpoints_passed')
+    }
+
+    input_types: dict = {}
+    languages: dict = {}
+    agents: set = set()
+    for s in ok:
+        for t_type, count in s['metrics']['user_input_types'].items():
+            input_types[t_type] = input_types.get(t_type, 0) + count
+        lang = s['metrics']['language']
+        languages[lang] = languages.get(lang, 0) + 1
+        agents.update(s['agents'])
+
+    red_total = sum(s['red_checkpoints'] for s in ok)
+    red_passed = sum(s['red_passed'] for s in ok)
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'sessions': {
+            'total': len(summaries),
+            'extracted': len(ok),
+            'failed': len(summaries) - len(ok),
+        },
+        'metrics': {
+            **totals,
+            'user_input_types': input_types,
+            'languages': languages,
+            # RED compliance pooled over all sessions' RED checkpoints
+            'checkpoint_compliance_pct': round(red_passed / red_total * 100, 1) if red_total else 100,
+            'unique_agents_invoked': len(agents),
+        },
+        'failures': [{'session': s['session'], 'error': s['error']} for s in summaries if s['status'] != 'ok'],
+        'outputs': [{'session': s['session'], 'output': s['output']} for s in ok],
+    }
+
+
+def extract_batch(
+    session_paths: list[Path],
+    output_dir: str,
+    fmt: str = 'yaml',
+    jobs: Optional[int] = None
+) -> dict:
+    """
+    Extract many sessions in parallel processes, one output file per session.
+
+    Regex-heavy extraction is CPU-bound, so sessions are fanned out across a
+    ProcessPoolExecutor rather than threads. Writes `extraction_rollup.<fmt>`
+    to `output_dir` and returns the rollup dict. Raises ValueError if two
+    sessions map to the same output name (see _output_names).
+    """
+    names = _output_names(session_paths)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    summaries = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(_extract_session_worker, str(path), str(output_dir / f"{name}.{fmt}"), fmt): path
+            for path, name in zip(session_paths, names)
+        }
+        for future in as_completed(futures):
+            try:
+                summaries.append(future.result())
+            except Exception as e:  # e.g. a worker process died
+                summaries.append({
+                    'session': str(futures[future]), 'output': None,
+                    'status': 'failed', 'error': f"{type(e).__name__}: {e}",
+                })
+
+    # Report in input order, not completion order
+    order = {str(p): i for i, p in enumerate(session_paths)}
+    summaries.sort(key=lambda s: order[s['session']])
+
+    rollup = _rollup(summaries)
+    rollup_path = output_dir / f"extraction_rollup.{fmt}"
+    with open(rollup_path, 'w', encoding='utf-8') as f:
+        if fmt == 'yaml':
+            yaml.dump(rollup, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        else:
+            json.dump(rollup, f, indent=2, ensure_ascii=False)
+    rollup['path'] = str(rollup_path)
+    return rollup
+
+
+def _write_result(result: ExtractionResult, output_dir: Path, fmt: str) -> Path:
+    """
+    Write an extraction result as YAML or JSON and return its path.
+
+    The document is the `yaml.dump` / `json.dump(indent=2)` of `asdict(result)`,
+    written one turn at a time instead of from a full result dict.
+    """
+    filename = f"{result.scenario_id or result.session_id}.{fmt}"
+    output_path = output_dir / filename
+
+    with tempfile.TemporaryFile('w+', encoding='utf-8', dir=output_dir) as spool:
+        writer = _TurnSpool(spool, fmt)
+        for turn in result.turns:
+            writer.add(turn.to_dict() if isinstance(turn, Record) else turn)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            writer.write_document(result.to_dict(turns=[]), f)
+    result.close()  # Every turn's content has been read
+
+    return output_path
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    """Run --batch extraction and return the exit code."""
+    session_paths = resolve_session_paths(args.batch)
+    if not session_paths:
+        print(f"No session files found for: {args.batch}")
+        return 2
+
+    print(f"Extracting {len(session_paths)} sessions with {args.jobs or os.cpu_count()} workers...")
+    try:
+        rollup = extract_batch(session_paths, args.output, args.format, args.jobs)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
+
+    sessions = rollup['sessions']
+    print(f"Extracted: {sessions['extracted']}/{sessions['total']}")
+    for failure in rollup['failures']:
+        print(f"  ❌ {failure['session']}: {failure['error']}")
+    print(f"Total turns: {rollup['metrics']['total_turns']}")
+    print(f"Checkpoint compliance: {rollup['metrics']['checkpoint_compliance_pct']}%")
+    print(f"Rollup saved to: {rollup['path']}")
+    return 1 if sessions['failed'] else 0
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
         description='Extract and analyze Claude Code session conversations'
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         '--session', '-s',
-        required=True,
         help='Path to Claude Code session JSONL file'
     )
+    source.add_argument(
+        '--batch', '-b',
+        help='Directory (searched recursively) or glob of session JSONL files'
+    )
     parser.add_argument(
         '--output', '-o',
         default='.',
@@ -730,38 +1170,35 @@ def main():
         default='yaml',
         help='Output format (default: yaml)'
     )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream turns straight to the output file (flat memory for large sessions)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for --batch (default: CPU count)'
+    )
 
     args = parser.parse_args()
 
-    # Extract conversation
-    extractor = ConversationExtractor(args.session, args.scenario_id)
-    result = extractor.extract()
-
-    # Convert to dict for output
-    result_dict = asdict(result) if hasattr(result, '__dataclass_fields__') else {
-        'session_id': result.session_id,
-        'scenario_id': result.scenario_id,
-        'extracted_at': result.extracted_at,
-        'language': result.language,
-        'total_turns': result.total_turns,
-        'turns': result.turns,
-        'checkpoints': result.checkpoints,
-        'agents_invoked': result.agents_invoked,
-        'metrics': result.metrics,
-    }
+    if args.batch:
+        raise SystemExit(_run_batch(args))
 
-    # Output extracted conversation
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    filename = f"{result.scenario_id or result.session_id}.{args.format}"
-    output_path = output_dir / filename
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        if args.format == 'yaml':
-            yaml.dump(result_dict, f, default_flow_style=False, allow_unicode=True)
-        else:
-            json.dump(result_dict, f, indent=2, ensure_ascii=False)
+    # Extract conversation
+    extractor = ConversationExtractor(args.session, args.scenario_id)
+    if args.stream:
+        session_name = args.scenario_id or Path(args.session).stem
+        output_path = output_dir / f"{session_name}.{args.format}"
+        result = extractor.extract_to_file(output_path, args.format)
+    else:
+        result = extractor.extract()
+        output_path = _write_result(result, output_dir, args.format)
 
     print(f"Extracted conversation saved to: {output_path}")
     print(f"Total turns: {result.total_turns}")
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Diverga QA Fake CLI
+====================
+
+Local stand-in for the `claude`, `opencode` and `codex` executables, for
+load-testing CLITestRunner without a network or a real model.
+
+The runner still builds real CLI arguments and spawns a real subprocess per
+turn; only the executable is swapped (see `CLITestRunner.CLI_EXECUTABLES`),
+so timeouts, exit codes, streaming and concurrency all go through the same
+code paths as a live run.
+
+Responses are scenario-appropriate: the message is looked up in the
+protocol YAMLs and the reply carries the turn's expected checkpoint (with VS
+options) and agent invocation. Alternatively, responses recorded in
+cassettes (`--record`) are served verbatim. The lookup table is built once
+into a JSON snapshot under qa/.cache and reused by every call until a
+protocol or cassette file changes.
+
+Behaviour is configurable per run:
+- latency: distribution of total response time, streamed in `chunks` parts
+- failure_rate: probability of exiting non-zero with a stderr message
+- hang_rate: probability of never answering (exercises runner timeouts)
+- size: distribution of extra filler characters appended to each response
+
+Distributions are written as `fixed:X`, `uniform:LOW,HIGH`,
+`normal:MEAN,STDDEV`, `lognormal:MEDIAN,SIGMA` or `exponential:MEAN`
+(values are clamped at 0).
+
+Usage:
+    python cli_test_runner.py --scenario QUAL-002 --fake-cli
+    python cli_test_runner.py --scenarios all --jobs 8 --fake-cli fake_cli.yaml
+    python -m qa.benchmarks.runner_load --sessions 300 --latency lognormal:2,0.5
+"""
+
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+try:
+    from .cassette import Cassette
+except ImportError:  # Executed as a script from qa/runners
+    from cassette import Cassette
+
+FAKE_CLI_PATH = Path(__file__).resolve()
+PROTOCOL_DIR = Path(__file__).parent.parent / "protocol"
+LIBRARY_CACHE_DIR = Path(__file__).parent.parent / '.cache'
+LIBRARY_VERSION = 1  # Bump when the response library snapshot layout changes
+SUPPORTED_TOOLS = ['claude', 'opencode', 'codex']
+SKILL_PREFIX = "/diverga:research-coordinator\n\n"
+HANG_SECONDS = 24 * 60 * 60
+
+LEVEL_EMOJI = {'RED': '🔴', 'ORANGE': '🟠', 'YELLOW': '🟡'}
+
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def parse_distribution(spec: str) -> Callable[[random.Random], float]:
+    """
+    Parse a distribution spec into a sampler returning non-negative floats.
+
+    Raises ValueError for unknown distributions or malformed parameters.
+    """
+    name, _, raw_params = spec.partition(':')
+    try:
+        params = [float(p) for p in raw_params.split(',')] if raw_params else []
+    except ValueError:
+        raise ValueError(f"Invalid distribution parameters: {spec!r}")
+
+    samplers = {
+        'fixed': (1, lambda rng, x: x),
+        'uniform': (2, lambda rng, low, high: rng.uniform(low, high)),
+        'normal': (2, lambda rng, mean, stddev: rng.gauss(mean, stddev)),
+        'lognormal': (2, lambda rng, median, sigma: rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0),
+        'exponential': (1, lambda rng, mean: rng.expovariate(1 / mean) if mean > 0 else 0.0),
+    }
+    if name not in samplers:
+        raise ValueError(f"Unknown distribution {name!r} in {spec!r}. Supported: {sorted(samplers)}")
+
+    arity, sample = samplers[name]
+    if len(params) != arity:
+        raise ValueError(f"Distribution {name!r} takes {arity} parameter(s), got {spec!r}")
+
+    return lambda rng: max(0.0, sample(rng, *params))
+
+
+@dataclass
+class FakeCLIConfig:
+    """Behaviour of the fake CLI executables."""
+    latency: str = 'fixed:0'  # Total seconds per response
+    failure_rate: float = 0.0
+    hang_rate: float = 0.0
+    size: str = 'fixed:0'  # Extra filler characters per response
+    chunks: int = 4  # Stdout writes per response, spread over the latency
+    seed: Optional[int] = None  # Same seed + message -> same outcome
+    cassette_dir: Optional[str] = None  # Serve recorded responses when set
+    protocol_dir: Optional[str] = None
+    library_path: Optional[str] = None  # Response library snapshot (default: one per directory pair in qa/.cache)
+
+    def __post_init__(self):
+        parse_distribution(self.latency)
+        parse_distribution(self.size)
+        for name in ('failure_rate', 'hang_rate'):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1, got {getattr(self, name)}")
+        if self.chunks < 1:
+            raise ValueError(f"chunks must be >= 1, got {self.chunks}")
+
+    @classmethod
+    def from_file(cls, path: str) -> 'FakeCLIConfig':
+        """Load a config from a YAML (or JSON) file of field: value pairs."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown fake CLI settings: {sorted(unknown)}")
+        return cls(**data)
+
+
+def fake_cli_executables(config: Optional[FakeCLIConfig] = None) -> Dict[str, List[str]]:
+    """
+    Executable prefixes for `CLITestRunner(executables=...)` running the fake CLI.
+
+    Builds (or refreshes) the response library snapshot here, so concurrent
+    fake CLI processes only load it.
+    """
+    config = config or FakeCLIConfig()
+    ResponseLibrary.cached(config.protocol_dir, config.cassette_dir, config.library_path)
+    encoded = json.dumps(asdict(config))
+    return {
+        tool: [sys.executable, str(FAKE_CLI_PATH), '--fake-config', encoded, tool]
+        for tool in SUPPORTED_TOOLS
+    }
+
+
+def parse_invocation(tool: str, args: List[str]) -> Tuple[str, bool]:
+    """Extract (message, is_first_turn) from the arguments the runner passes."""
+    if tool == 'claude':
+        message = args[args.index('-p') + 1] if '-p' in args else ''
+        is_first = '--continue' not in args
+    elif tool in ('opencode', 'codex'):
+        # opencode run <message> / codex exec <message>
+        message = args[1] if len(args) > 1 else ''
+        is_first = True
+    else:
+        raise ValueError(f"Unsupported tool: {tool}. Supported: {SUPPORTED_TOOLS}")
+
+    if message.startswith(SKILL_PREFIX):
+        message = message[len(SKILL_PREFIX):]
+    return message, is_first
+
+
+def default_library_path(protocol_dir: Optional[Path] = None, cassette_dir: Optional[Path] = None) -> Path:
+    """Snapshot path for a (protocol, cassette) directory pair."""
+    key = f"{Path(protocol_dir or PROTOCOL_DIR).resolve()}|{Path(cassette_dir).resolve() if cassette_dir else ''}"
+    return LIBRARY_CACHE_DIR / f"fake_cli_library_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.json"
+
+
+class ResponseLibrary:
+    """
+    Scenario-appropriate responses keyed by user message.
+
+    Only what a reply needs is kept per message (expected agent, checkpoint
+    and checkpoint level), so the library round-trips through a small JSON
+    snapshot; see `cached`.
+    """
+
+    def __init__(self, protocol_dir: Optional[Path] = None, cassette_dir: Optional[Path] = None):
+        self._turns: Dict[str, Dict[str, Optional[str]]] = {}
+        self._recorded: Dict[Tuple[str, str], str] = {}
+
+        for protocol_file in sorted(Path(protocol_dir or PROTOCOL_DIR).glob("test_*.yaml")):
+            with open(protocol_file, 'r', encoding='utf-8') as f:
+                protocol = yaml.load(f, Loader=YAML_LOADER) or {}
+            levels = {
+                cp.get('id'): cp.get('level')
+                for cp in protocol.get('checkpoints_expected') or [] if isinstance(cp, dict)
+            }
+            for turn_spec in protocol.get('conversation_flow') or []:
+                if isinstance(turn_spec, dict) and turn_spec.get('user'):
+                    expected = turn_spec.get('expected_behavior') or {}
+                    self._turns.setdefault(turn_spec['user'].strip(), {
+                        'agent': expected.get('agent_invoked'),
+                        'checkpoint': expected.get('checkpoint'),
+                        'level': levels.get(expected.get('checkpoint')),
+                    })
+
+        if cassette_dir:
+            for path in sorted(Path(cassette_dir).glob("*.cassette.json")):
+                for interaction in Cassette(path, 'replay').interactions:
+                    if interaction.returncode == 0 and not interaction.timed_out:
+                        self._recorded[(interaction.cli_tool, interaction.message)] = interaction.stdout
+
+    @staticmethod
+    def sources(protocol_dir: Optional[Path] = None, cassette_dir: Optional[Path] = None) -> List[list]:
+        """[path, mtime_ns, size] of every file the library is built from."""
+        files = sorted(Path(protocol_dir or PROTOCOL_DIR).glob("test_*.yaml"))
+        if cassette_dir:
+            files += sorted(Path(cassette_dir).glob("*.cassette.json"))
+        return [[str(p.resolve()), st.st_mtime_ns, st.st_size] for p, st in ((p, p.stat()) for p in files)]
+
+    def to_dict(self) -> dict:
+        return {
+            'turns': self._turns,
+            'recorded': [[tool, message, stdout] for (tool, message), stdout in self._recorded.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ResponseLibrary':
+        library = cls.__new__(cls)
+        library._turns = data['turns']
+        library._recorded = {(tool, message): stdout for tool, message, stdout in data['recorded']}
+        return library
+
+    @classmethod
+    def cached(
+        cls,
+        protocol_dir: Optional[Path] = None,
+        cassette_dir: Optional[Path] = None,
+        path: Optional[Path] = None
+    ) -> 'ResponseLibrary':
+        """
+        The library for these directories, loaded from the snapshot at `path`
+        when it was built from the same files (same paths, mtimes and sizes),
+        otherwise built and saved there. `path` defaults to
+        default_library_path(protocol_dir, cassette_dir).
+        """
+        sources = cls.sources(protocol_dir, cassette_dir)
+        path = Path(path) if path else default_library_path(protocol_dir, cassette_dir)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get('version') == LIBRARY_VERSION and snapshot.get('sources') == sources:
+                return cls.from_dict(snapshot)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or unreadable: rebuild
+
+        library = cls(protocol_dir, cassette_dir)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': LIBRARY_VERSION, 'sources': sources, **library.to_dict()}, f, ensure_ascii=False)
+            os.replace(tmp, path)  # Concurrent fake CLIs never read a half-written snapshot
+        except OSError:
+            pass  # Read-only location: serve the library without a snapshot
+        return library
+
+    def response_for(self, tool: str, message: str, is_first: bool) -> str:
+        recorded = self._recorded.get((tool, message))
+        if recorded is not None:
+            return recorded
+
+        lines = []
+        if is_first:
+            lines.append("Research Coordinator v6.3 (Human-Centered Edition) is active.\n")
+        lines.append(f"[FAKE {tool.upper()}] Responding to: {message.strip()[:80]}\n")
+
+        expected = self._turns.get(message.strip()) or {}
+
+        agent = expected.get('agent')
+        if agent:
+            agent_id = agent.split('-')[0].lower()
+            lines.append(f'Task(subagent_type="diverga:{agent_id}", description="{agent}")\n')
+
+        checkpoint = expected.get('checkpoint')
+        if checkpoint:
+            emoji = LEVEL_EMOJI.get(expected.get('level'), '🔴')
+            lines += [
+                f"{emoji} CHECKPOINT: {checkpoint}\n",
+                "[A] Conventional approach (T=0.65)",
+                "[B] Balanced alternative (T=0.40) ⭐",
+                "[C] Novel direction (T=0.25)\n",
+                "Which option would you like to proceed with?",
+            ]
+        return '\n'.join(lines) + '\n'
+
+
+def run(tool: str, args: List[str], config: FakeCLIConfig) -> int:
+    """Answer one CLI invocation on stdout/stderr and return the exit code."""
+    message, is_first = parse_invocation(tool, args)
+    rng = random.Random(f"{config.seed}:{tool}:{message}") if config.seed is not None else random.Random()
+
+    latency = parse_distribution(config.latency)(rng)
+    extra_chars = int(parse_distribution(config.size)(rng))
+    roll = rng.random()
+
+    if roll < config.hang_rate:
+        time.sleep(HANG_SECONDS)
+        return 0
+    if roll < config.hang_rate + config.failure_rate:
+        time.sleep(latency)
+        sys.stderr.write(f"fake-{tool}: simulated failure\n")
+        return 1
+
+    library = ResponseLibrary.cached(config.protocol_dir, config.cassette_dir, config.library_path)
+    response = library.response_for(tool, message, is_first)
+    if extra_chars:
+        filler = "Additional context for load testing. "
+        response += (filler * (extra_chars // len(filler) + 1))[:extra_chars] + '\n'
+
+    out = sys.stdout.buffer
+    data = response.encode('utf-8')
+    step = max(1, -(-len(data) // config.chunks))
+    for start in range(0, len(data), step):
+        time.sleep(latency / config.chunks)
+        out.write(data[start:start + step])
+        out.flush()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point: fake_cli.py [--fake-config JSON] <tool> <cli args...>"""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    config = FakeCLIConfig()
+    if argv[:1] == ['--fake-config']:
+        config = FakeCLIConfig(**json.loads(argv[1]))
+        argv = argv[2:]
+
+    if not argv or argv[0] not in SUPPORTED_TOOLS:
+        sys.stderr.write(f"usage: fake_cli.py [--fake-config JSON] {{{','.join(SUPPORTED_TOOLS)}}} ARGS...\n")
+        return 2
+    return run(argv[0], argv[1:], config)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
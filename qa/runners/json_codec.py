@@ -0,0 +1,193 @@
+"""
+Diverga QA JSON Codec
+=====================
+
+JSON decoding and encoding for session logs and result files, with a
+native fast path.
+
+When the optional `orjson` package is installed it parses and writes
+JSON; otherwise `pysimdjson` parses when installed; otherwise the standard
+library is used. Input a native parser rejects is handed to the standard
+library, so every backend accepts the same documents (orjson may decode
+integers beyond 64 bits as floats).
+
+`dump` writes the same document as `json.dump(obj, f, indent=2,
+ensure_ascii=False)`, except that orjson spells float exponents without
+a `+` or leading zero (`1e16`, `1e-7`) and writes NaN/Infinity as null.
+Dataclass instances (turn records) are written as `asdict` would convert
+them, without being copied into dicts first.
+
+`iter_jsonl` can prefilter lines by entry type: a line whose raw text has
+no `"type": "<wanted>"` pair is skipped without being decoded, so large
+irrelevant entries (progress, system events) cost one regex scan.
+Without a native backend, lines are handed to `json.loads` directly, so
+the standard library path reads as fast as a plain `json.loads` loop.
+"""
+
+import json
+import re
+from dataclasses import is_dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+try:
+    import orjson  # Optional: pip install orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson  # Optional: pip install pysimdjson
+except ImportError:
+    simdjson = None
+
+try:
+    from .records import field_names
+except ImportError:  # Executed as a script from qa/runners
+    from records import field_names
+
+BACKENDS = ("orjson", "simdjson", "json")  # In order of preference
+
+
+def available_backends() -> list[str]:
+    """Installed backends, in order of preference."""
+    installed = {"orjson": orjson is not None, "simdjson": simdjson is not None, "json": True}
+    return [backend for backend in BACKENDS if installed[backend]]
+
+
+def _default(obj: Any) -> Any:
+    """Serialize dataclass instances field by field (nested ones are handed back here)."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {name: getattr(obj, name) for name in field_names(type(obj))}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _prefilter(types: Iterable[str], keys: Iterable[str]) -> re.Pattern:
+    """Bytes regex matching a `"key": "type"` pair for any key and wanted type (plain ASCII names)."""
+    def alternatives(values: Iterable[str]) -> bytes:
+        return b"|".join(re.escape(value.encode("ascii")) for value in values)
+
+    return re.compile(rb'"(?:' + alternatives(keys) + rb')"\s*:\s*"(?:' + alternatives(types) + rb')"')
+
+
+class JSONCodec:
+    """
+    JSON codec over the fastest installed backend.
+
+    Args:
+        backend: "orjson", "simdjson" or "json"; the first available one
+            (see BACKENDS) when None
+    """
+
+    def __init__(self, backend: str | None = None):
+        if backend is None:
+            backend = available_backends()[0]
+        elif backend not in BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {backend} (choose from {', '.join(BACKENDS)})")
+        elif backend not in available_backends():
+            raise ImportError(f"{backend} is not installed")
+
+        self.backend = backend
+        self._native_loads = {"orjson": orjson and orjson.loads, "simdjson": simdjson and simdjson.loads}.get(backend)
+
+    def __repr__(self) -> str:
+        return f"JSONCodec(backend={self.backend!r})"
+
+    def loads(self, data: str | bytes) -> Any:
+        """Decode one JSON document; raises ValueError if it is malformed."""
+        if self._native_loads is not None:
+            try:
+                return self._native_loads(data)
+            except (ValueError, RuntimeError):  # simdjson raises RuntimeError for big integers
+                pass  # Rejected natively: the standard library decides
+        return json.loads(data)
+
+    def _line_loads(self):
+        """Per-line decoder: `loads`, or plain `json.loads` for the standard library backend."""
+        return self.loads if self._native_loads is not None else json.loads
+
+    def dumps(self, obj: Any) -> str:
+        """Encode `obj` as `json.dumps(obj, indent=2, ensure_ascii=False)` does."""
+        if self.backend == "orjson":
+            try:
+                options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                return orjson.dumps(obj, default=_default, option=options).decode("utf-8")
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+
+    def dump(self, obj: Any, f: TextIO) -> None:
+        """Write `obj` to a text file as `json.dump(obj, f, indent=2, ensure_ascii=False)` does."""
+        f.write(self.dumps(obj))
+
+    def iter_jsonl(
+        self,
+        path: str | Path,
+        types: Iterable[str] | None = None,
+        keys: Iterable[str] = ("type",),
+    ) -> Iterator[Any]:
+        """
+        Decode a JSONL file line by line, skipping blank and malformed lines.
+
+        Args:
+            path: JSONL file
+            types: When given, only lines containing a `"<key>": "<type>"`
+                pair for one of these types are decoded. Lines may still
+                decode to entries of other types (the pair can sit in a
+                nested object); callers dispatch on the decoded entry.
+            keys: Keys checked by the prefilter (e.g. ("type", "role"))
+        """
+        wanted = _prefilter(types, keys) if types is not None else None
+        loads = self._line_loads()
+
+        with open(path, "rb") as f:
+            if wanted is None:
+                for line in f:
+                    if line.strip():
+                        try:
+                            yield loads(line)
+                        except ValueError:
+                            continue  # Skip malformed lines
+                return
+
+            for line in f:
+                if not line.strip() or not wanted.search(line):
+                    continue
+                try:
+                    yield loads(line)
+                except ValueError:
+                    continue  # Skip malformed lines
+
+    def scan_jsonl(
+        self,
+        path: str | Path,
+        types: Iterable[str] | None = None,
+        keys: Iterable[str] = ("type",),
+        start: int = 0,
+    ) -> Iterator[tuple[int, bytes, Any]]:
+        """
+        (byte offset, raw line, entry) for every line of a JSONL file from
+        byte `start` on, blank ones included. The entry is None for lines
+        `iter_jsonl` would skip (blank, malformed or prefiltered).
+        """
+        wanted = _prefilter(types, keys) if types is not None else None
+        loads = self._line_loads()
+        offset = start
+
+        with open(path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                entry = None
+                if line.strip() and (wanted is None or wanted.search(line)):
+                    try:
+                        entry = loads(line)
+                    except ValueError:
+                        pass  # Malformed
+                yield offset, line, entry
+                offset += len(line)
+
+
+@lru_cache(maxsize=None)
+def get_codec(backend: str | None = None) -> JSONCodec:
+    """Shared codec for `backend` (the fastest installed one when None)."""
+    return JSONCodec(backend)
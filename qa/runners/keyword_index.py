@@ -0,0 +1,170 @@
+"""
+Diverga QA Keyword Index
+=========================
+
+Multi-pattern keyword matching with an Aho-Corasick automaton.
+
+The automaton is built once from a {key: [keywords]} mapping (e.g.
+AgentTracker.AGENT_KEYWORDS) and finds every keyword occurrence, English
+or Korean, in a single linear pass over the text. Matching is
+case-insensitive in the same way as `keyword.lower() in text.lower()`.
+
+When the optional `pyahocorasick` package is installed its C automaton is
+used; otherwise a pure-Python automaton with identical results is used.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+try:
+    import ahocorasick  # Optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """A keyword occurrence; offsets index into the original text."""
+    key: str
+    keyword: str
+    start: int
+    end: int
+
+
+class KeywordIndex:
+    """
+    Aho-Corasick index over keyword lists grouped by key.
+
+    Args:
+        keywords: Mapping of key (e.g. agent ID) to its keywords, in priority order
+        native: Use pyahocorasick when True, pure Python when False,
+            auto-detect when None
+    """
+
+    def __init__(self, keywords: dict[str, list[str]], native: bool | None = None):
+        if native and ahocorasick is None:
+            raise ImportError("pyahocorasick is not installed")
+
+        self.native = ahocorasick is not None if native is None else native
+
+        # entries[i] = (key, keyword, lowercase length); grouped by key in order
+        self._entries: list[tuple[str, str, int]] = []
+        self._key_entries: list[tuple[str, range]] = []
+        self._always: set[int] = set()  # Empty keywords match any text
+
+        patterns: dict[str, list[int]] = {}
+        for key, key_keywords in keywords.items():
+            first = len(self._entries)
+            for keyword in key_keywords:
+                lowered = keyword.lower()
+                index = len(self._entries)
+                self._entries.append((key, keyword, len(lowered)))
+                if lowered:
+                    patterns.setdefault(lowered, []).append(index)
+                else:
+                    self._always.add(index)
+            self._key_entries.append((key, range(first, len(self._entries))))
+
+        if self.native:
+            self._automaton = ahocorasick.Automaton()
+            for lowered, indices in patterns.items():
+                self._automaton.add_word(lowered, tuple(indices))
+            self._automaton.make_automaton()
+        else:
+            self._build(patterns)
+
+    def _build(self, patterns: dict[str, list[int]]) -> None:
+        """Build goto/fail/output tables for the pure-Python automaton."""
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+
+        for lowered, indices in patterns.items():
+            state = 0
+            for ch in lowered:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].extend(indices)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                fail[nxt] = goto[link].get(ch, 0)
+                outputs[nxt].extend(outputs[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(o) for o in outputs]
+
+    def _scan(self, text_lower: str) -> Iterable[tuple[int, tuple[int, ...]]]:
+        """Yield (end offset exclusive, entry indices) over lowercase text."""
+        if self.native:
+            for last, indices in self._automaton.iter(text_lower):
+                yield last + 1, indices
+            return
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for i, ch in enumerate(text_lower):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                yield i + 1, outputs[state]
+
+    def find_all(self, text: str) -> list[KeywordMatch]:
+        """Return every keyword occurrence, ordered by (start, end, declaration)."""
+        text_lower = text.lower()
+        origin = _offset_map(text) if len(text_lower) != len(text) else None
+
+        found = []
+        for end, indices in self._scan(text_lower):
+            for index in indices:
+                key, keyword, length = self._entries[index]
+                start = end - length
+                if origin is not None:
+                    start, end_orig = origin[start], origin[end - 1] + 1
+                else:
+                    end_orig = end
+                found.append((start, end_orig, index, KeywordMatch(key, keyword, start, end_orig)))
+
+        found.sort(key=lambda item: item[:3])
+        return [item[3] for item in found]
+
+    def first_per_key(self, text: str) -> list[tuple[str, str]]:
+        """
+        Return (key, keyword) for every key with at least one keyword in text.
+
+        The reported keyword is the first one in the key's declared list that
+        occurs anywhere in the text, and keys keep their declaration order.
+        """
+        present = set(self._always)
+        for _, indices in self._scan(text.lower()):
+            present.update(indices)
+
+        matches = []
+        for key, indices in self._key_entries:
+            for index in indices:
+                if index in present:
+                    matches.append((key, self._entries[index][1]))
+                    break
+        return matches
+
+
+def _offset_map(text: str) -> list[int]:
+    """Map each lowercase-text offset to its original-text offset."""
+    origin = []
+    for i, ch in enumerate(text):
+        origin.extend([i] * len(ch.lower()))
+    return origin
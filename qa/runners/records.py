@@ -0,0 +1,70 @@
+"""
+Diverga QA Records
+==================
+
+Base class for the compact turn records of ConversationExtractor and
+CLITestRunner.
+
+Records are slotted dataclasses (`@dataclass(slots=True)`): an instance
+holds its fields and nothing else, with no per-instance `__dict__`.
+`Record` adds read access by key (`turn['content']`) for code written
+against the dict form of extraction results, and `to_dict`, a shallow
+serializer used instead of `dataclasses.asdict`. Nested records become
+dicts, but their lists and dicts are shared rather than deep-copied, so
+a record is only copied one level deep, and only while it is written.
+"""
+
+import sys
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def field_names(cls: type) -> tuple[str, ...]:
+    """Field names of a dataclass, in definition order."""
+    return tuple(f.name for f in fields(cls))
+
+
+def intern(value: str | None) -> str | None:
+    """`sys.intern` that passes None (and str subclasses) through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list) and value and isinstance(value[0], Record):
+        return [item.to_dict() for item in value]
+    return value
+
+
+class Record:
+    """Mixin for slotted dataclass records: read access by key and a shallow `to_dict`."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in field_names(type(self)):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in field_names(type(self)) else default
+
+    def keys(self) -> tuple[str, ...]:
+        return field_names(type(self))
+
+    def __contains__(self, key: str) -> bool:
+        return key in field_names(type(self))
+
+    def to_dict(self, **overrides: Any) -> dict:
+        """
+        Fields as a dict, with nested records (and lists of records) as
+        dicts, the same shape `asdict` produces. Values in `overrides`
+        replace fields as given.
+        """
+        return {
+            name: overrides[name] if name in overrides else _plain(getattr(self, name))
+            for name in field_names(type(self))
+        }
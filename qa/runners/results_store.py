@@ -0,0 +1,658 @@
+#!/usr/bin/env python3
+"""
+Diverga QA Results Store
+=========================
+
+Embedded SQLite index of every QA result, for trend queries and regression
+reports across runs.
+
+`CLITestRunner.save_results` and `DivergaQARunner.save_report` write one
+timestamped file per run; this store ingests those results (or the live
+sessions directly, with `--store`) into indexed tables:
+
+- runs: one row per session or evaluation result (score, turns, counts,
+  latency summary)
+- turn_latency: per-turn response latency, time-to-first-byte, throughput
+- checkpoints / agents: what was detected in each run
+
+Scores are checkpoint compliance (%) for CLI sessions and the check pass
+rate (%) for evaluation results. Re-ingesting a run (e.g. after
+`--rescore`) replaces its previous rows.
+
+The regression report compares, per (scenario, CLI tool), the most recent
+`window` completed runs against the `window` completed runs before them
+with a one-sided Welch t-test, flagging significant score drops and
+per-turn latency slowdowns. Aborted and failed sessions are left out of
+both windows: their partial scores and latencies are not comparable.
+
+Usage:
+    python results_store.py ingest qa/reports
+    python results_store.py trend META-002 --metric latency_p95 --last 50
+    python results_store.py report --window 10 --alpha 0.05
+    python cli_test_runner.py --scenarios all --jobs 4 --store
+"""
+
+import argparse
+import json
+import math
+import sqlite3
+import sys
+import threading
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+try:
+    from .records import field_names
+except ImportError:  # Executed as a script from qa/runners
+    from records import field_names
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent / '.cache' / 'results.sqlite3'
+
+# Metrics stored on each run that trend() and the regression report accept
+METRICS = [
+    'score', 'total_turns', 'checkpoints_found', 'agents_invoked',
+    'latency_mean', 'latency_p95', 'ttfb_mean',
+]
+
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Runs the regression report compares: sessions that ran to the end, and every
+# evaluation result (its PASSED/FAILED status is the outcome, not an error)
+COMPLETED_RUNS = "(kind = 'evaluation' OR status = 'completed')"
+
+
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values)
+
+
+def _variance(values: List[float]) -> float:
+    """Unbiased sample variance."""
+    mean = _mean(values)
+    return sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the regularized incomplete beta (modified Lentz)."""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 301):
+        m2 = 2 * m
+        for numerator in (
+            m * (b - m) * x / ((a + m2 - 1.0) * (a + m2)),
+            -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1.0)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _incomplete_beta(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1.0 - x)
+    )
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def welch_t_test(baseline: List[float], recent: List[float]) -> Dict[str, float]:
+    """
+    Welch's unequal-variance t-test of mean(recent) against mean(baseline).
+
+    Returns t, degrees of freedom and one-sided p-values for "recent is
+    greater" and "recent is less". Both samples need at least 2 values.
+    """
+    if len(baseline) < 2 or len(recent) < 2:
+        raise ValueError("Welch's t-test needs at least 2 values per sample")
+
+    se2_base = _variance(baseline) / len(baseline)
+    se2_recent = _variance(recent) / len(recent)
+    diff = _mean(recent) - _mean(baseline)
+    se2 = se2_base + se2_recent
+
+    if se2 == 0:
+        # Both samples constant: any difference is certain, none is not
+        greater = 0.0 if diff > 0 else 1.0
+        less = 0.0 if diff < 0 else 1.0
+        return {'t': math.copysign(math.inf, diff) if diff else 0.0, 'df': float('nan'),
+                'p_greater': greater, 'p_less': less}
+
+    t = diff / math.sqrt(se2)
+    df = se2 ** 2 / (
+        (se2_base ** 2 / (len(baseline) - 1) if se2_base else 0.0)
+        + (se2_recent ** 2 / (len(recent) - 1) if se2_recent else 0.0)
+    )
+    # P(T > |t|) for Student's t with df degrees of freedom
+    tail = 0.5 * _incomplete_beta(df / 2.0, 0.5, df / (df + t * t))
+    return {
+        't': t,
+        'df': df,
+        'p_greater': tail if t > 0 else 1.0 - tail,
+        'p_less': tail if t < 0 else 1.0 - tail,
+    }
+
+
+def _turn_latencies(turns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Per-assistant-turn latency rows from a saved session's turns.
+
+    Uses recorded timing when present; sessions saved before timing existed
+    fall back to the gap between each user turn and the response to it.
+    """
+    rows = []
+    previous = None
+    for turn in turns:
+        if turn.get('role') != 'assistant':
+            previous = turn
+            continue
+
+        timing = turn.get('timing') or {}
+        total = timing.get('total_seconds')
+        if total is None and previous is not None:
+            try:
+                total = (
+                    datetime.fromisoformat(turn['timestamp']) - datetime.fromisoformat(previous['timestamp'])
+                ).total_seconds()
+            except (KeyError, TypeError, ValueError):
+                total = None
+        if total is not None:
+            rows.append({
+                'turn': turn.get('number'),
+                'total_seconds': total,
+                'ttfb_seconds': timing.get('ttfb_seconds'),
+                'chars_per_second': timing.get('chars_per_second'),
+            })
+        previous = turn
+    return rows
+
+
+def _percent(value: Any) -> Optional[float]:
+    """Parse 85.0 or '85.0%' into a float."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip().rstrip('%')
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class ResultsStore:
+    """
+    SQLite store of QA session and evaluation results.
+
+    Safe to share between threads of one process (e.g. a BatchRunner's
+    workers); separate processes may open the same file concurrently.
+
+    Args:
+        path: SQLite database file (parent directories are created)
+    """
+
+    SCHEMA = """
+        PRAGMA foreign_keys = ON;
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            run_key TEXT NOT NULL UNIQUE,
+            kind TEXT NOT NULL,
+            scenario_id TEXT NOT NULL,
+            cli_tool TEXT NOT NULL,
+            session_id TEXT,
+            run_at TEXT NOT NULL,
+            status TEXT,
+            score REAL,
+            total_turns INTEGER,
+            checkpoints_found INTEGER,
+            agents_invoked INTEGER,
+            latency_mean REAL,
+            latency_p95 REAL,
+            ttfb_mean REAL,
+            source TEXT
+        );
+        CREATE INDEX IF NOT EXISTS runs_scenario ON runs (scenario_id, cli_tool, kind, run_at);
+        CREATE INDEX IF NOT EXISTS runs_run_at ON runs (run_at);
+        CREATE TABLE IF NOT EXISTS turn_latency (
+            run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+            turn INTEGER,
+            total_seconds REAL NOT NULL,
+            ttfb_seconds REAL,
+            chars_per_second REAL
+        );
+        CREATE INDEX IF NOT EXISTS turn_latency_run ON turn_latency (run_id);
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+            turn INTEGER,
+            checkpoint_id TEXT NOT NULL,
+            confidence TEXT
+        );
+        CREATE INDEX IF NOT EXISTS checkpoints_run ON checkpoints (run_id);
+        CREATE INDEX IF NOT EXISTS checkpoints_id ON checkpoints (checkpoint_id);
+        CREATE TABLE IF NOT EXISTS agents (
+            run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+            agent TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS agents_run ON agents (run_id);
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(self.SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def _replace_run(
+        self,
+        run: Dict[str, Any],
+        latencies: List[Dict[str, Any]] = (),
+        checkpoints: List[Tuple] = (),
+        agents: Iterable[str] = ()
+    ) -> int:
+        """Insert a run (replacing any previous run with the same key) and its detail rows."""
+        columns = ', '.join(run)
+        placeholders = ', '.join('?' for _ in run)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM runs WHERE run_key = ?", (run['run_key'],))
+            run_id = self._conn.execute(
+                f"INSERT INTO runs ({columns}) VALUES ({placeholders})", tuple(run.values())
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO turn_latency (run_id, turn, total_seconds, ttfb_seconds, chars_per_second) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(run_id, r['turn'], r['total_seconds'], r['ttfb_seconds'], r['chars_per_second']) for r in latencies]
+            )
+            self._conn.executemany(
+                "INSERT INTO checkpoints (run_id, turn, checkpoint_id, confidence) VALUES (?, ?, ?, ?)",
+                [(run_id, *cp) for cp in checkpoints]
+            )
+            self._conn.executemany(
+                "INSERT INTO agents (run_id, agent) VALUES (?, ?)", [(run_id, a) for a in agents]
+            )
+        return run_id
+
+    def ingest_session(self, session: Any, source: str = '') -> int:
+        """
+        Ingest a CLI test session and return its run id.
+
+        Accepts a `TestSession` or the dict saved as conversation_raw*.json.
+        Raises ValueError if the session has no start time.
+        """
+        if is_dataclass(session):
+            # Turn and timing records are read by key in place rather than deep-copied (see records.py)
+            data = {name: getattr(session, name) for name in field_names(type(session))}
+        else:
+            data = session
+        turns = data.get('turns') or []
+        latencies = _turn_latencies(turns)
+        totals = sorted(r['total_seconds'] for r in latencies)
+        ttfbs = [r['ttfb_seconds'] for r in latencies if r['ttfb_seconds'] is not None]
+
+        validation = data.get('validation_results') or {}
+        cli_tool = data.get('cli_tool') or ''
+        # Sessions saved before v3.2 recorded 'started_at'
+        run_at = data.get('start_time') or data.get('started_at')
+        if not run_at:
+            raise ValueError(f"Session {data.get('scenario_id')} has no start time")
+        run = {
+            'run_key': f"session:{data['scenario_id']}:{cli_tool}:{data.get('session_id')}:{run_at}",
+            'kind': 'session',
+            'scenario_id': data['scenario_id'],
+            'cli_tool': cli_tool,
+            'session_id': data.get('session_id'),
+            'run_at': run_at,
+            'status': data.get('status'),
+            'score': _percent((validation.get('checkpoints') or {}).get('compliance')),
+            'total_turns': data.get('total_turns', len([t for t in turns if t.get('role') == 'user'])),
+            'checkpoints_found': len(data.get('checkpoints') or []),
+            'agents_invoked': len(data.get('agents_invoked') or []),
+            'latency_mean': _mean(totals) if totals else None,
+            # Nearest-rank: sessions have only a handful of turns
+            'latency_p95': totals[max(0, math.ceil(len(totals) * 0.95) - 1)] if totals else None,
+            'ttfb_mean': _mean(ttfbs) if ttfbs else None,
+            'source': source,
+        }
+        checkpoints = [
+            (cp.get('turn'), cp.get('checkpoint'), cp.get('confidence'))
+            for cp in data.get('checkpoints') or [] if cp.get('checkpoint')
+        ]
+        return self._replace_run(run, latencies, checkpoints, data.get('agents_invoked') or [])
+
+    def ingest_report(self, report: Any, source: str = '') -> List[int]:
+        """
+        Ingest every result of a `DivergaQARunner` report and return the run ids.
+
+        Accepts a `TestReport` or the dict saved as qa_report_*.yaml/json.
+        """
+        data = asdict(report) if is_dataclass(report) else report
+        run_ids = []
+        for result in data.get('results') or []:
+            summary = result.get('summary') or {}
+            checks = result.get('checks') or []
+            passed = sum(1 for c in checks if c.get('passed'))
+            score = summary.get('pass_rate')
+            if score is None and checks:
+                score = round(passed / len(checks) * 100, 1)
+
+            run_at = result.get('timestamp') or data.get('generated_at') or datetime.now().isoformat()
+            run = {
+                'run_key': f"evaluation:{result['scenario_id']}:{run_at}",
+                'kind': 'evaluation',
+                'scenario_id': result['scenario_id'],
+                'cli_tool': '',
+                'session_id': None,
+                'run_at': run_at,
+                'status': 'PASSED' if result.get('passed') else 'FAILED',
+                'score': _percent(score),
+                'source': source,
+            }
+            run_ids.append(self._replace_run(run))
+        return run_ids
+
+    def ingest_path(self, path: str) -> int:
+        """
+        Ingest saved results and return the number of runs ingested.
+
+        `path` may be a conversation_raw*.json, a qa_report_*.yaml/json, or a
+        directory searched recursively for both. Other files are skipped.
+        """
+        target = Path(path)
+        if target.is_dir():
+            files = sorted(target.rglob('conversation_raw*.json')) + sorted(target.rglob('qa_report_*'))
+        else:
+            files = [target]
+
+        count = 0
+        for file in files:
+            if file.name.startswith('conversation_raw') and file.suffix == '.json':
+                with open(file, 'r', encoding='utf-8') as f:
+                    self.ingest_session(json.load(f), source=str(file))
+                count += 1
+            elif file.name.startswith('qa_report_') and file.suffix in ('.json', '.yaml', '.yml'):
+                with open(file, 'r', encoding='utf-8') as f:
+                    data = json.load(f) if file.suffix == '.json' else yaml.load(f, Loader=YAML_LOADER)
+                count += len(self.ingest_report(data or {}, source=str(file)))
+        return count
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def trend(
+        self,
+        scenario_id: str,
+        metric: str = 'score',
+        cli_tool: Optional[str] = None,
+        last: int = 50,
+        kind: str = 'session'
+    ) -> List[Dict[str, Any]]:
+        """Values of `metric` for the last `last` runs of a scenario, oldest first."""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}. Supported: {METRICS}")
+
+        query = f"SELECT run_at, cli_tool, session_id, status, {metric} AS value FROM runs WHERE scenario_id = ? AND kind = ?"
+        params: List[Any] = [scenario_id, kind]
+        if cli_tool is not None:
+            query += " AND cli_tool = ?"
+            params.append(cli_tool)
+        query += " ORDER BY run_at DESC LIMIT ?"
+        params.append(last)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+    def mean_turn_latency(
+        self,
+        scenario_id: Optional[str] = None,
+        cli_tool: Optional[str] = None,
+        last: int = 20
+    ) -> Optional[float]:
+        """Mean per-turn latency over the last `last` timed sessions (None without history)."""
+        query = "SELECT id FROM runs WHERE kind = 'session' AND latency_mean IS NOT NULL"
+        params: List[Any] = []
+        if scenario_id is not None:
+            query += " AND scenario_id = ?"
+            params.append(scenario_id)
+        if cli_tool is not None:
+            query += " AND cli_tool = ?"
+            params.append(cli_tool)
+        query += " ORDER BY run_at DESC LIMIT ?"
+        params.append(last)
+
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT AVG(total_seconds) FROM turn_latency WHERE run_id IN ({query})", params
+            ).fetchone()
+        return row[0]
+
+    def scenarios(self) -> List[Dict[str, Any]]:
+        """Run counts and last run time per (kind, scenario, CLI tool)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, scenario_id, cli_tool, COUNT(*) AS runs, MAX(run_at) AS last_run "
+                "FROM runs GROUP BY kind, scenario_id, cli_tool ORDER BY kind, scenario_id, cli_tool"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _windows(self, kind: str, scenario_id: str, cli_tool: str, window: int) -> Tuple[List[sqlite3.Row], List[sqlite3.Row]]:
+        """(baseline, recent): the latest `window` completed runs and the `window` completed runs before them."""
+        rows = self._conn.execute(
+            f"SELECT id, score FROM runs WHERE kind = ? AND scenario_id = ? AND cli_tool = ? AND {COMPLETED_RUNS} "
+            "ORDER BY run_at DESC LIMIT ?",
+            (kind, scenario_id, cli_tool, 2 * window)
+        ).fetchall()
+        return rows[window:], rows[:window]
+
+    def _latencies(self, runs: List[sqlite3.Row]) -> List[float]:
+        if not runs:
+            return []
+        placeholders = ', '.join('?' for _ in runs)
+        return [
+            row[0] for row in self._conn.execute(
+                f"SELECT total_seconds FROM turn_latency WHERE run_id IN ({placeholders})",
+                [r['id'] for r in runs]
+            )
+        ]
+
+    def regression_report(
+        self,
+        window: int = 10,
+        alpha: float = 0.05,
+        min_score_drop: float = 5.0,
+        min_slowdown_pct: float = 10.0
+    ) -> Dict[str, Any]:
+        """
+        Flag statistically significant regressions between run windows.
+
+        For every (kind, scenario, CLI tool) with enough history, the latest
+        `window` completed runs are compared with the `window` completed runs
+        before them (aborted and failed sessions are skipped):
+
+        - score: per-run scores; flagged when the mean drops by at least
+          `min_score_drop` points with one-sided p < `alpha`
+        - latency: pooled per-turn latencies; flagged when the mean grows by
+          at least `min_slowdown_pct` percent with one-sided p < `alpha`
+
+        Effect-size floors keep tiny-but-significant shifts from drowning
+        out real regressions.
+        """
+        if window < 2:
+            raise ValueError(f"window must be >= 2, got {window}")
+
+        compared = 0
+        regressions = []
+        with self._lock:
+            groups = self._conn.execute("SELECT DISTINCT kind, scenario_id, cli_tool FROM runs").fetchall()
+            for kind, scenario_id, cli_tool in groups:
+                baseline, recent = self._windows(kind, scenario_id, cli_tool, window)
+                if len(baseline) < 2:
+                    continue
+                compared += 1
+
+                samples = {
+                    'score': (
+                        [r['score'] for r in baseline if r['score'] is not None],
+                        [r['score'] for r in recent if r['score'] is not None],
+                    ),
+                    'latency': (self._latencies(baseline), self._latencies(recent)),
+                }
+                for metric, (before, after) in samples.items():
+                    if len(before) < 2 or len(after) < 2:
+                        continue
+
+                    test = welch_t_test(before, after)
+                    before_mean, after_mean = _mean(before), _mean(after)
+                    change = after_mean - before_mean
+                    if metric == 'score':
+                        flagged = -change >= min_score_drop and test['p_less'] < alpha
+                        p_value = test['p_less']
+                    else:
+                        flagged = (
+                            before_mean > 0 and change / before_mean * 100 >= min_slowdown_pct
+                            and test['p_greater'] < alpha
+                        )
+                        p_value = test['p_greater']
+                    if not flagged:
+                        continue
+
+                    regressions.append({
+                        'kind': kind,
+                        'scenario_id': scenario_id,
+                        'cli_tool': cli_tool,
+                        'metric': metric,
+                        'baseline_mean': round(before_mean, 3),
+                        'recent_mean': round(after_mean, 3),
+                        'change': round(change, 3),
+                        'change_pct': round(change / before_mean * 100, 1) if before_mean else None,
+                        'baseline_n': len(before),
+                        'recent_n': len(after),
+                        't': round(test['t'], 3) if math.isfinite(test['t']) else test['t'],
+                        'p_value': p_value,
+                    })
+
+        regressions.sort(key=lambda r: (r['p_value'], r['scenario_id'], r['metric']))
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'window': window,
+            'alpha': alpha,
+            'groups_compared': compared,
+            'regressions': regressions,
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> 'ResultsStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def print_regression_report(report: Dict[str, Any]) -> None:
+    """Print a regression report as a table."""
+    print(
+        f"Compared {report['groups_compared']} scenario group(s): last {report['window']} runs vs "
+        f"the {report['window']} before (alpha {report['alpha']})"
+    )
+    if not report['regressions']:
+        print("✅ No significant regressions")
+        return
+
+    for r in report['regressions']:
+        target = f"{r['scenario_id']} ({r['cli_tool'] or r['kind']})"
+        unit = 's' if r['metric'] == 'latency' else '%'
+        print(
+            f"❌ {target:<28} {r['metric']:<8} {r['baseline_mean']:.2f}{unit} -> {r['recent_mean']:.2f}{unit} "
+            f"(n={r['baseline_n']}/{r['recent_n']}, p={r['p_value']:.4f})"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Diverga QA results store: ingest, trends and regressions')
+    parser.add_argument(
+        '--store',
+        default=str(DEFAULT_STORE_PATH),
+        help='SQLite database (default: qa/.cache/results.sqlite3)'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help='Ingest saved sessions and reports')
+    ingest.add_argument('paths', nargs='+', help='conversation_raw*.json, qa_report_* files or directories')
+
+    trend = commands.add_parser('trend', help='Show a metric over recent runs of a scenario')
+    trend.add_argument('scenario', help='Scenario ID (e.g., META-002)')
+    trend.add_argument('--metric', '-m', default='score', choices=METRICS)
+    trend.add_argument('--cli', '-c', default=None, help='Only runs of this CLI tool')
+    trend.add_argument('--last', '-n', type=int, default=50, help='Number of runs (default: 50)')
+    trend.add_argument('--kind', default='session', choices=['session', 'evaluation'])
+
+    report = commands.add_parser('report', help='Flag significant score drops and slowdowns')
+    report.add_argument('--window', '-w', type=int, default=10, help='Runs per comparison window (default: 10)')
+    report.add_argument('--alpha', type=float, default=0.05, help='Significance level (default: 0.05)')
+    report.add_argument('--min-score-drop', type=float, default=5.0, help='Minimum score drop in points (default: 5)')
+    report.add_argument('--min-slowdown', type=float, default=10.0, help='Minimum latency increase in %% (default: 10)')
+    report.add_argument('--output', '-o', default=None, help='Also write the report as YAML')
+
+    commands.add_parser('list', help='List scenarios with stored runs')
+
+    args = parser.parse_args()
+
+    with ResultsStore(args.store) as store:
+        if args.command == 'ingest':
+            total = 0
+            for path in args.paths:
+                total += store.ingest_path(path)
+            print(f"Ingested {total} run(s) into {args.store}")
+            sys.exit(0 if total else 2)
+
+        if args.command == 'trend':
+            rows = store.trend(args.scenario, args.metric, cli_tool=args.cli, last=args.last, kind=args.kind)
+            if not rows:
+                print(f"No stored runs for {args.scenario}")
+                sys.exit(2)
+            for row in rows:
+                value = '-' if row['value'] is None else f"{row['value']:.3f}"
+                print(f"{row['run_at']}  {row['cli_tool'] or '-':<9} {row['status'] or '-':<10} {value}")
+            sys.exit(0)
+
+        if args.command == 'list':
+            for row in store.scenarios():
+                print(f"{row['scenario_id']:<12} {row['kind']:<11} {row['cli_tool'] or '-':<9} "
+                      f"{row['runs']:>5} runs, last {row['last_run']}")
+            sys.exit(0)
+
+        result = store.regression_report(
+            window=args.window, alpha=args.alpha,
+            min_score_drop=args.min_score_drop, min_slowdown_pct=args.min_slowdown
+        )
+        print_regression_report(result)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                yaml.dump(result, f, default_flow_style=False, allow_unicode=True)
+        sys.exit(1 if result['regressions'] else 0)
+
+
+if __name__ == '__main__':
+    main()
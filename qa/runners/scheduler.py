@@ -0,0 +1,179 @@
+"""
+Diverga QA Batch Scheduler
+===========================
+
+Longest-processing-time-first (LPT) dispatch for multi-scenario runs.
+
+Scenarios differ a lot in length (META-002 sends 10 turns, QUANT-004
+four), so dispatching them in list order can leave workers idle while the
+longest scenario, started last, finishes alone. The scheduler estimates
+each scenario's cost and hands the longest ones out first; on `jobs`
+identical workers this keeps the makespan within 4/3 of optimal.
+
+Cost estimate per scenario:
+- turns: user turns in `conversation_flow` (what the runner actually sends),
+  falling back to the midpoint of `expected_turns`
+- seconds per turn: mean historical per-turn latency for the scenario and
+  CLI tool from the ResultsStore, then the CLI tool's mean across all
+  scenarios, then DEFAULT_SECONDS_PER_TURN
+
+The plan also predicts each scenario's start and finish time so the batch
+summary can report predicted versus actual completion.
+
+Usage:
+    python cli_test_runner.py --scenarios all --jobs 4 --store
+"""
+
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+try:
+    from .results_store import ResultsStore
+except ImportError:  # Executed as a script from qa/runners
+    from results_store import ResultsStore
+
+DEFAULT_SECONDS_PER_TURN = 30.0
+HISTORY_RUNS = 20  # Recent runs averaged for per-turn latency
+
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@dataclass
+class ScenarioEstimate:
+    """Predicted cost of one scenario."""
+    scenario_id: str
+    turns: int
+    seconds_per_turn: float
+    latency_source: str  # scenario, cli_tool or default
+
+    @property
+    def predicted_seconds(self) -> float:
+        return self.turns * self.seconds_per_turn
+
+
+@dataclass
+class ScheduledScenario:
+    """A scenario's place in the plan."""
+    scenario_id: str
+    worker: int
+    predicted_start: float
+    predicted_seconds: float
+
+    @property
+    def predicted_finish(self) -> float:
+        return self.predicted_start + self.predicted_seconds
+
+
+@dataclass
+class Schedule:
+    """Dispatch order with predicted per-scenario and total completion times."""
+    jobs: int
+    order: List[str] = field(default_factory=list)
+    slots: Dict[str, ScheduledScenario] = field(default_factory=dict)
+    estimates: Dict[str, ScenarioEstimate] = field(default_factory=dict)
+
+    @property
+    def predicted_makespan(self) -> float:
+        return max((s.predicted_finish for s in self.slots.values()), default=0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'policy': 'lpt',
+            'jobs': self.jobs,
+            'order': self.order,
+            'predicted_makespan_seconds': round(self.predicted_makespan, 1),
+            'scenarios': {
+                sid: {
+                    **asdict(self.estimates[sid]),
+                    'worker': slot.worker,
+                    'predicted_start_seconds': round(slot.predicted_start, 1),
+                    'predicted_seconds': round(slot.predicted_seconds, 1),
+                    'predicted_finish_seconds': round(slot.predicted_finish, 1),
+                }
+                for sid, slot in self.slots.items()
+            },
+        }
+
+
+def count_turns(protocol: dict) -> int:
+    """Number of CLI calls a protocol makes (user turns), or its expected_turns midpoint."""
+    flow = protocol.get('conversation_flow') or []
+    turns = sum(1 for t in flow if isinstance(t, dict) and str(t.get('user') or '').strip())
+    if turns:
+        return turns
+
+    # expected_turns is a number or a range like "10-15"
+    bounds = [int(n) for n in re.findall(r'\d+', str(protocol.get('expected_turns', '')))]
+    if bounds:
+        return max(1, round(sum(bounds[:2]) / len(bounds[:2])))
+    return max(1, len(flow))
+
+
+class Scheduler:
+    """
+    Estimates scenario costs and builds LPT dispatch plans.
+
+    Args:
+        protocol_dir: Directory of test_*.yaml protocols
+        store: ResultsStore with historical per-turn latency (optional)
+        default_seconds_per_turn: Latency assumed without any history
+    """
+
+    def __init__(
+        self,
+        protocol_dir: Path,
+        store: Optional[ResultsStore] = None,
+        default_seconds_per_turn: float = DEFAULT_SECONDS_PER_TURN
+    ):
+        self.protocol_dir = Path(protocol_dir)
+        self.store = store
+        self.default_seconds_per_turn = default_seconds_per_turn
+
+    def _load_protocol(self, scenario_id: str) -> dict:
+        # Same file naming as CLITestRunner._load_protocol
+        protocol_file = self.protocol_dir / f"test_{scenario_id.lower().replace('-', '_')}.yaml"
+        try:
+            with open(protocol_file, 'r', encoding='utf-8') as f:
+                return yaml.load(f, Loader=YAML_LOADER) or {}
+        except (OSError, yaml.YAMLError):
+            return {}  # The runner reports the real error when it starts
+
+    def estimate(self, scenario_id: str, cli_tool: str) -> ScenarioEstimate:
+        """Predict one scenario's run time."""
+        turns = count_turns(self._load_protocol(scenario_id))
+
+        latency, source = None, 'default'
+        if self.store:
+            latency = self.store.mean_turn_latency(scenario_id, cli_tool, last=HISTORY_RUNS)
+            source = 'scenario'
+            if latency is None:
+                latency = self.store.mean_turn_latency(cli_tool=cli_tool, last=HISTORY_RUNS)
+                source = 'cli_tool'
+        if latency is None:
+            latency, source = self.default_seconds_per_turn, 'default'
+
+        return ScenarioEstimate(scenario_id, turns, latency, source)
+
+    def plan(self, scenario_ids: List[str], cli_tool: str, jobs: int) -> Schedule:
+        """
+        Order scenarios longest-first and simulate dispatch on `jobs` workers.
+
+        Ties are broken by the requested order, so equal estimates keep it.
+        """
+        estimates = {sid: self.estimate(sid, cli_tool) for sid in scenario_ids}
+        position = {sid: i for i, sid in enumerate(scenario_ids)}
+        order = sorted(scenario_ids, key=lambda sid: (-estimates[sid].predicted_seconds, position[sid]))
+
+        schedule = Schedule(jobs=jobs, order=order, estimates=estimates)
+        free_at = [0.0] * jobs
+        for sid in order:
+            # Next scenario goes to whichever worker frees up first
+            worker = min(range(jobs), key=lambda w: (free_at[w], w))
+            seconds = estimates[sid].predicted_seconds
+            schedule.slots[sid] = ScheduledScenario(sid, worker, free_at[worker], seconds)
+            free_at[worker] += seconds
+        return schedule
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Diverga QA Session Index
+========================
+
+Random access to Claude Code session logs through a sidecar offset index.
+
+The index is built in one pass over a session JSONL, classifying entries
+exactly as ConversationExtractor does, and saved next to it as
+`<session>.jsonl.idx`. It records the byte offset of every line, its
+entry kind (user, assistant, tool_result or other), the turn it belongs
+to, whether an assistant message has tool calls, and the checkpoint the
+message raises. SessionReader memory-maps the log and decodes only the
+lines a caller asks for. Inspecting turn 734 or re-checking every
+checkpoint of a huge session then costs one seek per line instead of a
+full extraction.
+
+A saved index is reused while the log is unchanged. If the log has only
+been appended to (a live session), just the new lines are indexed;
+otherwise the index is rebuilt. Bumping INDEX_VERSION or the detector
+version invalidates saved indexes.
+
+Usage:
+    python session_index.py --session big_session.jsonl
+    python session_index.py --session big_session.jsonl --turn 734 --turn 735
+    python session_index.py --session big_session.jsonl --checkpoints --tool-calls
+"""
+
+import argparse
+import array
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    from .extract_conversation import ConversationExtractor
+    from .json_codec import JSONCodec, get_codec
+except ImportError:  # Executed as a script from qa/runners
+    from extract_conversation import ConversationExtractor
+    from json_codec import JSONCodec, get_codec
+
+try:
+    from .. import detectors
+except (ImportError, ValueError):  # qa/runners imported as a top-level package or script
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    import detectors
+
+INDEX_VERSION = 1
+
+KINDS = ("other", "user", "assistant", "tool_result")  # Row kind codes
+TOOL_CALLS = 0x80  # Kind flag: assistant message with tool calls
+_KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+
+def index_path_for(session_path: str | Path) -> Path:
+    """Default sidecar path: `<session>.jsonl.idx` next to the log."""
+    session_path = Path(session_path)
+    return session_path.with_name(session_path.name + ".idx")
+
+
+class SessionIndex:
+    """
+    Byte offsets, entry kinds and turn numbers of every line of a session log.
+
+    Row i is line i of the log and spans bytes `offsets[i]:offsets[i + 1]`.
+    `kinds[i]` is the row's KINDS code, or'ed with TOOL_CALLS for assistant
+    messages with tool calls. `turns[i]` is the turn the row belongs to,
+    numbered as ConversationExtractor numbers them: tool results and other
+    entries belong to the turn before them. `checkpoints` maps assistant
+    rows to the checkpoint they raise.
+
+    Use `SessionIndex.open` to load the saved index or build it.
+    """
+
+    def __init__(self, session_path: str | Path, prefilter: bool = True):
+        self.session_path = Path(session_path)
+        self.prefilter = prefilter
+        self.offsets = array.array("q", [0])
+        self.kinds = array.array("B")
+        self.turns = array.array("I")
+        self.checkpoints: dict[int, str] = {}
+        self.mtime_ns = 0
+        self.fingerprint = ""
+
+    @classmethod
+    def open(
+        cls,
+        session_path: str | Path,
+        index_path: str | Path | None = None,
+        extractor: ConversationExtractor | None = None,
+        rebuild: bool = False,
+        save: bool = True,
+    ) -> "SessionIndex":
+        """
+        The index of `session_path`.
+
+        The saved index is loaded when it is still current. If the log has
+        only grown, the index is extended; otherwise it is built again.
+        Whenever the index changes it is saved back on a best-effort basis
+        (a read-only archive keeps it in memory only).
+
+        Args:
+            session_path: Session JSONL file
+            index_path: Sidecar file (`index_path_for(session_path)` when None)
+            extractor: Classifies entries and detects checkpoints
+                (a ConversationExtractor for the session when None)
+            rebuild: Ignore any saved index
+            save: Write the index back when it changed
+        """
+        session_path = Path(session_path)
+        if not session_path.exists():
+            raise FileNotFoundError(f"Session file not found: {session_path}")
+        index_path = Path(index_path) if index_path else index_path_for(session_path)
+        extractor = extractor or ConversationExtractor(str(session_path))
+        stat = session_path.stat()
+
+        index = None if rebuild else cls.load(session_path, index_path, extractor.prefilter)
+        if index is not None and (index.size, index.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            return index
+        if index is None or not index._is_prefix(stat.st_size):
+            index = cls(session_path, extractor.prefilter)
+
+        index._extend(extractor, stat.st_mtime_ns)
+        if save:
+            try:
+                index.save(index_path)
+            except OSError:
+                pass
+        return index
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def size(self) -> int:
+        """Bytes of the log covered by the index."""
+        return self.offsets[-1]
+
+    @property
+    def total_turns(self) -> int:
+        return self.turns[-1] if self.turns else 0
+
+    def span(self, row: int) -> tuple[int, int]:
+        """(start, end) byte offsets of a row's line."""
+        return self.offsets[row], self.offsets[row + 1]
+
+    def kind(self, row: int) -> str:
+        return KINDS[self.kinds[row] & ~TOOL_CALLS]
+
+    def row_of_turn(self, turn: int) -> int:
+        """The user or assistant row that opens `turn`; KeyError if the log has no such turn."""
+        row = bisect.bisect_left(self.turns, turn)
+        if turn < 1 or row == len(self) or self.turns[row] != turn:
+            raise KeyError(f"No turn {turn} in {self.session_path} ({self.total_turns} turns)")
+        return row
+
+    def rows(self, *kinds: str) -> list[int]:
+        """Rows of the given kinds, in log order."""
+        codes = {_KIND_CODES[kind] for kind in kinds}
+        return [row for row, code in enumerate(self.kinds) if (code & ~TOOL_CALLS) in codes]
+
+    def tool_call_rows(self) -> list[int]:
+        """Assistant rows with tool calls, in log order."""
+        return [row for row, code in enumerate(self.kinds) if code & TOOL_CALLS]
+
+    def kind_counts(self) -> dict[str, int]:
+        """Rows per kind."""
+        counts = dict.fromkeys(KINDS, 0)
+        for code in self.kinds:
+            counts[KINDS[code & ~TOOL_CALLS]] += 1
+        return counts
+
+    def _read_span(self, f, row: int) -> bytes:
+        start, end = self.span(row)
+        f.seek(start)
+        return f.read(end - start)
+
+    def _fingerprint(self) -> str:
+        """Digest of the first and last indexed lines as they are on disk now."""
+        digest = hashlib.blake2b(digest_size=16)
+        if len(self):
+            with open(self.session_path, "rb") as f:
+                digest.update(self._read_span(f, 0))
+                digest.update(self._read_span(f, len(self) - 1))
+        return digest.hexdigest()
+
+    def _is_prefix(self, size: int) -> bool:
+        """Whether the log still starts with the indexed lines, i.e. it was only appended to."""
+        return size >= self.size and self._fingerprint() == self.fingerprint
+
+    def _truncate(self, rows: int) -> None:
+        """Forget every row from `rows` on."""
+        del self.offsets[rows + 1:]
+        del self.kinds[rows:]
+        del self.turns[rows:]
+        self.checkpoints = {row: cp_id for row, cp_id in self.checkpoints.items() if row < rows}
+
+    def _extend(self, extractor: ConversationExtractor, mtime_ns: int) -> None:
+        """Index the lines after the indexed ones."""
+        if len(self):
+            with open(self.session_path, "rb") as f:
+                if not self._read_span(f, len(self) - 1).endswith(b"\n"):
+                    self._truncate(len(self) - 1)  # Was still being written
+
+        types = extractor.ENTRY_TYPES if self.prefilter else None
+        turn = self.total_turns
+        lines = extractor.codec.scan_jsonl(self.session_path, types=types, keys=("type", "role"), start=self.size)
+        for offset, line, entry in lines:
+            kind = extractor.entry_kind(entry) if isinstance(entry, dict) else None
+            code = _KIND_CODES[kind or "other"]
+            if kind in ("user", "assistant"):
+                turn += 1
+            if kind == "assistant":
+                if entry.get("tool_calls"):
+                    code |= TOOL_CALLS
+                checkpoint_id = extractor._detect_checkpoint(entry.get("content", entry.get("message", "")))
+                if checkpoint_id:
+                    self.checkpoints[len(self)] = checkpoint_id
+            self.kinds.append(code)
+            self.turns.append(turn)
+            self.offsets.append(offset + len(line))
+
+        self.mtime_ns = mtime_ns
+        self.fingerprint = self._fingerprint()
+
+    def _header(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "detector_version": detectors.DETECTOR_VERSION,
+            "byteorder": sys.byteorder,
+            "prefilter": self.prefilter,
+        }
+
+    def save(self, index_path: str | Path) -> None:
+        """Write the index atomically: a JSON header line, then the offset, kind and turn arrays."""
+        index_path = Path(index_path)
+        header = {
+            **self._header(),
+            "rows": len(self),
+            "mtime_ns": self.mtime_ns,
+            "fingerprint": self.fingerprint,
+            "checkpoints": {str(row): cp_id for row, cp_id in self.checkpoints.items()},
+        }
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.offsets.tofile(f)
+            self.kinds.tofile(f)
+            self.turns.tofile(f)
+        os.replace(tmp_path, index_path)
+
+    @classmethod
+    def load(cls, session_path: str | Path, index_path: str | Path, prefilter: bool = True) -> "SessionIndex | None":
+        """The saved index, or None when it is missing, unreadable or was built differently."""
+        index = cls(session_path, prefilter)
+        try:
+            with open(index_path, "rb") as f:
+                header = json.loads(f.readline())
+                if any(header.get(key) != value for key, value in index._header().items()):
+                    return None
+                rows = header["rows"]
+                index.offsets = array.array("q")
+                index.offsets.fromfile(f, rows + 1)
+                index.kinds.fromfile(f, rows)
+                index.turns.fromfile(f, rows)
+            index.mtime_ns = header["mtime_ns"]
+            index.fingerprint = header["fingerprint"]
+            index.checkpoints = {int(row): cp_id for row, cp_id in header["checkpoints"].items()}
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+        return index
+
+
+class SessionReader:
+    """
+    Memory-mapped random access to a session log through its SessionIndex.
+
+    Only the lines a caller asks for are decoded.
+
+    Args:
+        session_path: Session JSONL file
+        index: Its index (`SessionIndex.open(session_path)` when None)
+        codec: JSON codec (the fastest installed backend when None)
+    """
+
+    def __init__(self, session_path: str | Path, index: SessionIndex | None = None, codec: JSONCodec | None = None):
+        self.index = index if index is not None else SessionIndex.open(session_path)
+        self.codec = codec or get_codec()
+        self._file = open(self.index.session_path, "rb")
+        if self.index.size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b""  # Empty files cannot be mapped
+
+    def line(self, row: int) -> bytes:
+        start, end = self.index.span(row)
+        return self._map[start:end]
+
+    def entry(self, row: int) -> dict:
+        """Decoded entry of a row; ValueError if its line is malformed."""
+        return self.codec.loads(self.line(row))
+
+    def turn(self, number: int) -> dict:
+        """The user or assistant entry of turn `number`."""
+        return self.entry(self.index.row_of_turn(number))
+
+    def turns(self, numbers: Iterable[int] | None = None) -> Iterator[tuple[int, dict]]:
+        """(turn, entry) for the given turns (every turn when None)."""
+        if numbers is None:
+            rows = self.index.rows("user", "assistant")
+        else:
+            rows = [self.index.row_of_turn(number) for number in numbers]
+        for row in rows:
+            yield self.index.turns[row], self.entry(row)
+
+    def tool_calls(self) -> Iterator[tuple[int, dict]]:
+        """(turn, tool call) for every tool call of every assistant message."""
+        for row in self.index.tool_call_rows():
+            for tool_call in self.entry(row)["tool_calls"]:
+                yield self.index.turns[row], tool_call
+
+    def tool_results(self) -> Iterator[tuple[int, dict]]:
+        """(turn, entry) for every tool result."""
+        for row in self.index.rows("tool_result"):
+            yield self.index.turns[row], self.entry(row)
+
+    def checkpoint_messages(self) -> Iterator[tuple[int, str, dict]]:
+        """(turn, checkpoint ID, entry) for every assistant message raising a checkpoint."""
+        for row, checkpoint_id in sorted(self.index.checkpoints.items()):
+            yield self.index.turns[row], checkpoint_id, self.entry(row)
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "SessionReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _print_checkpoints(reader: SessionReader) -> None:
+    for turn, checkpoint_id, entry in reader.checkpoint_messages():
+        analysis = detectors.analyze(entry.get("content", entry.get("message", "")))
+        halt = "✅ halted" if analysis.halt else "❌ no halt"
+        options = len({option for option, _, _ in analysis.t_scores if option})
+        print(f"  Turn {turn:>6}  {checkpoint_id:<28} {detectors.checkpoint_level(checkpoint_id):<7} "
+              f"{halt}  {options} option(s)")
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Index a Claude Code session log and read parts of it")
+    parser.add_argument("--session", "-s", required=True, help="Path to Claude Code session JSONL file")
+    parser.add_argument("--index", help="Sidecar index file (default: <session>.idx)")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the saved index and build it again")
+    parser.add_argument("--turn", "-t", type=int, action="append", default=[], help="Print the entry of this turn (repeatable)")
+    parser.add_argument("--checkpoints", action="store_true", help="Re-check every checkpoint-raising message")
+    parser.add_argument("--tool-calls", action="store_true", help="List every tool call")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = SessionIndex.open(args.session, args.index, rebuild=args.rebuild)
+    elapsed = time.perf_counter() - started
+
+    counts = ", ".join(f"{count} {kind}" for kind, count in index.kind_counts().items())
+    print(f"Index: {len(index)} lines ({counts}), {index.total_turns} turns, "
+          f"{len(index.checkpoints)} checkpoint messages ({elapsed * 1e3:.1f} ms)")
+
+    with SessionReader(args.session, index) as reader:
+        for turn in args.turn:
+            try:
+                entry = reader.turn(turn)
+            except KeyError as e:
+                print(f"❌ {e.args[0]}")
+                continue
+            print(f"\nTurn {turn}:")
+            print(json.dumps(entry, indent=2, ensure_ascii=False))
+
+        if args.checkpoints:
+            print("\nCheckpoints:")
+            _print_checkpoints(reader)
+
+        if args.tool_calls:
+            print("\nTool calls:")
+            for turn, tool_call in reader.tool_calls():
+                name = tool_call.get("name", tool_call.get("tool", ""))
+                print(f"  Turn {turn:>6}  {name}  {tool_call.get('id') or ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for Early-Abort Policies
+===============================
+
+Validates:
+- Policy parsing (--abort-on / --fail-fast)
+- Abort on a missed RED checkpoint, on the compliance bound and on consecutive timeouts
+- Aborted sessions are finalized, validated and saved with their abort record
+- Batch outcomes and re-scoring keep the aborted status
+
+Usage:
+    pytest tests/test_qa_abort_policy.py -v
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import yaml
+
+from qa.runners.abort_policy import AbortPolicy
+from qa.runners.batch_runner import BatchRunner
+from qa.runners.cli_test_runner import CLITestRunner
+
+
+def _scripted(runner, responses):
+    """Serve responses (str or exception) in turn order instead of calling the CLI."""
+    queue = list(responses)
+
+    def execute(message):
+        response = queue.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    runner._execute_cli = execute
+    return runner
+
+
+def _checkpoint(cp_id):
+    return f"🔴 CHECKPOINT: {cp_id}\n\n[A] Option A (T=0.50)\n[B] Option B (T=0.40)"
+
+
+# META-002 designates checkpoints at turns 1, 5, 7 and 10
+META_002_TURNS = {1: "CP_RESEARCH_DIRECTION", 5: "CP_THEORY_SELECTION", 7: "CP_SCOPE_DECISION",
+                  10: "CP_METHODOLOGY_APPROVAL"}
+
+
+def _meta_002_responses(skip=()):
+    return [_checkpoint(META_002_TURNS[t]) if t in META_002_TURNS and t not in skip else "Understood."
+            for t in range(1, 11)]
+
+
+class TestParse:
+    """--abort-on syntax."""
+
+    def test_parse(self):
+        policy = AbortPolicy.parse("red-miss, compliance, timeouts:2")
+        assert (policy.red_miss, policy.min_compliance, policy.max_consecutive_timeouts) == (True, 80.0, 2)
+        assert AbortPolicy.parse("compliance:60").describe() == "compliance:60"
+        assert AbortPolicy.fail_fast().describe() == "red-miss,compliance:80"
+
+    @pytest.mark.parametrize("spec", ["", "red-miss:1", "compliance:abc", "compliance:0", "timeouts", "timeouts:0", "slow"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            AbortPolicy.parse(spec)
+
+
+class TestRunnerAbort:
+    """Abort rules in CLITestRunner.run."""
+
+    def test_no_policy_plays_every_turn(self):
+        runner = _scripted(CLITestRunner("META-002", dry_run=True), _meta_002_responses(skip=(1,)))
+        session = runner.run()
+        assert session.status == "completed"
+        assert session.abort is None
+        assert len([t for t in session.turns if t.role == "user"]) == 10
+
+    def test_red_miss(self, tmp_path):
+        runner = _scripted(CLITestRunner("META-002", dry_run=True, abort_policy=AbortPolicy.fail_fast()),
+                           _meta_002_responses(skip=(1,)))
+        session = runner.run()
+
+        assert session.status == "aborted"
+        assert session.abort["rule"] == "red-miss"
+        assert (session.abort["turn"], session.abort["turns_skipped"]) == (1, 9)
+        assert session.validation_results["checkpoints"]["compliance"] == 0
+
+        output = runner.save_results(str(tmp_path))
+        raw = json.loads((output / "conversation_raw_claude.json").read_text(encoding="utf-8"))
+        assert raw["status"] == "aborted" and raw["abort"]["rule"] == "red-miss"
+        result = yaml.safe_load((output / "META-002_test_result_claude.yaml").read_text(encoding="utf-8"))
+        assert result["status"] == "ABORTED"
+
+    def test_orange_miss_is_not_red_miss(self):
+        runner = _scripted(CLITestRunner("META-002", dry_run=True, abort_policy=AbortPolicy(red_miss=True)),
+                           _meta_002_responses(skip=(5,)))
+        assert runner.run().status == "completed"
+
+    def test_compliance_bound(self):
+        runner = _scripted(CLITestRunner("META-002", dry_run=True, abort_policy=AbortPolicy.parse("compliance:80")),
+                           _meta_002_responses(skip=(5,)))
+        session = runner.run()
+        # 3 of 4 checkpoints still reachable after turn 5: 75% < 80%
+        assert session.status == "aborted"
+        assert (session.abort["rule"], session.abort["turn"], session.abort["turns_skipped"]) == ("compliance", 5, 5)
+        assert "CP_THEORY_SELECTION" in session.abort["reason"]
+
+    def test_compliance_bound_allows_passing_sessions(self):
+        runner = _scripted(CLITestRunner("META-002", dry_run=True, abort_policy=AbortPolicy.parse("compliance:75")),
+                           _meta_002_responses(skip=(5,)))
+        assert runner.run().status == "completed"
+
+    def test_consecutive_timeouts(self):
+        timeout = TimeoutError("CLI command timed out after 300s")
+        responses = [_checkpoint("CP_RESEARCH_DIRECTION"), timeout, "Understood.", timeout, timeout]
+        runner = _scripted(CLITestRunner("META-002", dry_run=True, abort_policy=AbortPolicy.parse("timeouts:2")),
+                           responses)
+        session = runner.run()
+
+        assert session.status == "aborted"
+        assert (session.abort["rule"], session.abort["turn"]) == ("timeouts", 5)
+        timed_out = [t.number for t in session.turns if t.metadata.get("timed_out")]
+        assert timed_out == [2, 4, 5]
+
+    def test_timeout_without_policy_fails(self):
+        runner = _scripted(CLITestRunner("META-002", dry_run=True, abort_policy=AbortPolicy(red_miss=True)),
+                           [_checkpoint("CP_RESEARCH_DIRECTION"), TimeoutError("timed out")])
+        session = runner.run()
+        assert session.status == "failed"
+        assert session.abort is None
+
+
+class TestAbortedResults:
+    """Batch outcomes and re-scoring."""
+
+    def test_batch_outcome(self, tmp_path):
+        # Dry-run responses never raise META-002's turn-1 checkpoint
+        batch = BatchRunner(["META-002"], dry_run=True, output_dir=str(tmp_path),
+                            abort_policy=AbortPolicy.fail_fast())
+        report = batch.run()
+        assert report.outcomes[0].status == "ABORTED"
+        assert report.outcomes[0].abort_reason
+        assert report.aborted == 1
+        assert report.exit_code == 1
+        assert report.to_dict()["summary"]["aborted"] == 1
+
+    def test_rescore_keeps_abort(self, tmp_path):
+        runner = _scripted(CLITestRunner("META-002", dry_run=True, abort_policy=AbortPolicy.fail_fast()),
+                           _meta_002_responses(skip=(1,)))
+        runner.run()
+        output = runner.save_results(str(tmp_path))
+
+        session = CLITestRunner("META-002", dry_run=True).rescore(output / "conversation_raw_claude.json")
+        assert session.status == "aborted"
+        assert session.abort["rule"] == "red-miss"
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for QA Agent Tracker Keyword Index
+==========================================
+
+Validates the Aho-Corasick keyword matcher behind AgentTracker:
+- detect_agent_from_keywords returns exactly what the nested loop did
+- Every occurrence is reported with offsets into the original text
+- English and Korean keywords, overlaps and case folding are handled
+- Pure-Python and pyahocorasick automata agree
+
+Usage:
+    pytest tests/test_qa_agent_tracker.py -v
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from qa.benchmarks.agent_keywords import legacy_detect_agent_from_keywords, load_user_turns
+from qa.runners.agent_tracker import AgentTracker
+from qa.runners.keyword_index import KeywordIndex, ahocorasick
+
+BACKENDS = [False] + ([True] if ahocorasick is not None else [])
+
+
+@pytest.fixture
+def tracker() -> AgentTracker:
+    return AgentTracker()
+
+
+class TestDetectAgentFromKeywords:
+    """detect_agent_from_keywords keeps its previous results."""
+
+    def test_matches_reference_on_recorded_turns(self, tracker):
+        texts = load_user_turns()
+        assert texts
+        for text in texts:
+            assert tracker.detect_agent_from_keywords(text) == legacy_detect_agent_from_keywords(
+                text, tracker.AGENT_KEYWORDS
+            )
+
+    @pytest.mark.parametrize("native", BACKENDS)
+    def test_matches_reference_on_random_text(self, tracker, native):
+        rng = random.Random(7)
+        vocabulary = [kw for kws in tracker.AGENT_KEYWORDS.values() for kw in kws]
+        vocabulary += ["the", "연구", "and", " ", "İ", "RQs", "Meta", "analysis", "-"]
+        index = KeywordIndex(tracker.AGENT_KEYWORDS, native=native)
+        for _ in range(500):
+            words = [rng.choice(vocabulary) for _ in range(rng.randint(0, 15))]
+            text = " ".join(w.upper() if rng.random() < 0.2 else w for w in words)
+            assert index.first_per_key(text) == legacy_detect_agent_from_keywords(
+                text, tracker.AGENT_KEYWORDS
+            )
+
+    def test_first_listed_keyword_wins(self, tracker):
+        # "interview" precedes "interview protocol" in diverga:d2's list
+        assert ("diverga:d2", "interview") in tracker.detect_agent_from_keywords("an Interview Protocol draft")
+
+    def test_index_is_built_once(self, tracker):
+        assert AgentTracker.keyword_index() is AgentTracker().keyword_index()
+
+
+class TestFindKeywordMatches:
+    """find_keyword_matches reports every occurrence with offsets."""
+
+    @pytest.mark.parametrize("native", BACKENDS)
+    def test_offsets_and_overlaps(self, tracker, native):
+        text = "Meta-analysis 계획과 interview protocol, then OSF"
+        matches = KeywordIndex(tracker.AGENT_KEYWORDS, native=native).find_all(text)
+
+        found = {(m.key, m.keyword) for m in matches}
+        assert ("diverga:c5", "meta-analysis") in found
+        assert ("diverga:d2", "interview") in found
+        assert ("diverga:d2", "interview protocol") in found
+        # One keyword shared by two agents is reported for both
+        assert ("diverga:f3", "OSF") in found and ("diverga:g4", "OSF") in found
+        for m in matches:
+            assert text[m.start:m.end].lower() == m.keyword.lower()
+        assert [m.start for m in matches] == sorted(m.start for m in matches)
+
+    def test_korean_keywords(self, tracker):
+        text = "메타분석과 효과크기를 계산해 주세요"
+        matches = tracker.find_keyword_matches(text)
+        assert [(m.key, text[m.start:m.end]) for m in matches] == [
+            ("diverga:c5", "메타분석"),
+            ("diverga:b3", "효과크기"),
+        ]
+
+    def test_offsets_survive_length_changing_lowercase(self, tracker):
+        # "İ".lower() is two characters; offsets must still index the original
+        text = "İİ effect size"
+        (match,) = tracker.find_keyword_matches(text)
+        assert text[match.start:match.end] == "effect size"
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for Analysis Cache
+=========================
+
+Validates the content-hash analysis cache:
+- Entries are keyed by detector, detector version and response text
+- Size-bounded LRU eviction keeps recently used entries
+- Cached detector results equal freshly computed ones
+- Re-scoring a saved session hits the cache for unchanged responses
+
+Usage:
+    pytest tests/test_qa_analysis_cache.py -v
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from qa.benchmarks.corpus import load_session_corpus
+from qa.runners.analysis_cache import AnalysisCache
+from qa.runners.cli_test_runner import CLITestRunner
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with AnalysisCache(str(tmp_path / "cache" / "analysis.sqlite3")) as c:
+        yield c
+
+
+class TestAnalysisCache:
+    """Tests for storage, keys and eviction."""
+
+    def test_round_trip_and_counters(self, cache):
+        assert cache.get("detect_agents", "1", "text") is None
+        cache.put("detect_agents", "1", "text", [{"id": "A1", "confidence": "HIGH"}])
+        assert cache.get("detect_agents", "1", "text") == [{"id": "A1", "confidence": "HIGH"}]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.stats()["entries"] == 1
+
+    def test_key_covers_detector_version_and_text(self, cache):
+        cache.put("detect_agents", "1", "text", ["v1"])
+        assert cache.get("detect_agents", "2", "text") is None
+        assert cache.get("detect_checkpoints", "1", "text") is None
+        assert cache.get("detect_agents", "1", "text ") is None
+        assert AnalysisCache.make_key("ab", "c", "") != AnalysisCache.make_key("a", "bc", "")
+
+    def test_get_or_compute_calls_once(self, cache):
+        calls = []
+
+        def compute(text):
+            calls.append(text)
+            return {"length": len(text)}
+
+        for _ in range(3):
+            assert cache.get_or_compute("skill", "1", "응답 텍스트", compute) == {"length": 6}
+        assert calls == ["응답 텍스트"]
+
+    def test_lru_eviction(self, tmp_path):
+        payload = "x" * 100
+        with AnalysisCache(str(tmp_path / "lru.sqlite3"), max_bytes=350) as cache:
+            for name in ("a", "b", "c"):
+                cache.put("d", "1", name, payload)
+            cache.get("d", "1", "a")  # "b" is now least recently used
+            cache.put("d", "1", "e", payload)
+
+            assert cache.get("d", "1", "b") is None
+            assert cache.get("d", "1", "a") == payload
+            assert cache.stats()["bytes"] <= 350
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "persist.sqlite3")
+        with AnalysisCache(path) as cache:
+            cache.put("d", "1", "text", {"ok": True})
+        with AnalysisCache(path) as cache:
+            assert cache.get("d", "1", "text") == {"ok": True}
+            assert cache.stats()["bytes"] > 0
+
+    def test_shared_between_threads(self, cache):
+        def work(i):
+            return cache.get_or_compute("d", "1", f"text {i % 10}", lambda t: t.upper())
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(work, range(200)))
+        assert results[13] == "TEXT 3"
+        assert cache.stats()["entries"] == 10
+
+
+class TestRunnerIntegration:
+    """CLITestRunner reuses cached analysis."""
+
+    def test_cached_results_match_fresh(self, cache):
+        runner = CLITestRunner("QUAL-002", dry_run=True, cache=cache)
+        plain = CLITestRunner("QUAL-002", dry_run=True)
+        texts = load_session_corpus()[:20]
+        assert texts
+
+        for _ in range(2):
+            for text in texts:
+                for detector in CLITestRunner.CACHED_DETECTORS:
+                    assert runner._analyze(detector, text) == plain._analyze(detector, text)
+        assert cache.hits == cache.misses == len(texts) * len(CLITestRunner.CACHED_DETECTORS)
+
+    def test_rescore_saved_session(self, cache, tmp_path):
+        runner = CLITestRunner("META-002", dry_run=True, cache=cache)
+        session = runner.run()
+        result_path = runner.save_results(str(tmp_path / "sessions"))
+        raw_file = result_path / "conversation_raw_claude.json"
+        misses = cache.misses
+
+        rescored = CLITestRunner("META-002", dry_run=True, cache=cache).rescore(raw_file)
+
+        assert cache.misses == misses
+        assert rescored.session_id == session.session_id
+        assert rescored.checkpoints and [c["checkpoint"] for c in rescored.checkpoints] == [
+            c["checkpoint"] for c in session.checkpoints
+        ]
+        assert rescored.validation_results["checkpoints"] == session.validation_results["checkpoints"]
+        assert rescored.turns[0].timestamp == session.turns[0].timestamp
+
+    def test_rescore_only_analyzes_changed_responses(self, cache, tmp_path):
+        runner = CLITestRunner("META-002", dry_run=True, cache=cache)
+        runner.run()
+        raw_file = runner.save_results(str(tmp_path / "sessions")) / "conversation_raw_claude.json"
+
+        raw = json.loads(raw_file.read_text(encoding="utf-8"))
+        assistant = next(t for t in raw["turns"] if t["role"] == "assistant" and t["number"] == 2)
+        assistant["content"] += "\n🔴 CHECKPOINT: CP_RESEARCH_DIRECTION\n[A] Go (T=0.50)"
+        raw_file.write_text(json.dumps(raw, ensure_ascii=False), encoding="utf-8")
+        misses = cache.misses
+
+        rescored = CLITestRunner("META-002", dry_run=True, cache=cache).rescore(raw_file)
+
+        # One changed turn-2 response: checkpoints, agents and VS options
+        assert cache.misses - misses == 3
+        assert "CP_RESEARCH_DIRECTION" in rescored.turns[3].checkpoints_detected
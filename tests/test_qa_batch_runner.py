@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for QA Batch Runner
+==========================
+
+Validates parallel multi-scenario execution:
+- `--scenarios` values resolve to runnable protocol IDs
+- Scenarios run concurrently in isolated working directories
+- Isolated working directories still expose the plugin and skill config
+- Aggregate summary and exit codes reflect per-scenario outcomes
+- A broken scenario does not abort the rest of the batch
+
+Usage:
+    pytest tests/test_qa_batch_runner.py -v
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from qa.runners.batch_runner import (
+    BatchReport,
+    BatchRunner,
+    ScenarioOutcome,
+    discover_scenarios,
+    link_project_config,
+    resolve_scenarios,
+)
+from qa.runners.cli_test_runner import CLITestRunner
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+class TestScenarioResolution:
+    """Tests for --scenarios expansion."""
+
+    def test_all_contains_only_runnable_protocols(self):
+        scenario_ids = discover_scenarios()
+        assert "QUAL-002" in scenario_ids
+        # v1 protocols use `user_input` and cannot be driven by the CLI runner
+        assert "QUAL-001" not in scenario_ids
+
+    def test_all_ids_load(self):
+        for scenario_id in resolve_scenarios("all"):
+            assert CLITestRunner(scenario_id, dry_run=True).protocol
+
+    def test_comma_list_is_normalized_and_deduplicated(self):
+        assert resolve_scenarios(" qual-002, META-002,QUAL-002 ") == ["QUAL-002", "META-002"]
+
+
+class TestBatchRunner:
+    """Tests for parallel execution in dry-run mode."""
+
+    def test_parallel_dry_run(self, tmp_path):
+        workspace = tmp_path / "ws"
+        batch = BatchRunner(
+            ["QUAL-002", "META-002", "QUANT-001"],
+            jobs=3,
+            output_dir=str(tmp_path / "out"),
+            dry_run=True,
+            workspace=str(workspace),
+        )
+        report = batch.run()
+
+        assert [o.scenario_id for o in report.outcomes] == ["QUAL-002", "META-002", "QUANT-001"]
+        assert all(o.session_status == "completed" for o in report.outcomes)
+        # Every scenario gets its own session
+        assert len({o.session_id for o in report.outcomes}) == 3
+        # Workspaces are cleaned up by default
+        assert list(workspace.iterdir()) == []
+
+        summary = yaml.safe_load(batch.save_report(report).read_text(encoding="utf-8"))
+        assert summary["summary"]["total"] == 3
+        assert summary["batch"]["jobs"] == 3
+        turns = sum(o.total_turns for o in report.outcomes)
+        assert summary["timing"]["by_cli_tool"]["claude"]["total_seconds"]["count"] == turns
+        assert "turn_timings" not in summary["scenarios"][0]
+        assert summary["scenarios"][0]["timing"]["turns"] == report.outcomes[0].total_turns
+        for outcome in report.outcomes:
+            assert Path(outcome.result_path).is_dir()
+
+    def test_workdir_is_isolated(self, tmp_path, monkeypatch):
+        seen = []
+        original = CLITestRunner.__init__
+
+        def spy(self, *args, **kwargs):
+            original(self, *args, **kwargs)
+            seen.append(self.workdir)
+
+        monkeypatch.setattr(CLITestRunner, "__init__", spy)
+        batch = BatchRunner(
+            ["QUAL-002", "META-002"],
+            jobs=2,
+            output_dir=str(tmp_path / "out"),
+            dry_run=True,
+            workspace=str(tmp_path / "ws"),
+            keep_workspaces=True,
+        )
+        batch.run()
+
+        assert len(set(seen)) == 2
+        assert all(path.parent == tmp_path / "ws" and path.is_dir() for path in seen)
+
+    def test_workdir_exposes_project_config(self, tmp_path):
+        batch = BatchRunner(["QUAL-002"], output_dir=str(tmp_path / "out"), workspace=str(tmp_path / "ws"))
+        workdir = batch._make_workdir("QUAL-002")
+
+        assert (workdir / ".claude-plugin" / "plugin.json").is_file()
+        assert (workdir / ".codex" / "skills").is_dir()
+        assert (workdir / ".opencode").is_dir()
+        assert sorted(p.name for p in (workdir / "skills").iterdir()) == sorted(
+            p.name for p in (BASE_DIR / "skills").iterdir()
+        )
+
+        batch._cleanup(workdir)
+        assert not workdir.exists()
+        assert (BASE_DIR / ".claude-plugin" / "plugin.json").is_file()  # Only the links were removed
+
+    def test_link_project_config_skips_missing(self, tmp_path):
+        repo = tmp_path / "repo"
+        (repo / "skills" / "research").mkdir(parents=True)
+        (repo / "CLAUDE.md").write_text("# project", encoding="utf-8")
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+
+        assert link_project_config(repo, workdir) == ["skills", "CLAUDE.md"]
+        assert (workdir / "skills" / "research").is_dir()
+        assert (workdir / "CLAUDE.md").read_text(encoding="utf-8") == "# project"
+
+    def test_asyncio_backend(self, tmp_path):
+        batch = BatchRunner(
+            ["QUAL-002", "META-002"],
+            jobs=2,
+            output_dir=str(tmp_path),
+            dry_run=True,
+            backend="asyncio",
+        )
+        report = batch.run()
+
+        assert report.backend == "asyncio"
+        assert all(o.session_status == "completed" for o in report.outcomes)
+
+    def test_missing_scenario_is_isolated_failure(self, tmp_path):
+        workspace = tmp_path / "ws"
+        batch = BatchRunner(
+            ["QUAL-002", "NOPE-999"],
+            jobs=2,
+            output_dir=str(tmp_path),
+            dry_run=True,
+            workspace=str(workspace),
+        )
+        report = batch.run()
+        assert list(workspace.iterdir()) == []
+
+        failed = report.outcomes[1]
+        assert failed.status == "FAILED"
+        assert "Protocol not found" in failed.error
+        assert report.outcomes[0].session_status == "completed"
+        assert report.exit_code == 2
+
+    def test_invalid_jobs_rejected(self):
+        with pytest.raises(ValueError):
+            BatchRunner(["QUAL-002"], jobs=0)
+
+
+class TestBatchReport:
+    """Tests for aggregate exit codes."""
+
+    @pytest.mark.parametrize(
+        "statuses,expected",
+        [
+            (["PASSED", "PASSED"], 0),
+            (["PASSED", "LOW_COMPLIANCE"], 1),
+            (["LOW_COMPLIANCE", "FAILED"], 2),
+        ],
+    )
+    def test_exit_code(self, statuses, expected):
+        report = BatchReport(cli_tool="claude", jobs=2, dry_run=True, start_time="")
+        report.outcomes = [
+            ScenarioOutcome(scenario_id=f"S-{i}", cli_tool="claude", status=s)
+            for i, s in enumerate(statuses)
+        ]
+        assert report.exit_code == expected
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for CLI Cassettes
+========================
+
+Validates record/replay of CLI calls:
+- Record mode stores stdout/stderr/exit code/latency per (tool, turn, message)
+- Replay serves recorded calls without running any subprocess
+- Replayed sessions match the recorded session on both backends
+- Recorded failures and missing interactions surface as errors
+
+Usage:
+    pytest tests/test_qa_cassette.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from qa.runners.batch_runner import BatchRunner
+from qa.runners.cassette import Cassette, CassetteMissError, Interaction
+from qa.runners.cli_test_runner import CLITestRunner
+
+# Echoes the message after a checkpoint block so each turn's response differs
+FAKE_CLI = textwrap.dedent(
+    """
+    import sys
+    print("🔴 CHECKPOINT: CP_RESEARCH_DIRECTION")
+    print("[A] Direct (T=0.60)")
+    print("Echo: " + sys.argv[1])
+    """
+)
+
+
+def _fake_command(message, is_first):
+    return [sys.executable, "-c", FAKE_CLI, message]
+
+
+def _record(tmp_path, scenario="META-002"):
+    cassette = Cassette.for_scenario(tmp_path / "cassettes", scenario, "claude", "record")
+    runner = CLITestRunner(scenario, cassette=cassette)
+    runner._build_command = _fake_command
+    return runner.run(), cassette
+
+
+def _no_subprocess(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("replay must not run the CLI")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fail)
+
+
+class TestRecord:
+    """Record mode writes every CLI call."""
+
+    def test_cassette_contents(self, tmp_path):
+        session, cassette = _record(tmp_path)
+
+        assert session.status == "completed"
+        data = json.loads(cassette.path.read_text(encoding="utf-8"))
+        user_turns = [t for t in session.turns if t.role == "user"]
+        assert len(data["interactions"]) == len(user_turns)
+
+        first = data["interactions"][0]
+        assert first["cli_tool"] == "claude"
+        assert first["message"] == user_turns[0].content
+        assert first["returncode"] == 0
+        assert first["stdout"].endswith(user_turns[0].content + "\n")
+        assert first["latency_seconds"] >= 0
+
+    def test_record_failure(self, tmp_path):
+        cassette = Cassette(tmp_path / "fail.cassette.json", "record")
+        runner = CLITestRunner("META-002", cassette=cassette)
+        runner._build_command = lambda m, f: [sys.executable, "-c", "import sys; sys.stderr.write('nope'); sys.exit(5)"]
+
+        session = runner.run()
+
+        assert session.status == "failed"
+        assert cassette.interactions[0].returncode == 5
+        assert cassette.interactions[0].stderr == "nope"
+
+
+class TestReplay:
+    """Replay mode serves recorded calls instantly."""
+
+    def test_replay_matches_recording(self, tmp_path, monkeypatch):
+        recorded, _ = _record(tmp_path)
+        _no_subprocess(monkeypatch)
+
+        cassette = Cassette.for_scenario(tmp_path / "cassettes", "META-002", "claude", "replay")
+        replayed = CLITestRunner("META-002", cassette=cassette).run()
+
+        assert replayed.status == "completed"
+        assert [t.content for t in replayed.turns] == [t.content for t in recorded.turns]
+        assert replayed.checkpoints and len(replayed.checkpoints) == len(recorded.checkpoints)
+        assert replayed.validation_results["checkpoints"] == recorded.validation_results["checkpoints"]
+        timing = replayed.turns[1].timing
+        assert timing.backend == "replay"
+        assert timing.total_seconds == recorded.turns[1].timing.total_seconds
+
+    def test_replay_async_backend(self, tmp_path, monkeypatch):
+        recorded, _ = _record(tmp_path)
+        _no_subprocess(monkeypatch)
+
+        cassette = Cassette.for_scenario(tmp_path / "cassettes", "META-002", "claude", "replay")
+        partials = []
+        replayed = asyncio.run(
+            CLITestRunner("META-002", cassette=cassette).run_async(on_partial=lambda t, cps: partials.append(cps))
+        )
+
+        assert [t.content for t in replayed.turns] == [t.content for t in recorded.turns]
+        assert "CP_RESEARCH_DIRECTION" in replayed.turns[1].timing.checkpoint_first_seen
+        assert len(partials) == len([t for t in recorded.turns if t.role == "assistant"])
+
+    def test_replay_recorded_error(self, tmp_path):
+        path = tmp_path / "err.cassette.json"
+        recorder = Cassette(path, "record")
+        recorder.record(Interaction("claude", 1, "hi", "", "rate limited", 1, 0.2))
+        recorder.record(Interaction("claude", 2, "again", "", "", -1, 300.0, timed_out=True))
+
+        runner = CLITestRunner("META-002", cassette=Cassette(path, "replay"))
+        runner._turn_count = 1
+        with pytest.raises(RuntimeError, match="non-zero: 1\nStderr: rate limited"):
+            runner._execute_cli("hi")
+        runner._turn_count = 2
+        with pytest.raises(TimeoutError):
+            runner._execute_cli("again")
+
+    def test_replay_miss(self, tmp_path):
+        path = tmp_path / "miss.cassette.json"
+        Cassette(path, "record").save()
+
+        runner = CLITestRunner("META-002", cassette=Cassette(path, "replay"))
+        with pytest.raises(CassetteMissError, match="turn 0"):
+            runner._execute_cli("never recorded")
+
+        session = CLITestRunner("META-002", cassette=Cassette(path, "replay")).run()
+        assert session.status == "failed"
+        assert "No recorded claude interaction" in session.error
+
+    def test_missing_cassette_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            Cassette(tmp_path / "absent.cassette.json", "replay")
+
+    def test_batch_replay(self, tmp_path, monkeypatch):
+        _record(tmp_path, "META-002")
+        _record(tmp_path, "QUAL-002")
+        _no_subprocess(monkeypatch)
+
+        batch = BatchRunner(
+            ["META-002", "QUAL-002"], jobs=2, output_dir=str(tmp_path / "out"),
+            cassette_dir=str(tmp_path / "cassettes"), cassette_mode="replay"
+        )
+        report = batch.run()
+
+        assert [o.session_status for o in report.outcomes] == ["completed", "completed"]
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Tests for CLI Test Runner
+==========================
+
+Validates CLITestRunner execution backends:
+- The asyncio backend streams stdout and records TTFB / total latency
+- Detectors run on partial output while a response is still streaming, scanning only new lines
+- The complete response is analyzed once per turn
+- Timeouts, non-zero exits and missing executables surface as before
+- Blocking and asyncio backends produce the same session in dry-run mode
+- Single-pass checkpoint detection matches the v3.2.2 reference exactly
+- Per-turn timing fields and p50/p95/p99 aggregates in result YAML
+- Slotted turn records serialize as `asdict` would
+
+Usage:
+    pytest tests/test_qa_cli_test_runner.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import sys
+import textwrap
+from dataclasses import asdict
+
+import pytest
+import yaml
+
+from qa.benchmarks.checkpoint_detection import (
+    legacy_detect_checkpoints,
+    legacy_normalize_checkpoint_name,
+)
+from qa.benchmarks.corpus import load_session_corpus
+from qa import detectors
+from qa.detectors import analysis, checkpoints
+from qa.runners.cli_test_runner import CLITestRunner, PartialCheckpointScan, Turn, TurnTiming, latency_stats
+from qa.runners.json_codec import JSONCodec, available_backends
+
+# Emits a checkpoint line, pauses, then finishes; Korean text is split
+# across writes to exercise incremental UTF-8 decoding.
+STREAMING_SCRIPT = textwrap.dedent(
+    """
+    import sys, time
+    out = sys.stdout.buffer
+    out.write("🔴 CHECKPOINT: CP_RESEARCH_DIRECTION\\n".encode()); out.flush()
+    time.sleep(0.3)
+    data = "연구 방향을 선택해 주세요\\n".encode()
+    out.write(data[:4]); out.flush()
+    time.sleep(0.05)
+    out.write(data[4:]); out.flush()
+    out.write(b"[A] Option (T=0.50)\\n"); out.flush()
+    """
+)
+
+
+def _runner_with_command(monkeypatch, argv, timeout=30) -> CLITestRunner:
+    runner = CLITestRunner("QUAL-002", timeout=timeout)
+    monkeypatch.setattr(runner, "_build_command", lambda message, is_first: argv)
+    return runner
+
+
+class TestAsyncioBackend:
+    """Tests for streaming execution via asyncio subprocesses."""
+
+    def test_streams_and_records_timing(self, monkeypatch):
+        runner = _runner_with_command(monkeypatch, [sys.executable, "-c", STREAMING_SCRIPT])
+        partials = []
+
+        response = asyncio.run(
+            runner._execute_cli_async("hi", on_partial=lambda text, cps: partials.append((text, cps)))
+        )
+
+        assert "연구 방향을 선택해 주세요" in response
+        timing = runner._last_timing
+        assert timing.backend == "asyncio"
+        assert 0 <= timing.ttfb_seconds < timing.total_seconds
+        # Checkpoint was visible before the response finished
+        assert timing.checkpoint_first_seen["CP_RESEARCH_DIRECTION"] < timing.total_seconds
+        assert len(partials) >= 2
+        assert any(cp["id"] == "CP_RESEARCH_DIRECTION" for cp in partials[0][1])
+        assert runner._is_first_turn is False
+
+    def test_timeout(self, monkeypatch):
+        runner = _runner_with_command(
+            monkeypatch, [sys.executable, "-c", "import time; time.sleep(5)"], timeout=1
+        )
+        with pytest.raises(TimeoutError, match="timed out after 1s"):
+            asyncio.run(runner._execute_cli_async("hi"))
+
+    def test_non_zero_exit(self, monkeypatch):
+        runner = _runner_with_command(
+            monkeypatch, [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+        )
+        with pytest.raises(RuntimeError, match="non-zero: 3"):
+            asyncio.run(runner._execute_cli_async("hi"))
+
+    def test_missing_executable(self, monkeypatch):
+        runner = _runner_with_command(monkeypatch, ["definitely-not-a-cli-tool"])
+        with pytest.raises(RuntimeError, match="not found"):
+            asyncio.run(runner._execute_cli_async("hi"))
+
+    def test_timeout_after_process_exited(self, monkeypatch):
+        """A process that exits as the timeout fires must still raise TimeoutError."""
+
+        class SilentStream:
+            async def read(self, n=-1):
+                await asyncio.sleep(10)
+
+        class ExitedProcess:
+            stdout = stderr = SilentStream()
+
+            def kill(self):
+                raise ProcessLookupError()
+
+            async def wait(self):
+                return 0
+
+        async def fake_exec(*args, **kwargs):
+            return ExitedProcess()
+
+        runner = _runner_with_command(monkeypatch, ["ignored"], timeout=0.1)
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+        with pytest.raises(TimeoutError, match="timed out"):
+            asyncio.run(runner._execute_cli_async("hi"))
+
+    def test_many_conversations_on_one_loop(self, monkeypatch):
+        runners = [
+            _runner_with_command(monkeypatch, [sys.executable, "-c", STREAMING_SCRIPT])
+            for _ in range(4)
+        ]
+
+        async def drive():
+            return await asyncio.gather(*(r._execute_cli_async("hi") for r in runners))
+
+        responses = asyncio.run(drive())
+        assert len(responses) == 4
+        assert len({r.session_id for r in runners}) == 4
+
+
+class TestPartialScan:
+    """Streaming detection scans each new line a bounded number of times."""
+
+    def _feed(self, scan, text, size):
+        return [scan.feed(text[i:i + size]) for i in range(0, len(text), size)]
+
+    def test_matches_full_detection(self):
+        text = "Intro line\n" * 200 + "🔴 CHECKPOINT: CP_RESEARCH_DIRECTION\n" + "Body\n" * 200
+        text += "🟠 CHECKPOINT: CP_THEORY_SELECTION\n[A] One (T=0.6)\n[B] Two (T=0.3)\n"
+        scan = PartialCheckpointScan()
+        self._feed(scan, text, 97)
+        full = detectors.detect_checkpoints(text)
+        assert list(scan.detected) == [cp["id"] for cp in full]
+        assert scan.detected == {cp["id"]: cp for cp in full}
+
+    def test_waits_for_line_end(self):
+        scan = PartialCheckpointScan()
+        assert scan.feed("🔴 CHECKPOINT: CP_RESEARCH") is False
+        assert scan.detected == {}
+        assert scan.feed("_DIRECTION\n") is True
+        assert list(scan.detected) == ["CP_RESEARCH_DIRECTION"]
+
+    def test_confidence_upgraded_by_later_options(self):
+        scan = PartialCheckpointScan()
+        scan.feed("🔴 CHECKPOINT: CP_RESEARCH_DIRECTION\n")
+        assert scan.detected["CP_RESEARCH_DIRECTION"]["confidence"] == "MEDIUM"
+        scan.feed("Which one?\n[A] Overall (T=0.6)\n")
+        assert scan.detected["CP_RESEARCH_DIRECTION"]["confidence"] == "HIGH"
+
+    def test_scanned_text_is_linear(self, monkeypatch):
+        scanned = []
+        original = detectors.detect_checkpoints
+        monkeypatch.setattr(detectors, "detect_checkpoints", lambda text: scanned.append(len(text)) or original(text))
+
+        text = "".join(f"Line {i} of a long streamed answer.\n" for i in range(5000))
+        scan = PartialCheckpointScan()
+        self._feed(scan, text, 64)
+        assert sum(scanned) < len(text) * (1 + PartialCheckpointScan.OVERLAP / 64)
+        assert max(scanned) < PartialCheckpointScan.OVERLAP + 2 * 64  # Overlap, carried partial line, new chunk
+
+    def test_complete_response_analyzed_once(self, monkeypatch):
+        calls = []
+        original = checkpoints.detect_checkpoints
+        monkeypatch.setattr(checkpoints, "detect_checkpoints", lambda text: calls.append(text) or original(text))
+        analysis._memoized.cache_clear()  # Earlier tests stream the same response
+
+        runner = _runner_with_command(monkeypatch, [sys.executable, "-c", STREAMING_SCRIPT])
+        partials = []
+        response = asyncio.run(runner._execute_cli_async("hi", on_partial=lambda text, cps: partials.append(cps)))
+        runner._record_assistant_turn(1, response, {})
+
+        assert calls.count(response) == 1
+        assert [cp["id"] for cp in partials[-1]] == runner.session.turns[-1].checkpoints_detected == [
+            "CP_RESEARCH_DIRECTION"
+        ]
+
+
+class TestBackendParity:
+    """Both backends must record identical analysis for the same responses."""
+
+    def test_dry_run_sessions_match(self):
+        sync_session = CLITestRunner("META-002", dry_run=True).run()
+        async_session = asyncio.run(CLITestRunner("META-002", dry_run=True).run_async())
+
+        assert sync_session.status == async_session.status == "completed"
+        assert sync_session.checkpoints and len(sync_session.checkpoints) == len(async_session.checkpoints)
+        assert [t.checkpoints_detected for t in sync_session.turns] == [
+            t.checkpoints_detected for t in async_session.turns
+        ]
+        assert sync_session.validation_results["checkpoints"] == async_session.validation_results["checkpoints"]
+
+        timing = async_session.turns[1].timing
+        assert timing.backend == "asyncio"
+        assert sync_session.turns[1].timing.backend == "subprocess"
+
+
+class TestCheckpointDetectionEquivalence:
+    """Single-pass detection must match the v3.2.2 multi-pass reference exactly."""
+
+    FRAGMENTS = [
+        "🔴 CHECKPOINT: CP_RESEARCH_DIRECTION", "🟠 체크포인트: CP_THEORY_SELECTION",
+        "## 🟡 CP_ANALYSIS_PLAN (확인)", "# ## 🔴 CP_GATE_2", "**CHECKPOINT**: **CP_META_TIER3_REVIEW**",
+        "checkpoint: cp_lower_case", "CHECKPOINT: META_GATE", "**CP_BOLD_ONE**", "***CP_X***",
+        "🔴 CHECKPOINT: Effect Size Target Selection\n", "🟠 CHECKPOINT: 연구 방향\n",
+        "🟡 CHECKPOINT: Something Unmapped Here**", "checkpoint for METHODOLOGY", "체크포인트 THEORY_X",
+        "[A] Option A (T=0.50)", "[Y]", "옵션 B", "Option   C", " ", "\n", "#", "*", "**", "CP_",
+        "🔴", "text ", "(note)", "Research Direction approval", "K", "K",
+    ]
+
+    def _assert_same(self, runner, text):
+        assert runner._detect_checkpoints(text) == legacy_detect_checkpoints(text, runner.CHECKPOINT_ALIASES)
+
+    def test_recorded_sessions(self):
+        runner = CLITestRunner("QUAL-002", dry_run=True)
+        texts = load_session_corpus()
+        assert texts
+        for text in texts:
+            self._assert_same(runner, text)
+
+    def test_randomized_fragments(self):
+        rng = random.Random(20260130)
+        runner = CLITestRunner("QUAL-002", dry_run=True)
+        for _ in range(2000):
+            text = "".join(rng.choice(self.FRAGMENTS) for _ in range(rng.randint(1, 12)))
+            self._assert_same(runner, text)
+
+    @pytest.mark.parametrize(
+        "name",
+        ["Effect Size Target Selection", "research direction", "Final  Review Stage", "연구 방향 확인", "Unknown Thing", "cp_custom"],
+    )
+    def test_alias_normalization(self, name):
+        runner = CLITestRunner("QUAL-002", dry_run=True)
+        assert runner._normalize_checkpoint_name(name) == legacy_normalize_checkpoint_name(
+            name, runner.CHECKPOINT_ALIASES
+        )
+
+
+class TestTurnTiming:
+    """First-class per-turn timing and session aggregates."""
+
+    def test_latency_stats(self):
+        stats = latency_stats([float(v) for v in range(1, 101)] + [None])
+        assert stats["count"] == 100
+        assert (stats["p50"], stats["p95"], stats["p99"], stats["max"]) == (50.5, 95.05, 99.01, 100.0)
+        assert latency_stats([]) == {"count": 0}
+        assert latency_stats([2.0])["p99"] == 2.0
+
+    def test_asyncio_turn_fields(self, monkeypatch):
+        runner = _runner_with_command(monkeypatch, [sys.executable, "-c", STREAMING_SCRIPT])
+        response = asyncio.run(runner._execute_cli_async("hi"))
+        runner._record_assistant_turn(1, response, {})
+
+        timing = runner.session.turns[-1].timing
+        assert timing.started_at and timing.spawn_seconds >= 0
+        assert timing.spawn_seconds <= timing.ttfb_seconds < timing.total_seconds
+        assert timing.response_chars == len(response)
+        assert timing.response_bytes == len(response.encode("utf-8")) > timing.response_chars
+        assert timing.chars_per_second == round(len(response) / timing.total_seconds, 1)
+
+    def test_result_yaml_aggregates(self, tmp_path):
+        runner = CLITestRunner("META-002", dry_run=True)
+        runner.run()
+        result_path = runner.save_results(str(tmp_path))
+
+        result = yaml.safe_load((result_path / "META-002_test_result_claude.yaml").read_text(encoding="utf-8"))
+        timing = result["timing"]
+        assert timing["cli_tool"] == "claude"
+        assert timing["turns"] == timing["total_seconds"]["count"] == result["metrics"]["total_turns"]
+        assert set(timing["total_seconds"]) == {"count", "mean", "p50", "p95", "p99", "max"}
+
+        raw = (result_path / "conversation_raw_claude.json").read_text(encoding="utf-8")
+        assert '"timing": {' in raw and '"response_bytes"' in raw
+
+    def test_huddle_uses_turn_latency(self):
+        runner = CLITestRunner("META-002", dry_run=True)
+        assistant = [
+            Turn(number=i, role="assistant", content="x", timestamp="not-a-timestamp",
+                 timing=TurnTiming(backend="subprocess", total_seconds=seconds))
+            for i, seconds in enumerate([1.5, 2.5, 4.0])
+        ]
+        assert runner._response_intervals(assistant) == [1.5, 2.5, 4.0]
+
+        # Sessions saved before timing existed fall back to timestamp intervals
+        untimed = [
+            Turn(number=1, role="assistant", content="x", timestamp="2026-01-01T00:00:00"),
+            Turn(number=2, role="assistant", content="x", timestamp="2026-01-01T00:00:03"),
+        ]
+        assert runner._response_intervals(untimed) == [3.0]
+
+    def test_rescore_keeps_recorded_timing(self, tmp_path):
+        runner = CLITestRunner("META-002", dry_run=True)
+        session = runner.run()
+        raw_file = runner.save_results(str(tmp_path)) / "conversation_raw_claude.json"
+
+        rescored = CLITestRunner("META-002", dry_run=True).rescore(raw_file)
+        assert [t.timing for t in rescored.turns] == [t.timing for t in session.turns]
+
+
+class TestTurnRecords:
+    """Turns are slotted records that serialize without asdict."""
+
+    def test_slotted_and_interned(self):
+        role = "".join(["assis", "tant"])
+        turn = Turn(number=1, role=role, content="x", timestamp="t", checkpoints_detected=["".join(["CP_", "A"])])
+        assert not hasattr(turn, "__dict__") and not hasattr(TurnTiming(backend="replay"), "__dict__")
+        assert turn.role is sys.intern("assistant")
+        assert turn.checkpoints_detected[0] is sys.intern("CP_A")
+        assert turn["role"] == "assistant" and turn.get("missing") is None
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_serialization_matches_asdict(self, backend):
+        runner = CLITestRunner("META-002", dry_run=True)
+        turns = runner.run().turns
+        assert any(t.timing for t in turns)
+        assert [t.to_dict() for t in turns] == [asdict(t) for t in turns]
+        assert JSONCodec(backend).dumps({"turns": turns}) == json.dumps(
+            {"turns": [asdict(t) for t in turns]}, indent=2, ensure_ascii=False
+        )
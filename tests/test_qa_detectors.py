@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Tests for the Shared Detector Library
+======================================
+
+Validates:
+- analyze() facts: checkpoints, agents, halt/wait/auto-proceed, VS options
+- With memo=True, one Analysis per recent response text, each detector run at most once
+- The memo is opt-in, bounded, and unused by extraction
+- Every runner reads responses through analyze() and reports the same facts
+- PatternTable scans agree with per-pattern re.search / re.finditer
+
+Usage:
+    pytest tests/test_qa_detectors.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+from qa import detectors
+from qa.benchmarks.corpus import load_session_corpus
+from qa.benchmarks.validator_patterns import agrees_with_reference, legacy_scan
+from qa.detectors import Analysis, analyze
+from qa.detectors import analysis as analysis_module, checkpoints
+from qa.detectors.table import PatternTable, lowercase_pattern
+from qa.runners.automated_test import AutomatedTestSimulator
+from qa.runners.checkpoint_validator import CheckpointValidator
+from qa.runners.cli_test_runner import CLITestRunner
+from qa.runners.conversation_simulator import ConversationSimulator
+from qa.runners.extract_conversation import ConversationExtractor
+
+CHECKPOINT_RESPONSE = """🔴 CHECKPOINT: CP_RESEARCH_DIRECTION
+
+Task(subagent_type="diverga:c5", description="meta-analysis")
+
+[A] Overall effect (T=0.75) ⭐ recommended
+[B] Subgroup effects (T=0.45)
+[C] Multi-level model (T=0.15)
+
+Which direction would you like to take?"""
+
+AUTO_PROCEED_RESPONSE = "Research direction noted. I'll proceed with the overall effect analysis now."
+
+
+class TestAnalysis:
+    """Facts reported by analyze()."""
+
+    def test_checkpoint_response(self):
+        analysis = analyze(CHECKPOINT_RESPONSE)
+        assert analysis.checkpoint_ids == ["CP_RESEARCH_DIRECTION"]
+        assert analysis.checkpoints[0]["confidence"] == "HIGH"
+        assert analysis.checkpoint == "CP_RESEARCH_DIRECTION"
+        assert analysis.agent_ids == ["C5"]
+        assert [o["option"] for o in analysis.vs_options] == ["A", "B", "C"]
+        assert analysis.options_count == 3
+        assert analysis.vs_summary["modal_recommended"]
+        assert analysis.halt and analysis.wait and not analysis.auto_proceed
+        assert analysis.skill["loaded"]
+
+    def test_auto_proceed_response(self):
+        analysis = analyze(AUTO_PROCEED_RESPONSE)
+        assert analysis.auto_proceed
+        assert not analysis.halt and not analysis.wait
+        assert analysis.checkpoint_ids == []
+        assert analysis.mentions_checkpoint("CP_RESEARCH_DIRECTION")  # By topic keywords
+        assert not analysis.mentions_checkpoint("CP_THEORY_SELECTION")
+
+    def test_question_mid_text_then_auto_proceed_is_not_a_halt(self):
+        response = "Why does this matter?\nI'll proceed with the systematic review design now."
+        analysis = analyze(response)
+        assert not analysis.halt and analysis.auto_proceed
+        assert not CheckpointValidator().scan(response).halt
+        assert analyze("Which design fits your question?\n").halt  # Trailing question still halts
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Please review CP_SCOPE_DECISION first.", "CP_SCOPE_DECISION"),
+        ("CHECKPOINT: theory pending", "CP_THEORY"),
+        ("No checkpoint for now", None),
+    ])
+    def test_checkpoint_fallbacks(self, text, expected):
+        assert analyze(text).checkpoint == expected
+
+    def test_checkpoint_level(self):
+        assert detectors.checkpoint_level("CP_METHODOLOGY_APPROVAL") == "RED"
+        assert detectors.checkpoint_level("cp_scope_decision") == "ORANGE"
+        assert detectors.checkpoint_level("CP_UNLISTED") == "UNKNOWN"
+
+    def test_options_count_uses_distinct_letters(self):
+        assert analyze("[A] one\n[B] two\n[C] three").options_count == 3
+        assert analyze("Option A or Option B, or [A] again").options_count == 2
+
+    def test_invalid_agents_are_ignored(self):
+        assert analyze("Task(subagent_type='diverga:b5') then A1-ResearchQuestionRefiner").agents == [
+            {"id": "A1", "confidence": "LOW", "context": "text mention"},
+        ]
+
+
+class TestMemo:
+    """Recent responses analyzed with memo=True are analyzed once."""
+
+    def test_same_text_same_analysis(self):
+        text = CHECKPOINT_RESPONSE + "\n(memo)"
+        assert analyze(text, memo=True) is analyze(text, memo=True)
+        assert isinstance(analyze(text, memo=True), Analysis)
+
+    def test_memo_is_opt_in(self):
+        text = CHECKPOINT_RESPONSE + "\n(no memo)"
+        assert analyze(text) is not analyze(text)
+        assert analyze(text) is not analyze(text, memo=True)
+
+    def test_memo_is_bounded(self):
+        text = CHECKPOINT_RESPONSE + "\n(evicted)"
+        first = analyze(text, memo=True)
+        for i in range(analysis_module.ANALYSIS_MEMO_SIZE):
+            analyze(f"response {i}", memo=True)
+        assert analyze(text, memo=True) is not first
+        assert analysis_module._memoized.cache_info().currsize <= analysis_module.ANALYSIS_MEMO_SIZE
+
+    def test_extraction_bypasses_memo(self, tmp_path):
+        session = tmp_path / "session.jsonl"
+        session.write_text(
+            json.dumps({"type": "user", "content": "Start"}) + "\n"
+            + json.dumps({"type": "assistant", "content": CHECKPOINT_RESPONSE + "\n(extracted)"}) + "\n",
+            encoding="utf-8",
+        )
+        analysis_module._memoized.cache_clear()
+        result = ConversationExtractor(str(session)).extract()
+        assert result.checkpoints[0]["id"] == "CP_RESEARCH_DIRECTION"
+        assert analysis_module._memoized.cache_info().currsize == 0
+
+    def test_detectors_run_once(self, monkeypatch):
+        calls = []
+        original = checkpoints.detect_checkpoints
+
+        def counting(response):
+            calls.append(response)
+            return original(response)
+
+        monkeypatch.setattr(checkpoints, "detect_checkpoints", counting)
+        text = CHECKPOINT_RESPONSE + "\n(count)"
+        analysis = analyze(text, memo=True)
+        assert analysis.checkpoint == analysis.checkpoint_ids[0] == analysis.checkpoints[0]["id"]
+        assert analyze(text, memo=True).mentions_checkpoint("CP_RESEARCH_DIRECTION")
+        assert calls == [text]
+
+    def test_version_covers_every_pattern_set(self):
+        assert set(detectors.PATTERN_VERSIONS) == {"checkpoints", "agents", "behavior", "vs", "skill"}
+        assert CLITestRunner.DETECTOR_VERSION == detectors.DETECTOR_VERSION
+
+
+class TestRunnersAgree:
+    """All runners report the facts analyze() reports."""
+
+    def test_cli_test_runner(self):
+        runner = CLITestRunner("META-002", dry_run=True)
+        runner._turn_count = 1
+        runner._record_assistant_turn(1, CHECKPOINT_RESPONSE, {})
+        turn = runner.session.turns[-1]
+        assert turn.checkpoints_detected == analyze(CHECKPOINT_RESPONSE).checkpoint_ids
+        assert turn.agents_detected == ["C5"]
+        assert turn.metadata["skill_check"] == analyze(CHECKPOINT_RESPONSE).skill
+
+    def test_checkpoint_validator(self):
+        validator = CheckpointValidator()
+        result = validator.validate(CHECKPOINT_RESPONSE, "CP_RESEARCH_DIRECTION")
+        assert result.checkpoint_triggered and result.halt_verified and result.wait_behavior_detected
+        assert result.alternatives_count == 3 and result.alternatives_presented
+        assert result.t_score_values == [0.15, 0.45, 0.75]
+        assert result.is_valid
+
+        result = validator.validate(AUTO_PROCEED_RESPONSE, "CP_RESEARCH_DIRECTION")
+        assert not result.is_valid
+        assert any(issue.startswith("AUTO_PROCEED_DETECTED") for issue in result.issues)
+
+    def test_conversation_simulator(self):
+        simulator = ConversationSimulator.from_scenario_id("QUAL-002")
+        assert simulator._detect_agent_in_response(CHECKPOINT_RESPONSE) == "diverga:c5"
+        assert simulator._detect_auto_proceed(AUTO_PROCEED_RESPONSE)
+        assert simulator._evaluate_vs_quality(CHECKPOINT_RESPONSE)["t_scores"] == [0.75, 0.45, 0.15]
+
+    def test_conversation_extractor(self, tmp_path):
+        session = tmp_path / "session.jsonl"
+        session.write_text('{"type": "user", "content": "Start"}\n', encoding="utf-8")
+        extractor = ConversationExtractor(str(session))
+        assert extractor._detect_checkpoint(CHECKPOINT_RESPONSE) == "CP_RESEARCH_DIRECTION"
+        assert extractor._verify_halt(CHECKPOINT_RESPONSE)
+        assert extractor._extract_vs_options(CHECKPOINT_RESPONSE) == (3, [0.75, 0.45, 0.15])
+
+    def test_automated_test_simulator(self):
+        simulator = AutomatedTestSimulator("QUAL-002")
+        assert simulator._detect_checkpoints(CHECKPOINT_RESPONSE, {}) == ["CP_RESEARCH_DIRECTION"]
+        assert simulator._detect_checkpoints("Noted.", {"checkpoint": "CP_SCOPE_DECISION"}) == ["CP_SCOPE_DECISION"]
+
+
+class TestPatternTable:
+    """One combined scan reports what each group's own search would."""
+
+    GROUPS = {
+        "question": [r"\?$", r"would.*you.*like"],
+        "t_score": r"(?:\[(?P<option>[A-Z])\][^\n\[]*?)?\bT\s*=\s*(?P<t_score>\d*\.\d+)",
+        "label": [r"\[([A-D])\]"],
+        "pair": [r"\[A\].*\[B\]"],
+        "nested": r"(?:foo|bar)?baz|\bqux",
+    }
+    TEXTS = [
+        "[A] First (T=0.7)\n[B] Second T=.3\nWould you like A?",
+        "WHICH one? [a] [b]\nno question here",
+        "İstanbul [C] T=0.25 would YOU like",
+        "xbarbaz quux qux",
+        "",
+    ]
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_scan_matches_per_group_search(self, text):
+        table = PatternTable(self.GROUPS, group_flags={"question": re.MULTILINE, "pair": re.DOTALL})
+        found = table.scan(text, collect=["t_score", "label"])
+        for name, pattern in table.patterns.items():
+            if name in ("t_score", "label"):
+                spans = [(m.span(), (m.group(1) or "").lower()) for m in found.get(name, [])]
+                assert spans == [(m.span(), (m.group(1) or "").lower()) for m in pattern.finditer(text)]
+            else:
+                first = pattern.search(text)
+                assert (found[name][0].span() if name in found else None) == (first.span() if first else None)
+
+    def test_first_is_highest_priority(self):
+        table = PatternTable({"label": [r"\[([A-D])\]"], "question": [r"\?"]})
+        assert table.first("why? [B]") == "label"
+        assert table.first("why?") == "question"
+        assert table.first("none") is None
+
+    def test_matching_in_priority_order(self):
+        table = PatternTable(self.GROUPS)
+        assert table.matching("qux then [B] and [A], T=.5") == ["t_score", "label", "nested"]
+
+    def test_lowercase_pattern_keeps_escapes_and_names(self):
+        assert lowercase_pattern(r"(?P<Opt>[A-Z])\S+\bWord") == r"(?P<Opt>[a-z])\S+\bword"
+
+
+class TestValidatorPatternTable:
+    """CheckpointValidator.scan against the per-pattern reference loop."""
+
+    def test_agrees_with_reference(self):
+        validator = CheckpointValidator()
+        texts = load_session_corpus()[:50] + [CHECKPOINT_RESPONSE, AUTO_PROCEED_RESPONSE, "İ (A) x (B) 옵션 A"]
+        for text in texts:
+            assert agrees_with_reference(validator.scan(text), legacy_scan(text))
+
+    def test_halt_reference_is_baseline_validator(self):
+        response = "Why does this matter?\nI'll proceed with the systematic review design now."
+        assert not legacy_scan(response).halt and not CheckpointValidator().scan(response).halt
+        assert legacy_scan("Please confirm the scope.").halt
+        # Added by the merged set: found by the validator, not by the baseline list
+        assert not legacy_scan("Which direction should we take").halt
+        assert CheckpointValidator().scan("Which direction should we take").halt
+        assert not agrees_with_reference(
+            CheckpointValidator().scan("Abstract"), legacy_scan("Please confirm the scope.")
+        )
+
+    def test_facts(self):
+        facts = CheckpointValidator().scan(CHECKPOINT_RESPONSE)
+        assert facts.checkpoint_topics == {"CP_RESEARCH_DIRECTION"}
+        assert facts.halt and facts.wait and not facts.auto_proceed
+        assert facts.options_count == 3 and facts.options_labeled
+        assert facts.t_scores == [0.15, 0.45, 0.75]
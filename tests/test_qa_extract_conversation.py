@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Tests for Conversation Extractor
+==================================
+
+Validates ConversationExtractor on synthetic Claude Code session logs:
+- stream() yields turns, checkpoints and agent invocations incrementally
+- Incremental metrics match the extract() result
+- extract_to_file() writes YAML/JSON identical to dumping extract()
+- Streaming memory stays flat as sessions grow
+- Batch mode extracts many sessions in parallel with per-file isolation and unique output names
+- The compiled user input classifier agrees with the per-pattern reference
+- Agent attribution agrees with the per-pattern reference without rescanning agents_invoked
+- Results share slotted turn records, written exactly as asdict() dumps them; lazy_content re-reads content
+
+Usage:
+    pytest tests/test_qa_extract_conversation.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import tracemalloc
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+import yaml
+
+from qa.benchmarks.agent_attribution import LegacyExtractor, write_session
+from qa.benchmarks.corpus import load_user_turns
+from qa.benchmarks.turn_records import LegacyExtractor as LegacyRecordExtractor
+from qa.benchmarks.turn_records import write_session as write_long_session
+from qa.benchmarks.user_input_classifier import legacy_classify_user_input, load_session_user_turns
+from qa.runners.extract_conversation import (
+    AgentInvocation,
+    Checkpoint,
+    ConversationExtractor,
+    Turn,
+    _output_names,
+    _write_result,
+    extract_batch,
+    resolve_session_paths,
+)
+
+
+def _session_entries(rounds: int = 3, filler: str = "") -> list[dict]:
+    """A session exercising checkpoints, selections, tool calls and tool results."""
+    entries = [{"type": "user", "content": "메타분석 연구를 시작하고 싶습니다. 효과크기를 어떻게 선택할까요?"}]
+    for i in range(rounds):
+        entries += [
+            {
+                "type": "assistant",
+                "content": f"🔴 CHECKPOINT: CP_RESEARCH_DIRECTION\n[A] Direct (T=0.6)\n[B] Broad (T=0.3)\nWhich direction would you like?{filler}",
+                "tool_calls": [{"id": f"t{i}", "name": "Task", "input": {"prompt": "diverga:C5 meta-analysis", "description": ""}}],
+            },
+            {"type": "user", "content": "Why is option B lower? How does it compare?"},
+            {"type": "assistant", "content": f"Because of heterogeneity. CHECKPOINT: theory pending{filler}"},
+            {"type": "tool_result", "tool_name": "Task", "content": "diverga:B3 effect size extraction done"},
+            {"type": "user", "content": "[A] I choose A, proceed"},
+            {"type": "assistant", "content": "Proceeding with the interview protocol.", "tool_calls": [{"name": "diverga:D2"}]},
+        ]
+    entries.append({"type": "assistant", "content": "🟠 CP_THEORY_SELECTION pending?"})
+    return entries
+
+
+def _write_session(path: Path, entries: list[dict]) -> Path:
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        f.write("{not json}\n\n")
+    return path
+
+
+@pytest.fixture
+def session_file(tmp_path) -> Path:
+    return _write_session(tmp_path / "session_abc.jsonl", _session_entries())
+
+
+class TestStream:
+    """stream() yields every record exactly once."""
+
+    def test_yields_all_records(self, session_file):
+        reference = ConversationExtractor(str(session_file)).extract()
+
+        extractor = ConversationExtractor(str(session_file))
+        records = list(extractor.stream())
+        turns = [r for r in records if isinstance(r, Turn)]
+        checkpoints = [r for r in records if isinstance(r, Checkpoint)]
+        agents = [r for r in records if isinstance(r, AgentInvocation)]
+
+        assert len(turns) == reference.total_turns
+        assert [t.turn_number for t in turns] == list(range(1, reference.total_turns + 1))
+        assert sorted(c.turn_triggered for c in checkpoints) == [c["turn_triggered"] for c in reference.checkpoints]
+        assert len(agents) == len(reference.agents_invoked)
+        # Turns are handed out, not retained
+        assert extractor.turns == []
+
+    def test_checkpoints_are_final_when_yielded(self, session_file):
+        statuses = {}
+        for record in ConversationExtractor(str(session_file)).stream():
+            if isinstance(record, Checkpoint):
+                statuses[record.turn_triggered] = record.status
+        assert "PASSED" in statuses.values()
+        assert list(statuses.values())[-1] == "INCOMPLETE"
+
+    def test_metrics_match_extract(self, session_file):
+        reference = ConversationExtractor(str(session_file)).extract()
+        extractor = ConversationExtractor(str(session_file))
+        for _ in extractor.stream():
+            pass
+        assert extractor._calculate_metrics() == reference.metrics
+        # Same figure as the original whole-list computation
+        agents = [a["agent"] for a in reference.agents_invoked]
+        assert reference.metrics["agent_transitions"] == len(
+            {agents[i] for i in range(1, len(agents)) if agents[i] != agents[i - 1]}
+        ) >= 1
+        assert reference.metrics["user_input_types"]["TECHNICAL_FOLLOW_UP"] == 3
+
+
+class TestUserInputClassifier:
+    """USER_TYPE_TABLE picks the first matching category in priority order."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Why is option B lower? How does it compare?", "TECHNICAL_FOLLOW_UP"),
+        ("But I'm worried about bias", "METHODOLOGICAL_CHALLENGE"),
+        ("[A] I choose A, proceed", "SELECTION"),
+        ("Yes, please continue", "APPROVAL"),
+        ("WHAT ABOUT a Bayesian model", "ALTERNATIVE_EXPLORATION"),
+        ("메타분석 연구를 시작하고 싶습니다", "STANDARD_RESPONSE"),
+    ])
+    def test_categories(self, text, expected):
+        assert ConversationExtractor("-")._classify_user_input(text) == expected
+
+    def test_agrees_with_reference(self, session_file):
+        extractor = ConversationExtractor("-")
+        texts = load_user_turns() + load_session_user_turns(str(session_file))
+        for text in texts:
+            assert extractor._classify_user_input(text) == legacy_classify_user_input(text)
+
+    def test_hit_counts(self, session_file):
+        extractor = ConversationExtractor(str(session_file))
+        extractor.extract()
+        hits = extractor.user_type_hits()
+        assert list(hits)[0] == "TECHNICAL_FOLLOW_UP" and list(hits)[-1] == "STANDARD_RESPONSE"
+        assert hits["TECHNICAL_FOLLOW_UP"] == 3 and hits["SCOPE_CHANGE"] == 0
+        assert sum(hits.values()) == extractor._calculate_metrics()["user_turns"]
+
+
+class TestAgentAttribution:
+    """AGENT_TABLE attribution and set-backed tool-result dedupe."""
+
+    @pytest.mark.parametrize("tool_call, expected", [
+        ({"name": "diverga:D2"}, "D2-InterviewFocusGroupSpecialist"),
+        ({"name": "Task", "input": {"prompt": "diverga:C5 meta-analysis", "description": ""}}, "C5-MetaAnalysisMaster"),
+        ({"name": "Task", "input": {"prompt": "Effect size extraction", "description": ""}}, "B3-EffectSizeExtractor"),
+        ({"name": "Glob", "input": {"prompt": "", "description": ""}}, None),
+    ])
+    def test_tool_call(self, tool_call, expected):
+        extractor = ConversationExtractor("-")
+        assert extractor._detect_agent_from_tool_call(tool_call) == expected
+        assert LegacyExtractor("-")._detect_agent_from_tool_call(tool_call) == expected
+
+    def test_matches_reference(self, session_file, tmp_path):
+        long_session = write_session(tmp_path / "long.jsonl", 300)
+        for path in (session_file, long_session):
+            ours = ConversationExtractor(str(path)).extract()
+            reference = LegacyExtractor(str(path)).extract()
+            assert ours.agents_invoked == reference.agents_invoked
+            assert [t["agent_invoked"] for t in ours.turns] == [t["agent_invoked"] for t in reference.turns]
+
+    def test_tool_results_do_not_scan_invocations(self, tmp_path):
+        class NoScanList(list):
+            def __iter__(self):
+                raise AssertionError("agents_invoked scanned")
+
+        extractor = ConversationExtractor(str(write_session(tmp_path / "session.jsonl", 2000)))
+        extractor.agents_invoked = NoScanList()
+        for entry in extractor._iter_entries():
+            extractor._process_entry(entry)
+        assert len(extractor.agents_invoked) > 1000
+        assert len({a.agent for a in list.__iter__(extractor.agents_invoked)}) == len(extractor._unique_agents)
+
+
+class TestExtractToFile:
+    """Streaming output is identical to the in-memory path."""
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return re.sub(r'(extracted_at"?:\s*["\']?)[0-9T:.\-]+', r"\1X", text)
+
+    @pytest.mark.parametrize("fmt", ["yaml", "json"])
+    def test_output_identical(self, tmp_path, fmt):
+        session = _write_session(tmp_path / "s.jsonl", _session_entries(rounds=4, filler=" ✓ " * 60))
+
+        (tmp_path / "legacy").mkdir()
+
+        legacy_path = _write_result(ConversationExtractor(str(session), "QUAL-002").extract(), tmp_path / "legacy", fmt)
+        streamed_path = tmp_path / "stream" / f"QUAL-002.{fmt}"
+        result = ConversationExtractor(str(session), "QUAL-002").extract_to_file(streamed_path, fmt)
+
+        assert result.turns == []
+        assert self._normalize(streamed_path.read_text(encoding="utf-8")) == self._normalize(
+            legacy_path.read_text(encoding="utf-8")
+        )
+
+    @pytest.mark.parametrize("fmt", ["yaml", "json"])
+    def test_empty_session(self, tmp_path, fmt):
+        session = tmp_path / "empty.jsonl"
+        session.write_text("\n", encoding="utf-8")
+        (tmp_path / "legacy").mkdir()
+
+        legacy_path = _write_result(ConversationExtractor(str(session)).extract(), tmp_path / "legacy", fmt)
+        streamed_path = tmp_path / f"empty.{fmt}"
+        ConversationExtractor(str(session)).extract_to_file(streamed_path, fmt)
+
+        assert self._normalize(streamed_path.read_text(encoding="utf-8")) == self._normalize(
+            legacy_path.read_text(encoding="utf-8")
+        )
+
+    def test_memory_stays_flat(self, tmp_path):
+        filler = "x" * 20_000
+
+        def peak_for(rounds: int) -> int:
+            session = _write_session(tmp_path / f"big_{rounds}.jsonl", _session_entries(rounds, filler))
+            tracemalloc.start()
+            extractor = ConversationExtractor(str(session))
+            for _ in extractor.stream():
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+        small, large = peak_for(20), peak_for(200)
+        # 10x more content (~8 MB more) must not grow peak memory proportionally
+        assert large < small * 2
+
+
+class TestTurnRecords:
+    """Slotted, shared turn records and the asdict-free writer."""
+
+    def test_result_shares_slotted_records(self, session_file):
+        extractor = ConversationExtractor(str(session_file))
+        result = extractor.extract()
+
+        assert result.turns == extractor.turns and result.turns[0] is extractor.turns[0]
+        for record in (result.turns[0], result.checkpoints[0], result.agents_invoked[0], result):
+            assert not hasattr(record, "__dict__")
+        assert result.turns[1]["role"] == "assistant" and "content" in result.turns[1]
+        assert result.checkpoints[0].get("missing", "-") == "-"
+        with pytest.raises(KeyError):
+            result.turns[0]["to_dict"]
+        assert result.to_dict() == asdict(result)
+
+    def test_strings_interned(self, session_file):
+        result = ConversationExtractor(str(session_file)).extract()
+        assert result.turns[0].role is sys.intern("user")
+        assert result.turns[0].turn_type is sys.intern(result.turns[0].turn_type)
+        assert result.checkpoints[0].id is result.turns[1].checkpoint_triggered is sys.intern("CP_RESEARCH_DIRECTION")
+
+    @pytest.mark.parametrize("fmt", ["yaml", "json"])
+    def test_write_matches_asdict_dump(self, session_file, tmp_path, fmt):
+        result = ConversationExtractor(str(session_file)).extract()
+        written = _write_result(result, tmp_path, fmt).read_text(encoding="utf-8")
+        if fmt == "yaml":
+            assert written == yaml.dump(asdict(result), default_flow_style=False, allow_unicode=True)
+        else:
+            assert written == json.dumps(asdict(result), indent=2, ensure_ascii=False)
+
+    def test_matches_legacy_layout(self, session_file):
+        ours = ConversationExtractor(str(session_file)).extract()
+        reference = LegacyRecordExtractor(str(session_file)).extract()
+        assert [t.to_dict() for t in ours.turns] == reference.turns
+        assert [c.to_dict() for c in ours.checkpoints] == reference.checkpoints
+
+    def test_lazy_content(self, tmp_path):
+        path = write_long_session(tmp_path / "long.jsonl", 200, 5000)
+        eager = ConversationExtractor(str(path)).extract()
+
+        tracemalloc.start()
+        lazy = ConversationExtractor(str(path), lazy_content=True).extract()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert lazy.turns == eager.turns
+        assert lazy.turns[1]["content"] == eager.turns[1].content
+        assert (lazy.checkpoints, lazy.metrics) == (eager.checkpoints, eager.metrics)
+        # 100 responses of 5000 characters are not retained
+        assert retained < 100 * 5000
+
+        (tmp_path / "lazy").mkdir()
+        lazy_path = _write_result(lazy, tmp_path / "lazy", "json")
+        assert lazy.turns[1]._source._map is None  # Unmapped once the turns are written
+        assert lazy.turns[1].content == eager.turns[1].content
+        lazy.close()
+        eager_path = _write_result(eager, tmp_path, "json")
+        normalize = TestExtractToFile._normalize
+        assert normalize(lazy_path.read_text(encoding="utf-8")) == normalize(eager_path.read_text(encoding="utf-8"))
+
+
+class TestBatch:
+    """Batch extraction fans sessions out across worker processes."""
+
+    @pytest.fixture
+    def archive(self, tmp_path) -> Path:
+        root = tmp_path / "archive"
+        for week in ("w1", "w2"):
+            (root / week).mkdir(parents=True)
+        _write_session(root / "w1" / "alpha.jsonl", _session_entries(rounds=2))
+        _write_session(root / "w1" / "dup.jsonl", _session_entries(rounds=1))
+        _write_session(root / "w2" / "dup.jsonl", _session_entries(rounds=3))
+        (root / "w2" / "notes.txt").write_text("ignored", encoding="utf-8")
+        return root
+
+    def test_resolve_directory_and_glob(self, archive):
+        assert [p.name for p in resolve_session_paths(str(archive))] == ["alpha.jsonl", "dup.jsonl", "dup.jsonl"]
+        assert [p.parent.name for p in resolve_session_paths(str(archive / "*" / "dup.jsonl"))] == ["w1", "w2"]
+        assert resolve_session_paths(str(archive / "w1" / "alpha.jsonl")) == [archive / "w1" / "alpha.jsonl"]
+        assert resolve_session_paths(str(archive / "missing*.jsonl")) == []
+
+    @pytest.mark.parametrize("fmt", ["yaml", "json"])
+    def test_outputs_and_rollup(self, archive, tmp_path, fmt):
+        paths = resolve_session_paths(str(archive))
+        out = tmp_path / "out"
+        rollup = extract_batch(paths, str(out), fmt, jobs=2)
+
+        assert sorted(p.name for p in out.iterdir()) == sorted(
+            ["alpha." + fmt, "w1_dup." + fmt, "w2_dup." + fmt, "extraction_rollup." + fmt]
+        )
+        assert rollup["sessions"] == {"total": 3, "extracted": 3, "failed": 0}
+        assert [o["session"] for o in rollup["outputs"]] == [str(p) for p in paths]
+
+        references = [ConversationExtractor(str(p)).extract() for p in paths]
+        assert rollup["metrics"]["total_turns"] == sum(r.total_turns for r in references)
+        assert rollup["metrics"]["user_input_types"]["TECHNICAL_FOLLOW_UP"] == sum(
+            r.metrics["user_input_types"]["TECHNICAL_FOLLOW_UP"] for r in references
+        )
+        assert rollup["metrics"]["unique_agents_invoked"] == len(
+            {a["agent"] for r in references for a in r.agents_invoked}
+        )
+
+    def test_output_names_below_common_root(self, tmp_path):
+        paths = [tmp_path / "a" / "x" / "s.jsonl", tmp_path / "b" / "x" / "s.jsonl", tmp_path / "a" / "t.jsonl"]
+        assert _output_names(paths) == ["a_x_s", "b_x_s", "t"]
+
+        nested = [tmp_path / "x" / "s.jsonl", tmp_path / "x" / "y" / "s.jsonl"]
+        assert _output_names(nested) == ["s", "y_s"]
+
+    def test_output_name_collision_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="a_x_s"):
+            _output_names([tmp_path / "a" / "x" / "s.jsonl", tmp_path / "b" / "s.jsonl", tmp_path / "a_x_s.jsonl"])
+        with pytest.raises(ValueError):
+            _output_names([tmp_path / "s.jsonl", tmp_path / "s.jsonl"])
+
+    def test_two_level_collision_outputs(self, tmp_path):
+        root = tmp_path / "archive"
+        for project in ("a", "b"):
+            (root / project / "x").mkdir(parents=True)
+        _write_session(root / "a" / "x" / "s.jsonl", _session_entries(rounds=1))
+        _write_session(root / "b" / "x" / "s.jsonl", _session_entries(rounds=2))
+
+        out = tmp_path / "out"
+        rollup = extract_batch(resolve_session_paths(str(root)), str(out), "json", jobs=2)
+        assert rollup["sessions"]["extracted"] == 2
+        assert sorted(p.name for p in out.iterdir()) == ["a_x_s.json", "b_x_s.json", "extraction_rollup.json"]
+
+    def test_failure_is_isolated(self, archive, tmp_path):
+        paths = resolve_session_paths(str(archive)) + [archive / "w1" / "deleted.jsonl"]
+        rollup = extract_batch(paths, str(tmp_path / "out"), "yaml", jobs=2)
+
+        assert rollup["sessions"] == {"total": 4, "extracted": 3, "failed": 1}
+        assert rollup["failures"][0]["session"].endswith("deleted.jsonl")
+        assert "FileNotFoundError" in rollup["failures"][0]["error"]
+        assert Path(rollup["path"]).exists()
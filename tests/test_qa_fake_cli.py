@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for the Fake CLI
+=======================
+
+Validates the local stand-in for claude/opencode/codex:
+- Distribution specs, invocation parsing and config loading
+- Scenario-appropriate responses that the runner's detectors recognize
+- The response library is built once into a snapshot and rebuilt when protocols change
+- Failures, hangs and response sizes go through the runner's real code paths
+
+Usage:
+    pytest tests/test_qa_fake_cli.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from qa.runners.cassette import Cassette, Interaction
+from qa.runners.cli_test_runner import CLITestRunner
+from qa.runners import fake_cli
+from qa.runners.fake_cli import (
+    PROTOCOL_DIR,
+    FakeCLIConfig,
+    ResponseLibrary,
+    fake_cli_executables,
+    parse_distribution,
+    parse_invocation,
+)
+
+
+@pytest.fixture(scope="module")
+def library_path(tmp_path_factory) -> str:
+    """One response library snapshot for the module, outside the source tree."""
+    return str(tmp_path_factory.mktemp("fake_cli") / "library.json")
+
+
+def _runner(library_path, scenario="META-002", cli_tool="claude", timeout=30, **config) -> CLITestRunner:
+    return CLITestRunner(
+        scenario, cli_tool=cli_tool, timeout=timeout,
+        executables=fake_cli_executables(FakeCLIConfig(library_path=library_path, **config))
+    )
+
+
+class TestConfig:
+    """Distribution specs and configuration."""
+
+    @pytest.mark.parametrize(
+        "spec,low,high",
+        [("fixed:0.5", 0.5, 0.5), ("uniform:1,2", 1, 2), ("lognormal:1,0.3", 0, 10), ("exponential:0.2", 0, 10)],
+    )
+    def test_distributions(self, spec, low, high):
+        sample = parse_distribution(spec)
+        rng = random.Random(7)
+        assert all(low <= sample(rng) <= high for _ in range(200))
+
+    def test_negative_samples_are_clamped(self):
+        sample = parse_distribution("normal:-5,0.1")
+        assert sample(random.Random(1)) == 0.0
+
+    @pytest.mark.parametrize("spec", ["gamma:1,2", "uniform:1", "fixed:abc"])
+    def test_invalid_distributions(self, spec):
+        with pytest.raises(ValueError):
+            parse_distribution(spec)
+
+    def test_invalid_config(self, tmp_path):
+        with pytest.raises(ValueError):
+            FakeCLIConfig(failure_rate=1.5)
+        path = tmp_path / "fake.yaml"
+        path.write_text("latency: fixed:0.1\nbogus: 1\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="bogus"):
+            FakeCLIConfig.from_file(str(path))
+
+    def test_executables_plug_into_runner(self, library_path):
+        runner = _runner(library_path)
+        cmd = runner._build_command("hello", True)
+        assert cmd[1].endswith("fake_cli.py") and cmd[4] == "claude"
+        assert cmd[5:7] == ["-p", "/diverga:research-coordinator\n\nhello"]
+        assert parse_invocation("claude", cmd[5:]) == ("hello", True)
+        assert parse_invocation("claude", runner._build_command("next", False)[5:]) == ("next", False)
+        assert parse_invocation("codex", ["exec", "hi"]) == ("hi", True)
+
+
+class TestResponses:
+    """Responses carry the protocol's expected checkpoint and agent."""
+
+    def test_scenario_appropriate(self):
+        runner = CLITestRunner("META-002", dry_run=True)
+        first = runner.protocol["conversation_flow"][0]
+        response = ResponseLibrary().response_for("claude", first["user"], True)
+
+        detected = runner._detect_checkpoints(response)
+        assert detected[0]["id"] == first["expected_behavior"]["checkpoint"]
+        assert len(runner._extract_vs_options(response)) == 3
+        assert runner._check_skill_loaded(response)["loaded"]
+
+    def test_recorded_responses_take_precedence(self, tmp_path):
+        cassette = Cassette(tmp_path / "X_claude.cassette.json", "record")
+        cassette.record(Interaction("claude", 1, "hi", "recorded answer", "", 0, 1.0))
+        library = ResponseLibrary(cassette_dir=tmp_path)
+        assert library.response_for("claude", "hi", True) == "recorded answer"
+        assert library.response_for("opencode", "hi", True) != "recorded answer"
+
+
+class TestLibrarySnapshot:
+    """The library is parsed once and reused until its sources change."""
+
+    @pytest.fixture
+    def protocol_dir(self, tmp_path) -> Path:
+        target = tmp_path / "protocol"
+        target.mkdir()
+        for name in ("test_meta_002.yaml", "test_qual_002.yaml"):
+            shutil.copy(PROTOCOL_DIR / name, target / name)
+        return target
+
+    def _count_builds(self, monkeypatch) -> list:
+        builds = []
+        original = ResponseLibrary.__init__
+        monkeypatch.setattr(ResponseLibrary, "__init__", lambda self, *a: builds.append(a) or original(self, *a))
+        return builds
+
+    def test_reused_until_protocol_changes(self, protocol_dir, tmp_path, monkeypatch):
+        snapshot = tmp_path / "library.json"
+        builds = self._count_builds(monkeypatch)
+        message = CLITestRunner("META-002", dry_run=True).protocol["conversation_flow"][0]["user"].strip()
+
+        fresh = ResponseLibrary.cached(protocol_dir, path=snapshot)
+        loaded = ResponseLibrary.cached(protocol_dir, path=snapshot)
+        assert len(builds) == 1 and snapshot.exists()
+        assert loaded.response_for("claude", message, True) == fresh.response_for("claude", message, True)
+
+        edited = protocol_dir / "test_meta_002.yaml"
+        edited.write_text(edited.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        os.utime(edited, ns=(edited.stat().st_atime_ns, edited.stat().st_mtime_ns + 10**9))
+        ResponseLibrary.cached(protocol_dir, path=snapshot)
+        (protocol_dir / "test_qual_002.yaml").unlink()
+        ResponseLibrary.cached(protocol_dir, path=snapshot)
+        assert len(builds) == 3
+
+    def test_recorded_responses_in_snapshot(self, tmp_path, monkeypatch):
+        cassette = Cassette(tmp_path / "X_claude.cassette.json", "record")
+        cassette.record(Interaction("claude", 1, "hi", "recorded answer", "", 0, 1.0))
+        ResponseLibrary.cached(cassette_dir=tmp_path, path=tmp_path / "library.json")
+
+        builds = self._count_builds(monkeypatch)
+        library = ResponseLibrary.cached(cassette_dir=tmp_path, path=tmp_path / "library.json")
+        assert builds == [] and library.response_for("claude", "hi", True) == "recorded answer"
+
+    def test_executables_prebuild_default_snapshot(self, protocol_dir, tmp_path, monkeypatch):
+        monkeypatch.setattr(fake_cli, "LIBRARY_CACHE_DIR", tmp_path / "cache")
+        fake_cli_executables(FakeCLIConfig(protocol_dir=str(protocol_dir)))
+        assert fake_cli.default_library_path(protocol_dir).parent == tmp_path / "cache"
+        assert fake_cli.default_library_path(protocol_dir).exists()
+        assert fake_cli.default_library_path(protocol_dir) != fake_cli.default_library_path()
+
+    def test_unwritable_snapshot(self, protocol_dir, tmp_path):
+        (tmp_path / "file").write_text("", encoding="utf-8")
+        library = ResponseLibrary.cached(protocol_dir, path=tmp_path / "file" / "library.json")
+        assert library.to_dict()["turns"]
+
+
+class TestRunnerAgainstFakeCLI:
+    """End-to-end runs through real subprocesses."""
+
+    def test_full_scenario(self, library_path):
+        session = _runner(library_path).run()
+        assert session.status == "completed"
+        assert session.validation_results["checkpoints"]["compliance"] == 100.0
+
+    def test_async_backend_and_size(self, library_path):
+        runner = _runner(library_path, cli_tool="opencode", size="fixed:5000", latency="fixed:0.2", chunks=2)
+        response = asyncio.run(runner._execute_cli_async("Anything"))
+        assert len(response) > 5000
+        assert 0 < runner._last_timing.ttfb_seconds < runner._last_timing.total_seconds
+
+    def test_failures(self, library_path):
+        session = _runner(library_path, failure_rate=1.0).run()
+        assert session.status == "failed"
+        assert "non-zero: 1" in session.error and "simulated failure" in session.error
+
+    @pytest.mark.parametrize("backend", ["subprocess", "asyncio"])
+    def test_hangs_hit_timeout(self, library_path, backend):
+        runner = _runner(library_path, timeout=1, hang_rate=1.0)
+        session = runner.run() if backend == "subprocess" else asyncio.run(runner.run_async())
+        assert session.status == "failed"
+        assert "timed out after 1s" in session.error
+
+    def test_seed_is_deterministic(self, library_path):
+        runners = [_runner(library_path, seed=3, failure_rate=0.5), _runner(library_path, seed=3, failure_rate=0.5)]
+        sessions = [r.run() for r in runners]
+        assert sessions[0].status == sessions[1].status
+        assert len(sessions[0].turns) == len(sessions[1].turns)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON Codec
+========================
+
+Validates qa/runners/json_codec.py on every installed backend:
+- Decoding agrees with json.loads, including input a native parser rejects
+- Writing matches json.dump(indent=2, ensure_ascii=False)
+- iter_jsonl skips blank, malformed and (with the prefilter) unwanted lines
+- The standard library backend decodes lines with json.loads directly
+- ConversationExtractor output is the same for every backend, with or without the prefilter
+
+Usage:
+    pytest tests/test_qa_json_codec.py -v
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from qa.benchmarks.session_parsing import LegacyExtractor, extract, write_session
+from qa.runners.extract_conversation import ConversationExtractor
+from qa.runners.json_codec import BACKENDS, JSONCodec, available_backends, get_codec
+
+INSTALLED = available_backends()
+
+
+@pytest.fixture(params=INSTALLED)
+def codec(request) -> JSONCodec:
+    return JSONCodec(request.param)
+
+
+class TestBackends:
+    def test_default_is_first_installed(self):
+        assert INSTALLED[-1] == "json"
+        assert JSONCodec().backend == INSTALLED[0]
+        assert get_codec() is get_codec()
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            JSONCodec("ujson")
+
+    def test_missing_backend(self):
+        missing = [backend for backend in BACKENDS if backend not in INSTALLED]
+        if not missing:
+            pytest.skip("every backend is installed")
+        with pytest.raises(ImportError):
+            JSONCodec(missing[0])
+
+
+class TestLoads:
+    @pytest.mark.parametrize("text", [
+        '{"type": "user", "content": "효과크기 🔴 \\u00e9"}',
+        '[1, 2.5, -3e-7, true, false, null, "x"]',
+        '{"n": 12345678901234567890}',
+        '{"nan": NaN}',
+    ])
+    def test_agrees_with_stdlib(self, codec, text):
+        expected = json.loads(text)
+        result = codec.loads(text.encode("utf-8"))
+        if "NaN" in text:
+            assert result["nan"] != result["nan"]
+        elif codec.backend != "orjson" or "1234567890" not in text:  # orjson may decode big ints as floats
+            assert result == expected
+
+    @pytest.mark.parametrize("text", ["{not json}", '{"a": 1', ""])
+    def test_malformed_raises_value_error(self, codec, text):
+        with pytest.raises(ValueError):
+            codec.loads(text)
+
+
+class TestDump:
+    def test_matches_json_dump(self, codec):
+        data = {
+            "scenario_id": "META-002",
+            "turns": [{"role": "assistant", "content": "🔴 CHECKPOINT\n[A] 직접", "t": 0.35, "n": None}],
+            "metrics": {"total": 3, "passed": True, "types": {"TECHNICAL_FOLLOW_UP": 2}},
+            "empty": [], "nested_empty": {},
+        }
+        f = io.StringIO()
+        codec.dump(data, f)
+        assert f.getvalue() == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_falls_back_for_unsupported_values(self, codec):
+        data = {"big": 2 ** 70}
+        assert codec.dumps(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class TestIterJsonl:
+    @pytest.fixture
+    def jsonl(self, tmp_path) -> Path:
+        path = tmp_path / "session.jsonl"
+        path.write_bytes(
+            b'{"type": "user", "content": "hi"}\r\n'
+            b"\n"
+            b"{not json}\n"
+            b'{"type":"progress","data":{"type":"user"}}\n'
+            b'{"type": "system", "subtype": "usage"}\n'
+            b'{"role" : "assistant", "content": "ok"}\n'
+            b'{"type": "assistant", "content": "truncated'
+        )
+        return path
+
+    def test_skips_blank_and_malformed(self, codec, jsonl):
+        entries = list(codec.iter_jsonl(jsonl))
+        assert [e.get("type", e.get("role")) for e in entries] == ["user", "progress", "system", "assistant"]
+
+    def test_prefilter(self, codec, jsonl):
+        entries = list(codec.iter_jsonl(jsonl, types=("user", "assistant"), keys=("type", "role")))
+        # The progress entry nests a user message, so it is decoded; the system entry is not
+        assert [e.get("type", e.get("role")) for e in entries] == ["user", "progress", "assistant"]
+
+    @pytest.mark.parametrize("types", [None, ("user", "assistant")])
+    def test_stdlib_decodes_with_json_loads(self, jsonl, monkeypatch, types):
+        codec = JSONCodec("json")
+        expected = list(codec.iter_jsonl(jsonl, types, keys=("type", "role")))
+        monkeypatch.setattr(JSONCodec, "loads", lambda self, data: pytest.fail("codec.loads called per line"))
+        assert list(codec.iter_jsonl(jsonl, types, keys=("type", "role"))) == expected
+        assert [entry for _, _, entry in codec.scan_jsonl(jsonl) if entry is not None] == list(codec.iter_jsonl(jsonl))
+
+
+class TestExtractorCodec:
+    @pytest.mark.parametrize("prefilter", [False, True])
+    def test_extraction_matches_reference(self, tmp_path, codec, prefilter):
+        path = str(write_session(tmp_path / "session.jsonl", 40))
+        assert extract(ConversationExtractor(path, codec=codec, prefilter=prefilter)) == extract(LegacyExtractor(path))
+
+    def test_missing_session(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ConversationExtractor(str(tmp_path / "missing.jsonl")).extract()
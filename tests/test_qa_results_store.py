@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Tests for the Results Store
+============================
+
+Validates the SQLite index of QA results:
+- Sessions, saved raw files and evaluation reports are ingested once each
+- Live sessions are ingested without copying their turn records
+- Trend queries return a metric over recent runs, oldest first
+- The Welch t-test matches reference values
+- The regression report flags significant score drops and slowdowns only
+- Aborted and failed partial runs are left out of both regression windows
+
+Usage:
+    pytest tests/test_qa_results_store.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from qa.runners.batch_runner import BatchRunner
+from qa.runners.cli_test_runner import CLITestRunner
+from qa.runners import results_store
+from qa.runners.results_store import ResultsStore, welch_t_test
+
+SESSIONS_DIR = Path(__file__).parent.parent / "qa" / "reports" / "sessions"
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(str(tmp_path / "store" / "results.sqlite3")) as s:
+        yield s
+
+
+def _session(
+    index: int, compliance: float, latencies: list, scenario="META-002", cli_tool="claude", status="completed"
+) -> dict:
+    """A conversation_raw-shaped session with one assistant turn per latency."""
+    turns = []
+    for number, latency in enumerate(latencies, 1):
+        turns.append({"number": number, "role": "user", "content": "q", "timestamp": ""})
+        turns.append({
+            "number": number, "role": "assistant", "content": "a", "timestamp": "",
+            "timing": {"total_seconds": latency, "ttfb_seconds": latency / 4, "chars_per_second": 100.0},
+        })
+    return {
+        "scenario_id": scenario,
+        "cli_tool": cli_tool,
+        "session_id": f"s{index}",
+        "start_time": f"2026-02-01T10:{index:02d}:00",
+        "status": status,
+        "checkpoints": [{"checkpoint": "CP_RESEARCH_DIRECTION", "turn": 1, "confidence": "HIGH"}],
+        "agents_invoked": ["C5"],
+        "validation_results": {"checkpoints": {"compliance": compliance}},
+        "turns": turns,
+    }
+
+
+class TestIngest:
+    """Sessions and reports land in the store once."""
+
+    def test_session_rows(self, store):
+        run_id = store.ingest_session(_session(1, 80.0, [1.0, 3.0]))
+        rows = store.trend("META-002", "latency_mean")
+        assert rows == [{"run_at": "2026-02-01T10:01:00", "cli_tool": "claude", "session_id": "s1",
+                         "status": "completed", "value": 2.0}]
+        assert store.trend("META-002", "latency_p95")[0]["value"] == 3.0
+        assert store.trend("META-002", "ttfb_mean")[0]["value"] == 0.5
+        checkpoints = store._conn.execute("SELECT checkpoint_id FROM checkpoints WHERE run_id = ?", (run_id,))
+        assert [r[0] for r in checkpoints] == ["CP_RESEARCH_DIRECTION"]
+
+    def test_reingest_replaces(self, store):
+        store.ingest_session(_session(1, 50.0, [1.0]))
+        store.ingest_session(_session(1, 90.0, [1.0]))
+        assert [r["value"] for r in store.trend("META-002")] == [90.0]
+        assert store._conn.execute("SELECT COUNT(*) FROM turn_latency").fetchone()[0] == 1
+
+    def test_saved_sessions(self, store, tmp_path):
+        shutil.copytree(SESSIONS_DIR / "QUANT-004", tmp_path / "QUANT-004")
+        assert store.ingest_path(str(tmp_path)) == 2
+        rows = store.trend("QUANT-004", "score", cli_tool="claude")
+        assert rows[0]["value"] == 25.0
+        # No recorded timing: latency comes from user -> response timestamp gaps
+        assert store.trend("QUANT-004", "latency_mean", cli_tool="claude")[0]["value"] == pytest.approx(23.84, abs=0.01)
+
+    def test_report(self, store, tmp_path):
+        report = {"generated_at": "2026-02-01T10:00:00", "results": [
+            {"scenario_id": "QUAL-002", "passed": False, "timestamp": "2026-02-01T10:00:00",
+             "checks": [{"passed": True}, {"passed": False}], "summary": {}},
+        ]}
+        path = tmp_path / "qa_report_20260201_100000.json"
+        path.write_text(json.dumps(report), encoding="utf-8")
+        assert store.ingest_path(str(path)) == 1
+        assert store.trend("QUAL-002", kind="evaluation")[0]["value"] == 50.0
+
+    def test_trend_limits_and_orders(self, store):
+        for i in range(5):
+            store.ingest_session(_session(i, float(i), [1.0]))
+        assert [r["value"] for r in store.trend("META-002", last=3)] == [2.0, 3.0, 4.0]
+        with pytest.raises(ValueError):
+            store.trend("META-002", metric="bogus")
+
+    def test_batch_ingests(self, store, tmp_path):
+        batch = BatchRunner(["META-002", "QUAL-002"], jobs=2, dry_run=True,
+                            output_dir=str(tmp_path / "out"), store=store)
+        report = batch.run()
+        assert {r["scenario_id"] for r in store.scenarios()} == {"META-002", "QUAL-002"}
+        meta = next(o for o in report.outcomes if o.scenario_id == "META-002")
+        assert store.trend("META-002")[0]["value"] == meta.compliance
+
+    def test_live_session_not_copied(self, store, tmp_path, monkeypatch):
+        session = asyncio.run(CLITestRunner("META-002", dry_run=True).run_async())
+        monkeypatch.setattr(results_store, "asdict", lambda obj: pytest.fail("session deep-copied"), raising=False)
+        store.ingest_session(session)
+
+        columns = "scenario_id, session_id, status, score, total_turns, checkpoints_found, latency_mean, ttfb_mean"
+        with ResultsStore(str(tmp_path / "reference.sqlite3")) as reference:
+            reference.ingest_session(json.loads(json.dumps(asdict(session))))
+            query = f"SELECT {columns} FROM runs"
+            assert store._conn.execute(query).fetchall() == reference._conn.execute(query).fetchall()
+        assert len(store._conn.execute("SELECT * FROM turn_latency").fetchall()) == len(session.turns) // 2
+
+
+class TestRegression:
+    """Welch t-test and window comparison."""
+
+    def test_welch_reference(self):
+        # se² = 2.5/5 + 5.3/5, Welch-Satterthwaite df; one-sided tail of Student's t
+        result = welch_t_test([1, 2, 3, 4, 5], [3, 4, 5, 6, 9])
+        assert result["t"] == pytest.approx(1.9215, abs=1e-4)
+        assert result["df"] == pytest.approx(7.0868, abs=1e-4)
+        assert result["p_greater"] == pytest.approx(0.04780, abs=1e-5)
+        assert result["p_greater"] + result["p_less"] == pytest.approx(1.0)
+
+    def test_flags_slowdown_and_score_drop(self, store):
+        for i in range(10):
+            store.ingest_session(_session(i, 95.0 + i % 2, [1.0 + 0.05 * (i % 3), 1.1]))
+        for i in range(10, 20):
+            store.ingest_session(_session(i, 70.0 + i % 2, [2.0 + 0.05 * (i % 3), 2.1]))
+
+        report = store.regression_report(window=10)
+        assert report["groups_compared"] == 1
+        assert {r["metric"] for r in report["regressions"]} == {"score", "latency"}
+        score = next(r for r in report["regressions"] if r["metric"] == "score")
+        assert score["baseline_mean"] == 95.5 and score["recent_mean"] == 70.5
+        assert score["p_value"] < 0.001
+
+    def test_noise_and_improvements_not_flagged(self, store):
+        for i in range(20):
+            # Faster, higher-scoring recent window plus noise
+            store.ingest_session(_session(i, 80.0 + (i % 3) + (5 if i >= 10 else 0), [2.0 - 0.1 * (i >= 10) + 0.2 * (i % 2)]))
+        assert store.regression_report(window=10)["regressions"] == []
+        with pytest.raises(ValueError):
+            store.regression_report(window=1)
+
+    def test_partial_runs_not_compared(self, store):
+        for i in range(10):
+            store.ingest_session(_session(i, 95.0 + i % 2, [1.0 + 0.05 * (i % 3), 1.1]))
+        for i in range(10, 20):
+            # Aborted after one slow, checkpoint-less turn; failed mid-run
+            status = "aborted" if i % 2 else "failed"
+            store.ingest_session(_session(i, 10.0 + i % 2, [4.0 + 0.05 * (i % 3)], status=status))
+        assert store.regression_report(window=10)["regressions"] == []
+
+        for i in range(20, 30):
+            store.ingest_session(_session(i, 95.0 + i % 2, [1.0 + 0.05 * (i % 3), 1.1]))
+        report = store.regression_report(window=10)
+        assert report["groups_compared"] == 1 and report["regressions"] == []
+
+    def test_rescored_session_round_trips(self, store, tmp_path):
+        runner = CLITestRunner("META-002", dry_run=True)
+        session = runner.run()
+        raw_dir = runner.save_results(str(tmp_path))
+        store.ingest_session(session)
+        assert store.ingest_path(str(raw_dir)) == 1
+        assert len(store.trend("META-002")) == 1
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for Retries and Resumable Sessions
+=========================================
+
+Validates:
+- Exponential backoff on CLI timeouts and errors, and which errors are final
+- Per-turn session checkpoints, removed once a session finishes
+- Resuming a failed session from its last completed turn with `--continue`
+- Batch workdirs of failed sessions are kept for --resume and removed once it finishes
+
+Usage:
+    pytest tests/test_qa_resume.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from qa.runners import cli_test_runner
+from qa.runners.batch_runner import BatchRunner
+from qa.runners.cli_test_runner import CLINotFoundError, CLITestRunner
+
+
+def _scripted(runner, responses):
+    """Serve responses (str or exception) per CLI call instead of running the CLI."""
+    calls = []
+
+    def execute(message):
+        calls.append(message)
+        response = responses.pop(0) if responses else "Understood."
+        if isinstance(response, Exception):
+            raise response
+        runner._is_first_turn = False
+        return response
+
+    runner._execute_cli = execute
+    return calls
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(cli_test_runner.time, "sleep", delays.append)
+    return delays
+
+
+class TestRetry:
+    """Backoff and retryable errors."""
+
+    def test_transient_failures_are_retried(self, sleeps):
+        runner = CLITestRunner("QUANT-004", dry_run=True, retries=3, retry_backoff=1.0)
+        calls = _scripted(runner, [TimeoutError("timed out"), RuntimeError("CLI returned non-zero: 1"), "ok"])
+        session = runner.run()
+
+        assert session.status == "completed"
+        assert sleeps == [1.0, 2.0]
+        assert len(calls) == 6  # 4 turns + 2 retries of turn 1
+
+    def test_backoff_is_capped(self):
+        runner = CLITestRunner("QUANT-004", dry_run=True, retries=10, retry_backoff=10.0)
+        delays = [runner._retry_delay(attempt, TimeoutError()) for attempt in range(1, 7)]
+        assert delays == [10.0, 20.0, 40.0, 80.0, 120.0, 120.0]
+        assert runner._retry_delay(11, TimeoutError()) is None
+
+    @pytest.mark.parametrize("error", [CLINotFoundError("CLI tool 'claude' not found"), ValueError("bad")])
+    def test_final_errors_are_not_retried(self, sleeps, error):
+        runner = CLITestRunner("QUANT-004", dry_run=True, retries=3, retry_backoff=1.0)
+        _scripted(runner, [error])
+        assert runner.run().status == "failed"
+        assert sleeps == []
+
+    def test_retries_exhausted(self, sleeps):
+        runner = CLITestRunner("QUANT-004", dry_run=True, retries=2, retry_backoff=1.0)
+        _scripted(runner, [RuntimeError("boom")] * 3)
+        session = runner.run()
+        assert session.status == "failed"
+        assert session.error == "boom"
+        assert sleeps == [1.0, 2.0]
+
+
+class TestCheckpoints:
+    """Per-turn persistence and --resume."""
+
+    def _fail_at_turn_3(self, tmp_path):
+        runner = CLITestRunner("META-002", dry_run=True, checkpoint_dir=tmp_path)
+        _scripted(runner, ["one", "two", RuntimeError("CLI returned non-zero: 1")])
+        session = runner.run()
+        assert session.status == "failed"
+        return runner
+
+    def test_checkpoint_after_each_turn(self, tmp_path):
+        runner = self._fail_at_turn_3(tmp_path)
+        data = json.loads(runner.checkpoint_path.read_text(encoding="utf-8"))
+
+        assert data["session_id"] == runner.session_id
+        assert data["next_turn_spec"] == 2
+        assert data["is_first_turn"] is False
+        assert [(t["number"], t["role"]) for t in data["turns"]] == [(1, "user"), (1, "assistant"),
+                                                                     (2, "user"), (2, "assistant")]
+
+    def test_completed_session_removes_checkpoint(self, tmp_path):
+        runner = CLITestRunner("QUANT-004", dry_run=True, checkpoint_dir=tmp_path)
+        assert runner.run().status == "completed"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_resume_continues_after_last_completed_turn(self, tmp_path):
+        failed = self._fail_at_turn_3(tmp_path)
+
+        path = CLITestRunner.find_checkpoint(failed.session_id, tmp_path)
+        runner = CLITestRunner.from_checkpoint(path, dry_run=True, checkpoint_dir=tmp_path)
+        assert "--continue" in runner._build_command("next", runner._is_first_turn)
+        calls = _scripted(runner, [])
+        session = runner.run()
+
+        assert session.status == "completed"
+        assert session.session_id == failed.session_id
+        assert session.start_time == failed.session.start_time
+        assert len(calls) == 8  # Turns 3-10 only
+        assert [t.number for t in session.turns if t.role == "user"] == list(range(1, 11))
+        assert [t.content for t in session.turns if t.role == "assistant"][:2] == ["one", "two"]
+        assert not path.exists()
+
+    def test_resume_async(self, tmp_path):
+        failed = self._fail_at_turn_3(tmp_path)
+        runner = CLITestRunner.from_checkpoint(failed.checkpoint_path, dry_run=True, checkpoint_dir=tmp_path)
+        session = asyncio.run(runner.run_async())
+        assert session.status == "completed"
+        assert len([t for t in session.turns if t.role == "user"]) == 10
+
+    def test_resume_without_workdir_needs_new_conversation(self, tmp_path):
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        runner = CLITestRunner("META-002", dry_run=True, checkpoint_dir=tmp_path, workdir=workdir,
+                               scratch_workdir=True)
+        _scripted(runner, ["one", RuntimeError("boom")])
+        runner.run()
+        workdir.rmdir()
+
+        with pytest.raises(FileNotFoundError, match="--resume-new-conversation"):
+            CLITestRunner.from_checkpoint(runner.checkpoint_path, dry_run=True)
+
+        resumed = CLITestRunner.from_checkpoint(runner.checkpoint_path, new_conversation=True, dry_run=True)
+        assert resumed._is_first_turn is True
+        assert resumed.workdir == CLITestRunner.REPO_ROOT
+        assert not resumed.scratch_workdir  # The repo root is never removed
+
+    def test_batch_keeps_failed_workdir_until_resumed(self, tmp_path, monkeypatch):
+        responses = ["one", RuntimeError("CLI returned non-zero: 1")]
+
+        def execute(runner, message):
+            response = responses.pop(0) if responses else "Understood."
+            if isinstance(response, Exception):
+                raise response
+            runner._is_first_turn = False
+            return response
+
+        monkeypatch.setattr(CLITestRunner, "_execute_cli", execute)
+        workspace, checkpoints = tmp_path / "ws", tmp_path / "sessions"
+        batch = BatchRunner(["META-002"], output_dir=str(tmp_path / "out"), dry_run=True,
+                            workspace=str(workspace), checkpoint_dir=checkpoints)
+        outcome = batch.run().outcomes[0]
+        assert outcome.session_status == "failed"
+        [workdir] = workspace.iterdir()
+
+        path = CLITestRunner.find_checkpoint(outcome.session_id, checkpoints)
+        runner = CLITestRunner.from_checkpoint(path, dry_run=True, checkpoint_dir=checkpoints)
+        assert runner.workdir == workdir and runner._is_first_turn is False
+        assert runner.run().status == "completed"
+        assert list(workspace.iterdir()) == []
+
+    def test_batch_removes_workdir_without_checkpoint(self, tmp_path, monkeypatch):
+        def execute(runner, message):
+            raise ValueError("bad")
+
+        monkeypatch.setattr(CLITestRunner, "_execute_cli", execute)
+        workspace = tmp_path / "ws"
+        batch = BatchRunner(["META-002"], output_dir=str(tmp_path / "out"), dry_run=True, workspace=str(workspace))
+        assert batch.run().outcomes[0].session_status == "failed"
+        assert list(workspace.iterdir()) == []
+
+    def test_missing_checkpoint(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            CLITestRunner.find_checkpoint("no-such-session", tmp_path)
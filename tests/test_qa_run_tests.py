@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for DivergaQARunner Protocol Validation
+==============================================
+
+Validates incremental `run_all`:
+- Results match a full validation
+- Unchanged protocols are reused from the manifest without parsing
+- Modified, new and deleted protocols are picked up
+- A validation version bump discards the manifest
+
+Usage:
+    pytest tests/test_qa_run_tests.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from qa.run_tests import DivergaQARunner
+
+PROTOCOL_DIR = Path(__file__).parent.parent / "qa" / "protocol"
+
+
+@pytest.fixture
+def protocols(tmp_path, monkeypatch):
+    target = tmp_path / "protocol"
+    target.mkdir()
+    for name in ("test_meta_002.yaml", "test_qual_002.yaml"):
+        shutil.copy(PROTOCOL_DIR / name, target / name)
+    monkeypatch.setattr(DivergaQARunner, "PROTOCOL_DIR", target)
+    return target
+
+
+def _run(tmp_path, **kwargs):
+    runner = DivergaQARunner(incremental=True, manifest_path=str(tmp_path / "manifest.json"), **kwargs)
+    return runner, runner.run_all()
+
+
+def _summary(report):
+    return sorted((r["scenario_id"], r["passed"], r["summary"].get("total_checks")) for r in report.results)
+
+
+class TestIncremental:
+    """Manifest-backed re-validation."""
+
+    def test_matches_full_validation(self, protocols, tmp_path):
+        full = DivergaQARunner().run_all()
+        runner, first = _run(tmp_path)
+        assert runner.revalidated == 2
+        assert _summary(first) == _summary(full)
+
+        runner, second = _run(tmp_path)
+        assert runner.revalidated == 0
+        assert _summary(second) == _summary(full)
+
+    def test_unchanged_files_are_not_parsed(self, protocols, tmp_path, monkeypatch):
+        _run(tmp_path)
+        monkeypatch.setattr("qa.run_tests.yaml.load", lambda *a, **k: pytest.fail("parsed an unchanged protocol"))
+        # A touched file is hashed but not parsed
+        os.utime(protocols / "test_qual_002.yaml", ns=(0, 10**9))
+        runner, report = _run(tmp_path)
+        assert runner.revalidated == 0 and report.total_scenarios == 2
+
+    def test_changes_are_revalidated(self, protocols, tmp_path):
+        _run(tmp_path)
+        (protocols / "test_qual_002.yaml").write_text("scenario_id: QUAL-002\n", encoding="utf-8")
+        (protocols / "test_new_001.yaml").write_text("name: [unclosed\n", encoding="utf-8")
+        (protocols / "test_meta_002.yaml").unlink()
+
+        runner, report = _run(tmp_path)
+        assert runner.revalidated == 2
+        results = {r["scenario_id"]: r for r in report.results}
+        assert set(results) == {"QUAL_002", "NEW_001"}
+        assert not results["QUAL_002"]["passed"]
+        assert results["NEW_001"]["errors"]
+
+    def test_version_bump_invalidates(self, protocols, tmp_path, monkeypatch):
+        _run(tmp_path)
+        monkeypatch.setattr(DivergaQARunner, "VALIDATION_VERSION", "test")
+        runner, _ = _run(tmp_path)
+        assert runner.revalidated == 2
+
+    def test_unwritable_manifest_is_skipped(self, protocols, tmp_path):
+        (tmp_path / "not_a_dir").write_text("", encoding="utf-8")
+        runner = DivergaQARunner(incremental=True, manifest_path=str(tmp_path / "not_a_dir" / "manifest.json"))
+        assert runner.run_all().total_scenarios == 2
+        assert runner.revalidated == 2
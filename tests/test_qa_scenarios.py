@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the Scenario Registry
+================================
+
+Validates indexed scenario lookup:
+- Both protocol layouts (nested `scenario:` and top-level `scenario_id`) are indexed
+- Tag/paradigm/priority queries
+- The persisted index is reused and only changed files are re-parsed
+- Full scenarios load lazily
+
+Usage:
+    pytest tests/test_qa_scenarios.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from qa.protocol.scenarios import Paradigm, Priority, ScenarioRegistry, list_scenarios, load_scenario
+
+PROTOCOL_DIR = Path(__file__).parent.parent / "qa" / "protocol"
+
+
+@pytest.fixture
+def protocol_dir(tmp_path):
+    target = tmp_path / "protocol"
+    target.mkdir()
+    for name in ("test_meta_001.yaml", "test_meta_002.yaml", "test_qual_001.yaml"):
+        shutil.copy(PROTOCOL_DIR / name, target / name)
+    return target
+
+
+def _registry(protocol_dir, tmp_path):
+    return ScenarioRegistry(protocol_dir, tmp_path / "index.json")
+
+
+class TestLookup:
+    """Index contents and queries."""
+
+    def test_both_layouts(self, protocol_dir, tmp_path):
+        registry = _registry(protocol_dir, tmp_path)
+        assert sorted(e.scenario_id for e in registry) == ["META-001", "META-002", "QUAL-001"]
+        assert registry.get("META-001").priority is Priority.CRITICAL
+        assert registry.get("META-002").paradigm is Paradigm.QUANTITATIVE
+        with pytest.raises(ValueError, match="Scenario not found"):
+            registry.get("NOPE-001")
+
+    def test_query(self, protocol_dir, tmp_path):
+        registry = _registry(protocol_dir, tmp_path)
+        assert [e.scenario_id for e in registry.query(tag="c2")] == ["QUAL-001"]
+        assert [e.scenario_id for e in registry.query(priority="critical")] == ["META-001"]
+        assert {e.scenario_id for e in registry.query(tag="meta-analysis", priority=Priority.CRITICAL)} == {"META-001"}
+        assert registry.query(tag="c2", paradigm="quantitative") == []
+        assert len(registry.query()) == 3
+
+    def test_load_is_lazy_and_memoized(self, protocol_dir, tmp_path):
+        registry = _registry(protocol_dir, tmp_path)
+        scenario = registry.load("META-002")
+        assert scenario.scenario_id == "META-002"
+        assert registry.load("META-002") is scenario
+
+    def test_module_functions(self):
+        ids = [scenario_id for scenario_id, _, _ in list_scenarios()]
+        assert "" not in ids and "QUAL-002" in ids
+        assert load_scenario("QUAL-002").name == "Advanced Phenomenology with Paradigm Debates"
+
+
+class TestPersistence:
+    """The index is persisted and invalidated per file."""
+
+    def test_reopen_parses_nothing(self, protocol_dir, tmp_path, monkeypatch):
+        assert _registry(protocol_dir, tmp_path).refresh() == 0
+        assert (tmp_path / "index.json").exists()
+
+        monkeypatch.setattr(ScenarioRegistry, "_index_file", lambda *a: pytest.fail("re-parsed an unchanged file"))
+        assert len(_registry(protocol_dir, tmp_path)) == 3
+
+    def test_unwritable_index_is_skipped(self, protocol_dir, tmp_path):
+        (tmp_path / "not_a_dir").write_text("", encoding="utf-8")
+        registry = ScenarioRegistry(protocol_dir, tmp_path / "not_a_dir" / "index.json")
+        assert len(registry) == 3 and registry.load("META-002").scenario_id == "META-002"
+
+    def test_changed_new_and_deleted_files(self, protocol_dir, tmp_path):
+        registry = _registry(protocol_dir, tmp_path)
+        (protocol_dir / "test_meta_002.yaml").write_text(
+            "scenario_id: META-002\nname: Renamed\nparadigm: qualitative\n", encoding="utf-8"
+        )
+        stat = (protocol_dir / "test_meta_002.yaml").stat()
+        os.utime(protocol_dir / "test_meta_002.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        (protocol_dir / "test_qual_001.yaml").unlink()
+        (protocol_dir / "test_new_001.yaml").write_text("scenario_id: NEW-001\nname: New\n", encoding="utf-8")
+
+        assert registry.refresh() == 2
+        assert registry.get("META-002").name == "Renamed"
+        assert "QUAL-001" not in registry and "NEW-001" in registry
+        assert [e.scenario_id for e in registry.query(paradigm="qualitative")] == ["META-002"]
+        assert registry.load("META-002").paradigm is Paradigm.QUALITATIVE
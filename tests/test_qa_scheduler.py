@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the Batch Scheduler
+==============================
+
+Validates longest-first dispatch:
+- Turn counts come from the conversation flow, then expected_turns
+- Per-turn latency comes from scenario history, then CLI tool history, then a default
+- LPT order and the simulated makespan
+- BatchRunner dispatches in plan order and reports predicted vs actual times
+
+Usage:
+    pytest tests/test_qa_scheduler.py -v
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from qa.runners.batch_runner import BatchRunner
+from qa.runners.cli_test_runner import CLITestRunner
+from qa.runners.results_store import ResultsStore
+from qa.runners.scheduler import DEFAULT_SECONDS_PER_TURN, Scheduler, count_turns
+
+
+def _session(scenario_id, index, latency, cli_tool="claude"):
+    turns = []
+    for number in (1, 2):
+        turns.append({"number": number, "role": "user", "timestamp": ""})
+        turns.append({"number": number, "role": "assistant", "timestamp": "", "timing": {"total_seconds": latency}})
+    return {"scenario_id": scenario_id, "cli_tool": cli_tool, "session_id": f"{scenario_id}-{index}",
+            "start_time": f"2026-02-01T10:{index:02d}:00", "status": "completed", "turns": turns}
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(str(tmp_path / "results.sqlite3")) as s:
+        yield s
+
+
+class TestEstimates:
+    """Turn counts and latency sources."""
+
+    def test_count_turns(self):
+        flow = [{"user": "a"}, {"user": " "}, {"user_input": "legacy"}, {"user": "b"}]
+        assert count_turns({"conversation_flow": flow}) == 2
+        assert count_turns({"expected_turns": "10-15"}) == 12
+        assert count_turns({"expected_turns": 4}) == 4
+        assert count_turns({}) == 1
+
+    def test_latency_sources(self, store):
+        store.ingest_session(_session("META-002", 1, 4.0))
+        store.ingest_session(_session("QUAL-002", 2, 2.0))
+        scheduler = Scheduler(CLITestRunner.PROTOCOL_DIR, store=store)
+
+        meta = scheduler.estimate("META-002", "claude")
+        assert (meta.turns, meta.seconds_per_turn, meta.latency_source) == (10, 4.0, "scenario")
+        quant = scheduler.estimate("QUANT-004", "claude")
+        assert (quant.seconds_per_turn, quant.latency_source) == (3.0, "cli_tool")
+        codex = scheduler.estimate("QUANT-004", "codex")
+        assert (codex.seconds_per_turn, codex.latency_source) == (DEFAULT_SECONDS_PER_TURN, "default")
+
+
+class TestPlan:
+    """LPT order and predicted makespan."""
+
+    def test_longest_first(self):
+        schedule = Scheduler(CLITestRunner.PROTOCOL_DIR).plan(["QUANT-004", "META-002", "QUAL-002"], "claude", 2)
+        assert schedule.order == ["META-002", "QUAL-002", "QUANT-004"]
+        # META-002 (10 turns) on worker 0; QUAL-002 (8) then QUANT-004 (4) on worker 1
+        assert schedule.slots["QUANT-004"].worker == 1
+        assert schedule.slots["QUANT-004"].predicted_start == 8 * DEFAULT_SECONDS_PER_TURN
+        assert schedule.predicted_makespan == 12 * DEFAULT_SECONDS_PER_TURN
+
+    def test_ties_keep_requested_order(self):
+        schedule = Scheduler(CLITestRunner.PROTOCOL_DIR).plan(["QUANT-005", "QUANT-004"], "claude", 1)
+        assert schedule.order == ["QUANT-005", "QUANT-004"]
+
+
+class TestBatchDispatch:
+    """BatchRunner uses the plan."""
+
+    @pytest.mark.parametrize("backend", ["subprocess", "asyncio"])
+    def test_dispatch_order_and_report(self, tmp_path, backend, monkeypatch):
+        started = []
+        original = BatchRunner._make_runner
+
+        def recording(self, scenario_id, workdir):
+            started.append(scenario_id)
+            return original(self, scenario_id, workdir)
+
+        monkeypatch.setattr(BatchRunner, "_make_runner", recording)
+        batch = BatchRunner(["QUANT-004", "META-002", "QUAL-002"], jobs=1, dry_run=True,
+                            output_dir=str(tmp_path), backend=backend)
+        report = batch.run()
+
+        assert started == ["META-002", "QUAL-002", "QUANT-004"]
+        assert [o.scenario_id for o in report.outcomes] == ["QUANT-004", "META-002", "QUAL-002"]
+        assert report.outcomes[1].predicted_seconds == 10 * DEFAULT_SECONDS_PER_TURN
+        assert report.outcomes[0].finished_at_seconds >= report.outcomes[1].finished_at_seconds
+
+        data = report.to_dict()["schedule"]
+        assert data["order"] == started
+        assert data["scenarios"]["META-002"]["predicted_finish_seconds"] == 10 * DEFAULT_SECONDS_PER_TURN
+        assert data["actual_makespan_seconds"] >= 0
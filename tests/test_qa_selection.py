@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for Scenario Selection and Sharding
+==========================================
+
+Validates:
+- The selection expression language (keys, comparisons, and/or/not, parentheses)
+- Errors for malformed expressions and shard specs
+- Deterministic, duration-balanced sharding that covers every scenario once
+- Selection in the batch runner and protocol validation
+
+Usage:
+    pytest tests/test_qa_selection.py -v
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from qa.protocol.scenarios import Paradigm, Priority, ScenarioIndexEntry
+from qa.protocol.selection import assign_shards, parse_selection, parse_shard, select_scenarios, shard_scenarios
+from qa.run_tests import DivergaQARunner
+from qa.runners.batch_runner import filter_scenarios
+
+
+def _entry(scenario_id, priority="medium", paradigm="quantitative", tags=(), minutes=10):
+    return ScenarioIndexEntry(
+        scenario_id=scenario_id, name=scenario_id, priority=Priority(priority), paradigm=Paradigm(paradigm),
+        tags=list(tags), estimated_duration_minutes=minutes, path="", mtime_ns=0, size=0,
+    )
+
+
+ENTRIES = [
+    _entry("QUAL-001", "high", "qualitative", ["phenomenology", "C2"], 15),
+    _entry("QUAL-002", "medium", "qualitative", ["grounded-theory"]),
+    _entry("META-001", "critical", "quantitative", ["meta-analysis", "critical-path"], 15),
+    _entry("MIXED-001", "low", "mixed_methods", ["integration"], 5),
+]
+
+
+def _ids(expression):
+    return [e.scenario_id for e in select_scenarios(ENTRIES, expression)]
+
+
+class TestSelection:
+    """Expression language."""
+
+    @pytest.mark.parametrize("expression,expected", [
+        ("priority:high", ["QUAL-001"]),
+        ("priority>=high", ["QUAL-001", "META-001"]),
+        ("priority<medium", ["MIXED-001"]),
+        ("paradigm:mixed-methods", ["MIXED-001"]),
+        ("tag:c2", ["QUAL-001"]),
+        ("tag:meta-*", ["META-001"]),
+        ("id:qual-*", ["QUAL-001", "QUAL-002"]),
+        ("duration>=15", ["QUAL-001", "META-001"]),
+        ("priority>=high and paradigm:qualitative", ["QUAL-001"]),
+        ("paradigm:qualitative or tag:integration and priority:low", ["QUAL-001", "QUAL-002", "MIXED-001"]),
+        ("(paradigm:qualitative or tag:integration) and not priority:low", ["QUAL-001", "QUAL-002"]),
+        ("not not id:META-001", ["META-001"]),
+    ])
+    def test_expressions(self, expression, expected):
+        assert _ids(expression) == expected
+
+    @pytest.mark.parametrize("expression", [
+        "", "priority:urgent", "paradigm:experimental", "color:red", "tag>=x", "(tag:x", "tag:x and",
+        "tag:x tag:y", "tag:x )", "duration<soon",
+    ])
+    def test_invalid(self, expression):
+        with pytest.raises(ValueError):
+            parse_selection(expression)
+
+
+class TestSharding:
+    """Duration-balanced, deterministic shards."""
+
+    @pytest.mark.parametrize("spec", ["0/3", "4/3", "3", "a/b"])
+    def test_invalid_spec(self, spec):
+        with pytest.raises(ValueError):
+            parse_shard(spec)
+
+    def test_partition_is_complete_and_balanced(self):
+        entries = [_entry(f"S-{i:03d}", minutes=m) for i, m in enumerate([30, 5, 10, 10, 20, 5, 15, 25])]
+        shards = assign_shards(entries, 3)
+        assert sorted(e.scenario_id for s in shards for e in s) == sorted(e.scenario_id for e in entries)
+        loads = [sum(e.estimated_duration_minutes for e in s) for s in shards]
+        assert max(loads) - min(loads) <= 5
+
+    def test_independent_of_input_order(self):
+        forward = [e.scenario_id for e in shard_scenarios(ENTRIES, "2/2")]
+        backward = [e.scenario_id for e in shard_scenarios(list(reversed(ENTRIES)), "2/2")]
+        assert forward == backward
+
+
+class TestIntegration:
+    """Selection through the runners."""
+
+    def test_filter_scenarios(self):
+        ids = ["META-002", "QUAL-002", "QUAL-003", "QUANT-001"]
+        assert filter_scenarios(ids) == ids
+        assert filter_scenarios(ids, select="paradigm:qualitative") == ["QUAL-002", "QUAL-003"]
+        shards = [filter_scenarios(ids, shard=f"{k}/2") for k in (1, 2)]
+        assert sorted(shards[0] + shards[1]) == sorted(ids)
+        with pytest.raises(ValueError):
+            filter_scenarios(ids, select="priority:")
+
+    def test_run_all_selection(self):
+        report = DivergaQARunner().run_all(select="priority>=high")
+        assert sorted(r["scenario_id"] for r in report.results) == ["HUMAN_001", "META_001", "MIXED_001", "QUAL_001"]
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the Session Index
+===========================
+
+Validates SessionIndex and SessionReader on synthetic session logs:
+- Turn numbers, tool calls and checkpoints agree with ConversationExtractor
+- The sidecar index is reused, extended after appends and rebuilt after rewrites
+- Half-written final lines are indexed again once complete
+- Indexes built with another version or prefilter setting are ignored
+
+Usage:
+    pytest tests/test_qa_session_index.py -v
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from qa.benchmarks.session_parsing import write_session
+from qa.runners.extract_conversation import ConversationExtractor
+from qa.runners.session_index import SessionIndex, SessionReader, index_path_for
+
+
+def _append(path: Path, text: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def session_file(tmp_path) -> Path:
+    path = write_session(tmp_path / "session.jsonl", 40)
+    _append(path, "{not json}\n\n")
+    return path
+
+
+class TestSessionReader:
+    def test_agrees_with_extraction(self, session_file):
+        result = ConversationExtractor(str(session_file)).extract()
+
+        with SessionReader(session_file) as reader:
+            assert reader.index.total_turns == result.total_turns
+            assert [entry["content"] for _, entry in reader.turns()] == [t["content"] for t in result.turns]
+            assert [(turn, cp_id) for turn, cp_id, _ in reader.checkpoint_messages()] == [
+                (c["turn_triggered"], c["id"]) for c in result.checkpoints
+            ]
+            assert [(turn, call["id"]) for turn, call in reader.tool_calls()] == [
+                (t["turn_number"], call["id"]) for t in result.turns for call in t["tool_calls"]
+            ]
+            assert all(turn % 2 == 0 for turn, _ in reader.tool_results())
+
+    def test_turn_lookup(self, session_file):
+        result = ConversationExtractor(str(session_file)).extract()
+        with SessionReader(session_file) as reader:
+            assert reader.turn(27)["content"] == result.turns[26]["content"]
+            assert [turn for turn, _ in reader.turns([40, 1])] == [40, 1]
+            for missing in (0, 41):
+                with pytest.raises(KeyError):
+                    reader.turn(missing)
+
+    def test_kinds(self, session_file):
+        index = SessionIndex.open(session_file)
+        assert index.kind_counts() == {"other": 102, "user": 20, "assistant": 20, "tool_result": 20}
+        assert index.kind(0) == "user"
+        assert index.size == session_file.stat().st_size
+
+    def test_empty_session(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+        with SessionReader(path) as reader:
+            assert len(reader.index) == 0
+            assert list(reader.turns()) == []
+
+    def test_missing_session(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            SessionIndex.open(tmp_path / "missing.jsonl")
+
+
+class TestSidecar:
+    def test_saved_and_reused(self, session_file, monkeypatch):
+        index = SessionIndex.open(session_file)
+        assert index_path_for(session_file).exists()
+
+        monkeypatch.setattr(SessionIndex, "_extend", lambda *args: pytest.fail("index rebuilt"))
+        loaded = SessionIndex.open(session_file)
+        assert (loaded.offsets, loaded.kinds, loaded.turns, loaded.checkpoints) == (
+            index.offsets, index.kinds, index.turns, index.checkpoints
+        )
+
+    def test_extended_after_append(self, session_file):
+        before = SessionIndex.open(session_file)
+        _append(session_file, json.dumps({"type": "user", "content": "[A] proceed"}) + "\n")
+
+        after = SessionIndex.open(session_file)
+        assert len(after) == len(before) + 1
+        assert after.total_turns == before.total_turns + 1
+        assert after.offsets[:len(before.offsets)] == before.offsets
+
+    def test_partial_last_line(self, session_file):
+        _append(session_file, '{"type": "assistant", "content": "🔴 CHECKPOINT: CP_METHODOLOGY_APPROVAL')
+        partial = SessionIndex.open(session_file)
+        assert partial.kind(len(partial) - 1) == "other"
+
+        _append(session_file, ' pending?"}\n')
+        complete = SessionIndex.open(session_file)
+        assert len(complete) == len(partial)
+        assert complete.total_turns == partial.total_turns + 1
+        with SessionReader(session_file, complete) as reader:
+            assert list(reader.checkpoint_messages())[-1][:2] == (complete.total_turns, "CP_METHODOLOGY_APPROVAL")
+
+    def test_rebuilt_after_rewrite(self, session_file):
+        SessionIndex.open(session_file)
+        write_session(session_file, 10)
+
+        index = SessionIndex.open(session_file)
+        assert index.total_turns == 10
+        assert index.size == session_file.stat().st_size
+
+    def test_ignores_other_builds(self, session_file):
+        index_path = index_path_for(session_file)
+        SessionIndex.open(session_file)
+        assert SessionIndex.load(session_file, index_path) is not None
+        assert SessionIndex.load(session_file, index_path, prefilter=False) is None
+
+        index_path.write_bytes(b'{"version": 0}\n')
+        assert SessionIndex.load(session_file, index_path) is None
+        assert SessionIndex.open(session_file).total_turns == 40
+
+    def test_unwritable_sidecar(self, session_file, tmp_path):
+        index = SessionIndex.open(session_file, index_path=tmp_path / "missing" / "session.idx")
+        assert index.total_turns == 40
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for VS Analytics
+=======================
+
+Validates:
+- T-Score extraction (labelled and unlabelled, recommended markers)
+- Per-turn and per-session statistics, and the T-Score distribution
+- NumPy and pure-Python paths agree
+- Loading session archives and recording through MetricsCollector
+
+Usage:
+    pytest tests/test_qa_vs_analytics.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from qa.protocol.metrics import MetricsCollector
+from qa.protocol.vs_analytics import VSTable, extract_t_scores, np, summarize_response
+
+RESPONSE = """🔴 CHECKPOINT: CP_RESEARCH_DIRECTION
+
+[A] Overall effect analysis (T=0.75) ⭐ recommended
+[B] Subject-specific effects (T=0.45)
+[C] Multi-level meta-analysis, T-Score: .15
+
+A conventional framing would score T ≈ 0.3.
+[A] Overall effect analysis (T=0.75)
+"""
+
+
+def _session(session_id, scenario_id, responses):
+    turns = []
+    for number, content in enumerate(responses, start=1):
+        turns.append({"number": number, "role": "user", "content": "..."})
+        turns.append({"number": number, "role": "assistant", "content": content})
+    return {"session_id": session_id, "scenario_id": scenario_id, "turns": turns}
+
+
+SESSIONS = [
+    _session("s1", "META-002", [RESPONSE, "[A] x (T=0.5)\n[B] y (T=0.3)"]),
+    _session("s2", "QUAL-002", ["No options here."]),
+    _session("s3", "QUAL-002", ["[A] a (T=0.9) 권장\n[B] b (T=0.1)"]),
+]
+
+# numpy is a dev requirement (requirements-dev.txt): CI must run the NumPy path rather than skip it
+NUMPY_REQUIRED = np is not None or bool(os.environ.get("CI"))
+PATHS = [False] + ([True] if NUMPY_REQUIRED else [])
+requires_numpy = pytest.mark.skipif(not NUMPY_REQUIRED, reason="numpy not installed")
+
+
+class TestExtraction:
+    """Single-response extraction."""
+
+    def test_extract_t_scores(self):
+        assert extract_t_scores(RESPONSE) == [("A", 0.75, True), ("B", 0.45, False), ("C", 0.15, False), ("", 0.3, False)]
+        assert extract_t_scores("[A] out of range (T=1.5)") == []
+
+    def test_summarize_response(self):
+        summary = summarize_response(RESPONSE)
+        assert summary["options_presented"] == 3
+        assert (summary["t_score_min"], summary["t_score_max"]) == (0.15, 0.75)
+        assert summary["modal_identified"] and summary["modal_recommended"]
+        assert summary["modal_t_score"] == 0.75
+
+
+@pytest.mark.parametrize("native", PATHS)
+class TestTable:
+    """Columnar statistics on both paths."""
+
+    def test_turn_stats(self, native):
+        table = VSTable.from_sessions(SESSIONS, native=native)
+        assert len(table) == 8
+        records = list(table.turn_stats().records())
+
+        assert [(r["session"], r["turn"]) for r in records] == [("s1", 1), ("s1", 2), ("s3", 1)]
+        first = records[0]
+        assert first["options"] == 4
+        assert first["t_score_spread"] == pytest.approx(0.6)
+        assert first["t_score_mean"] == pytest.approx(0.4125)
+        assert (first["creative"], first["experimental"]) == (2, 1)
+        assert first["modal_identified"] and first["modal_recommended"]
+        assert not records[1]["modal_identified"]
+        assert records[2]["scenario_id"] == "QUAL-002"
+
+    def test_session_stats(self, native):
+        stats = VSTable.from_sessions(SESSIONS, native=native).session_stats()
+        assert list(stats["session"]) == ["s1", "s3"]
+        assert list(stats["options"]) == [6, 2]
+        assert list(stats["t_score_max"]) == [0.75, 0.9]
+
+    def test_distribution(self, native):
+        distribution = VSTable.from_sessions(SESSIONS, native=native).distribution()
+        assert distribution["count"] == 8
+        assert sum(distribution["histogram"]["counts"]) == 8
+        assert distribution["histogram"]["counts"][3] == 2  # 0.3 twice, on the bin edge
+        assert distribution["quantiles"][0.5] == pytest.approx(0.375)
+        assert distribution["modal_share"] == pytest.approx(0.25)
+
+    def test_empty(self, native):
+        table = VSTable(native=native)
+        assert len(table.turn_stats()) == 0
+        assert table.distribution()["count"] == 0
+
+
+@requires_numpy
+def test_paths_agree_at_scale():
+    sessions = [
+        _session(f"s{i}", f"S-{i % 7}", [f"[A] a (T=0.{(i * 7 + t) % 10}5)\n[B] b (T=0.{(i + t) % 10})" for t in range(5)])
+        for i in range(2000)
+    ]
+    native = VSTable.from_sessions(sessions, native=True).session_stats()
+    python = VSTable.from_sessions(sessions, native=False).session_stats()
+    assert list(native["session"]) == python["session"]
+    for name in native.columns:
+        assert native[name].tolist() == pytest.approx(python[name])
+
+
+def test_from_archive(tmp_path):
+    for data in SESSIONS:
+        folder = tmp_path / data["scenario_id"]
+        folder.mkdir(exist_ok=True)
+        (folder / f"conversation_raw_{data['session_id']}.json").write_text(json.dumps(data), encoding="utf-8")
+    table = VSTable.from_archive(tmp_path)
+    assert sorted(table.sessions) == ["s1", "s2", "s3"]
+    assert len(table) == 8
+
+
+def test_metrics_collector_record_vs_response():
+    metrics = MetricsCollector("META-002").record_vs_response(RESPONSE)
+    assert metrics.options_presented == 3
+    assert metrics.t_score_spread == pytest.approx(0.6)
+    assert (metrics.creative_options_count, metrics.experimental_options_count) == (2, 1)
+    assert metrics.modal_recommended_as_primary